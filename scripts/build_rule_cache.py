@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Build pre-compiled rule cache for fast startup.
 
-Generates a JSON cache file from all YAML rule files and a pickle
-file of compiled regex patterns so that startup doesn't need to
-parse 500+ YAML files or compile 1200+ regex patterns.
+Generates a JSON cache file and a memory-mapped binary cache from all
+YAML rule files, plus a pickle file of compiled regex patterns, so that
+startup doesn't need to parse 500+ YAML files or compile 1200+ regex
+patterns. The binary cache is mapped read-only, so pre-forked workers
+share one copy of the rule data.
 
 Usage:
     python scripts/build_rule_cache.py
@@ -30,6 +32,7 @@ import click
 from rich.console import Console
 
 from raxe.domain.engine.matcher import PatternMatcher
+from raxe.infrastructure.packs.binary_cache import BINARY_CACHE_FILENAME, write_binary_cache
 from raxe.infrastructure.packs.cache import (
     CACHE_FILENAME,
     PATTERNS_CACHE_FILENAME,
@@ -85,6 +88,17 @@ def main(pack_dir: Path | None) -> None:
     size_kb = cache_path.stat().st_size / 1024
     console.print(f"  Rules cache written: {cache_path} ({size_kb:.0f} KB)")
 
+    binary_path = pack_dir / BINARY_CACHE_FILENAME
+    write_binary_cache(
+        pack.rules,
+        manifest_hash,
+        binary_path,
+        pack_id=pack.manifest.versioned_id,
+    )
+
+    binary_size_kb = binary_path.stat().st_size / 1024
+    console.print(f"  Binary rules cache written: {binary_path} ({binary_size_kb:.0f} KB)")
+
     # Compile all regex patterns and write patterns cache
     console.print("  Compiling regex patterns...")
     matcher = PatternMatcher()
@@ -115,7 +129,7 @@ def main(pack_dir: Path | None) -> None:
     console.print(f"  Patterns cache written: {patterns_path} ({patterns_size_kb:.0f} KB)")
 
     console.print()
-    console.print("[green]Done![/green] Both caches will be used on next startup.")
+    console.print("[green]Done![/green] All caches will be used on next startup.")
 
 
 if __name__ == "__main__":
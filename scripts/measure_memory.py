@@ -8,6 +8,9 @@ memory deltas.
 Multi-worker mode (--workers N) spawns N child processes using
 multiprocessing.Process, each loading a full Raxe instance and running a
 scan, to replicate real deployment memory profiles (e.g. gunicorn workers).
+With --prefork the parent runs prefork_warmup() first and the workers are
+forked from it (gunicorn --preload), so rule data and model weights are
+shared; compare the per-worker USS (unique memory) of both modes.
 
 Usage:
     python scripts/measure_memory.py
@@ -15,6 +18,7 @@ Usage:
     python scripts/measure_memory.py --output report.json
     python scripts/measure_memory.py --workers 2
     python scripts/measure_memory.py --workers 4 --l1-only --low-memory
+    python scripts/measure_memory.py --workers 4 --prefork
 """
 
 from __future__ import annotations
@@ -70,6 +74,43 @@ def _get_process_rss_mb(pid: int) -> float | None:
     return None
 
 
+def _get_process_shared_memory_mb(pid: int) -> dict[str, float]:
+    """Get PSS and USS in MB for an external process by PID.
+
+    PSS splits shared pages evenly between the processes mapping them and
+    USS counts only pages private to the process, so unlike RSS they show
+    what pre-fork sharing saves. Reads /proc/<pid>/smaps_rollup on Linux,
+    falls back to psutil. Returns an empty dict when unavailable.
+    """
+    fields = {"Pss:": "pss_mb", "Private_Clean:": "uss_mb", "Private_Dirty:": "uss_mb"}
+    result: dict[str, float] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                key = fields.get(parts[0]) if parts else None
+                if key:
+                    result[key] = result.get(key, 0.0) + int(parts[1]) / 1024
+        return result
+    except (FileNotFoundError, PermissionError, ValueError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return result
+
+    try:
+        full = psutil.Process(pid).memory_full_info()
+    except (psutil.Error, AttributeError):
+        return result
+    if hasattr(full, "pss"):
+        result["pss_mb"] = full.pss / (1024 * 1024)
+    if hasattr(full, "uss"):
+        result["uss_mb"] = full.uss / (1024 * 1024)
+    return result
+
+
 def _self_peak_rss_mb() -> float:
     """Return this process's peak RSS (ru_maxrss) in MB."""
     raw = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
@@ -307,18 +348,47 @@ def _worker_fn(
     exit_event.wait(timeout=60)
 
 
+def _prefork_warmup_parent(l2_enabled: bool) -> dict:
+    """Run prefork_warmup() in this (parent) process before forking."""
+    os.environ["RAXE_LOG_LEVEL"] = "ERROR"
+    os.environ["RAXE_TELEMETRY_ENABLED"] = "false"
+
+    from raxe.application.preloader import prefork_warmup
+    from raxe.domain.ml.shared_models import clear_shared_models
+
+    print("\n  Pre-fork warmup in parent...", flush=True)
+    stats = prefork_warmup()
+    if not l2_enabled:
+        # Workers will not build L2 sessions; do not hold the weights
+        clear_shared_models()
+    print(
+        f"  Compiled {stats.patterns_compiled} patterns, shared "
+        f"{stats.model_bytes_shared / (1024 * 1024):.0f} MB of model weights "
+        f"in {stats.duration_ms:.0f} ms"
+    )
+    return {
+        "patterns_compiled": stats.patterns_compiled,
+        "model_bytes_shared": stats.model_bytes_shared,
+        "duration_ms": round(stats.duration_ms, 1),
+    }
+
+
 def run_multiworker(
     n_workers: int,
     *,
     l2_enabled: bool = True,
     low_memory: bool = False,
+    prefork: bool = False,
 ) -> dict:
     """Spawn N worker processes, each loading Raxe + one scan, and measure
     aggregate live RSS while all workers are alive simultaneously.
 
+    With ``prefork`` the parent warms up first and the workers are forked
+    from it, sharing rule data and model weights.
+
     Returns a dict with per-worker and aggregate memory data.
     """
-    ctx = multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("fork" if prefork else "spawn")
 
     # Barrier: n_workers + 0 (parent joins via timeout polling)
     ready_barrier = ctx.Barrier(n_workers)
@@ -327,7 +397,7 @@ def run_multiworker(
     manager = ctx.Manager()
     result_dict = manager.dict()
 
-    mode_desc = f"l2_enabled={l2_enabled}, low_memory={low_memory}"
+    mode_desc = f"l2_enabled={l2_enabled}, low_memory={low_memory}, prefork={prefork}"
 
     print(f"\n{'=' * 65}")
     print("  Multi-worker memory measurement")
@@ -335,6 +405,12 @@ def run_multiworker(
     print(f"  Mode: {mode_desc}")
     print(f"{'=' * 65}")
 
+    prefork_stats: dict | None = None
+    if prefork:
+        if low_memory:
+            os.environ["RAXE_LOW_MEMORY"] = "true"
+        prefork_stats = _prefork_warmup_parent(l2_enabled)
+
     # Measure parent baseline before spawning anything
     parent_baseline_mb = _self_peak_rss_mb()
 
@@ -395,11 +471,15 @@ def run_multiworker(
 
         # --- Measure live RSS from the parent side (all workers alive) ---
         live_rss_per_worker: list[float] = []
+        live_shared_per_worker: list[dict[str, float]] = []
         for _wid, entry in enumerate(per_worker):
             pid = entry["pid"]
             live_mb = _get_process_rss_mb(pid)
             if live_mb is not None:
                 live_rss_per_worker.append(live_mb)
+            shared = _get_process_shared_memory_mb(pid)
+            if shared:
+                live_shared_per_worker.append(shared)
 
         # Signal workers that measurement is done
         measure_event.set()
@@ -412,6 +492,7 @@ def run_multiworker(
             "n_workers": n_workers,
             "l2_enabled": l2_enabled,
             "low_memory": low_memory,
+            "prefork": prefork,
             "per_worker": per_worker,
             "total_peak_rss_mb": round(total_self_reported, 1),
             "avg_peak_rss_mb": round(avg_self_reported, 1),
@@ -423,6 +504,15 @@ def run_multiworker(
             summary["total_live_rss_mb"] = round(total_live, 1)
             summary["avg_live_rss_mb"] = round(total_live / len(live_rss_per_worker), 1)
 
+        for key in ("pss_mb", "uss_mb"):
+            values = [m[key] for m in live_shared_per_worker if key in m]
+            if values:
+                summary[f"total_live_{key}"] = round(sum(values), 1)
+                summary[f"avg_live_{key}"] = round(sum(values) / len(values), 1)
+
+        if prefork_stats is not None:
+            summary["prefork_warmup"] = prefork_stats
+
         # Print the summary table
         print()
         print("  Per-worker RSS (self-reported peak):")
@@ -440,6 +530,11 @@ def run_multiworker(
         print(f"    Total peak RSS (self-reported):  {total_self_reported:.0f} MB")
         if live_rss_per_worker:
             print(f"    Total live RSS (parent-observed): {sum(live_rss_per_worker):.0f} MB")
+        if "total_live_pss_mb" in summary:
+            print(f"    Total live PSS (shared pages split): {summary['total_live_pss_mb']:.0f} MB")
+        if "total_live_uss_mb" in summary:
+            print(f"    Total live USS (private only):      {summary['total_live_uss_mb']:.0f} MB")
+            print(f"    Per-worker avg USS: {summary['avg_live_uss_mb']:.0f} MB")
         print(f"    Per-worker avg: {avg_self_reported:.0f} MB")
         print(f"    Parent baseline: {parent_baseline_mb:.0f} MB")
         print()
@@ -534,6 +629,7 @@ def main() -> None:
             "  python scripts/measure_memory.py --workers 2      # 2-worker aggregate\n"
             "  python scripts/measure_memory.py --workers 4 --l1-only\n"
             "  python scripts/measure_memory.py --workers 2 --low-memory --json\n"
+            "  python scripts/measure_memory.py --workers 4 --prefork   # shared weights\n"
         ),
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
@@ -556,6 +652,12 @@ def main() -> None:
         default=False,
         help="Set RAXE_LOW_MEMORY=true (shared ONNX arena, fewer threads)",
     )
+    parser.add_argument(
+        "--prefork",
+        action="store_true",
+        default=False,
+        help="Warm up in the parent and fork workers from it (shared rules and model weights)",
+    )
     parser.add_argument(
         "--warmup-scans",
         type=int,
@@ -587,6 +689,7 @@ def main() -> None:
             args.workers,
             l2_enabled=l2_enabled,
             low_memory=args.low_memory,
+            prefork=args.prefork,
         )
 
     # --- Output ---
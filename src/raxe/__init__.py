@@ -40,62 +40,87 @@ __version__ = "0.15.0"
 __author__ = "RAXE Team"
 __license__ = "Proprietary"
 
-# Core client (PRIMARY EXPORT)
-# Common types
-from raxe.domain.engine.executor import Detection, ScanResult
-from raxe.domain.rules.models import Severity
-from raxe.sdk.client import Raxe
-
-# Exceptions
-from raxe.sdk.exceptions import (
-    RaxeBlockedError,
-    RaxeException,
-    SecurityException,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from raxe.application.telemetry_orchestrator import get_orchestrator as get_telemetry
+    from raxe.async_sdk import AsyncRaxe
+    from raxe.cli.main import cli
+    from raxe.domain.engine.executor import Detection, ScanResult
+    from raxe.domain.rules.models import Severity
+    from raxe.sdk.client import Raxe
+    from raxe.sdk.exceptions import RaxeBlockedError, RaxeException, SecurityException
+    from raxe.sdk.wrappers.anthropic import RaxeAnthropic
+    from raxe.sdk.wrappers.openai import RaxeOpenAI
+
+# Public exports are resolved on first access (PEP 562) so that
+# ``import raxe`` - which every ``raxe`` CLI invocation does - stays cheap
+# and does not load the SDK, ML and telemetry stacks up front.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # Core client (PRIMARY EXPORT)
+    "Raxe": ("raxe.sdk.client", "Raxe"),
+    "AsyncRaxe": ("raxe.async_sdk", "AsyncRaxe"),
+    # Common types
+    "Detection": ("raxe.domain.engine.executor", "Detection"),
+    "ScanResult": ("raxe.domain.engine.executor", "ScanResult"),
+    "Severity": ("raxe.domain.rules.models", "Severity"),
+    # Exceptions
+    "RaxeBlockedError": ("raxe.sdk.exceptions", "RaxeBlockedError"),
+    "RaxeException": ("raxe.sdk.exceptions", "RaxeException"),
+    "SecurityException": ("raxe.sdk.exceptions", "SecurityException"),
+    # CLI entry point
+    "cli": ("raxe.cli.main", "cli"),
+    # Telemetry (optional, for advanced users)
+    "get_telemetry": ("raxe.application.telemetry_orchestrator", "get_orchestrator"),
+    # Wrappers (the LLM packages themselves are imported on use)
+    "RaxeOpenAI": ("raxe.sdk.wrappers.openai", "RaxeOpenAI"),
+    "RaxeAnthropic": ("raxe.sdk.wrappers.anthropic", "RaxeAnthropic"),
+}
 
 __all__ = [
+    "AsyncRaxe",
     "Detection",
     # Core
     "Raxe",
+    "RaxeAnthropic",
     "RaxeBlockedError",
     # Exceptions
     "RaxeException",
+    "RaxeOpenAI",
     # Types
     "ScanResult",
     "SecurityException",
     "Severity",
     # Metadata
     "__version__",
+    "cli",
+    "get_telemetry",
 ]
 
-# CLI entry point and Async SDK (always available)
-from raxe.async_sdk import AsyncRaxe  # noqa: F401 - Exported via __all__.append
-from raxe.cli.main import cli  # noqa: F401 - Used by setuptools entry point
-
-__all__.append("AsyncRaxe")
 
-# Wrappers (optional, require respective LLM packages)
-try:
-    from raxe.sdk.wrappers.openai import RaxeOpenAI  # noqa: F401 - Conditionally exported
+def __getattr__(name: str) -> Any:
+    """Lazily import public exports on first access.
 
-    __all__.append("RaxeOpenAI")
-except ImportError:
-    # OpenAI not installed, skip wrapper
-    pass
+    Args:
+        name: Attribute name
 
-try:
-    from raxe.sdk.wrappers.anthropic import RaxeAnthropic  # noqa: F401 - Conditionally exported
+    Returns:
+        The exported object (cached in module globals afterwards)
 
-    __all__.append("RaxeAnthropic")
-except ImportError:
-    # Anthropic not installed, skip wrapper
-    pass
+    Raises:
+        AttributeError: If the name is not exported
+    """
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__.append("cli")
+    module_name, attribute = target
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
 
-# Telemetry (optional, for advanced users)
-from raxe.application.telemetry_orchestrator import (  # noqa: E402
-    get_orchestrator as get_telemetry,  # noqa: F401
-)
 
-__all__.append("get_telemetry")
+def __dir__() -> list[str]:
+    """Include lazy exports in ``dir(raxe)``."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
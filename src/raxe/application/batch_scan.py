@@ -0,0 +1,656 @@
+"""Streaming batch scan engine.
+
+Backs ``raxe batch``. The input file is read lazily and cut into chunks of
+prompts; chunks are scanned either in-process or by a pool of worker
+processes that each load the scan pipeline once, and every finished chunk
+is handed straight to an output sink. Memory stays bounded by
+``chunk_size * max_in_flight`` prompts whatever the size of the input.
+
+Ordering:
+- ordered (default): chunks are emitted in input order
+- unordered: chunks are emitted as they finish; every record carries its
+  ``line`` id so the output can be joined back to the input
+
+Resuming:
+``BatchState`` tracks the contiguous prefix of completed chunks. Its
+checkpoint records the input byte offset after that prefix together with
+the size of the output file at that point, so a resumed run truncates the
+output to the checkpoint and continues from the offset. Ordered runs are
+exactly-once; unordered runs may repeat the records of chunks that were
+past the prefix when the run stopped.
+
+Input format: one prompt per line, or JSONL with a ``"prompt"`` field.
+Blank lines are skipped and ``line`` is the 1-based ordinal of the prompt.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 64
+PROMPT_PREVIEW_CHARS = 50
+CHECKPOINT_VERSION = 1
+
+CSV_FIELDS = [
+    "line",
+    "prompt",
+    "has_threats",
+    "detection_count",
+    "highest_severity",
+    "duration_ms",
+]
+
+
+def extract_prompt(line: str) -> str:
+    """Extract the prompt from an input line.
+
+    Args:
+        line: Raw input line
+
+    Returns:
+        The ``"prompt"`` field of a JSON object line, otherwise the stripped
+        line ("" for blank lines)
+    """
+    line = line.strip()
+    if not line:
+        return ""
+    if line.startswith("{"):
+        try:
+            data = json.loads(line)
+            if isinstance(data, dict) and "prompt" in data:
+                return str(data["prompt"])
+        except json.JSONDecodeError:
+            pass  # Not valid JSON, use line as-is
+    return line
+
+
+@dataclass(frozen=True)
+class BatchChunk:
+    """A slice of consecutive prompts from the input file.
+
+    Attributes:
+        index: 0-based chunk number (relative to the start of this run)
+        first_line: Line id of the first prompt
+        prompts: Prompt texts
+        end_offset: Input byte offset just after the chunk's last line
+    """
+
+    index: int
+    first_line: int
+    prompts: tuple[str, ...]
+    end_offset: int
+
+
+def iter_chunks(
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    start_offset: int = 0,
+    start_line: int = 0,
+) -> Iterator[BatchChunk]:
+    """Read prompts lazily and group them into chunks.
+
+    Args:
+        path: Input file
+        chunk_size: Prompts per chunk
+        start_offset: Byte offset to start reading from (resume)
+        start_line: Line id of the last prompt before ``start_offset``
+
+    Yields:
+        Chunks in input order
+    """
+    index = 0
+    line_id = start_line
+    prompts: list[str] = []
+    with open(path, "rb") as f:
+        f.seek(start_offset)
+        offset = start_offset
+        for raw in f:
+            offset += len(raw)
+            prompt = extract_prompt(raw.decode("utf-8", errors="replace"))
+            if not prompt:
+                continue
+            prompts.append(prompt)
+            if len(prompts) >= chunk_size:
+                yield BatchChunk(index, line_id + 1, tuple(prompts), offset)
+                index += 1
+                line_id += len(prompts)
+                prompts = []
+        if prompts:
+            yield BatchChunk(index, line_id + 1, tuple(prompts), offset)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Scan outcome for one prompt.
+
+    Attributes:
+        line: Line id of the prompt
+        record: Output record (None if the scan failed)
+        error: Error message if the scan failed
+        critical: Whether the highest severity is critical
+        content_hash: SHA-256 of the prompt (only when requested)
+        severity: Highest severity across layers (for the verdict store)
+        total_detections: Detections across layers (for the verdict store)
+    """
+
+    line: int
+    record: dict[str, Any] | None
+    error: str | None = None
+    critical: bool = False
+    content_hash: str | None = None
+    severity: str | None = None
+    total_detections: int = 0
+
+    @property
+    def has_threats(self) -> bool:
+        """Whether the prompt contains a threat."""
+        return self.record is not None and self.record["has_threats"]
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    """Scan outcomes for one chunk.
+
+    Attributes:
+        index: Chunk index
+        end_offset: Input byte offset just after the chunk
+        last_line: Line id of the chunk's last prompt
+        results: Per-prompt results in line order
+        detection_key: ``Raxe.detection_fingerprint`` of the client that
+            scanned the chunk (set when content hashes are requested)
+    """
+
+    index: int
+    end_offset: int
+    last_line: int
+    results: list[BatchResult]
+    detection_key: str | None = None
+
+
+def scan_chunk(
+    raxe: Any,
+    chunk: BatchChunk,
+    scan_kwargs: dict[str, Any] | None = None,
+    *,
+    content_hashes: bool = False,
+    detection_key: str | None = None,
+) -> ChunkResult:
+    """Scan every prompt of a chunk.
+
+    Errors are captured per prompt so one bad line does not lose the chunk.
+
+    Args:
+        raxe: Raxe client
+        chunk: Chunk to scan
+        scan_kwargs: Extra keyword arguments for ``Raxe.scan``
+        content_hashes: Include the prompt SHA-256 in each result
+        detection_key: Detection fingerprint to attach to the result
+
+    Returns:
+        Chunk result
+    """
+    from raxe.domain.fingerprint import ContentFingerprint
+
+    scan_kwargs = scan_kwargs or {}
+    results: list[BatchResult] = []
+    for line, prompt in enumerate(chunk.prompts, start=chunk.first_line):
+        try:
+            result = raxe.scan(prompt, **scan_kwargs)
+        except Exception as e:
+            results.append(BatchResult(line=line, record=None, error=str(e)))
+            continue
+
+        scan_result = result.scan_result
+        detections = scan_result.l1_result.detections
+        highest = scan_result.combined_severity.value if scan_result.has_threats else "none"
+        results.append(
+            BatchResult(
+                line=line,
+                record={
+                    "line": line,
+                    "prompt": prompt[:PROMPT_PREVIEW_CHARS] + "..."
+                    if len(prompt) > PROMPT_PREVIEW_CHARS
+                    else prompt,
+                    "has_threats": scan_result.has_threats,
+                    "detection_count": len(detections),
+                    "highest_severity": highest,
+                    "duration_ms": result.duration_ms,
+                    "detections": [
+                        {
+                            "rule_id": d.rule_id,
+                            "severity": d.severity.value,
+                            "confidence": d.confidence,
+                        }
+                        for d in detections
+                    ],
+                },
+                critical=highest == "critical",
+                content_hash=ContentFingerprint(prompt).sha256 if content_hashes else None,
+                severity=result.severity,
+                total_detections=result.total_detections,
+            )
+        )
+    return ChunkResult(
+        index=chunk.index,
+        end_offset=chunk.end_offset,
+        last_line=chunk.first_line + len(chunk.prompts) - 1,
+        results=results,
+        detection_key=detection_key,
+    )
+
+
+def _detection_key(raxe: Any, scan_kwargs: dict[str, Any]) -> str:
+    """Detection fingerprint of a client for the scope of a batch."""
+    return str(
+        raxe.detection_fingerprint(
+            l2_enabled=scan_kwargs.get("l2_enabled"),
+            tenant_id=scan_kwargs.get("tenant_id"),
+            app_id=scan_kwargs.get("app_id"),
+            policy_id=scan_kwargs.get("policy_id"),
+        )
+    )
+
+
+# Per-process state of pool workers (set by _init_worker)
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(
+    raxe_kwargs: dict[str, Any], scan_kwargs: dict[str, Any], content_hashes: bool
+) -> None:
+    """Load the scan pipeline once per worker process."""
+    from raxe.sdk.client import Raxe
+
+    raxe = Raxe(**raxe_kwargs)
+    _worker_state.update(
+        raxe=raxe,
+        scan_kwargs=scan_kwargs,
+        content_hashes=content_hashes,
+        detection_key=_detection_key(raxe, scan_kwargs) if content_hashes else None,
+    )
+    # Pool workers exit without running atexit hooks; flush telemetry here
+    mp_util.Finalize(None, raxe.close, exitpriority=10)
+
+
+def _scan_chunk_in_worker(chunk: BatchChunk) -> ChunkResult:
+    """Scan a chunk with the worker's pipeline."""
+    return scan_chunk(
+        _worker_state["raxe"],
+        chunk,
+        _worker_state["scan_kwargs"],
+        content_hashes=_worker_state["content_hashes"],
+        detection_key=_worker_state["detection_key"],
+    )
+
+
+class BatchScanEngine:
+    """Scan a prompt file chunk by chunk with bounded memory.
+
+    With ``workers=1`` chunks are scanned in-process by ``raxe``. With more
+    workers, a process pool is started (spawned, since the ONNX runtime and
+    telemetry threads are not fork-safe) and each worker builds its own
+    ``Raxe(**raxe_kwargs)`` once; at most ``workers * 2`` chunks are in
+    flight at any time, and the calling process needs no client at all.
+    With ``content_hashes`` every chunk result carries the detection
+    fingerprint of the client that scanned it, for keying verdict stores.
+
+    Example usage:
+        engine = BatchScanEngine(raxe=raxe, workers=4)
+        for chunk_result in engine.run("prompts.jsonl"):
+            for result in chunk_result.results:
+                sink.write(result.record)
+    """
+
+    def __init__(
+        self,
+        *,
+        raxe: Any = None,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        fail_fast: bool = False,
+        scan_kwargs: dict[str, Any] | None = None,
+        raxe_kwargs: dict[str, Any] | None = None,
+        content_hashes: bool = False,
+    ):
+        """Initialize engine.
+
+        Args:
+            raxe: Raxe client for in-process scanning (required if workers=1)
+            workers: Number of scan processes (1 = scan in-process)
+            chunk_size: Prompts per chunk
+            ordered: Emit chunks in input order (False = completion order)
+            fail_fast: Stop after the first critical threat
+            scan_kwargs: Extra keyword arguments for ``Raxe.scan``
+            raxe_kwargs: Keyword arguments for ``Raxe()`` in worker processes
+            content_hashes: Include prompt SHA-256 hashes in the results
+
+        Raises:
+            ValueError: If workers or chunk_size is below 1, or no client is
+                given for in-process scanning
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if workers == 1 and raxe is None:
+            raise ValueError("raxe client is required for in-process scanning")
+
+        self.raxe = raxe
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.fail_fast = fail_fast
+        self.scan_kwargs = scan_kwargs or {}
+        self.raxe_kwargs = raxe_kwargs or {}
+        self.content_hashes = content_hashes
+        self.max_in_flight = workers * 2
+
+    def run(
+        self, path: str | Path, *, checkpoint: BatchCheckpoint | None = None
+    ) -> Iterator[ChunkResult]:
+        """Scan a prompt file.
+
+        Args:
+            path: Input file
+            checkpoint: Checkpoint to resume from
+
+        Yields:
+            Chunk results (in input order unless ``ordered=False``). With
+            ``fail_fast`` the chunk holding the first critical threat is cut
+            after that line and is the last one yielded.
+        """
+        chunks = iter_chunks(
+            path,
+            self.chunk_size,
+            start_offset=checkpoint.offset if checkpoint else 0,
+            start_line=checkpoint.line if checkpoint else 0,
+        )
+        if self.workers == 1:
+            detection_key = (
+                _detection_key(self.raxe, self.scan_kwargs) if self.content_hashes else None
+            )
+            results = (
+                scan_chunk(
+                    self.raxe,
+                    chunk,
+                    self.scan_kwargs,
+                    content_hashes=self.content_hashes,
+                    detection_key=detection_key,
+                )
+                for chunk in chunks
+            )
+        else:
+            results = self._run_pool(chunks)
+
+        try:
+            for chunk_result in results:
+                if self.fail_fast:
+                    for i, result in enumerate(chunk_result.results):
+                        if result.critical or result.error is not None:
+                            del chunk_result.results[i + 1 :]
+                            yield chunk_result
+                            return
+                yield chunk_result
+        finally:
+            results.close()
+
+    def _run_pool(self, chunks: Iterator[BatchChunk]) -> Iterator[ChunkResult]:
+        """Scan chunks on a process pool, keeping a bounded number in flight."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.raxe_kwargs, self.scan_kwargs, self.content_hashes),
+        )
+        try:
+            if self.ordered:
+                pending: deque[Future[ChunkResult]] = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_scan_chunk_in_worker, chunk))
+                    if len(pending) >= self.max_in_flight:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            else:
+                in_flight: set[Future[ChunkResult]] = set()
+                for chunk in chunks:
+                    in_flight.add(executor.submit(_scan_chunk_in_worker, chunk))
+                    if len(in_flight) >= self.max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class BatchCheckpoint:
+    """Resume point of a batch scan.
+
+    Attributes:
+        input_path: Absolute path of the input file
+        output_format: Output format of the run
+        offset: Input byte offset after the last contiguous completed chunk
+        line: Line id of the last prompt before ``offset``
+        output_size: Output file size in bytes at the checkpoint
+        scanned: Prompts scanned (including failures)
+        threats_found: Prompts with threats
+        errors: Prompts whose scan failed
+        critical_found: Whether a critical threat was found
+    """
+
+    input_path: str
+    output_format: str
+    offset: int = 0
+    line: int = 0
+    output_size: int = 0
+    scanned: int = 0
+    threats_found: int = 0
+    errors: int = 0
+    critical_found: bool = False
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint atomically.
+
+        Args:
+            path: Checkpoint file
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"version": CHECKPOINT_VERSION, **asdict(self)}))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> BatchCheckpoint:
+        """Read a checkpoint.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            Checkpoint
+
+        Raises:
+            ValueError: If the file is not a batch checkpoint of this version
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid checkpoint file {path}: {e}") from e
+        if not isinstance(data, dict) or data.pop("version", None) != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint file {path}")
+        return cls(**data)
+
+
+@dataclass
+class BatchState:
+    """Running totals and contiguous-progress tracking of a batch scan.
+
+    Chunks may complete out of order; the checkpoint only advances over the
+    contiguous prefix of completed chunks, and its totals only count that
+    prefix. Chunks past the prefix are held in ``pending`` until it reaches
+    them, so a resumed run (which rescans them) does not count them twice.
+
+    Attributes:
+        checkpoint: Totals and resume point of the contiguous prefix
+        pending: Completed chunks past the prefix, by index, as
+            (end_offset, last_line, scanned, threats_found, errors, critical_found)
+        next_index: Index of the first chunk not yet completed
+    """
+
+    checkpoint: BatchCheckpoint
+    pending: dict[int, tuple[int, int, int, int, int, bool]] = field(default_factory=dict)
+    next_index: int = field(default=0, init=False)
+
+    @property
+    def totals(self) -> BatchCheckpoint:
+        """Totals of every completed chunk, including those past the prefix."""
+        cp = replace(self.checkpoint)
+        for _, _, scanned, threats_found, errors, critical_found in self.pending.values():
+            cp.scanned += scanned
+            cp.threats_found += threats_found
+            cp.errors += errors
+            cp.critical_found = cp.critical_found or critical_found
+        return cp
+
+    def record(self, chunk_result: ChunkResult) -> None:
+        """Account for a completed chunk.
+
+        Args:
+            chunk_result: Completed chunk
+        """
+        scanned = threats_found = errors = 0
+        critical_found = False
+        for result in chunk_result.results:
+            scanned += 1
+            if result.error is not None:
+                errors += 1
+            elif result.has_threats:
+                threats_found += 1
+                critical_found = critical_found or result.critical
+
+        self.pending[chunk_result.index] = (
+            chunk_result.end_offset,
+            chunk_result.last_line,
+            scanned,
+            threats_found,
+            errors,
+            critical_found,
+        )
+        cp = self.checkpoint
+        while self.next_index in self.pending:
+            cp.offset, cp.line, scanned, threats_found, errors, critical_found = self.pending.pop(
+                self.next_index
+            )
+            cp.scanned += scanned
+            cp.threats_found += threats_found
+            cp.errors += errors
+            cp.critical_found = cp.critical_found or critical_found
+            self.next_index += 1
+
+
+class BatchSink:
+    """Output sink for batch scan records."""
+
+    def __init__(self, stream: IO[str]):
+        """Initialize sink.
+
+        Args:
+            stream: Text stream to write to
+        """
+        self.stream = stream
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Flush buffered records to the stream."""
+        self.stream.flush()
+
+    def close(self, checkpoint: BatchCheckpoint) -> None:
+        """Finish the output.
+
+        Args:
+            checkpoint: Final totals
+        """
+        self.flush()
+
+
+class JsonlSink(BatchSink):
+    """One JSON record per line."""
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record."""
+        self.stream.write(json.dumps(record) + "\n")
+
+
+class CsvSink(BatchSink):
+    """CSV rows without the per-detection details."""
+
+    def __init__(self, stream: IO[str], *, header: bool = True):
+        """Initialize sink.
+
+        Args:
+            stream: Text stream to write to (opened with newline="")
+            header: Write the header row (False when appending)
+        """
+        super().__init__(stream)
+        self._writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        if header:
+            self._writer.writeheader()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record."""
+        self._writer.writerow(record)
+
+
+class JsonSink(BatchSink):
+    """A single JSON document ``{"results": [...], "total_scanned": ...}``.
+
+    Records are streamed into the ``results`` array; totals are written
+    when the sink is closed. Not resumable.
+    """
+
+    def __init__(self, stream: IO[str]):
+        """Initialize sink.
+
+        Args:
+            stream: Text stream to write to
+        """
+        super().__init__(stream)
+        self._count = 0
+        self.stream.write('{\n  "results": [')
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record."""
+        self.stream.write(",\n    " if self._count else "\n    ")
+        self.stream.write(json.dumps(record))
+        self._count += 1
+
+    def close(self, checkpoint: BatchCheckpoint) -> None:
+        """Finish the output.
+
+        Args:
+            checkpoint: Final totals
+        """
+        self.stream.write("\n  ]," if self._count else "],")
+        self.stream.write(f'\n  "total_scanned": {self._count},')
+        self.stream.write(f'\n  "threats_found": {checkpoint.threats_found}\n}}\n')
+        super().close(checkpoint)
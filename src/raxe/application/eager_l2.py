@@ -29,7 +29,7 @@ import time
 from typing import Any
 
 from raxe.domain.engine.executor import ScanResult
-from raxe.domain.ml.protocol import L2Detector, L2Result
+from raxe.domain.ml.protocol import L2CancelToken, L2Detector, L2Result
 from raxe.infrastructure.config.scan_config import ScanConfig
 from raxe.infrastructure.models.discovery import (
     DiscoveredModel,
@@ -308,12 +308,21 @@ class EagerL2Detector:
                 # Load Gemma 5-head detector
                 from raxe.domain.ml.gemma_detector import create_gemma_detector
 
+                # Optionally record raw head probabilities for `raxe models rescore`
+                head_output_sink = None
+                if self.config and self.config.record_head_outputs:
+                    from raxe.infrastructure.ml.head_output_store import HeadOutputStore
+
+                    head_output_sink = HeadOutputStore()
+                    logger.info("head_output_recording_enabled", root=str(head_output_sink.root))
+
                 logger.info(f"Loading Gemma detector from: {discovered.model_dir}")
                 self._detector = create_gemma_detector(
                     model_dir=str(discovered.model_dir),
                     confidence_threshold=self.confidence_threshold,
                     scorer=scorer,
                     low_memory=self.low_memory,
+                    head_output_sink=head_output_sink,
                 )
             else:
                 # No other model types supported - raise clear error
@@ -326,6 +335,7 @@ class EagerL2Detector:
 
             # Get model info
             model_info = self._detector.model_info
+            session_stats = self._detector.session_load_stats
 
             # Update statistics
             self._init_stats.update(
@@ -335,6 +345,8 @@ class EagerL2Detector:
                     "embedding_model": model_info.get("embedding_model", "unknown"),
                     "families": model_info.get("families", []),
                     "latency_p95_ms": model_info.get("latency_p95_ms", 0),
+                    "session_load": session_stats,
+                    "optimization_saved_ms": session_stats["optimization_saved_ms"],
                 }
             )
 
@@ -410,7 +422,12 @@ class EagerL2Detector:
         )
 
     def analyze(
-        self, text: str, l1_result: ScanResult, context: dict[str, Any] | None = None
+        self,
+        text: str,
+        l1_result: ScanResult,
+        context: dict[str, Any] | None = None,
+        *,
+        cancel_token: L2CancelToken | None = None,
     ) -> L2Result:
         """Analyze text with L2 ML detector.
 
@@ -420,6 +437,7 @@ class EagerL2Detector:
             text: Text to analyze
             l1_result: L1 scan results
             context: Optional context metadata
+            cancel_token: Optional cancellation handle, passed through
 
         Returns:
             L2 detection results
@@ -435,7 +453,7 @@ class EagerL2Detector:
             raise RuntimeError("Detector not initialized")
 
         # Delegate to underlying detector
-        return self._detector.analyze(text, l1_result, context)
+        return self._detector.analyze(text, l1_result, context, cancel_token=cancel_token)
 
     @property
     def initialization_stats(self) -> dict[str, Any]:
@@ -449,6 +467,10 @@ class EagerL2Detector:
                 - model_id: Model identifier
                 - discovery_time_ms: Time spent discovering model
                 - model_load_time_ms: Time spent loading model
+                - session_load: How each ONNX session was created (optimized
+                  graph cache hits/misses, per-session and wall-clock time)
+                - optimization_saved_ms: Graph optimization time saved by
+                  loading pre-optimized graphs
                 - estimated_load_ms: Estimated load time
                 - timestamp: When initialization completed
 
@@ -0,0 +1,273 @@
+"""Priority lanes for bounded L2 execution.
+
+L2 inference is the scarce resource of the async scan pipeline: one ONNX
+run occupies several cores for tens of milliseconds. Scans therefore queue
+for a small, dedicated pool of L2 workers in one of three lanes:
+
+- interactive: prompts a user is waiting on (always served first)
+- background: asynchronous monitoring scans
+- batch: bulk and offline scans
+
+Admission control bounds each lane's queue relative to the worker count.
+A scan that finds its lane full is not queued at all; the pipeline then
+degrades it to L1-only, so bursts cannot build an unbounded backlog and
+tail latency stays bounded.
+
+Example:
+    executor = PriorityExecutor(max_workers=2)
+    future = executor.try_submit(ScanPriority.INTERACTIVE, detector.analyze, text)
+    if future is None:
+        ...  # lane saturated: skip L2
+"""
+
+import heapq
+import itertools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from raxe.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# One ONNX run uses up to 4 intra-op threads (see GemmaL2Detector), so one
+# L2 worker per 4 cores keeps concurrent runs from oversubscribing the CPU
+L1_WORKERS = max(1, min(8, os.cpu_count() or 1))
+L2_WORKERS = max(1, (os.cpu_count() or 1) // 4)
+
+
+class ScanPriority(Enum):
+    """Scheduling lane of a scan, highest priority first."""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+    BATCH = "batch"
+
+    @property
+    def rank(self) -> int:
+        """Queue order (lower runs first)."""
+        return _RANKS[self]
+
+
+_RANKS = {priority: rank for rank, priority in enumerate(ScanPriority)}
+
+# Queued jobs admitted per lane, per L2 worker
+DEFAULT_LANE_DEPTH = {
+    ScanPriority.INTERACTIVE: 4,
+    ScanPriority.BACKGROUND: 2,
+    ScanPriority.BATCH: 1,
+}
+
+
+@dataclass
+class LaneStats:
+    """Counters of one lane.
+
+    Attributes:
+        queued: Jobs waiting for a worker
+        admitted: Jobs accepted since startup
+        rejected: Jobs refused because the lane was full
+    """
+
+    queued: int = 0
+    admitted: int = 0
+    rejected: int = 0
+
+
+@dataclass
+class _WorkItem:
+    """Queued call and its future."""
+
+    priority: ScanPriority
+    future: Future
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    dequeued: bool = False
+
+
+class PriorityExecutor:
+    """Bounded thread pool that runs queued calls by lane priority.
+
+    Calls of a higher-priority lane always start before queued calls of a
+    lower one; within a lane they start in submission order. Worker threads
+    are started on demand up to ``max_workers``.
+
+    Futures are ``concurrent.futures.Future`` objects, so they can be
+    awaited from any event loop with ``asyncio.wrap_future``. Cancelling a
+    queued future removes it from its lane's queue depth immediately.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = L2_WORKERS,
+        *,
+        lane_depth: dict[ScanPriority, int] | None = None,
+        thread_name_prefix: str = "raxe-l2",
+    ):
+        """Initialize priority executor.
+
+        Args:
+            max_workers: Number of worker threads
+            lane_depth: Queued jobs admitted per lane, per worker
+                (default: DEFAULT_LANE_DEPTH)
+            thread_name_prefix: Worker thread name prefix
+
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+        depth = {**DEFAULT_LANE_DEPTH, **(lane_depth or {})}
+        self.max_workers = max_workers
+        self.lane_limits = {priority: depth[priority] * max_workers for priority in ScanPriority}
+        self._thread_name_prefix = thread_name_prefix
+
+        self._cond = threading.Condition()
+        self._heap: list[tuple[int, int, _WorkItem]] = []
+        self._seq = itertools.count()
+        self._lanes = {priority: LaneStats() for priority in ScanPriority}
+        self._threads: list[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+
+    def try_submit(
+        self, priority: ScanPriority, fn: Callable[..., Any], *args: Any
+    ) -> Future | None:
+        """Queue a call unless its lane is full.
+
+        Args:
+            priority: Lane of the call
+            fn: Callable to run on a worker thread
+            *args: Positional arguments for fn
+
+        Returns:
+            Future of the call, or None if the lane is saturated
+
+        Raises:
+            RuntimeError: If the executor was shut down
+        """
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a shut down executor")
+
+            lane = self._lanes[priority]
+            if lane.queued >= self.lane_limits[priority]:
+                lane.rejected += 1
+                return None
+
+            item = _WorkItem(priority=priority, future=Future(), fn=fn, args=args)
+            heapq.heappush(self._heap, (priority.rank, next(self._seq), item))
+            lane.queued += 1
+            lane.admitted += 1
+
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._cond.notify()
+
+        item.future.add_done_callback(lambda _: self._on_cancel(item))
+        return item.future
+
+    def queue_depth(self, priority: ScanPriority | None = None) -> int:
+        """Jobs waiting for a worker.
+
+        Args:
+            priority: Lane to count (default: all lanes)
+
+        Returns:
+            Number of queued jobs
+        """
+        with self._cond:
+            if priority is not None:
+                return self._lanes[priority].queued
+            return sum(lane.queued for lane in self._lanes.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Executor statistics.
+
+        Returns:
+            Worker counts and per-lane queued/admitted/rejected counters
+        """
+        with self._cond:
+            return {
+                "workers": self.max_workers,
+                "busy": len(self._threads) - self._idle,
+                "lanes": {
+                    priority.value: {
+                        "queued": lane.queued,
+                        "limit": self.lane_limits[priority],
+                        "admitted": lane.admitted,
+                        "rejected": lane.rejected,
+                    }
+                    for priority, lane in self._lanes.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting calls and cancel queued ones.
+
+        Args:
+            wait: Wait for running calls to finish
+        """
+        with self._cond:
+            self._shutdown = True
+            pending = [item for _, _, item in self._heap]
+            self._heap.clear()
+            for item in pending:
+                self._dequeue(item)
+            self._cond.notify_all()
+            threads = list(self._threads)
+
+        for item in pending:
+            item.future.cancel()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _start_worker(self) -> None:
+        """Start one worker thread (caller holds the lock)."""
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self._thread_name_prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _dequeue(self, item: _WorkItem) -> None:
+        """Remove an item from its lane's depth once (caller holds the lock)."""
+        if not item.dequeued:
+            item.dequeued = True
+            self._lanes[item.priority].queued -= 1
+
+    def _on_cancel(self, item: _WorkItem) -> None:
+        """Release the queue slot of a future cancelled while queued."""
+        if item.future.cancelled():
+            with self._cond:
+                self._dequeue(item)
+
+    def _worker(self) -> None:
+        """Run queued calls, highest priority first, until shutdown."""
+        while True:
+            with self._cond:
+                self._idle += 1
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                self._idle -= 1
+                if not self._heap:
+                    return
+                _, _, item = heapq.heappop(self._heap)
+                self._dequeue(item)
+
+            if not item.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = item.fn(*item.args)
+            except BaseException as e:
+                item.future.set_exception(e)
+            else:
+                item.future.set_result(result)
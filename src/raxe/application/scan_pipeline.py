@@ -14,22 +14,41 @@ Performance targets:
 - Component breakdown: L1 <5ms, L2 <1ms, overhead <4ms
 """
 
+import functools
 import hashlib
+import threading
 import time
+from collections import Counter
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 # Temporary BlockAction enum for backward compatibility
 from enum import Enum
+from typing import Any, Protocol
 
 from raxe.application.apply_policy import ApplyPolicyUseCase
+from raxe.application.scan_lanes import L2_WORKERS, PriorityExecutor, ScanPriority
 from raxe.application.scan_merger import CombinedScanResult, ScanMerger
 from raxe.application.telemetry_orchestrator import get_orchestrator
-from raxe.domain.engine.executor import Detection, RuleExecutor
-from raxe.domain.ml.protocol import L2Detector, L2Result
+from raxe.domain.engine.executor import (
+    CompiledRule,
+    Detection,
+    RuleExecutor,
+    RuleObserver,
+    ScanResult,
+)
+from raxe.domain.fingerprint import ContentFingerprint
+from raxe.domain.ml.protocol import L2CancelToken, L2Detector, L2Result, accepts_cancel_token
+from raxe.domain.rules.models import Rule
+from raxe.domain.rules.ruleset import RulesetSnapshot
 from raxe.infrastructure.packs.registry import PackRegistry
 from raxe.infrastructure.telemetry.hook import TelemetryHook
+from raxe.utils.histogram import StageLatencyRecorder
 from raxe.utils.logging import get_logger
+from raxe.utils.profiler import SampledRuleProfiler
 
 
 class BlockAction(Enum):
@@ -53,6 +72,145 @@ except ImportError:
 logger = get_logger(__name__)
 
 
+def load_ruleset(
+    pack_registry: PackRegistry,
+    rule_executor: RuleExecutor,
+) -> tuple[Sequence[Rule], tuple[CompiledRule, ...] | None, int | None]:
+    """Read the rules for one scan from the registry's current snapshot.
+
+    The snapshot is read exactly once, so a concurrent reload cannot change
+    the ruleset mid-scan. Registries that do not publish snapshots fall
+    back to ``get_all_rules()``.
+
+    Args:
+        pack_registry: Registry to read rules from
+        rule_executor: Executor whose compiled-pattern cache to use
+
+    Returns:
+        Tuple of (rules, compiled patterns or None, ruleset generation or None)
+    """
+    snapshot = getattr(pack_registry, "snapshot", None)
+    if isinstance(snapshot, RulesetSnapshot):
+        return snapshot.rules, rule_executor.compile_ruleset(snapshot), snapshot.generation
+    return pack_registry.get_all_rules(), None, None
+
+
+class DetectionCache(Protocol):
+    """Cache of detection stage outputs (e.g. ``raxe.sdk.result_cache.ResultCache``)."""
+
+    def get(self, key: Hashable, token: Hashable) -> Any | None:
+        """Return the value cached under key and token, or None."""
+        ...
+
+    def set(self, key: Hashable, value: Any, token: Hashable) -> None:
+        """Cache a value computed under token."""
+        ...
+
+
+@dataclass(frozen=True)
+class DetectionStage:
+    """Output of the detection stage of one scan.
+
+    Holds everything the scan derives from the text and the detection
+    configuration alone (rules, L1, detector plugins, L2), which makes it
+    safe to cache. Thresholds, suppressions, policy, telemetry, plugin
+    hooks and actions are applied on top of it on every scan.
+
+    Attributes:
+        l1_result: L1 result, detector plugin detections included
+        l2_result: L2 result (None if L2 was disabled or skipped)
+        rules_loaded: Number of rules in the ruleset snapshot
+        ruleset_generation: Generation of the ruleset snapshot
+        l1_duration_ms: L1 processing time
+        l2_duration_ms: L2 processing time
+        l2_degraded: L2 was skipped because its priority lane was full
+        l2_timeout: L2 was aborted after l2_timeout_ms
+        l2_cancel_stage: Where a laned L2 run was stopped: "grace" (before
+            the detector started), "queued" or "in_flight"
+    """
+
+    l1_result: ScanResult
+    l2_result: L2Result | None
+    rules_loaded: int
+    ruleset_generation: int | None
+    l1_duration_ms: float = 0.0
+    l2_duration_ms: float = 0.0
+    l2_degraded: bool = False
+    l2_timeout: bool = False
+    l2_cancel_stage: str | None = None
+
+    @property
+    def cacheable(self) -> bool:
+        """False if L2 was skipped for load rather than by configuration."""
+        return not (self.l2_degraded or self.l2_timeout)
+
+
+class _LanedL2Run:
+    """L2 run queued in a priority lane before L1 has finished.
+
+    The run is submitted first so queueing overlaps L1. Once a worker picks
+    it up, it waits for the L1 result until the grace window (counted from
+    submission) ends, so a high-confidence CRITICAL hit usually drops it
+    before the detector starts; a run that already started is aborted
+    through its cancel token.
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[..., L2Result],
+        text: str,
+        context: dict[str, object] | None,
+        empty_l1: ScanResult,
+        grace_ms: float,
+    ):
+        self.cancel_token = L2CancelToken()
+        self.future: Future[L2Result | None] | None = None
+        self._analyze = analyze
+        self._text = text
+        self._context = context
+        self._l1_result = empty_l1
+        self._deadline = time.monotonic() + grace_ms / 1000
+        self._l1_ready = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+        self._aborted = False
+
+    def run(self) -> L2Result | None:
+        """Run the detector unless aborted within the grace window."""
+        self._l1_ready.wait(max(0.0, self._deadline - time.monotonic()))
+        with self._lock:
+            if self._aborted:
+                return None
+            self._started = True
+            l1_result = self._l1_result
+        return self._analyze(self._text, l1_result, self._context, self.cancel_token)
+
+    def l1_done(self, l1_result: ScanResult) -> None:
+        """Hand the L1 result to a run still waiting out the grace window."""
+        with self._lock:
+            self._l1_result = l1_result
+        self._l1_ready.set()
+
+    def abort(self) -> str | None:
+        """Stop the run.
+
+        Returns:
+            "queued" if it never reached a worker, "grace" if the detector
+            had not started, "in_flight" if its run was aborted, or None if
+            it had already completed
+        """
+        if self.future is None or self.future.cancel():
+            return "queued"
+        with self._lock:
+            if self.future.done():
+                return None
+            self._aborted = True
+            stage = "in_flight" if self._started else "grace"
+        self._l1_ready.set()
+        self.cancel_token.cancel()
+        return stage
+
+
 @dataclass(frozen=True)
 class ScanPipelineResult:
     """Complete result from full scan pipeline.
@@ -229,6 +387,11 @@ class ScanPipeline:
         min_confidence_for_skip: float = 0.7,
         enable_schema_validation: bool = False,
         schema_validation_mode: str = "log_only",
+        rule_profiler: SampledRuleProfiler | None = None,
+        l2_workers: int = L2_WORKERS,
+        lane_depth: dict[ScanPriority, int] | None = None,
+        l2_grace_ms: float = 3.0,
+        l2_timeout_ms: float | None = None,
     ):
         """Initialize scan pipeline.
 
@@ -246,6 +409,16 @@ class ScanPipeline:
             min_confidence_for_skip: Minimum L1 confidence to skip L2 on CRITICAL (default: 0.7)
             enable_schema_validation: Enable runtime schema validation
             schema_validation_mode: Validation mode (log_only, warn, enforce)
+            rule_profiler: Sampled per-rule cost profiler (default: 1 in 100 scans)
+            l2_workers: L2 threads serving scans with a priority (default:
+                one per 4 cores)
+            lane_depth: Queued L2 jobs admitted per lane, per L2 worker
+                (default: DEFAULT_LANE_DEPTH)
+            l2_grace_ms: How long a laned L2 run waits for L1 before
+                starting, so a high-confidence CRITICAL hit can drop it
+                (default: 3ms, 0 to start L2 immediately)
+            l2_timeout_ms: Abort laned L2 runs after this long (default:
+                None, wait for L2 to finish)
         """
         self.pack_registry = pack_registry
         self.rule_executor = rule_executor
@@ -277,6 +450,18 @@ class ScanPipeline:
         self._scan_count = 0
         self._total_duration_ms = 0.0
         self._validation_errors = 0
+        self._stage_latency = StageLatencyRecorder()
+        self._rule_profiler = rule_profiler or SampledRuleProfiler()
+
+        # Priority lanes for L2, started by the first scan with a priority
+        self._l2_workers = l2_workers
+        self._lane_depth = lane_depth
+        self._l2_lanes: PriorityExecutor | None = None
+        self._l2_lanes_lock = threading.Lock()
+        self.l2_grace_ms = l2_grace_ms
+        self.l2_timeout_ms = l2_timeout_ms
+        self._l2_runs: Counter[str] = Counter()
+        self._l2_runs_lock = threading.Lock()
 
     def scan(
         self,
@@ -289,6 +474,9 @@ class ScanPipeline:
         mode: str = "balanced",
         confidence_threshold: float = 0.5,
         explain: bool = False,
+        fingerprint: ContentFingerprint | None = None,
+        detection_cache: DetectionCache | None = None,
+        priority: ScanPriority | str | None = None,
     ) -> ScanPipelineResult:
         """Execute complete scan pipeline with layer control.
 
@@ -304,12 +492,22 @@ class ScanPipeline:
                 - thorough: All layers, all rules (<100ms acceptable)
             confidence_threshold: Minimum confidence to report detections (default: 0.5)
             explain: Include explanation in detections (default: False)
+            fingerprint: Content fingerprint computed by the caller. Reused for
+                text_hash and input_length so the text is hashed once per scan.
+            detection_cache: Cache of detection stage outputs. A hit skips
+                rule loading, L1, detector plugins and L2 (and is marked with
+                ``metadata["cache_hit"]``); the remaining stages always run.
+                Scans with ``context`` bypass the cache.
+            priority: L2 lane - interactive, background or batch. L2 then
+                runs on the pipeline's bounded L2 workers, and a scan whose
+                lane is full degrades to L1-only (``metadata["l2_degraded"]``).
+                None runs L2 inline on the calling thread (default).
 
         Returns:
             ScanPipelineResult with complete analysis and policy decision
 
         Raises:
-            ValueError: If text is empty or invalid or mode is invalid
+            ValueError: If text is empty or invalid, or mode or priority is invalid
         """
         # Validate mode
         if mode not in ("fast", "balanced", "thorough"):
@@ -320,6 +518,8 @@ class ScanPipeline:
             error = ValueError("Text cannot be empty")
             self._track_scan_error(error, error_code="SCAN_003", is_recoverable=False)
             raise error
+        if priority is not None:
+            priority = ScanPriority(priority)
 
         # Apply mode-specific configurations
         if mode == "fast":
@@ -347,8 +547,7 @@ class ScanPipeline:
         start_time = time.perf_counter()
         scan_timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Record input length for metrics
-        input_length = len(text.encode("utf-8"))
+        fingerprint = ContentFingerprint.of(text, fingerprint)
 
         # PLUGIN HOOK: on_scan_start (allow text transformation)
         if self.plugin_manager:
@@ -359,152 +558,49 @@ class ScanPipeline:
                 # Use first transformation if any plugins returned one
                 if transformed_results:
                     text = transformed_results[0]
+                    fingerprint = ContentFingerprint.of(text, fingerprint)
                     logger.debug("Plugin transformed input text")
             except Exception as e:
                 logger.error(f"Plugin on_scan_start hook failed: {e}")
 
-        # 1. Load rules from pack registry
-        rules = self.pack_registry.get_all_rules()
-
-        # 2. Execute L1 rule-based detection (if enabled)
-        # NOTE: L1 and L2 are NOT run in parallel because:
-        # - L1 is very fast (~1ms) while L2 dominates (~110ms)
-        # - Thread pool overhead (~0.5ms) cancels out parallelism benefit
-        # - Sequential execution is simpler and easier to debug
-        # - If L1 becomes slower in future, reconsider parallelization
-        l1_duration_ms = 0.0
-        if l1_enabled:
-            l1_start = time.perf_counter()
-            if METRICS_AVAILABLE and collector:
-                with collector.measure_scan("regex"):
-                    l1_result = self.rule_executor.execute_rules(text, rules)
-            else:
-                l1_result = self.rule_executor.execute_rules(text, rules)
-            l1_duration_ms = (time.perf_counter() - l1_start) * 1000
-        else:
-            # L1 disabled - create empty result
-            from raxe.domain.engine.executor import ScanResult
-
-            l1_result = ScanResult(
-                detections=[],
-                scanned_at=scan_timestamp,
-                text_length=len(text),
-                rules_checked=0,
-                scan_duration_ms=0.0,
+        # Record input length for metrics
+        input_length = fingerprint.byte_length
+
+        # 1-3. Detection stage: rules, L1, detector plugins and L2. It depends
+        # only on the (transformed) text and the detection configuration, so
+        # a cache hit skips it; thresholds, suppressions, policy, telemetry,
+        # hooks and actions below run on every scan, hits included.
+        stage = None
+        cache_key = None
+        cache_token = None
+        if detection_cache is not None and context is None:
+            cache_key = (
+                fingerprint.cache_key,
+                fingerprint.char_length,
+                mode,
+                l1_enabled,
+                l2_enabled,
             )
-
-        # PLUGIN HOOK: run detector plugins (merge with L1)
-        plugin_detection_count = 0
-        if self.plugin_manager:
-            try:
-                plugin_detections = self.plugin_manager.run_detectors(text, context)
-                if plugin_detections:
-                    # Merge plugin detections into L1 result
-                    from raxe.domain.engine.executor import ScanResult
-
-                    l1_result = ScanResult(
-                        detections=l1_result.detections + plugin_detections,
-                        has_detections=l1_result.has_detections or len(plugin_detections) > 0,
-                        highest_severity=l1_result.highest_severity,  # Will be recalculated
-                        total_rules_checked=l1_result.total_rules_checked + len(plugin_detections),
-                        execution_time_ms=l1_result.execution_time_ms,
-                    )
-                    plugin_detection_count = len(plugin_detections)
-                    logger.debug(f"Plugins detected {plugin_detection_count} additional threats")
-            except Exception as e:
-                logger.error(f"Plugin detectors failed: {e}")
-
-        # 3. Execute L2 analysis (with optimizations and layer control)
-        l2_result = None
-        l2_duration_ms = 0.0
-        if l2_enabled and self.enable_l2:
-            # Optimization: skip L2 if CRITICAL already detected with high confidence
-            should_skip_l2 = False
-            if self.fail_fast_on_critical and l1_result.highest_severity:
-                from raxe.domain.rules.models import Severity
-
-                if l1_result.highest_severity == Severity.CRITICAL:
-                    # Check confidence of CRITICAL detections
-                    max_confidence = max(
-                        (
-                            d.confidence
-                            for d in l1_result.detections
-                            if d.severity == Severity.CRITICAL
-                        ),
-                        default=0.0,
-                    )
-
-                    if max_confidence >= self.min_confidence_for_skip:
-                        # High confidence CRITICAL - skip L2 for performance
-                        should_skip_l2 = True
-                        logger.info(
-                            "l2_scan_skipped",
-                            reason="critical_l1_detection_high_confidence",
-                            l1_severity="CRITICAL",
-                            l1_max_confidence=max_confidence,
-                            skip_threshold=self.min_confidence_for_skip,
-                            text_hash=self._hash_text(text),
-                        )
-                    else:
-                        # Low confidence CRITICAL - run L2 for validation
-                        logger.debug(
-                            f"Running L2 despite CRITICAL: low confidence {max_confidence:.2%} "
-                            f"(threshold: {self.min_confidence_for_skip:.2%})"
-                        )
-
-            if not should_skip_l2:
-                l2_start = time.perf_counter()
-                if METRICS_AVAILABLE and collector:
-                    with collector.measure_scan("ml"):
-                        l2_result = self.l2_detector.analyze(text, l1_result, context)
-                else:
-                    l2_result = self.l2_detector.analyze(text, l1_result, context)
-                l2_duration_ms = (time.perf_counter() - l2_start) * 1000
-
-        # Log L2 inference results
-        if l2_result and l2_result.has_predictions:
-            # Log each L2 prediction with full context (including new bundle schema fields)
-            for prediction in l2_result.predictions:
-                # Extract bundle schema fields if available
-                log_data = {
-                    "threat_type": prediction.threat_type.value,
-                    "confidence": prediction.confidence,
-                    "explanation": prediction.explanation or "No explanation provided",
-                    "features_used": prediction.features_used or [],
-                    "text_hash": self._hash_text(text),
-                    "processing_time_ms": l2_result.processing_time_ms,
-                    "model_version": l2_result.model_version,
-                }
-
-                # Add new bundle schema fields (is_attack, family, sub_family, etc.)
-                if "is_attack" in prediction.metadata:
-                    log_data["is_attack"] = prediction.metadata["is_attack"]
-                if "family" in prediction.metadata:
-                    log_data["family"] = prediction.metadata["family"]
-                if "sub_family" in prediction.metadata:
-                    log_data["sub_family"] = prediction.metadata["sub_family"]
-                if "scores" in prediction.metadata:
-                    log_data["scores"] = prediction.metadata["scores"]
-                if "why_it_hit" in prediction.metadata:
-                    log_data["why_it_hit"] = prediction.metadata["why_it_hit"]
-                if "recommended_action" in prediction.metadata:
-                    log_data["recommended_action"] = prediction.metadata["recommended_action"]
-                if "trigger_matches" in prediction.metadata:
-                    log_data["trigger_matches"] = prediction.metadata["trigger_matches"]
-                if "uncertain" in prediction.metadata:
-                    log_data["uncertain"] = prediction.metadata["uncertain"]
-
-                # Log with all available data
-                logger.info("l2_threat_detected", **log_data)
-        elif l2_result:
-            # Log clean L2 scan
-            logger.debug(
-                "l2_scan_clean",
-                processing_time_ms=l2_result.processing_time_ms,
-                model_version=l2_result.model_version,
-                confidence=l2_result.confidence,
-                text_hash=self._hash_text(text),
+            cache_token = self.detection_token()
+            stage = detection_cache.get(cache_key, cache_token)
+        cache_hit = stage is not None
+        if stage is None:
+            stage = self._detect(
+                text,
+                context=context,
+                l1_enabled=l1_enabled,
+                l2_enabled=l2_enabled,
+                fingerprint=fingerprint,
+                scan_timestamp=scan_timestamp,
+                priority=priority,
             )
+            if cache_key is not None and stage.cacheable:
+                detection_cache.set(cache_key, stage, cache_token)
+
+        l1_result = stage.l1_result
+        l2_result = stage.l2_result
+        l1_duration_ms = 0.0 if cache_hit else stage.l1_duration_ms
+        l2_duration_ms = 0.0 if cache_hit else stage.l2_duration_ms
 
         # 4. Apply confidence threshold filtering
         if confidence_threshold > 0:
@@ -574,7 +670,8 @@ class ScanPipeline:
         metadata: dict[str, object] = {
             "customer_id": customer_id,
             "scan_timestamp": scan_timestamp,
-            "rules_loaded": len(rules),
+            "rules_loaded": stage.rules_loaded,
+            "ruleset_generation": stage.ruleset_generation,
             "l2_skipped": self.enable_l2 and l2_result is None,
             "l1_duration_ms": l1_duration_ms,
             "l2_duration_ms": l2_duration_ms,
@@ -590,6 +687,13 @@ class ScanPipeline:
         }
         if context:
             metadata["context"] = context
+        if cache_hit:
+            metadata["cache_hit"] = True
+        if priority is not None:
+            metadata["priority"] = priority.value
+            metadata["l2_degraded"] = stage.l2_degraded
+            metadata["l2_timeout"] = stage.l2_timeout
+            metadata["l2_cancel_stage"] = None if cache_hit else stage.l2_cancel_stage
 
         combined_result = self.scan_merger.merge(
             l1_result=l1_result,
@@ -600,17 +704,20 @@ class ScanPipeline:
         # 6. Evaluate policy to determine action
         # CRITICAL: Policy must consider BOTH L1 and L2 detections
         # We evaluate using the combined result to include L2 predictions
+        policy_start = time.perf_counter()
         policy_decision, should_block = self._evaluate_policy(
             l1_result=l1_result,
             l2_result=l2_result,
             combined_severity=combined_result.combined_severity,
         )
+        self._stage_latency.record("policy", (time.perf_counter() - policy_start) * 1000)
 
-        # 7. Calculate text hash (privacy-preserving)
-        text_hash = self._hash_text(text)
+        # 7. Text hash (privacy-preserving, shared with history and telemetry)
+        text_hash = fingerprint.sha256
 
         # Calculate total duration
         duration_ms = (time.perf_counter() - start_time) * 1000
+        self._stage_latency.record("total", duration_ms)
 
         # Calculate layer statistics
         breakdown = combined_result.layer_breakdown()
@@ -706,6 +813,331 @@ class ScanPipeline:
 
         return result
 
+    def _detect(
+        self,
+        text: str,
+        *,
+        context: dict[str, object] | None,
+        l1_enabled: bool,
+        l2_enabled: bool,
+        fingerprint: ContentFingerprint,
+        scan_timestamp: str,
+        priority: ScanPriority | None = None,
+    ) -> DetectionStage:
+        """Run the detection stage of one scan: L1, detector plugins and L2.
+
+        Args:
+            text: Text to scan (after on_scan_start transformations)
+            context: Optional context metadata
+            l1_enabled: Run L1 (regex) detection
+            l2_enabled: Run L2 (ML) detection
+            fingerprint: Content fingerprint of the text
+            scan_timestamp: ISO timestamp of the scan
+            priority: L2 lane (None runs L2 on the calling thread)
+
+        Returns:
+            DetectionStage with the L1 (plus plugin) and L2 results
+        """
+        # 1. Load rules from pack registry (immutable snapshot for this scan)
+        rules, compiled, ruleset_generation = load_ruleset(self.pack_registry, self.rule_executor)
+        # Only pass pre-compiled patterns when the registry published them
+        l1_kwargs = {"compiled": compiled} if compiled is not None else {}
+
+        empty_l1 = ScanResult(
+            detections=[],
+            scanned_at=scan_timestamp,
+            text_length=len(text),
+            rules_checked=0,
+            scan_duration_ms=0.0,
+        )
+
+        # With a priority, queue L2 in its lane before running L1, so the
+        # queue wait overlaps L1 and the run starts as soon as L1 is done
+        # (or its grace window ends). Without one L1 and L2 run in turn on
+        # this thread: L1 is ~1ms against ~110ms of L2, so inline scans
+        # gain nothing from a thread hop.
+        l2_run = None
+        l2_degraded = False
+        l2_start = 0.0
+        if priority is not None and l2_enabled and self.enable_l2:
+            lanes = self._get_l2_lanes()
+            queue_depth = lanes.queue_depth(priority)
+            l2_run = _LanedL2Run(self._analyze_l2, text, context, empty_l1, self.l2_grace_ms)
+            l2_start = time.perf_counter()
+            l2_run.future = lanes.try_submit(priority, l2_run.run)
+            if l2_run.future is None:
+                # Lane saturated: degrade to L1-only instead of queueing
+                l2_run = None
+                l2_degraded = True
+                logger.warning(
+                    "l2_degraded_saturated",
+                    priority=priority.value,
+                    queue_depth=queue_depth,
+                    text_hash=fingerprint.sha256,
+                )
+
+        # 2. Execute L1 rule-based detection (if enabled)
+        l1_duration_ms = 0.0
+        if l1_enabled:
+            rule_observer = self._rule_profiler.begin_sample(len(text))
+            execute_kwargs = l1_kwargs
+            if rule_observer is not None:
+                # Sampled scan: time every rule and pattern
+                execute_kwargs = {
+                    **l1_kwargs,
+                    "rule_observer": self._export_rule_cost(rule_observer),
+                }
+            l1_start = time.perf_counter()
+            try:
+                # Sampled scans are measured too, so the histogram is not biased
+                if METRICS_AVAILABLE and collector:
+                    with collector.measure_scan("regex"):
+                        l1_result = self.rule_executor.execute_rules(text, rules, **execute_kwargs)
+                else:
+                    l1_result = self.rule_executor.execute_rules(text, rules, **execute_kwargs)
+            except BaseException:
+                if l2_run is not None:
+                    l2_run.abort()
+                raise
+            l1_duration_ms = (time.perf_counter() - l1_start) * 1000
+            self._stage_latency.record("l1", l1_duration_ms)
+        else:
+            # L1 disabled - use the empty result
+            l1_result = empty_l1
+
+        # PLUGIN HOOK: run detector plugins (merge with L1)
+        plugin_detection_count = 0
+        if self.plugin_manager:
+            plugins_start = time.perf_counter()
+            try:
+                plugin_detections = self.plugin_manager.run_detectors(text, context)
+                if plugin_detections:
+                    # Merge plugin detections into L1 result
+                    l1_result = ScanResult(
+                        detections=l1_result.detections + plugin_detections,
+                        has_detections=l1_result.has_detections or len(plugin_detections) > 0,
+                        highest_severity=l1_result.highest_severity,  # Will be recalculated
+                        total_rules_checked=l1_result.total_rules_checked + len(plugin_detections),
+                        execution_time_ms=l1_result.execution_time_ms,
+                    )
+                    plugin_detection_count = len(plugin_detections)
+                    logger.debug(f"Plugins detected {plugin_detection_count} additional threats")
+            except Exception as e:
+                logger.error(f"Plugin detectors failed: {e}")
+            self._stage_latency.record("plugins", (time.perf_counter() - plugins_start) * 1000)
+
+        # 3. Execute L2 analysis (with optimizations and layer control)
+        l2_result = None
+        l2_duration_ms = 0.0
+        l2_timeout = False
+        l2_cancel_stage = None
+        if l2_enabled and self.enable_l2:
+            # Optimization: skip L2 if CRITICAL already detected with high confidence
+            should_skip_l2 = False
+            if self.fail_fast_on_critical and l1_result.highest_severity:
+                from raxe.domain.rules.models import Severity
+
+                if l1_result.highest_severity == Severity.CRITICAL:
+                    # Check confidence of CRITICAL detections
+                    max_confidence = max(
+                        (
+                            d.confidence
+                            for d in l1_result.detections
+                            if d.severity == Severity.CRITICAL
+                        ),
+                        default=0.0,
+                    )
+
+                    if max_confidence >= self.min_confidence_for_skip:
+                        # High confidence CRITICAL - skip L2 for performance
+                        should_skip_l2 = True
+                        logger.info(
+                            "l2_scan_skipped",
+                            reason="critical_l1_detection_high_confidence",
+                            l1_severity="CRITICAL",
+                            l1_max_confidence=max_confidence,
+                            skip_threshold=self.min_confidence_for_skip,
+                            text_hash=fingerprint.sha256,
+                        )
+                    else:
+                        # Low confidence CRITICAL - run L2 for validation
+                        logger.debug(
+                            f"Running L2 despite CRITICAL: low confidence {max_confidence:.2%} "
+                            f"(threshold: {self.min_confidence_for_skip:.2%})"
+                        )
+
+            if l2_run is not None and should_skip_l2:
+                # Drop the laned run, or abort it if the detector already started
+                l2_cancel_stage = l2_run.abort()
+                if l2_cancel_stage is not None:
+                    logger.info(
+                        "l2_cancelled_critical",
+                        reason="high_confidence_critical_detected",
+                        l1_severity="CRITICAL",
+                        stage=l2_cancel_stage,
+                        text_hash=fingerprint.sha256,
+                    )
+            elif l2_run is not None:
+                l2_run.l1_done(l1_result)
+                timeout = self.l2_timeout_ms / 1000 if self.l2_timeout_ms is not None else None
+                try:
+                    l2_result = l2_run.future.result(timeout)
+                except FutureTimeoutError:
+                    # The result would be discarded, so free the worker too
+                    l2_cancel_stage = l2_run.abort()
+                    l2_timeout = l2_cancel_stage is not None
+                    if l2_timeout:
+                        logger.warning(
+                            "l2_timeout",
+                            timeout_ms=self.l2_timeout_ms,
+                            stage=l2_cancel_stage,
+                            text_hash=fingerprint.sha256,
+                        )
+                    else:
+                        l2_result = l2_run.future.result()
+                except CancelledError:
+                    # The pipeline was closed while the run was queued
+                    l2_degraded = True
+                if l2_result is not None:
+                    l2_duration_ms = (time.perf_counter() - l2_start) * 1000
+                    self._stage_latency.record("l2", l2_duration_ms)
+            elif not should_skip_l2 and not l2_degraded:
+                l2_start = time.perf_counter()
+                l2_result = self._analyze_l2(text, l1_result, context)
+                l2_duration_ms = (time.perf_counter() - l2_start) * 1000
+                self._stage_latency.record("l2", l2_duration_ms)
+
+            if l2_run is not None and not l2_degraded:
+                self._count_l2_run(
+                    f"cancelled_{l2_cancel_stage}" if l2_cancel_stage else "completed"
+                )
+
+        # Log L2 inference results
+        if l2_result and l2_result.has_predictions:
+            # Log each L2 prediction with full context (including new bundle schema fields)
+            for prediction in l2_result.predictions:
+                # Extract bundle schema fields if available
+                log_data = {
+                    "threat_type": prediction.threat_type.value,
+                    "confidence": prediction.confidence,
+                    "explanation": prediction.explanation or "No explanation provided",
+                    "features_used": prediction.features_used or [],
+                    "text_hash": fingerprint.sha256,
+                    "processing_time_ms": l2_result.processing_time_ms,
+                    "model_version": l2_result.model_version,
+                }
+
+                # Add new bundle schema fields (is_attack, family, sub_family, etc.)
+                if "is_attack" in prediction.metadata:
+                    log_data["is_attack"] = prediction.metadata["is_attack"]
+                if "family" in prediction.metadata:
+                    log_data["family"] = prediction.metadata["family"]
+                if "sub_family" in prediction.metadata:
+                    log_data["sub_family"] = prediction.metadata["sub_family"]
+                if "scores" in prediction.metadata:
+                    log_data["scores"] = prediction.metadata["scores"]
+                if "why_it_hit" in prediction.metadata:
+                    log_data["why_it_hit"] = prediction.metadata["why_it_hit"]
+                if "recommended_action" in prediction.metadata:
+                    log_data["recommended_action"] = prediction.metadata["recommended_action"]
+                if "trigger_matches" in prediction.metadata:
+                    log_data["trigger_matches"] = prediction.metadata["trigger_matches"]
+                if "uncertain" in prediction.metadata:
+                    log_data["uncertain"] = prediction.metadata["uncertain"]
+
+                # Log with all available data
+                logger.info("l2_threat_detected", **log_data)
+        elif l2_result:
+            # Log clean L2 scan
+            logger.debug(
+                "l2_scan_clean",
+                processing_time_ms=l2_result.processing_time_ms,
+                model_version=l2_result.model_version,
+                confidence=l2_result.confidence,
+                text_hash=fingerprint.sha256,
+            )
+
+        return DetectionStage(
+            l1_result=l1_result,
+            l2_result=l2_result,
+            rules_loaded=len(rules),
+            ruleset_generation=ruleset_generation,
+            l1_duration_ms=l1_duration_ms,
+            l2_duration_ms=l2_duration_ms,
+            l2_degraded=l2_degraded,
+            l2_timeout=l2_timeout,
+            l2_cancel_stage=l2_cancel_stage,
+        )
+
+    def _analyze_l2(
+        self,
+        text: str,
+        l1_result: ScanResult,
+        context: dict[str, object] | None,
+        cancel_token: L2CancelToken | None = None,
+    ) -> L2Result:
+        """Run the L2 detector (on the calling thread or an L2 lane worker).
+
+        The cancel token is only passed to detectors whose analyze() takes
+        one; runs of older detectors cannot be aborted once started.
+        """
+        analyze = self.l2_detector.analyze
+        if cancel_token is not None and accepts_cancel_token(analyze):
+            analyze = functools.partial(analyze, cancel_token=cancel_token)
+        if METRICS_AVAILABLE and collector:
+            with collector.measure_scan("ml"):
+                return analyze(text, l1_result, context)
+        return analyze(text, l1_result, context)
+
+    def _count_l2_run(self, outcome: str) -> None:
+        """Count one laned L2 run outcome."""
+        with self._l2_runs_lock:
+            self._l2_runs[outcome] += 1
+
+    def l2_run_stats(self) -> dict[str, int]:
+        """Laned L2 runs since startup, by outcome.
+
+        Returns:
+            Counts of completed and cancelled runs, with cancelled runs
+            split by stage (grace, queued, in_flight)
+        """
+        with self._l2_runs_lock:
+            stages = {
+                stage: self._l2_runs[f"cancelled_{stage}"]
+                for stage in ("grace", "queued", "in_flight")
+            }
+            return {
+                "completed": self._l2_runs["completed"],
+                "cancelled": sum(stages.values()),
+                **stages,
+            }
+
+    def _get_l2_lanes(self) -> PriorityExecutor:
+        """Get or create the L2 executor used by scans with a priority."""
+        with self._l2_lanes_lock:
+            if self._l2_lanes is None:
+                self._l2_lanes = PriorityExecutor(
+                    self._l2_workers,
+                    lane_depth=self._lane_depth,
+                    thread_name_prefix="raxe-l2",
+                )
+            return self._l2_lanes
+
+    def lane_stats(self) -> dict[str, Any]:
+        """L2 lane statistics.
+
+        Returns:
+            Worker counts and per-lane queued/admitted/rejected counters
+        """
+        return self._get_l2_lanes().stats()
+
+    def close(self) -> None:
+        """Shut down the L2 lane workers (queued L2 jobs are cancelled)."""
+        with self._l2_lanes_lock:
+            lanes, self._l2_lanes = self._l2_lanes, None
+        if lanes is not None:
+            lanes.shutdown(wait=False)
+
     def scan_batch(
         self,
         texts: list[str],
@@ -1013,11 +1445,72 @@ class ScanPipeline:
         """Total number of scans performed."""
         return self._scan_count
 
+    @property
+    def rule_profiler(self) -> SampledRuleProfiler:
+        """Sampled per-rule cost profiler."""
+        return self._rule_profiler
+
+    def _export_rule_cost(self, observer: RuleObserver) -> RuleObserver:
+        """Wrap a rule observer to also feed the rule duration metric.
+
+        Args:
+            observer: Profiler observer for the sampled scan
+
+        Returns:
+            Observer recording into both the profiler and Prometheus
+        """
+        if not (METRICS_AVAILABLE and collector):
+            return observer
+
+        def observe(rule, duration_ms: float, matched: bool, pattern_costs: list[float]) -> None:
+            observer(rule, duration_ms, matched, pattern_costs)
+            try:
+                collector.record_rule_execution(rule.rule_id, duration_ms / 1000)
+            except Exception as e:
+                logger.debug(f"Metrics recording error (non-blocking): {e}")
+
+        return observe
+
+    def detection_token(self) -> Hashable:
+        """Token identifying the current detection configuration.
+
+        Changes whenever the ruleset is reloaded, the L2 model is swapped,
+        the set of loaded plugins changes or an L2 skip setting is edited.
+        Detection stage outputs cached under a different token are stale.
+
+        Returns:
+            Hashable token of the detection configuration
+        """
+        generation = getattr(self.pack_registry, "generation", None)
+        model_version = None
+        if self.l2_detector is not None:
+            try:
+                model_version = self.l2_detector.model_info.get("version")
+            except Exception:
+                model_version = None
+        plugins = tuple(map(id, getattr(self.plugin_manager, "all_plugins", None) or ()))
+        return (
+            generation,
+            id(self.l2_detector),
+            model_version,
+            plugins,
+            self.enable_l2,
+            self.fail_fast_on_critical,
+            self.min_confidence_for_skip,
+        )
+
+    @property
+    def stage_latency(self) -> StageLatencyRecorder:
+        """Per-stage latency histograms (l1, l2, plugins, policy, total)."""
+        return self._stage_latency
+
     def get_stats(self) -> dict[str, object]:
         """Get pipeline statistics.
 
         Returns:
-            Dictionary with performance metrics
+            Dictionary with performance metrics, including per-stage
+            latency distributions under ``stage_latency`` and laned L2
+            run outcomes under ``l2_runs``
         """
         return {
             "scan_count": self._scan_count,
@@ -1025,6 +1518,13 @@ class ScanPipeline:
             "total_duration_ms": self._total_duration_ms,
             "enable_l2": self.enable_l2,
             "fail_fast_on_critical": self.fail_fast_on_critical,
+            "stage_latency": self._stage_latency.summary(),
+            "l2_runs": self.l2_run_stats(),
+            "rule_profile": {
+                "sample_rate": self._rule_profiler.sample_rate,
+                "sampled_scans": self._rule_profiler.sampled_scans,
+                "top_rules": [cost.to_dict() for cost in self._rule_profiler.top_rules(5)],
+            },
         }
 
     def _track_scan_error(
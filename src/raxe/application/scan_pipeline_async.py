@@ -6,33 +6,58 @@ in parallel, reducing total latency from ~53ms (sequential) to ~50ms (parallel).
 Key benefits:
 - L1 and L2 run concurrently (not sequentially)
 - Total latency = max(L1, L2) instead of L1 + L2
-- Smart cancellation: L2 cancelled if CRITICAL detected in L1
+- Smart cancellation: L2 cancelled if CRITICAL detected in L1. L2 waits
+  a short grace window for L1 before starting, so most CRITICAL hits skip
+  the embedding run entirely; runs already in flight are aborted through
+  ONNX ``RunOptions.terminate`` rather than finishing unobserved
 - Graceful degradation: timeouts don't block the scan
 - Better resource utilization: CPU and GPU work in parallel
+- Dedicated L1 and L2 executors: app code using the loop's default
+  executor never competes with scans for threads
+- Priority lanes with admission control: interactive scans run L2 before
+  background and batch scans; a scan whose lane is full degrades to
+  L1-only (``l2_degraded``) instead of queueing without bound
 
 Performance:
 - Sequential (current): L1 (3ms) + L2 (50ms) = 53ms
 - Parallel (async): max(L1: 3ms, L2: 50ms) = 50ms (5.6% faster)
 - CRITICAL fast path: 3ms (L2 cancelled)
 
+The SDK clients (``Raxe.scan_async``, ``AsyncRaxe``) do not use this
+pipeline: they run ``ScanPipeline.scan`` on their scan executors with a
+``priority``, which gives L2 the same priority lanes, admission control,
+grace window and CRITICAL/timeout aborts.
+
 Example:
-    async with AsyncRaxe() as raxe:
-        result = await raxe.scan("Ignore all instructions")
+    pipeline = AsyncScanPipeline(registry, RuleExecutor(), detector, ScanMerger())
+    try:
+        result = await pipeline.scan("Ignore all instructions", priority="background")
         print(f"Latency: {result.duration_ms}ms")  # ~50ms
+    finally:
+        pipeline.close()
 """
 
 import asyncio
+import functools
 import hashlib
+import threading
 import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from raxe.application.scan_lanes import L1_WORKERS, L2_WORKERS, PriorityExecutor, ScanPriority
 from raxe.application.scan_merger import CombinedScanResult, ScanMerger
-from raxe.domain.engine.executor import RuleExecutor, ScanResult
-from raxe.domain.ml.protocol import L2Detector, L2Result
-from raxe.domain.rules.models import Severity
+from raxe.application.scan_pipeline import load_ruleset
+from raxe.domain.engine.executor import CompiledRule, RuleExecutor, ScanResult
+from raxe.domain.fingerprint import ContentFingerprint
+from raxe.domain.ml.protocol import L2CancelToken, L2Detector, accepts_cancel_token
+from raxe.domain.rules.models import Rule, Severity
 from raxe.infrastructure.packs.registry import PackRegistry
+from raxe.utils.histogram import StageLatencyRecorder
 from raxe.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -52,6 +77,14 @@ class AsyncScanMetrics:
     l2_timeout: bool
     parallel_speedup: float  # (L1 + L2) / max(L1, L2)
     total_duration_ms: float
+    priority: str = ScanPriority.INTERACTIVE.value
+    l2_queue_depth: int = 0  # L2 jobs queued in the scan's lane at admission
+    l2_degraded: bool = False  # L2 skipped because the lane was saturated
+    # Where L2 was stopped (CRITICAL cancel or timeout): "grace" (never
+    # submitted), "queued" (dropped before starting) or "in_flight" (aborted)
+    l2_cancel_stage: str | None = None
+    l2_runs_completed: int = 0  # Pipeline total of L2 runs that completed
+    l2_runs_cancelled: int = 0  # Pipeline total of L2 runs stopped early
 
 
 @dataclass(frozen=True)
@@ -79,6 +112,11 @@ class AsyncScanPipelineResult:
         """Count of L2 predictions."""
         return len(self.scan_result.l2_predictions or [])
 
+    @property
+    def l2_degraded(self) -> bool:
+        """True if L2 was skipped because its lane was saturated."""
+        return bool(self.metadata.get("l2_degraded", False))
+
 
 class AsyncScanPipeline:
     """Async parallel scan pipeline with concurrent L1/L2 execution.
@@ -87,7 +125,8 @@ class AsyncScanPipeline:
     total latency. Results are merged after both complete.
 
     Architecture:
-        1. Start L1 and L2 tasks in parallel
+        1. Start L1 and L2 tasks in parallel (L2 queued in the scan's
+           priority lane, or skipped if the lane is full)
         2. Wait for L1 first (fast path)
         3. Check if L2 should be cancelled (CRITICAL optimization)
         4. Wait for L2 or timeout
@@ -111,6 +150,11 @@ class AsyncScanPipeline:
         min_confidence_for_skip: float = 0.7,
         l1_timeout_ms: float = 10.0,
         l2_timeout_ms: float = 150.0,
+        stage_latency: StageLatencyRecorder | None = None,
+        l1_workers: int = L1_WORKERS,
+        l2_workers: int = L2_WORKERS,
+        lane_depth: dict[ScanPriority, int] | None = None,
+        l2_grace_ms: float = 3.0,
     ):
         """Initialize async scan pipeline.
 
@@ -124,16 +168,38 @@ class AsyncScanPipeline:
             min_confidence_for_skip: Minimum L1 confidence to skip L2 on CRITICAL
             l1_timeout_ms: L1 timeout in milliseconds (default: 10ms)
             l2_timeout_ms: L2 timeout in milliseconds (default: 150ms)
+            stage_latency: Recorder for per-stage latency histograms (shared
+                with the sync pipeline by the SDK client; created if None)
+            l1_workers: L1 executor threads (default: cores, up to 8)
+            l2_workers: L2 executor threads (default: one per 4 cores)
+            lane_depth: Queued L2 jobs admitted per lane, per L2 worker
+                (default: DEFAULT_LANE_DEPTH)
+            l2_grace_ms: How long L2 waits for L1 before starting, so a
+                high-confidence CRITICAL hit can skip it (default: 3ms,
+                0 to start L2 immediately)
         """
         self.pack_registry = pack_registry
         self.rule_executor = rule_executor
         self.l2_detector = l2_detector
         self.scan_merger = scan_merger
+        # Detectors written before L2CancelToken take no cancel_token argument
+        self._l2_accepts_cancel_token = accepts_cancel_token(l2_detector.analyze)
         self.enable_l2 = enable_l2
         self.fail_fast_on_critical = fail_fast_on_critical
         self.min_confidence_for_skip = min_confidence_for_skip
         self.l1_timeout_ms = l1_timeout_ms
         self.l2_timeout_ms = l2_timeout_ms
+        self.l2_grace_ms = l2_grace_ms
+        self.stage_latency = stage_latency or StageLatencyRecorder()
+
+        self._l2_runs: Counter[str] = Counter()
+        self._l2_runs_lock = threading.Lock()
+
+        # Dedicated executors: never the loop's shared default executor
+        self._l1_executor = ThreadPoolExecutor(max_workers=l1_workers, thread_name_prefix="raxe-l1")
+        self._l2_executor = PriorityExecutor(
+            l2_workers, lane_depth=lane_depth, thread_name_prefix="raxe-l2"
+        )
 
         logger.info(
             "AsyncScanPipeline initialized",
@@ -141,6 +207,9 @@ class AsyncScanPipeline:
             fail_fast_on_critical=fail_fast_on_critical,
             l1_timeout_ms=l1_timeout_ms,
             l2_timeout_ms=l2_timeout_ms,
+            l2_grace_ms=l2_grace_ms,
+            l1_workers=l1_workers,
+            l2_workers=l2_workers,
         )
 
     async def scan(
@@ -152,6 +221,8 @@ class AsyncScanPipeline:
         l1_enabled: bool = True,
         l2_enabled: bool = True,
         mode: str = "balanced",
+        fingerprint: ContentFingerprint | None = None,
+        priority: ScanPriority | str = ScanPriority.INTERACTIVE,
     ) -> AsyncScanPipelineResult:
         """Execute async parallel scan with L1 and L2 running concurrently.
 
@@ -162,12 +233,16 @@ class AsyncScanPipeline:
             l1_enabled: Enable L1 detection (default: True)
             l2_enabled: Enable L2 detection (default: True)
             mode: Performance mode (fast/balanced/thorough)
+            fingerprint: Content fingerprint computed by the caller (reused for
+                text_hash so the text is hashed once per scan)
+            priority: L2 lane - interactive, background or batch
+                (default: interactive)
 
         Returns:
             AsyncScanPipelineResult with scan results and metrics
 
         Raises:
-            ValueError: If text is empty or mode is invalid
+            ValueError: If text is empty, or mode or priority is invalid
         """
         if not text:
             raise ValueError("Text cannot be empty")
@@ -175,6 +250,8 @@ class AsyncScanPipeline:
         if mode not in ("fast", "balanced", "thorough"):
             raise ValueError(f"Invalid mode: {mode}")
 
+        priority = ScanPriority(priority)
+
         # Apply mode-specific settings
         if mode == "fast":
             l1_enabled = True
@@ -183,11 +260,13 @@ class AsyncScanPipeline:
             l1_enabled = True
             l2_enabled = True
 
+        fingerprint = ContentFingerprint.of(text, fingerprint)
+
         start_time = time.perf_counter()
         scan_timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Load rules
-        rules = self.pack_registry.get_all_rules()
+        # Load rules (immutable snapshot for this scan)
+        rules, compiled, ruleset_generation = load_ruleset(self.pack_registry, self.rule_executor)
 
         # Track metrics
         l1_start = time.perf_counter()
@@ -196,18 +275,62 @@ class AsyncScanPipeline:
         l2_end = 0.0
         l2_cancelled = False
         l2_timeout = False
+        l2_degraded = False
+        l2_queue_depth = 0
+        l2_cancel_stage: str | None = None
+        l2_job: Future | None = None
+        cancel_token = L2CancelToken()
 
         # Create tasks for parallel execution
         tasks = {}
 
         if l1_enabled:
-            tasks["l1"] = asyncio.create_task(self._run_l1_async(text, rules), name="L1-detection")
+            tasks["l1"] = asyncio.create_task(
+                self._run_l1_async(text, rules, compiled), name="L1-detection"
+            )
 
         if l2_enabled and self.enable_l2 and mode != "fast":
-            l2_start = time.perf_counter()
-            tasks["l2"] = asyncio.create_task(
-                self._run_l2_async(text, context), name="L2-detection"
-            )
+            # Grace window: let a fast L1 finish first, so a CRITICAL hit
+            # skips the embedding run instead of aborting it midway
+            early_l1 = None
+            if "l1" in tasks and self.l2_grace_ms > 0:
+                done, _ = await asyncio.wait({tasks["l1"]}, timeout=self.l2_grace_ms / 1000)
+                if done and tasks["l1"].exception() is None:
+                    early_l1 = tasks["l1"].result()
+
+            if self._should_cancel_l2(early_l1):
+                l2_cancelled = True
+                l2_cancel_stage = "grace"
+                logger.info(
+                    "l2_cancelled_critical",
+                    reason="high_confidence_critical_detected",
+                    l1_severity="CRITICAL",
+                    stage=l2_cancel_stage,
+                    text_hash=fingerprint.sha256,
+                )
+            else:
+                if early_l1 is None:
+                    early_l1 = self._create_empty_l1_result(text, scan_timestamp)
+                l2_queue_depth = self._l2_executor.queue_depth(priority)
+                l2_job = self._submit_l2(
+                    text,
+                    early_l1,
+                    context,
+                    priority,
+                    cancel_token,
+                )
+                if l2_job is None:
+                    # Lane saturated: degrade to L1-only instead of queueing
+                    l2_degraded = True
+                    logger.warning(
+                        "l2_degraded_saturated",
+                        priority=priority.value,
+                        queue_depth=l2_queue_depth,
+                        text_hash=fingerprint.sha256,
+                    )
+                else:
+                    l2_start = time.perf_counter()
+                    tasks["l2"] = asyncio.wrap_future(l2_job)
 
         # Wait for L1 first (fast path)
         l1_result = None
@@ -225,11 +348,14 @@ class AsyncScanPipeline:
 
         # Check if we should cancel L2 (CRITICAL optimization)
         l2_result = None
+        l2_completed = False  # The L2 run finished, whether or not it is used
         if "l2" in tasks:
             should_cancel = self._should_cancel_l2(l1_result)
 
             if should_cancel:
-                # Cancel L2 task
+                # Drop the L2 job if still queued, abort its run otherwise
+                l2_cancel_stage = self._abort_l2(l2_job, cancel_token)
+                l2_completed = l2_cancel_stage is None
                 tasks["l2"].cancel()
                 l2_cancelled = True
                 l2_end = time.perf_counter()
@@ -237,7 +363,8 @@ class AsyncScanPipeline:
                     "l2_cancelled_critical",
                     reason="high_confidence_critical_detected",
                     l1_severity="CRITICAL",
-                    text_hash=self._hash_text(text),
+                    stage=l2_cancel_stage,
+                    text_hash=fingerprint.sha256,
                 )
             else:
                 # Wait for L2 with timeout
@@ -245,18 +372,32 @@ class AsyncScanPipeline:
                     l2_result = await asyncio.wait_for(
                         tasks["l2"], timeout=self.l2_timeout_ms / 1000
                     )
+                    l2_completed = True
                     l2_end = time.perf_counter()
                 except asyncio.TimeoutError:
                     logger.warning(f"L2 timeout after {self.l2_timeout_ms}ms")
+                    # The result would be discarded, so free the worker too
+                    l2_cancel_stage = self._abort_l2(l2_job, cancel_token)
+                    l2_completed = l2_cancel_stage is None
                     l2_timeout = True
                     l2_end = time.perf_counter()
                 except asyncio.CancelledError:
                     l2_cancelled = True
                     l2_end = time.perf_counter()
 
+        if l2_cancel_stage is not None:
+            self._count_l2_run(f"cancelled_{l2_cancel_stage}")
+        elif l2_completed:
+            self._count_l2_run("completed")
+        l2_runs = self.l2_run_stats()
+
         # Calculate timings
         l1_duration_ms = (l1_end - l1_start) * 1000 if l1_end > 0 else 0.0
         l2_duration_ms = (l2_end - l2_start) * 1000 if l2_start > 0 and l2_end > 0 else 0.0
+        if l1_duration_ms > 0:
+            self.stage_latency.record("l1", l1_duration_ms)
+        if l2_duration_ms > 0 and not l2_cancelled:
+            self.stage_latency.record("l2", l2_duration_ms)
 
         # Calculate parallel speedup
         sequential_time = l1_duration_ms + l2_duration_ms
@@ -268,6 +409,7 @@ class AsyncScanPipeline:
             "customer_id": customer_id,
             "scan_timestamp": scan_timestamp,
             "rules_loaded": len(rules),
+            "ruleset_generation": ruleset_generation,
             "l2_skipped": self.enable_l2 and l2_result is None,
             "l1_duration_ms": l1_duration_ms,
             "l2_duration_ms": l2_duration_ms,
@@ -275,7 +417,11 @@ class AsyncScanPipeline:
             "l1_enabled": l1_enabled,
             "l2_enabled": l2_enabled and self.enable_l2,
             "l2_cancelled": l2_cancelled,
+            "l2_cancel_stage": l2_cancel_stage,
             "l2_timeout": l2_timeout,
+            "l2_degraded": l2_degraded,
+            "l2_queue_depth": l2_queue_depth,
+            "priority": priority.value,
             "execution_mode": "async_parallel",
         }
 
@@ -290,6 +436,7 @@ class AsyncScanPipeline:
 
         # Calculate total duration
         total_duration_ms = (time.perf_counter() - start_time) * 1000
+        self.stage_latency.record("total", total_duration_ms)
 
         # Create metrics
         metrics = AsyncScanMetrics(
@@ -303,6 +450,12 @@ class AsyncScanPipeline:
             l2_timeout=l2_timeout,
             parallel_speedup=parallel_speedup,
             total_duration_ms=total_duration_ms,
+            priority=priority.value,
+            l2_queue_depth=l2_queue_depth,
+            l2_degraded=l2_degraded,
+            l2_cancel_stage=l2_cancel_stage,
+            l2_runs_completed=l2_runs["completed"],
+            l2_runs_cancelled=l2_runs["cancelled"],
         )
 
         # Log async performance
@@ -313,50 +466,143 @@ class AsyncScanPipeline:
             l2_duration_ms=l2_duration_ms,
             parallel_speedup=parallel_speedup,
             l2_cancelled=l2_cancelled,
+            l2_cancel_stage=l2_cancel_stage,
             l2_timeout=l2_timeout,
+            l2_degraded=l2_degraded,
+            priority=priority.value,
             has_threats=combined_result.has_threats,
         )
 
         return AsyncScanPipelineResult(
             scan_result=combined_result,
             duration_ms=total_duration_ms,
-            text_hash=self._hash_text(text),
+            text_hash=fingerprint.sha256,
             metadata=metadata,
             metrics=metrics,
         )
 
-    async def _run_l1_async(self, text: str, rules: list) -> ScanResult:
-        """Run L1 detection asynchronously in thread pool.
+    async def _run_l1_async(
+        self,
+        text: str,
+        rules: Sequence[Rule],
+        compiled: tuple[CompiledRule, ...] | None = None,
+    ) -> ScanResult:
+        """Run L1 detection asynchronously on the L1 executor.
 
         L1 is CPU-bound (regex), so we run it in a thread pool executor
         to avoid blocking the event loop.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,  # Use default thread pool executor
-            self.rule_executor.execute_rules,
-            text,
-            rules,
-        )
+        loop = asyncio.get_running_loop()
+        if compiled is None:
+            call = functools.partial(self.rule_executor.execute_rules, text, rules)
+        else:
+            call = functools.partial(
+                self.rule_executor.execute_rules, text, rules, compiled=compiled
+            )
+        return await loop.run_in_executor(self._l1_executor, call)
 
-    async def _run_l2_async(self, text: str, context: dict[str, Any] | None) -> L2Result:
-        """Run L2 ML detection asynchronously in thread pool.
+    def _submit_l2(
+        self,
+        text: str,
+        l1_result: ScanResult,
+        context: dict[str, Any] | None,
+        priority: ScanPriority,
+        cancel_token: L2CancelToken,
+    ) -> Future | None:
+        """Queue L2 ML detection in the scan's lane of the L2 executor.
+
+        L2 embedding generation is CPU-bound, so it runs on a worker thread.
+        Cancelling the returned future while the job is still queued
+        releases its slot in the lane; cancelling the token aborts a run
+        already in flight (detectors without a ``cancel_token`` parameter
+        are not given the token, and their runs finish unobserved).
 
-        L2 embedding generation is CPU-bound, so we run it in a thread pool
-        executor to avoid blocking the event loop.
+        Args:
+            text: Text to analyze
+            l1_result: L1 result if L1 finished within the grace window,
+                otherwise an empty result
+            context: Optional context metadata
+            priority: Lane of the job
+            cancel_token: Cancellation handle of the job
+
+        Returns:
+            Future of the L2 result, or None if the lane is saturated
+        """
+        if self._l2_accepts_cancel_token:
+            call = functools.partial(
+                self.l2_detector.analyze, text, l1_result, context, cancel_token=cancel_token
+            )
+        else:
+            call = functools.partial(self.l2_detector.analyze, text, l1_result, context)
+        return self._l2_executor.try_submit(priority, call)
+
+    def _abort_l2(self, job: Future, cancel_token: L2CancelToken) -> str | None:
+        """Stop an L2 job whose result is no longer wanted.
+
+        Args:
+            job: Future returned by _submit_l2
+            cancel_token: Cancellation handle of the job
+
+        Returns:
+            "queued" if the job never started, "in_flight" if its run was
+            aborted, or None if it had already completed
+        """
+        if job.cancel():
+            return "queued"
+        if job.done():
+            return None
+        cancel_token.cancel()
+        return "in_flight"
 
-        Note: L1 results are not needed by the current bundle detector,
-        so we pass None to avoid waiting for L1 to complete.
+    def _count_l2_run(self, outcome: str) -> None:
+        """Count one L2 run outcome."""
+        with self._l2_runs_lock:
+            self._l2_runs[outcome] += 1
+
+    def l2_run_stats(self) -> dict[str, int]:
+        """L2 runs since startup, by outcome.
+
+        Returns:
+            Counts of completed and cancelled runs, with cancelled runs
+            split by stage (grace, queued, in_flight)
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,  # Use default thread pool executor
-            self.l2_detector.analyze,
-            text,
-            None,  # L1 results not needed for bundle detector
-            context,
+        with self._l2_runs_lock:
+            stages = {
+                stage: self._l2_runs[f"cancelled_{stage}"]
+                for stage in ("grace", "queued", "in_flight")
+            }
+            return {
+                "completed": self._l2_runs["completed"],
+                "cancelled": sum(stages.values()),
+                **stages,
+            }
+
+    def queue_depth(self, priority: ScanPriority | str | None = None) -> int:
+        """L2 jobs waiting for a worker.
+
+        Args:
+            priority: Lane to count (default: all lanes)
+
+        Returns:
+            Number of queued L2 jobs
+        """
+        return self._l2_executor.queue_depth(
+            ScanPriority(priority) if priority is not None else None
         )
 
+    def lane_stats(self) -> dict[str, Any]:
+        """L2 executor statistics.
+
+        Returns:
+            Worker counts and per-lane queued/admitted/rejected counters
+        """
+        return self._l2_executor.stats()
+
+    def close(self) -> None:
+        """Shut down the L1 and L2 executors (queued L2 jobs are cancelled)."""
+        self._l2_executor.shutdown(wait=False)
+        self._l1_executor.shutdown(wait=False)
+
     def _should_cancel_l2(self, l1_result: ScanResult | None) -> bool:
         """Check if L2 should be cancelled based on L1 results.
 
@@ -430,13 +430,13 @@ class SessionTracker:
         has_isatty = hasattr(sys.stdin, "isatty")
         environment["is_interactive"] = sys.stdin.isatty() if has_isatty else False
 
-        # Detect Jupyter notebook
+        # Detect Jupyter notebook. A kernel has always imported IPython
+        # already; importing it here would only add startup time.
+        ipython_module = sys.modules.get("IPython")
         try:
-            from IPython import get_ipython
-
-            ipython = get_ipython()
+            ipython = ipython_module.get_ipython() if ipython_module is not None else None
             environment["is_notebook"] = ipython is not None and "IPKernelApp" in str(type(ipython))
-        except (ImportError, NameError):
+        except (AttributeError, NameError):
             environment["is_notebook"] = False
 
         return environment
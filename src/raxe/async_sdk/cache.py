@@ -11,12 +11,13 @@ Performance targets:
 """
 
 import asyncio
-import hashlib
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
+from raxe.domain.fingerprint import fast_content_key
+
 T = TypeVar("T")
 
 
@@ -222,7 +223,7 @@ class AsyncLRUCache(Generic[T]):
 class ScanResultCache:
     """Specialized cache for scan results.
 
-    Uses text hash as key to deduplicate identical prompts.
+    Uses the fast content key as cache key to deduplicate identical prompts.
     """
 
     def __init__(self, maxsize: int = 1000, ttl: float = 300.0):
@@ -235,15 +236,18 @@ class ScanResultCache:
         self._cache: AsyncLRUCache[Any] = AsyncLRUCache(maxsize=maxsize, ttl=ttl)
 
     def _hash_text(self, text: str) -> str:
-        """Create hash of text for cache key.
+        """Create cache key for text.
+
+        Uses the process-local fast content key rather than SHA-256: the
+        key never leaves the process and the str hash is cached by CPython.
 
         Args:
-            text: Text to hash
+            text: Text to key
 
         Returns:
-            SHA256 hash (hex encoded)
+            16-character hex key
         """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return fast_content_key(text)
 
     async def get(self, text: str) -> Any | None:
         """Get cached scan result for text.
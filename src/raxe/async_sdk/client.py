@@ -30,15 +30,19 @@ Example usage:
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
 from raxe.application.preloader import preload_pipeline
+from raxe.application.scan_lanes import ScanPriority
 from raxe.application.scan_pipeline import ScanPipelineResult
 from raxe.application.telemetry_orchestrator import get_orchestrator
 from raxe.async_sdk.cache import ScanResultCache
 from raxe.infrastructure.config.scan_config import ScanConfig
+from raxe.sdk.client import ASYNC_SCAN_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +92,7 @@ class AsyncRaxe:
         voting_preset: str | None = None,
         cache_size: int = 1000,
         cache_ttl: float = 300.0,
+        max_workers: int | None = None,
         **kwargs: Any,
     ):
         """Initialize async RAXE client.
@@ -102,6 +107,9 @@ class AsyncRaxe:
             voting_preset: L2 voting preset (balanced, high_security, low_fp)
             cache_size: LRU cache size (default: 1000 entries)
             cache_ttl: Cache TTL in seconds (default: 300 = 5 minutes)
+            max_workers: Threads for CPU-bound scanning (default:
+                ASYNC_SCAN_WORKERS). Scans run on this dedicated executor,
+                not on the event loop's default thread pool.
             **kwargs: Additional config options passed to ScanConfig
 
         Raises:
@@ -126,6 +134,11 @@ class AsyncRaxe:
         # Store voting preset for L2 detector initialization
         self._voting_preset = voting_preset
 
+        # Dedicated scan executor (created on first scan)
+        self._max_workers = max_workers or ASYNC_SCAN_WORKERS
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
         # Initialize cache (skip if cache_size is 0)
         if cache_size > 0:
             self._cache = ScanResultCache(maxsize=cache_size, ttl=cache_ttl)
@@ -191,6 +204,11 @@ class AsyncRaxe:
             instance._cache = None  # type: ignore
             instance._cache_enabled = False
 
+        # Dedicated scan executor (created on first scan)
+        instance._max_workers = ASYNC_SCAN_WORKERS
+        instance._executor = None
+        instance._executor_lock = threading.Lock()
+
         # Get voting preset from config (L2 voting config)
         instance._voting_preset = None
         if hasattr(instance.config, "l2_scoring") and instance.config.l2_scoring:
@@ -221,15 +239,23 @@ class AsyncRaxe:
         context: dict[str, object] | None = None,
         block_on_threat: bool = False,
         use_cache: bool = True,
+        priority: ScanPriority | str | None = ScanPriority.INTERACTIVE,
     ) -> ScanPipelineResult:
         """Scan text for security threats (async).
 
+        L2 runs in the given priority lane of the pipeline's bounded L2
+        workers; a scan whose lane is full is degraded to L1-only
+        (``metadata["l2_degraded"]``) and is not cached, nor is a scan
+        whose L2 run timed out (``metadata["l2_timeout"]``).
+
         Args:
             text: Text to scan (prompt or response)
             customer_id: Optional customer ID for policy evaluation
             context: Optional context metadata for the scan
             block_on_threat: Raise SecurityException if threat detected (default: False)
             use_cache: Use cached result if available (default: True)
+            priority: L2 lane - interactive (default), background or batch
+                (None runs L2 on the scan thread)
 
         Returns:
             ScanPipelineResult with detections and policy decision
@@ -299,22 +325,30 @@ class AsyncRaxe:
 
         # Cache miss - run scan
         # Note: The scan pipeline is synchronous but CPU-bound
-        # We run it in executor to avoid blocking the event loop
+        # We run it on the client's executor to avoid blocking the event loop
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._get_executor(),
             self._scan_sync,
             text,
             customer_id,
             context,
+            priority,
         )
 
         # Track telemetry (non-blocking, privacy-preserving)
         # Pass original prompt for accurate hash and length calculation
         self._track_scan(result, prompt=text, entry_point="async_sdk")
 
-        # Cache result if enabled
-        if self._cache_enabled and use_cache and self._cache:
+        # Cache result if enabled (an L1-only result degraded under load or
+        # by an L2 timeout is not)
+        if (
+            self._cache_enabled
+            and use_cache
+            and self._cache
+            and not result.metadata.get("l2_degraded")
+            and not result.metadata.get("l2_timeout")
+        ):
             await self._cache.set(text, result)
 
         # Enforce blocking if requested
@@ -330,6 +364,7 @@ class AsyncRaxe:
         text: str,
         customer_id: str | None,
         context: dict[str, object] | None,
+        priority: ScanPriority | str | None = None,
     ) -> ScanPipelineResult:
         """Synchronous scan helper (runs in executor).
 
@@ -340,6 +375,7 @@ class AsyncRaxe:
             text: Text to scan
             customer_id: Optional customer ID
             context: Optional context
+            priority: L2 lane (None runs L2 on the scan thread)
 
         Returns:
             ScanPipelineResult
@@ -348,8 +384,19 @@ class AsyncRaxe:
             text,
             customer_id=customer_id or self.config.customer_id,
             context=context,
+            priority=priority,
         )
 
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get or create the dedicated scan executor."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="raxe-async-scan",
+                )
+            return self._executor
+
     async def scan_batch(
         self,
         texts: list[str],
@@ -492,6 +539,9 @@ class AsyncRaxe:
                 scan_duration_ms=result.duration_ms,
                 entry_point=entry_point,  # type: ignore[arg-type]
                 prompt=prompt,
+                # Reuse the pipeline's SHA-256 instead of hashing the prompt again
+                prompt_hash=result.text_hash or None,
+                prompt_length=len(prompt),
                 action_taken="block" if result.should_block else "allow",
                 l2_enabled=result.metadata.get("l2_enabled", True),
             )
@@ -504,7 +554,8 @@ class AsyncRaxe:
     async def close(self) -> None:
         """Close client and cleanup resources.
 
-        This clears the cache, flushes telemetry, and prepares the client for shutdown.
+        This clears the cache, flushes telemetry, shuts down the scan
+        executor, and prepares the client for shutdown.
 
         Example:
             raxe = AsyncRaxe()
@@ -515,6 +566,12 @@ class AsyncRaxe:
         """
         await self.clear_cache()
 
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.pipeline.close()
+
         # Flush telemetry on close to ensure events are sent
         try:
             from raxe.infrastructure.telemetry.flush_helper import ensure_telemetry_flushed
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
@@ -71,11 +72,14 @@ class DashboardData:
     hourly_scans: list[int] = field(default_factory=lambda: [0] * 24)
     hourly_threats: list[int] = field(default_factory=lambda: [0] * 24)
 
-    # Performance metrics
+    # Performance metrics (percentiles from the scan history latency sketches)
     avg_latency_ms: float = 0.0
     p95_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
     l1_avg_ms: float = 0.0
     l2_avg_ms: float = 0.0
+    l1_p95_ms: float = 0.0
+    l2_p95_ms: float = 0.0
 
     # System status
     rules_loaded: int = 0
@@ -93,10 +97,15 @@ class DashboardDataProvider:
     Queries the scan history database and aggregates data for
     dashboard display. Implements caching to minimize database
     queries during rapid refresh cycles.
+
+    After the first load, refreshes are incremental: only scans with an ID
+    above ``_last_seen_scan_id`` are read and folded into the in-memory
+    counts, trends and alert feed. Aggregates are rebuilt from the history
+    rollups when the clock hour changes or too many scans arrived at once.
     """
 
     MAX_ALERTS_CACHED = 100
-    MAX_SCANS_QUERIED = 500
+    MAX_DELTA_SCANS = 5000
     PREVIEW_LENGTH = 50
 
     def __init__(
@@ -125,6 +134,10 @@ class DashboardDataProvider:
         self._cache_time: datetime | None = None
         self._last_seen_scan_id: int | None = None
 
+        # Incremental refresh state
+        self._alerts: deque[AlertItem] = deque(maxlen=self.MAX_ALERTS_CACHED)
+        self._aggregates_hour: datetime | None = None
+
     def get_data(self, force_refresh: bool = False) -> DashboardData:
         """Get dashboard data, using cache if fresh.
 
@@ -195,92 +208,212 @@ class DashboardDataProvider:
     def _fetch_data(self) -> DashboardData:
         """Fetch fresh data from the database.
 
+        Folds scans recorded since the last refresh into the previous data
+        when possible, otherwise rebuilds everything.
+
         Returns:
             New DashboardData instance
         """
         now = datetime.now(timezone.utc)
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+
+        if (
+            self._cache is None
+            or self._last_seen_scan_id is None
+            or self._aggregates_hour != current_hour
+        ):
+            return self._fetch_full(now)
+
+        new_scans = self.db.list_scans_after(
+            self._last_seen_scan_id, limit=self.MAX_DELTA_SCANS + 1
+        )
+        if len(new_scans) > self.MAX_DELTA_SCANS:
+            return self._fetch_full(now)
+
+        return self._fold_new_scans(self._cache, new_scans, now)
+
+    def _fetch_full(self, now: datetime) -> DashboardData:
+        """Rebuild all dashboard data.
+
+        Counts, trends and latencies come from the history rollups; only the
+        alert feed reads scan rows, bounded by ``MAX_ALERTS_CACHED``.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            New DashboardData instance
+        """
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Get recent scans
-        scans = self.db.list_scans(limit=self.MAX_SCANS_QUERIED)
+        # Read the high-water mark first: a scan recorded while the
+        # aggregates are read is at worst counted twice until the next
+        # rebuild, never skipped
+        self._last_seen_scan_id = self.db.get_latest_scan_id() or 0
+        self._aggregates_hour = now.replace(minute=0, second=0, microsecond=0)
 
         # Calculate today's stats
-        today_scans = [s for s in scans if s.timestamp >= today_start]
-        total_scans_today = len(today_scans)
-        total_threats_today = sum(s.threats_found for s in today_scans)
+        today = self.db.get_statistics(since=today_start)
 
         # Threats by severity
         threats_by_severity = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0, "INFO": 0}
-        for scan in today_scans:
-            if scan.highest_severity:
-                sev = scan.highest_severity.upper()
-                if sev in threats_by_severity:
-                    threats_by_severity[sev] += 1
+        for severity, count in today["severity_counts"].items():
+            sev = severity.upper()
+            if sev in threats_by_severity:
+                threats_by_severity[sev] += count
 
         # Build recent alerts (threats only)
-        recent_alerts: list[AlertItem] = []
-        for scan in scans:
-            if scan.threats_found > 0 and len(recent_alerts) < self.MAX_ALERTS_CACHED:
-                detections = self.db.get_detections(scan.id or 0)
-                recent_alerts.append(
-                    AlertItem(
-                        scan_id=scan.id or 0,
-                        timestamp=scan.timestamp,
-                        severity=scan.highest_severity or "UNKNOWN",
-                        rule_ids=[d.rule_id for d in detections],
-                        detection_count=scan.threats_found,
-                        prompt_preview=self._safe_preview(scan.prompt_text),
-                        prompt_hash=scan.prompt_hash,
-                        event_id=scan.event_id,
-                        l1_detections=scan.l1_detections,
-                        l2_detections=scan.l2_detections,
-                        confidence=max((d.confidence for d in detections), default=0.0),
-                        descriptions=[d.description or "" for d in detections if d.description],
-                    )
-                )
+        threat_scans = self.db.list_scans(limit=self.MAX_ALERTS_CACHED, threats_only=True)
+        self._alerts.clear()
+        self._alerts.extend(self._build_alerts(threat_scans))
 
         # Calculate hourly trends (last 24 hours)
-        hourly_scans, hourly_threats = self._calculate_hourly_trends(scans, now)
+        hourly_scans, hourly_threats = self._calculate_hourly_trends(now)
 
-        # Get performance stats
-        stats = self.db.get_statistics(days=1)
+        # Last scan time
+        latest = self.db.list_scans(limit=1)
+        last_scan_time = latest[0].timestamp if latest else None
+
+        data = DashboardData(
+            total_scans_today=today["total_scans"],
+            total_threats_today=today["total_detections"],
+            threats_by_severity=threats_by_severity,
+            recent_alerts=list(self._alerts),
+            hourly_scans=hourly_scans,
+            hourly_threats=hourly_threats,
+            rules_loaded=0,  # Will be set by orchestrator
+            ml_model_loaded=True,
+            last_scan_time=last_scan_time,
+            data_range_days=self.history_days,
+            last_refresh=datetime.now(timezone.utc),
+        )
+        return self._with_latency(data)
 
-        # Calculate P95 approximation (1.5x average is rough estimate)
-        avg_total = stats.get("avg_total_duration_ms") or 0.0
-        p95_approx = avg_total * 1.5 if avg_total > 0 else 0.0
+    def _fold_new_scans(
+        self, previous: DashboardData, new_scans: list[ScanRecord], now: datetime
+    ) -> DashboardData:
+        """Add scans recorded since the last refresh to the previous data.
 
-        # Last scan time
-        last_scan_time = scans[0].timestamp if scans else None
+        Args:
+            previous: Data from the last refresh (not modified)
+            new_scans: Scans with IDs above ``_last_seen_scan_id``, oldest first
+            now: Current timestamp (same clock hour as ``previous``)
 
-        # Update tracking
-        if scans:
-            self._last_seen_scan_id = scans[0].id
+        Returns:
+            New DashboardData instance
+        """
+        if not new_scans:
+            return replace(previous, last_refresh=datetime.now(timezone.utc))
 
-        return DashboardData(
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+
+        total_scans_today = previous.total_scans_today
+        total_threats_today = previous.total_threats_today
+        threats_by_severity = dict(previous.threats_by_severity)
+        hourly_scans = list(previous.hourly_scans)
+        hourly_threats = list(previous.hourly_threats)
+        last_scan_time = previous.last_scan_time
+
+        for scan in new_scans:
+            if scan.timestamp >= today_start:
+                total_scans_today += 1
+                total_threats_today += scan.threats_found
+                sev = (scan.highest_severity or "").upper()
+                if sev in threats_by_severity:
+                    threats_by_severity[sev] += 1
+
+            scan_hour = scan.timestamp.replace(minute=0, second=0, microsecond=0)
+            hours_ago = int((current_hour - scan_hour).total_seconds() // 3600)
+            if 0 <= hours_ago < 24:
+                hourly_scans[23 - hours_ago] += 1
+                if scan.threats_found > 0:
+                    hourly_threats[23 - hours_ago] += 1
+
+            if last_scan_time is None or scan.timestamp > last_scan_time:
+                last_scan_time = scan.timestamp
+
+        threat_scans = [scan for scan in new_scans if scan.threats_found > 0]
+        self._alerts.extendleft(self._build_alerts(threat_scans))
+        self._last_seen_scan_id = max(self._last_seen_scan_id or 0, new_scans[-1].id or 0)
+
+        data = replace(
+            previous,
             total_scans_today=total_scans_today,
             total_threats_today=total_threats_today,
             threats_by_severity=threats_by_severity,
-            recent_alerts=recent_alerts,
+            recent_alerts=list(self._alerts),
             hourly_scans=hourly_scans,
             hourly_threats=hourly_threats,
-            avg_latency_ms=avg_total,
-            p95_latency_ms=p95_approx,
-            l1_avg_ms=stats.get("avg_l1_duration_ms") or 0.0,
-            l2_avg_ms=stats.get("avg_l2_duration_ms") or 0.0,
-            rules_loaded=0,  # Will be set by orchestrator
-            ml_model_loaded=True,
             last_scan_time=last_scan_time,
-            data_range_days=self.history_days,
             last_refresh=datetime.now(timezone.utc),
         )
+        return self._with_latency(data)
+
+    def _build_alerts(self, scans: list[ScanRecord]) -> list[AlertItem]:
+        """Build alert items, fetching all detections in one batched query.
+
+        Args:
+            scans: Threat scans
+
+        Returns:
+            AlertItems in the same order as ``scans``
+        """
+        detections_by_scan = self.db.get_detections_for_scans([scan.id or 0 for scan in scans])
+
+        alerts = []
+        for scan in scans:
+            detections = detections_by_scan.get(scan.id or 0, [])
+            alerts.append(
+                AlertItem(
+                    scan_id=scan.id or 0,
+                    timestamp=scan.timestamp,
+                    severity=scan.highest_severity or "UNKNOWN",
+                    rule_ids=[d.rule_id for d in detections],
+                    detection_count=scan.threats_found,
+                    prompt_preview=self._safe_preview(scan.prompt_text),
+                    prompt_hash=scan.prompt_hash,
+                    event_id=scan.event_id,
+                    l1_detections=scan.l1_detections,
+                    l2_detections=scan.l2_detections,
+                    confidence=max((d.confidence for d in detections), default=0.0),
+                    descriptions=[d.description or "" for d in detections if d.description],
+                )
+            )
+        return alerts
 
-    def _calculate_hourly_trends(
-        self, scans: list[ScanRecord], now: datetime
-    ) -> tuple[list[int], list[int]]:
+    def _with_latency(self, data: DashboardData) -> DashboardData:
+        """Fill in the last day's latency metrics from the rollups.
+
+        Args:
+            data: Dashboard data to update
+
+        Returns:
+            Copy of ``data`` with the performance fields set
+        """
+        stats = self.db.get_statistics(days=1)
+        percentiles = stats.get("latency_percentiles", {})
+
+        def percentile(stage: str, key: str) -> float:
+            return percentiles.get(stage, {}).get(key, 0.0)
+
+        return replace(
+            data,
+            avg_latency_ms=stats.get("avg_total_duration_ms") or 0.0,
+            p95_latency_ms=percentile("total", "p95_ms"),
+            p99_latency_ms=percentile("total", "p99_ms"),
+            l1_avg_ms=stats.get("avg_l1_duration_ms") or 0.0,
+            l2_avg_ms=stats.get("avg_l2_duration_ms") or 0.0,
+            l1_p95_ms=percentile("l1", "p95_ms"),
+            l2_p95_ms=percentile("l2", "p95_ms"),
+        )
+
+    def _calculate_hourly_trends(self, now: datetime) -> tuple[list[int], list[int]]:
         """Calculate hourly scan and threat counts for last 24 hours.
 
+        Buckets are clock hours (UTC), read from the hourly rollups.
+
         Args:
-            scans: List of ScanRecord objects
             now: Current timestamp
 
         Returns:
@@ -289,20 +422,15 @@ class DashboardDataProvider:
         hourly_scans = [0] * 24
         hourly_threats = [0] * 24
 
-        cutoff = now - timedelta(hours=24)
-
-        for scan in scans:
-            if scan.timestamp < cutoff:
-                continue
-
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+        for bucket in self.db.get_rollup_series("hour", since=current_hour - timedelta(hours=23)):
             # Calculate hours ago (0 = current hour, 23 = 23 hours ago)
-            hours_ago = int((now - scan.timestamp).total_seconds() / 3600)
+            hours_ago = int((current_hour - bucket.start).total_seconds() // 3600)
             if 0 <= hours_ago < 24:
-                # Index 23 = oldest, index 0 = newest
-                bucket = 23 - hours_ago
-                hourly_scans[bucket] += 1
-                if scan.threats_found > 0:
-                    hourly_threats[bucket] += 1
+                # Index 23 = newest, index 0 = oldest
+                index = 23 - hours_ago
+                hourly_scans[index] = bucket.scans
+                hourly_threats[index] = bucket.threat_scans
 
         return hourly_scans, hourly_threats
 
@@ -339,9 +467,4 @@ class DashboardDataProvider:
         if self._last_seen_scan_id is None:
             return False
 
-        scans = self.db.list_scans(limit=5)
-        for scan in scans:
-            if scan.id and scan.id > self._last_seen_scan_id and scan.threats_found > 0:
-                return True
-
-        return False
+        return bool(self.db.list_scans_after(self._last_seen_scan_id, limit=1, threats_only=True))
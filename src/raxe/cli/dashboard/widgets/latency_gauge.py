@@ -132,6 +132,11 @@ class LatencyGaugeWidget:
         p95_color = self._get_latency_color(data.p95_latency_ms)
         result.append(f"{data.p95_latency_ms:.1f}ms", style=Style(color=p95_color))
 
+        result.append(", P99: ", style=Style(color=self.theme.muted))
+
+        p99_color = self._get_latency_color(data.p99_latency_ms)
+        result.append(f"{data.p99_latency_ms:.1f}ms", style=Style(color=p99_color))
+
         result.append(")", style=Style(color=self.theme.muted))
 
         return result
@@ -3,9 +3,12 @@ RAXE export command - Export scan history.
 """
 
 import csv
+import gzip
 import json
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import IO, Any
 
 import click
 
@@ -17,6 +20,29 @@ from raxe.cli.output import (
     no_color_option,
     quiet_option,
 )
+from raxe.infrastructure.database.scan_history import (
+    DetectionRecord,
+    ScanHistoryDB,
+    ScanRecord,
+)
+
+DATETIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]
+
+CSV_FIELDS = [
+    "id",
+    "event_id",
+    "timestamp",
+    "prompt_hash",
+    "threats_found",
+    "highest_severity",
+    "l1_detections",
+    "l2_detections",
+    "l1_duration_ms",
+    "l2_duration_ms",
+    "total_duration_ms",
+    "version",
+    "rule_ids",
+]
 
 
 @click.command()
@@ -25,25 +51,49 @@ from raxe.cli.output import (
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "csv"]),
+    type=click.Choice(["json", "jsonl", "csv"]),
     default="json",
     help="Output format (default: json)",
 )
 @click.option(
     "--output",
     type=click.Path(),
-    help="Output file path (default: raxe_export.{format})",
+    help="Output file path (default: raxe_export.{format}); a .gz suffix compresses",
 )
 @click.option(
     "--days",
     type=int,
     default=30,
-    help="Days of history to export (default: 30)",
+    help="Days of history to export (default: 30, ignored with --since)",
+)
+@click.option(
+    "--since",
+    type=click.DateTime(formats=DATETIME_FORMATS),
+    help="Export scans at or after this UTC time (e.g. 2025-01-01)",
+)
+@click.option(
+    "--until",
+    type=click.DateTime(formats=DATETIME_FORMATS),
+    help="Export scans before this UTC time (default: now)",
+)
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    help="Compress the output with gzip",
 )
 @click.pass_context
-def export(ctx, output_format: str, output: str | None, days: int) -> None:
+def export(
+    ctx,
+    output_format: str,
+    output: str | None,
+    days: int,
+    since: datetime | None,
+    until: datetime | None,
+    compress: bool,
+) -> None:
     """
-    Export scan history to JSON or CSV.
+    Export scan history to JSON, JSONL or CSV.
 
     Exports local scan history including:
       - Scan timestamps
@@ -51,11 +101,15 @@ def export(ctx, output_format: str, output: str | None, days: int) -> None:
       - Severity levels
       - Rule matches
 
+    Scans are streamed page by page, so exports of any size run in
+    constant memory. Prompt text is never exported.
+
     \b
     Examples:
       raxe export
       raxe export --format csv --output scans.csv
       raxe export --days 7 --format json
+      raxe export --format jsonl --since 2025-01-01 --until 2025-04-01 --gzip
     """
     quiet = ctx.obj.get("quiet", False) if ctx.obj else False
     if not quiet:
@@ -65,36 +119,54 @@ def export(ctx, output_format: str, output: str | None, days: int) -> None:
         console.print()
 
     try:
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+            period = f"{days} days"
+        else:
+            since = since.replace(tzinfo=timezone.utc)
+            period = f"{since:%Y-%m-%d %H:%M} to "
+            period += f"{until:%Y-%m-%d %H:%M}" if until else "now"
+        if until is not None:
+            until = until.replace(tzinfo=timezone.utc)
+
         # Determine output file
         if output is None:
-            output = f"raxe_export.{output_format}"
+            output = f"raxe_export.{output_format}" + (".gz" if compress else "")
 
         output_path = Path(output)
+        compress = compress or output_path.suffix == ".gz"
 
-        console.print(f"[cyan]Exporting {days} days of scan history...[/cyan]")
+        console.print(f"[cyan]Exporting scan history ({period})...[/cyan]")
         console.print()
 
-        # Load scan history (placeholder - will integrate with actual database)
-        data = _load_scan_history(days)
+        db = ScanHistoryDB()
+        total = db.count_scans(since=since, until=until)
 
-        if not data:
+        if not total:
             console.print("[yellow]No scan history found for the specified period[/yellow]")
             console.print()
             return
 
-        # Export based on format
-        with create_progress_bar("Exporting...") as progress:
-            task = progress.add_task("Processing...", total=len(data))
+        with (
+            create_progress_bar("Exporting...") as progress,
+            _open_output(
+                output_path, compress, newline="" if output_format == "csv" else None
+            ) as f,
+        ):
+            task = progress.add_task("Processing...", total=total)
+            records = _iter_records(db, since, until, progress, task)
 
             if output_format == "json":
-                _export_json(output_path, data, progress, task)
+                count = _export_json(f, records)
+            elif output_format == "jsonl":
+                count = _export_jsonl(f, records)
             else:
-                _export_csv(output_path, data, progress, task)
+                count = _export_csv(f, records)
 
         console.print()
         display_success(
-            f"Exported {len(data)} scans to {output_path}",
-            f"Format: {output_format.upper()}, Period: {days} days",
+            f"Exported {count} scans to {output_path}",
+            f"Format: {output_format.upper()}{' (gzip)' if compress else ''}, Period: {period}",
         )
 
     except Exception as e:
@@ -102,94 +174,149 @@ def export(ctx, output_format: str, output: str | None, days: int) -> None:
         raise click.Abort() from e
 
 
-def _load_scan_history(days: int) -> list[dict]:
+def _open_output(output_path: Path, compress: bool, newline: str | None) -> IO[str]:
     """
-    Load scan history from local database.
+    Open the export file for writing text.
 
     Args:
-        days: Number of days to look back
+        output_path: Output file path
+        compress: Write gzip-compressed output
+        newline: Newline translation (``""`` for CSV)
 
     Returns:
-        List of scan records
+        Text stream
     """
-    # Placeholder implementation
-    # In production, this would query the SQLite database
-    # For now, return sample data
-
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-
-    # TODO: Integrate with actual telemetry database
-    _ = cutoff_date  # Will be used when real database is integrated
-    # from raxe.infrastructure.telemetry.queue import TelemetryQueue
-    # queue = TelemetryQueue()
-    # return queue.get_history(since=cutoff_date)
-
-    # Sample data for demonstration
-    sample_data = [
-        {
-            "timestamp": (datetime.now(timezone.utc) - timedelta(days=i)).isoformat(),
-            "prompt_hash": f"hash_{i}",
-            "has_threats": i % 3 == 0,
-            "detection_count": 1 if i % 3 == 0 else 0,
-            "highest_severity": "high" if i % 3 == 0 else "none",
-            "duration_ms": 5.2 + (i * 0.1),
-        }
-        for i in range(min(10, days))  # Limit sample data
-    ]
-
-    return sample_data
-
-
-def _export_json(output_path: Path, data: list[dict], progress, task) -> None:
+    if compress:
+        return gzip.open(output_path, "wt", encoding="utf-8", newline=newline)
+    return output_path.open("w", encoding="utf-8", newline=newline)
+
+
+def _iter_records(
+    db: ScanHistoryDB,
+    since: datetime | None,
+    until: datetime | None,
+    progress,
+    task,
+) -> Iterator[dict[str, Any]]:
     """
-    Export data to JSON format.
+    Stream export records page by page.
 
     Args:
-        output_path: Output file path
-        data: Scan history data
+        db: Scan history database
+        since: Only include scans at or after this time
+        until: Only include scans before this time
         progress: Progress bar instance
         task: Progress task ID
+
+    Yields:
+        Export records, oldest first
+    """
+    for page in db.iter_scan_pages(since=since, until=until):
+        for scan, detections in page:
+            yield _scan_to_record(scan, detections)
+        progress.advance(task, len(page))
+
+
+def _scan_to_record(scan: ScanRecord, detections: list[DetectionRecord]) -> dict[str, Any]:
+    """
+    Convert a scan and its detections to an export record.
+
+    Args:
+        scan: Scan record
+        detections: Detections of the scan
+
+    Returns:
+        JSON-serializable record (without prompt text)
     """
-    with output_path.open("w") as f:
-        json.dump(
+    return {
+        "id": scan.id,
+        "event_id": scan.event_id,
+        "timestamp": scan.timestamp.isoformat(),
+        "prompt_hash": scan.prompt_hash,
+        "threats_found": scan.threats_found,
+        "highest_severity": scan.highest_severity,
+        "l1_detections": scan.l1_detections,
+        "l2_detections": scan.l2_detections,
+        "l1_duration_ms": scan.l1_duration_ms,
+        "l2_duration_ms": scan.l2_duration_ms,
+        "total_duration_ms": scan.total_duration_ms,
+        "version": scan.version,
+        "detections": [
             {
-                "exported_at": datetime.now().isoformat(),
-                "record_count": len(data),
-                "scans": data,
-            },
-            f,
-            indent=2,
-        )
-        progress.update(task, completed=len(data))
+                "rule_id": d.rule_id,
+                "severity": d.severity,
+                "confidence": d.confidence,
+                "detection_layer": d.detection_layer,
+                "category": d.category,
+            }
+            for d in detections
+        ],
+    }
+
+
+def _export_json(f: IO[str], records: Iterator[dict[str, Any]]) -> int:
+    """
+    Write records as one JSON document.
+
+    The ``scans`` array is streamed; ``record_count`` follows it.
+
+    Args:
+        f: Output stream
+        records: Export records
 
+    Returns:
+        Number of records written
+    """
+    f.write(f'{{"exported_at": {json.dumps(datetime.now().isoformat())}, "scans": [')
+    count = 0
+    for record in records:
+        f.write(",\n  " if count else "\n  ")
+        f.write(json.dumps(record))
+        count += 1
+    f.write(f'\n], "record_count": {count}}}\n')
+    return count
 
-def _export_csv(output_path: Path, data: list[dict], progress, task) -> None:
+
+def _export_jsonl(f: IO[str], records: Iterator[dict[str, Any]]) -> int:
     """
-    Export data to CSV format.
+    Write one JSON record per line.
 
     Args:
-        output_path: Output file path
-        data: Scan history data
-        progress: Progress bar instance
-        task: Progress task ID
+        f: Output stream
+        records: Export records
+
+    Returns:
+        Number of records written
     """
-    if not data:
-        return
+    count = 0
+    for record in records:
+        f.write(json.dumps(record) + "\n")
+        count += 1
+    return count
+
 
-    # Get all unique keys from data
-    fieldnames = set()
-    for record in data:
-        fieldnames.update(record.keys())
+def _export_csv(f: IO[str], records: Iterator[dict[str, Any]]) -> int:
+    """
+    Write one CSV row per scan.
 
-    fieldnames = sorted(fieldnames)
+    Detections are summarized as space-separated rule IDs.
 
-    with output_path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    Args:
+        f: Output stream (opened with newline="")
+        records: Export records
 
-        for i, record in enumerate(data):
-            writer.writerow(record)
-            progress.update(task, completed=i + 1)
+    Returns:
+        Number of records written
+    """
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(
+            {**record, "rule_ids": " ".join(d["rule_id"] for d in record["detections"])}
+        )
+        count += 1
+    return count
 
 
 if __name__ == "__main__":
@@ -154,6 +154,13 @@ def stats(days: int) -> None:
             for severity, count in stats["severity_counts"].items():
                 console.print(f"  {severity}: {count}")
 
+        # Most frequent rules
+        top_rules = db.get_top_rules(days=days, limit=5)
+        if top_rules:
+            console.print("\n[bold]Top Rules:[/bold]")
+            for rule_id, count in top_rules:
+                console.print(f"  {rule_id}: {count}")
+
         # Performance
         console.print("\n[bold]Average Latencies:[/bold]")
         if stats["avg_l1_duration_ms"]:
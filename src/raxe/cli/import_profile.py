@@ -0,0 +1,134 @@
+"""Import-time profiling for ``raxe --profile-import``.
+
+Re-runs the same CLI invocation in a fresh interpreter with
+``python -X importtime`` and reports which modules the command spent its
+startup time importing. A fresh interpreter is required because by the
+time the flag is parsed, ``raxe`` itself is already imported.
+
+Example:
+    raxe --profile-import scan "hello" --l1-only
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from rich.console import Console
+from rich.table import Table
+
+PROFILE_IMPORT_FLAG = "--profile-import"
+
+# Number of modules shown in the report
+DEFAULT_LIMIT = 25
+
+_IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Import cost of one module, as reported by ``-X importtime``.
+
+    Attributes:
+        module: Fully qualified module name
+        self_us: Time spent executing the module itself (microseconds)
+        cumulative_us: Time including the module's own imports (microseconds)
+        depth: Nesting level (1 = imported directly by the entry point)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> tuple[list[ImportTiming], list[str]]:
+    """Split ``-X importtime`` stderr into timings and other lines.
+
+    Args:
+        output: Captured stderr of the profiled process
+
+    Returns:
+        Tuple of (timings in import order, non-profiling stderr lines)
+    """
+    timings: list[ImportTiming] = []
+    other: list[str] = []
+    for line in output.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            other.append(line)
+            continue
+        fields = line[len(_IMPORTTIME_PREFIX) :].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        try:
+            timing = ImportTiming(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip())) // 2,
+            )
+        except ValueError:
+            continue  # Header line ("self [us] | cumulative | imported package")
+        timings.append(timing)
+    return timings, other
+
+
+def profile_imports(args: list[str]) -> tuple[int, list[ImportTiming]]:
+    """Run ``raxe <args>`` in a fresh interpreter with import timing enabled.
+
+    The command's stdout and stdin are passed through; its non-profiling
+    stderr output is re-emitted on our stderr.
+
+    Args:
+        args: CLI arguments (without ``--profile-import``)
+
+    Returns:
+        Tuple of (exit code of the command, import timings)
+    """
+    completed = subprocess.run(  # noqa: S603 - re-runs our own CLI
+        [sys.executable, "-X", "importtime", "-m", "raxe.cli.main", *args],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    timings, other = parse_importtime(completed.stderr)
+    if other:
+        sys.stderr.write("\n".join(other) + "\n")
+    return completed.returncode, timings
+
+
+def display_import_profile(
+    timings: list[ImportTiming],
+    console: Console,
+    limit: int = DEFAULT_LIMIT,
+) -> None:
+    """Print the slowest imports and the total import time.
+
+    Args:
+        timings: Parsed import timings
+        console: Console to print to
+        limit: Number of modules to list
+    """
+    total_us = sum(t.self_us for t in timings)
+    raxe_us = sum(t.self_us for t in timings if t.module.split(".")[0] == "raxe")
+
+    table = Table(title=f"Slowest imports (top {limit} by self time)", show_lines=False)
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:limit]:
+        table.add_row(
+            timing.module,
+            f"{timing.self_us / 1000:.1f}",
+            f"{timing.cumulative_us / 1000:.1f}",
+        )
+
+    console.print()
+    console.print(table)
+    console.print(
+        f"Total import time: [bold]{total_us / 1000:.1f} ms[/bold] "
+        f"across {len(timings)} modules "
+        f"([cyan]raxe[/cyan] modules: {raxe_us / 1000:.1f} ms)"
+    )
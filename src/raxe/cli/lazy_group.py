@@ -0,0 +1,82 @@
+"""Click group that imports subcommands on demand.
+
+Importing every command module up front makes each ``raxe`` invocation pay
+for rich tables, YAML, the SDK and the analytics stack, even for a single
+``raxe scan``. ``LazyGroup`` only knows each subcommand's import path and
+imports the module when the command is actually resolved (invoked, shown
+in help, or completed).
+
+Example:
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={"stats": "raxe.cli.stats:stats"},
+    )
+    def cli():
+        ...
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import click
+
+# ctx.meta key holding the unparsed argument list of the group
+RAW_ARGS_KEY = "raxe.raw_args"
+
+
+class LazyGroup(click.Group):
+    """``click.Group`` whose subcommands are imported by name when needed.
+
+    Commands registered eagerly (``@group.command()`` / ``add_command``)
+    keep working alongside the lazy ones. The unparsed argument list is kept
+    in ``ctx.meta[RAW_ARGS_KEY]`` so the group callback can re-run the same
+    invocation (see ``raxe --profile-import``).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Create the group.
+
+        Args:
+            *args: Passed to ``click.Group``
+            lazy_subcommands: Command name -> ``"module.path:attribute"``
+            **kwargs: Passed to ``click.Group``
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Remember the raw arguments, then parse as usual."""
+        ctx.meta[RAW_ARGS_KEY] = list(args)
+        return super().parse_args(ctx, args)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy command names without importing anything."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a command, importing its module on first use."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.commands[cmd_name] = self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand.
+
+        Raises:
+            TypeError: If the import path does not name a click command
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command '{cmd_name}' ({self.lazy_subcommands[cmd_name]}) "
+                f"is not a click command"
+            )
+        return command
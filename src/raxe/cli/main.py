@@ -11,17 +11,7 @@ from pathlib import Path
 import click
 
 from raxe import __version__
-
-# MSSP/Partner ecosystem CLI commands
-from raxe.cli.agent import agent
-from raxe.cli.app import app
-from raxe.cli.auth import auth, auth_link
-from raxe.cli.config import config
-from raxe.cli.customer import customer
-from raxe.cli.dashboard_cmd import dashboard, monitor
-from raxe.cli.doctor import doctor
 from raxe.cli.error_handler import handle_cli_error
-from raxe.cli.event import event
 from raxe.cli.exit_codes import (
     EXIT_CONFIG_ERROR,
     EXIT_INVALID_INPUT,
@@ -32,13 +22,7 @@ from raxe.cli.expiry_warning import (
     check_and_display_expiry_warning,
     check_and_display_first_run_notice,
 )
-from raxe.cli.export import export
-from raxe.cli.help import help_command
-from raxe.cli.history import history
-from raxe.cli.mcp_cmd import mcp
-from raxe.cli.models import models
-from raxe.cli.mssp import mssp
-from raxe.cli.openclaw import openclaw
+from raxe.cli.lazy_group import RAW_ARGS_KEY, LazyGroup
 from raxe.cli.output import (
     configure_console,
     console,
@@ -49,20 +33,44 @@ from raxe.cli.output import (
     no_color_option,
     quiet_option,
 )
-from raxe.cli.policy import policy
-from raxe.cli.privacy import privacy_command
-from raxe.cli.profiler import profile_command
-from raxe.cli.repl import repl
-from raxe.cli.rules import rules
-from raxe.cli.serve import serve
-from raxe.cli.stats import stats
-from raxe.cli.suppress import suppress
-from raxe.cli.telemetry import telemetry
-from raxe.cli.tenant import tenant
-from raxe.cli.test import test
-from raxe.cli.tune import tune
-from raxe.cli.validate import validate_rule_command
-from raxe.sdk.client import Raxe
+
+# Subcommands defined in their own modules, imported only when invoked
+# (or listed in help) so that `raxe scan` does not pay for the whole CLI.
+LAZY_SUBCOMMANDS: dict[str, str] = {
+    "agent": "raxe.cli.agent:agent",
+    "app": "raxe.cli.app:app",
+    "auth": "raxe.cli.auth:auth",
+    "config": "raxe.cli.config:config",
+    "customer": "raxe.cli.customer:customer",
+    "dashboard": "raxe.cli.dashboard_cmd:dashboard",
+    "doctor": "raxe.cli.doctor:doctor",
+    "event": "raxe.cli.event:event",
+    "export": "raxe.cli.export:export",
+    "help": "raxe.cli.help:help_command",
+    "history": "raxe.cli.history:history",
+    # Top-level alias for 'raxe link ABC123' (same as 'raxe auth link ABC123')
+    "link": "raxe.cli.auth:auth_link",
+    "mcp": "raxe.cli.mcp_cmd:mcp",
+    "models": "raxe.cli.models:models",
+    "monitor": "raxe.cli.dashboard_cmd:monitor",
+    # MSSP/Partner ecosystem commands
+    "mssp": "raxe.cli.mssp:mssp",
+    # OpenClaw integration
+    "openclaw": "raxe.cli.openclaw:openclaw",
+    "policy": "raxe.cli.policy:policy",
+    "privacy": "raxe.cli.privacy:privacy_command",
+    "profile": "raxe.cli.profiler:profile_command",
+    "repl": "raxe.cli.repl:repl",
+    "rules": "raxe.cli.rules:rules",
+    "serve": "raxe.cli.serve:serve",
+    "stats": "raxe.cli.stats:stats",
+    "suppress": "raxe.cli.suppress:suppress",
+    "telemetry": "raxe.cli.telemetry:telemetry",
+    "tenant": "raxe.cli.tenant:tenant",
+    "test": "raxe.cli.test:test",
+    "tune": "raxe.cli.tune:tune",
+    "validate-rule": "raxe.cli.validate:validate_rule_command",
+}
 
 # Note: Telemetry flush is handled globally by cli.result_callback below
 
@@ -89,7 +97,12 @@ def _show_full_help(ctx, param, value):
     ctx.exit()
 
 
-@click.group(invoke_without_command=True, add_help_option=False)
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    invoke_without_command=True,
+    add_help_option=False,
+)
 @click.version_option(version=__version__, prog_name="RAXE CLI", message="%(prog)s %(version)s")
 @click.option(
     "--no-color",
@@ -132,9 +145,25 @@ def _show_full_help(ctx, param, value):
     callback=_show_full_help,
     help="Show all commands",
 )
+@click.option(
+    "--profile-import",
+    is_flag=True,
+    hidden=True,
+    help="Run the command and report per-module import time",
+)
 @click.pass_context
-def cli(ctx, no_color: bool, verbose: bool, quiet: bool, no_wizard: bool):
+def cli(
+    ctx,
+    no_color: bool,
+    verbose: bool,
+    quiet: bool,
+    no_wizard: bool,
+    profile_import: bool,
+):
     """RAXE - AI Security for LLMs • Privacy-First Threat Detection"""
+    if profile_import:
+        _run_import_profile(ctx)
+
     # Flush any stale telemetry from previous sessions (non-blocking background thread)
     # This recovers events that were queued but not flushed due to crashes or improper exit
     try:
@@ -199,6 +228,23 @@ def cli(ctx, no_color: bool, verbose: bool, quiet: bool, no_wizard: bool):
         setup_logging(enable_console_logging=True)
 
 
+def _run_import_profile(ctx: click.Context) -> None:
+    """Re-run this invocation under ``-X importtime`` and report, then exit."""
+    from rich.console import Console
+
+    from raxe.cli.import_profile import (
+        PROFILE_IMPORT_FLAG,
+        display_import_profile,
+        profile_imports,
+    )
+
+    args = [arg for arg in ctx.meta.get(RAW_ARGS_KEY, []) if arg != PROFILE_IMPORT_FLAG]
+    exit_code, timings = profile_imports(args)
+    # Report on stderr so machine-readable command output stays clean
+    display_import_profile(timings, Console(stderr=True))
+    ctx.exit(exit_code)
+
+
 @cli.result_callback()
 @click.pass_context
 def _flush_telemetry_on_exit(ctx, *args, **kwargs):
@@ -769,6 +815,8 @@ def scan(
             l2_kwarg = {"l2_enabled": True}
         else:
             l2_kwarg = {}  # Let Raxe() resolve via RAXE_ENABLE_L2 env var
+        from raxe.sdk.client import Raxe
+
         raxe = Raxe(progress_callback=progress, **l2_kwarg)
     except Exception as e:
         display_error("Failed to initialize RAXE", str(e))
@@ -1017,7 +1065,7 @@ def scan(
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["text", "json", "csv"]),
+    type=click.Choice(["text", "json", "jsonl", "csv"]),
     default="text",
     help="Output format (default: text)",
 )
@@ -1049,6 +1097,41 @@ def scan(
     "policy_id",
     help="Explicit policy ID override (highest priority)",
 )
+@click.option(
+    "--verdict-store",
+    "verdict_store",
+    is_flag=False,
+    flag_value="",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Record verdicts in a RAG verdict store to pre-warm it "
+    "(default path: ~/.raxe/rag_verdicts.db)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Scan processes, each loading the pipeline once (default: 1, in-process)",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=64,
+    help="Prompts handed to a worker at a time (default: 64)",
+)
+@click.option(
+    "--unordered",
+    is_flag=True,
+    help="Write results as soon as they complete instead of in input order",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False),
+    help="Save progress to this file and resume from it if it exists "
+    "(requires --output with jsonl or csv format)",
+)
 @handle_cli_error
 def batch_scan(
     file: str,
@@ -1058,11 +1141,18 @@ def batch_scan(
     tenant_id: str | None,
     app_id: str | None,
     policy_id: str | None,
+    verdict_store: str | None,
+    workers: int,
+    chunk_size: int,
+    unordered: bool,
+    checkpoint_path: str | None,
 ) -> None:
     """
     Batch scan prompts from a file.
 
-    Reads prompts from a file (one per line) and scans each.
+    Reads prompts from a file (one per line, or JSONL with a "prompt"
+    field) and scans each. Input is streamed and results are written as
+    they complete, so files of any size can be scanned.
 
     \b
     Examples:
@@ -1070,16 +1160,53 @@ def batch_scan(
       raxe batch prompts.txt --format json --output results.json
       raxe batch prompts.txt --fail-fast
 
+    \b
+    Large backfills (4 worker processes, resumable):
+      raxe batch chats.jsonl --format jsonl --output results.jsonl \\
+          --workers 4 --checkpoint results.ckpt
+      raxe batch chats.jsonl --format jsonl --output results.jsonl \\
+          --workers 4 --unordered
+
     \b
     Multi-Tenant Examples:
       raxe batch prompts.txt --tenant acme
       raxe batch prompts.txt --tenant acme --app chatbot
       raxe batch prompts.txt --tenant acme --policy strict
-    """
-    import csv as csv_module
-    from pathlib import Path
 
+    \b
+    Pre-warm the RAG verdict store with a corpus (one chunk per line, or
+    JSONL with a "prompt" field for multi-line chunks):
+      raxe batch corpus.jsonl --verdict-store
+      raxe batch corpus.jsonl --verdict-store /data/rag_verdicts.db
+    """
+    import os
+    import time
+
+    from raxe.application.batch_scan import (
+        BatchCheckpoint,
+        BatchScanEngine,
+        BatchState,
+        CsvSink,
+        JsonlSink,
+        JsonSink,
+        iter_chunks,
+    )
     from raxe.cli.branding import print_logo
+    from raxe.cli.output import create_throughput_progress_bar
+
+    checkpoint_interval_seconds = 5.0
+    max_table_rows = 1000
+
+    if output_format == "csv" and not output:
+        display_error("CSV format requires --output option", "Specify output file with --output")
+        sys.exit(EXIT_INVALID_INPUT)
+
+    if checkpoint_path and (not output or output_format not in ("jsonl", "csv")):
+        display_error(
+            "--checkpoint requires a resumable output",
+            "Use --format jsonl or --format csv with --output",
+        )
+        sys.exit(EXIT_INVALID_INPUT)
 
     # Show compact logo for text output
     if output_format == "text":
@@ -1088,159 +1215,197 @@ def batch_scan(
         # Check and display API key expiry warning if applicable
         check_and_display_expiry_warning(console)
 
-    try:
-        raxe = Raxe()
-    except Exception as e:
-        display_error("Failed to initialize RAXE", str(e))
-        console.print("Try running: [cyan]raxe init[/cyan]")
-        sys.exit(EXIT_CONFIG_ERROR)
-
-    # Read prompts from file
-    # Supports both plain text (one prompt per line) and JSON format
-    # JSON format: {"id": "...", "prompt": "...", ...} - extracts "prompt" field
-    import json as json_module
-
-    def extract_prompt(line: str) -> str:
-        """Extract prompt from line, handling JSON if present."""
-        line = line.strip()
-        if not line:
-            return ""
-        # Try to parse as JSON and extract "prompt" field
-        if line.startswith("{"):
-            try:
-                data = json_module.loads(line)
-                if isinstance(data, dict) and "prompt" in data:
-                    return str(data["prompt"])
-            except json_module.JSONDecodeError:
-                pass  # Not valid JSON, use line as-is
-        return line
-
-    try:
-        with open(file) as f:
-            prompts = [extract_prompt(line) for line in f]
-            prompts = [p for p in prompts if p]  # Filter empty
-    except Exception as e:
-        display_error("Failed to read input file", str(e))
-        sys.exit(EXIT_INVALID_INPUT)
-
-    if not prompts:
-        console.print("[yellow]No prompts found in file[/yellow]")
-        return
+    # Worker processes build their own clients; only in-process scans need one here
+    raxe = None
+    if workers == 1:
+        try:
+            from raxe.sdk.client import Raxe
 
-    console.print(f"[cyan]Batch scanning {len(prompts)} prompts...[/cyan]")
-    console.print()
+            raxe = Raxe()
+        except Exception as e:
+            display_error("Failed to initialize RAXE", str(e))
+            console.print("Try running: [cyan]raxe init[/cyan]")
+            sys.exit(EXIT_CONFIG_ERROR)
 
-    # Scan all prompts
-    results = []
-    threats_found = 0
-    critical_found = False
+    input_path = str(Path(file).resolve())
+    resume = None
+    if checkpoint_path and Path(checkpoint_path).exists():
+        try:
+            resume = BatchCheckpoint.load(checkpoint_path)
+        except (OSError, TypeError, ValueError) as e:
+            display_error("Failed to read checkpoint", str(e))
+            sys.exit(EXIT_INVALID_INPUT)
+        if resume.input_path != input_path or resume.output_format != output_format:
+            display_error(
+                "Checkpoint does not match this batch",
+                f"It was written for {resume.input_path} ({resume.output_format} output)",
+            )
+            sys.exit(EXIT_INVALID_INPUT)
+    else:
+        try:
+            if next(iter_chunks(file, 1), None) is None:
+                console.print("[yellow]No prompts found in file[/yellow]")
+                return
+        except Exception as e:
+            display_error("Failed to read input file", str(e))
+            sys.exit(EXIT_INVALID_INPUT)
 
-    from raxe.cli.output import create_progress_bar
+    state = BatchState(
+        resume or BatchCheckpoint(input_path=input_path, output_format=output_format)
+    )
 
-    with create_progress_bar("Scanning...") as progress:
-        task = progress.add_task("Processing...", total=len(prompts))
+    store = None
+    if verdict_store is not None:
+        from raxe.infrastructure.database.verdict_store import StoredVerdict, VerdictStore
 
-        for i, prompt in enumerate(prompts):
-            try:
-                result = raxe.scan(
-                    prompt,
-                    tenant_id=tenant_id,
-                    app_id=app_id,
-                    policy_id=policy_id,
-                )
-                results.append(
-                    {
-                        "line": i + 1,
-                        "prompt": prompt[:50] + "..." if len(prompt) > 50 else prompt,
-                        "has_threats": result.scan_result.has_threats,
-                        "detection_count": len(result.scan_result.l1_result.detections),
-                        "highest_severity": result.scan_result.combined_severity.value
-                        if result.scan_result.has_threats
-                        else "none",
-                        "duration_ms": result.duration_ms,
-                        "detections": [
-                            {
-                                "rule_id": d.rule_id,
-                                "severity": d.severity.value,
-                                "confidence": d.confidence,
-                            }
-                            for d in result.scan_result.l1_result.detections
-                        ],
-                    }
+        try:
+            store = VerdictStore(Path(verdict_store) if verdict_store else None)
+        except Exception as e:
+            display_error("Failed to open verdict store", str(e))
+            store = None
+
+    # Open the output sink; text output is rendered as a table at the end
+    stream = None
+    sink = None
+    if output_format != "text":
+        try:
+            if output:
+                if resume is not None:
+                    os.truncate(output, resume.output_size)
+                stream = open(
+                    output,
+                    "a" if resume is not None else "w",
+                    encoding="utf-8",
+                    newline="" if output_format == "csv" else None,
                 )
+            else:
+                stream = click.get_text_stream("stdout")
+        except OSError as e:
+            display_error("Failed to open output file", str(e))
+            sys.exit(EXIT_INVALID_INPUT)
 
-                if result.scan_result.has_threats:
-                    threats_found += 1
-                    if result.scan_result.combined_severity.value == "critical":
-                        critical_found = True
-                        if fail_fast:
-                            console.print()
-                            console.print(
-                                f"[red bold]Critical threat at line {i + 1}. Stopping.[/red bold]"
-                            )
-                            break
-
-                progress.update(task, completed=i + 1)
-
-            except Exception as e:
-                console.print()
-                display_error(f"Error scanning line {i + 1}", str(e))
-                if fail_fast:
-                    break
+        if output_format == "jsonl":
+            sink = JsonlSink(stream)
+        elif output_format == "csv":
+            sink = CsvSink(stream, header=resume is None)
+        else:
+            sink = JsonSink(stream)
+
+    def save_checkpoint() -> None:
+        sink.flush()
+        state.checkpoint.output_size = os.path.getsize(output)
+        state.checkpoint.save(checkpoint_path)
+
+    # Progress goes to stdout, so hide it while results stream there
+    show_progress = sink is None or output is not None
+    if show_progress:
+        if resume is not None:
+            console.print(
+                f"[cyan]Resuming batch scan after line {resume.line} "
+                f"({resume.scanned} prompts already scanned)...[/cyan]"
+            )
+        else:
+            console.print(f"[cyan]Batch scanning {file}...[/cyan]")
+        console.print()
 
-    console.print()
+    engine = BatchScanEngine(
+        raxe=raxe,
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=not unordered,
+        fail_fast=fail_fast,
+        scan_kwargs={"tenant_id": tenant_id, "app_id": app_id, "policy_id": policy_id},
+        content_hashes=store is not None,
+    )
 
-    # Output results
-    if output_format == "json":
-        import json
+    table_rows = []
+    verdicts_recorded = 0
+    stopped_at = None
+    started = time.monotonic()
+    scanned_before = state.checkpoint.scanned
+    last_saved = started
+
+    with create_throughput_progress_bar("Scanning...", disable=not show_progress) as progress:
+        task = progress.add_task(
+            "Processing...",
+            total=os.path.getsize(file),
+            completed=state.checkpoint.offset,
+            rate=0.0,
+        )
 
-        output_data = {
-            "total_scanned": len(results),
-            "threats_found": threats_found,
-            "results": results,
-        }
+        for chunk_result in engine.run(file, checkpoint=resume):
+            verdicts = {}
+            for result in chunk_result.results:
+                if result.error is not None:
+                    progress.console.print()
+                    display_error(f"Error scanning line {result.line}", result.error)
+                    continue
+
+                if sink is not None:
+                    sink.write(result.record)
+                elif len(table_rows) < max_table_rows:
+                    table_rows.append(result.record)
+
+                if result.content_hash is not None:
+                    verdicts[result.content_hash] = StoredVerdict(
+                        has_threats=result.has_threats,
+                        severity=result.severity,
+                        detection_count=result.total_detections,
+                    )
 
+            state.record(chunk_result)
+
+            if store is not None and verdicts:
+                try:
+                    store.put_many(verdicts, chunk_result.detection_key)
+                    verdicts_recorded += len(verdicts)
+                except Exception as e:
+                    display_error("Failed to update verdict store", str(e))
+                    store = None
+
+            last = chunk_result.results[-1] if chunk_result.results else None
+            if fail_fast and last is not None and (last.critical or last.error is not None):
+                stopped_at = last
+
+            now = time.monotonic()
+            progress.update(
+                task,
+                completed=state.checkpoint.offset,
+                rate=(state.totals.scanned - scanned_before) / max(now - started, 1e-9),
+            )
+            if checkpoint_path and (
+                stopped_at is not None or now - last_saved >= checkpoint_interval_seconds
+            ):
+                save_checkpoint()
+                last_saved = now
+
+    # Summaries count every scanned chunk, including any past the checkpoint
+    totals = state.totals
+    if sink is not None:
+        sink.close(totals)
         if output:
-            Path(output).write_text(json.dumps(output_data, indent=2))
-            display_success(f"Results written to {output}")
-        else:
-            click.echo(json.dumps(output_data, indent=2))
+            stream.close()
 
-    elif output_format == "csv":
-        if not output:
-            display_error(
-                "CSV format requires --output option", "Specify output file with --output"
-            )
-            sys.exit(EXIT_INVALID_INPUT)
+    console.print()
 
-        with open(output, "w", newline="") as f:
-            writer = csv_module.DictWriter(
-                f,
-                fieldnames=[
-                    "line",
-                    "prompt",
-                    "has_threats",
-                    "detection_count",
-                    "highest_severity",
-                    "duration_ms",
-                ],
-            )
-            writer.writeheader()
-            for result in results:
-                writer.writerow(
-                    {
-                        "line": result["line"],
-                        "prompt": result["prompt"],
-                        "has_threats": result["has_threats"],
-                        "detection_count": result["detection_count"],
-                        "highest_severity": result["highest_severity"],
-                        "duration_ms": result["duration_ms"],
-                    }
-                )
+    if stopped_at is not None and stopped_at.critical:
+        console.print(f"[red bold]Critical threat at line {stopped_at.line}. Stopping.[/red bold]")
+        console.print()
 
+    if output and sink is not None:
         display_success(f"Results written to {output}")
 
-    else:  # text format
+    if checkpoint_path and stopped_at is None:
+        # Finished: a later run with the same checkpoint starts over
+        Path(checkpoint_path).unlink(missing_ok=True)
+
+    if store is not None:
+        store.close()
+        console.print(f"[green]Recorded {verdicts_recorded} verdicts in {store.db_path}[/green]")
+        console.print()
+
+    clean_scans = totals.scanned - totals.errors
+    if output_format == "text":
         # Display summary
         from rich.table import Table
 
@@ -1251,7 +1416,7 @@ def batch_scan(
         table.add_column("Detections", justify="right", no_wrap=True)
         table.add_column("Time", justify="right", no_wrap=True)
 
-        for result in results:
+        for result in table_rows:
             if result["has_threats"]:
                 status = "[red]THREAT[/red]"
             else:
@@ -1266,15 +1431,20 @@ def batch_scan(
             )
 
         console.print(table)
+        if clean_scans > len(table_rows):
+            console.print(
+                f"[dim]{clean_scans - len(table_rows)} more results not shown. "
+                "Use --format jsonl --output FILE for the full results.[/dim]"
+            )
         console.print()
 
         # Summary
         console.print("[bold]Summary[/bold]")
-        console.print(f"  Total scanned: {len(results)}")
-        console.print(f"  Threats found: {threats_found}")
-        console.print(f"  Clean scans: {len(results) - threats_found}")
+        console.print(f"  Total scanned: {clean_scans}")
+        console.print(f"  Threats found: {totals.threats_found}")
+        console.print(f"  Clean scans: {clean_scans - totals.threats_found}")
 
-        if critical_found:
+        if totals.critical_found:
             console.print("  [red bold]Critical threats detected![/red bold]")
 
         console.print()
@@ -1284,8 +1454,9 @@ def batch_scan(
     try:
         from raxe.infrastructure.telemetry.flush_helper import ensure_telemetry_flushed
 
-        timeout = min(5.0 + len(prompts) * 0.05, 120.0)
-        max_batches = max(20, (len(prompts) // 50 + 1) * 2)
+        scanned = totals.scanned - scanned_before
+        timeout = min(5.0 + scanned * 0.05, 120.0)
+        max_batches = max(20, (scanned // 50 + 1) * 2)
 
         ensure_telemetry_flushed(
             timeout_seconds=timeout,
@@ -1295,7 +1466,7 @@ def batch_scan(
         pass  # Never let telemetry affect batch completion
 
     # Exit with code 1 if any threats detected
-    if threats_found > 0:
+    if totals.threats_found > 0:
         sys.exit(EXIT_THREAT_DETECTED)
 
 
@@ -1308,6 +1479,8 @@ def pack():
 @pack.command("list")
 def pack_list():
     """List installed rule packs."""
+    from raxe.sdk.client import Raxe
+
     raxe = Raxe()
 
     click.echo("Installed packs:")
@@ -1413,44 +1586,5 @@ def completion(shell: str):
     click.echo(comp.source())
 
 
-# Register new commands
-cli.add_command(auth)
-cli.add_command(test)
-cli.add_command(stats)
-cli.add_command(export)
-cli.add_command(repl)
-cli.add_command(rules)
-cli.add_command(doctor)
-cli.add_command(models)
-cli.add_command(profile_command)
-cli.add_command(privacy_command)
-cli.add_command(suppress)
-cli.add_command(tenant)
-cli.add_command(app)
-cli.add_command(policy)
-cli.add_command(tune)
-cli.add_command(validate_rule_command)
-cli.add_command(config)
-cli.add_command(event)
-cli.add_command(history)
-cli.add_command(telemetry)
-cli.add_command(help_command)
-cli.add_command(dashboard)
-cli.add_command(monitor)
-cli.add_command(serve)
-cli.add_command(mcp)
-
-# Top-level alias for 'raxe link ABC123' (same as 'raxe auth link ABC123')
-cli.add_command(auth_link, name="link")
-
-# MSSP/Partner ecosystem commands
-cli.add_command(mssp)
-cli.add_command(customer)
-cli.add_command(agent)
-
-# OpenClaw integration
-cli.add_command(openclaw)
-
-
 if __name__ == "__main__":
     cli()
@@ -1,6 +1,7 @@
 """CLI commands for L2 model management.
 
-Provides commands to list, inspect, test, and compare L2 models.
+Provides commands to list, inspect, test, and compare L2 models, and to
+replay voting and scoring over recorded head outputs.
 """
 
 import click
@@ -565,6 +566,140 @@ def download_model_cmd(model_name: str | None, download_all: bool, force: bool):
     console.print()
 
 
+@models.command("rescore")
+@click.option(
+    "--model-version",
+    help="Recorded model version to replay (default: most recently recorded)",
+)
+@click.option(
+    "--preset",
+    "presets",
+    multiple=True,
+    type=click.Choice(["balanced", "high_recall", "max_recall", "low_fp"]),
+    help="Voting preset to replay (repeatable, default: all presets)",
+)
+@click.option(
+    "--baseline",
+    type=click.Choice(["balanced", "high_recall", "max_recall", "low_fp"]),
+    default="balanced",
+    help="Preset the others are compared with (default: balanced)",
+)
+@click.option(
+    "--scoring-mode",
+    type=click.Choice(["high_security", "balanced", "low_fp"]),
+    help="Also replay hierarchical scoring in this mode",
+)
+@click.option(
+    "--unique",
+    is_flag=True,
+    help="Count each distinct text once",
+)
+def rescore_cmd(
+    model_version: str | None,
+    presets: tuple[str, ...],
+    baseline: str,
+    scoring_mode: str | None,
+    unique: bool,
+):
+    """Replay voting and scoring over recorded L2 head outputs.
+
+    Evaluates voting presets and scoring modes on historical traffic
+    without re-running the model. Requires head output recording:
+    set scan.record_head_outputs: true in config.yaml (or
+    RAXE_RECORD_HEAD_OUTPUTS=true) and scan as usual.
+
+    \b
+    Examples:
+      raxe models rescore
+      raxe models rescore --preset balanced --preset high_recall
+      raxe models rescore --baseline low_fp --scoring-mode high_security --unique
+    """
+    import time
+
+    from raxe.domain.ml.rescore import compare, rescore
+    from raxe.domain.ml.scoring_models import ActionType, ScoringMode
+    from raxe.domain.ml.threat_scorer import HierarchicalThreatScorer
+    from raxe.domain.ml.voting.binary_first_engine import BINARY_FIRST_PRESETS
+    from raxe.infrastructure.ml.head_output_store import HeadOutputStore
+
+    store = HeadOutputStore()
+    versions = store.model_versions()
+    if not versions:
+        console.print("[yellow]No head outputs recorded[/yellow]")
+        console.print()
+        console.print("Enable recording, then scan as usual:")
+        console.print("  [cyan]export RAXE_RECORD_HEAD_OUTPUTS=true[/cyan]")
+        console.print()
+        return
+
+    model_version = model_version or versions[0]
+    if model_version not in versions:
+        console.print(f"[red]No head outputs recorded for model: {model_version}[/red]")
+        console.print()
+        console.print("Recorded models:")
+        for version in versions:
+            console.print(f"  • {version}")
+        return
+
+    matrix = store.load(model_version)
+    if unique:
+        matrix = matrix.unique()
+
+    start = time.perf_counter()
+    scorer = HierarchicalThreatScorer(mode=ScoringMode(scoring_mode)) if scoring_mode else None
+    names = list(dict.fromkeys([baseline, *(presets or BINARY_FIRST_PRESETS)]))
+    results = {name: rescore(matrix, BINARY_FIRST_PRESETS[name], scorer) for name in names}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    total = len(matrix)
+    table = Table(title=f"Voting Replay ({total} scans, {model_version})")
+    table.add_column("Preset", style="cyan", no_wrap=True)
+    table.add_column("Safe", justify="right", style="green")
+    table.add_column("Review", justify="right", style="yellow")
+    table.add_column("Threat", justify="right", style="red")
+    table.add_column("Flagged", justify="right")
+    table.add_column(f"vs {baseline}", justify="right")
+
+    for name, result in results.items():
+        counts = result.decision_counts()
+        flagged = int(result.flagged.sum())
+        if name == baseline:
+            diff = "[dim]baseline[/dim]"
+        else:
+            comparison = compare(results[baseline], result)
+            diff = f"+{comparison.newly_flagged} / -{comparison.no_longer_flagged}"
+        table.add_row(
+            name,
+            str(counts.get("safe", 0)),
+            str(counts.get("review", 0)),
+            str(counts.get("threat", 0)),
+            f"{flagged} ({flagged / total:.1%})" if total else "0",
+            diff,
+        )
+
+    console.print()
+    console.print(table)
+
+    if scorer is not None:
+        actions = [action.value for action in ActionType]
+        scoring_table = Table(title=f"Scoring Replay ({scoring_mode} mode, flagged scans)")
+        scoring_table.add_column("Preset", style="cyan", no_wrap=True)
+        for action in actions:
+            scoring_table.add_column(action, justify="right")
+        for name, result in results.items():
+            counts = result.action_counts()
+            scoring_table.add_row(name, *(str(counts.get(action, 0)) for action in actions))
+        console.print()
+        console.print(scoring_table)
+
+    console.print()
+    console.print(
+        f"[dim]Replayed {len(results)} policies in {elapsed_ms:.1f}ms "
+        f"(+new / -cleared: flagged scans gained / lost vs {baseline})[/dim]"
+    )
+    console.print()
+
+
 @models.command("status")
 def model_status():
     """Show ML model installation status.
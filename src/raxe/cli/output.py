@@ -4,19 +4,31 @@ Rich output formatting utilities for RAXE CLI.
 Provides beautiful, colored terminal output for scan results and other CLI commands.
 """
 
+from __future__ import annotations
+
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 from rich.text import Text
 
-from raxe.cli.l2_formatter import L2ResultFormatter
 from raxe.domain.rules.models import Severity
-from raxe.sdk.client import ScanPipelineResult
+
+if TYPE_CHECKING:
+    # The SDK and L2 formatter (ML stack) are only imported when a scan
+    # result is actually displayed, keeping CLI startup cheap
+    from raxe.sdk.client import ScanPipelineResult
 
 # Global console instance — mutated by configure_console() when --no-color is set
 console = Console()
@@ -289,6 +301,8 @@ def _display_threat_detected(
     if result.scan_result.l2_result:
         has_predictions = result.scan_result.l2_result.has_predictions
         if has_predictions or explain:
+            from raxe.cli.l2_formatter import L2ResultFormatter
+
             formatter = L2ResultFormatter()
             formatter.format_predictions(
                 result.scan_result.l2_result,
@@ -475,6 +489,33 @@ def create_progress_bar(description: str) -> Progress:
     )
 
 
+def create_throughput_progress_bar(description: str, *, disable: bool = False) -> Progress:
+    """
+    Create a progress bar with throughput and ETA for streaming operations.
+
+    Tasks are expected to carry a ``rate`` field (items per second).
+
+    Args:
+        description: Description of the operation
+        disable: Hide the progress bar (e.g. while results stream to stdout)
+
+    Returns:
+        Progress bar instance
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("{task.fields[rate]:,.0f}/s"),
+        TimeElapsedColumn(),
+        TextColumn("ETA"),
+        TimeRemainingColumn(),
+        console=console,
+        disable=disable,
+    )
+
+
 def display_error(message: str, details: str | None = None) -> None:
     """
     Display an error message with rich formatting.
@@ -6,11 +6,13 @@ import json
 from datetime import datetime, timedelta, timezone
 
 import click
+from rich.table import Table
 
 from raxe.cli.output import console, display_error, no_color_option, quiet_option
 from raxe.infrastructure.analytics.aggregator import DataAggregator
 from raxe.infrastructure.analytics.engine import AnalyticsEngine
 from raxe.infrastructure.analytics.streaks import StreakTracker
+from raxe.infrastructure.database.scan_history import ScanHistoryDB
 from raxe.utils.error_sanitizer import sanitize_error_message
 
 
@@ -40,8 +42,28 @@ from raxe.utils.error_sanitizer import sanitize_error_message
     type=click.Path(),
     help="Export stats to JSON file",
 )
+@click.option(
+    "--rules",
+    "show_rules",
+    is_flag=True,
+    help="Show the costliest detection rules (sampled rule profiling)",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Number of rules to show with --rules (default: 10)",
+)
 @click.pass_context
-def stats(ctx, output_format: str, show_global: bool, retention: bool, export: str | None) -> None:
+def stats(
+    ctx,
+    output_format: str,
+    show_global: bool,
+    retention: bool,
+    export: str | None,
+    show_rules: bool,
+    top: int,
+) -> None:
     """
     Show local RAXE statistics and analytics.
 
@@ -51,12 +73,14 @@ def stats(ctx, output_format: str, show_global: bool, retention: bool, export: s
       - Engagement streaks and achievements
       - Global community statistics (--global)
       - Retention analysis (--retention)
+      - Costliest rules from sampled rule profiling (--rules)
 
     \b
     Examples:
       raxe stats                    # Show your statistics
       raxe stats --global           # Show global platform stats
       raxe stats --retention        # Show retention analysis
+      raxe stats --rules --top 5    # Show the 5 costliest rules
       raxe stats --format json      # Output as JSON
       raxe stats --export stats.json # Export to file
     """
@@ -78,7 +102,14 @@ def stats(ctx, output_format: str, show_global: bool, retention: bool, export: s
         # In production, this would come from installation tracking
         installation_id = _get_installation_id()
 
-        if show_global:
+        if show_rules:
+            # Show costliest rules (aggregated from sampled scans)
+            rule_costs = ScanHistoryDB().get_rule_costs(limit=top)
+            if output_format == "json":
+                click.echo(json.dumps([cost.to_dict() for cost in rule_costs], indent=2))
+            else:
+                _display_rule_costs(rule_costs)
+        elif show_global:
             # Show global statistics
             stats_data = engine.get_global_stats()
             if output_format == "json":
@@ -113,6 +144,9 @@ def stats(ctx, output_format: str, show_global: bool, retention: bool, export: s
                     "detection_rate": user_stats.detection_rate,
                     "last_scan": user_stats.last_scan.isoformat() if user_stats.last_scan else None,
                     "avg_scan_time_ms": user_stats.avg_scan_time_ms,
+                    "p50_scan_time_ms": user_stats.p50_scan_time_ms,
+                    "p95_scan_time_ms": user_stats.p95_scan_time_ms,
+                    "p99_scan_time_ms": user_stats.p99_scan_time_ms,
                     "l1_detections": user_stats.l1_detections,
                     "l2_detections": user_stats.l2_detections,
                 },
@@ -222,6 +256,11 @@ def _display_user_stats(user_stats, streak_info: dict, progress: dict, unlocked:
     # Performance
     console.print("[bold]Performance[/bold]")
     console.print(f"  └─ Avg scan time: {user_stats.avg_scan_time_ms:.1f}ms")
+    if user_stats.p95_scan_time_ms:
+        console.print(
+            f"  └─ P50/P95/P99: {user_stats.p50_scan_time_ms:.1f}/"
+            f"{user_stats.p95_scan_time_ms:.1f}/{user_stats.p99_scan_time_ms:.1f}ms"
+        )
     console.print(f"  └─ L1 detections: {user_stats.l1_detections}")
     console.print(f"  └─ L2 detections: {user_stats.l2_detections}")
     console.print()
@@ -279,6 +318,42 @@ def _display_global_stats(stats_data: dict) -> None:
     console.print()
 
 
+def _display_rule_costs(rule_costs: list) -> None:
+    """Display costliest rules in text format."""
+    console.print()
+    console.print("[bold cyan]⏱  Costliest Rules (sampled scans)[/bold cyan]")
+    console.print()
+
+    if not rule_costs:
+        console.print("[yellow]No rule profiling data yet[/yellow]")
+        console.print("[dim]Rules are profiled on a sample of scans; run more scans.[/dim]")
+        console.print()
+        return
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Rule ID", style="cyan")
+    table.add_column("Total (ms)", style="yellow", justify="right")
+    table.add_column("Mean (ms)", style="green", justify="right")
+    table.add_column("Max (ms)", style="red", justify="right")
+    table.add_column("Match rate", style="white", justify="right")
+    table.add_column("Worst input", style="white", justify="right")
+    table.add_column("Samples", style="dim", justify="right")
+
+    for cost in rule_costs:
+        table.add_row(
+            cost.rule_id,
+            f"{cost.total_ms:.2f}",
+            f"{cost.mean_ms:.3f}",
+            f"{cost.max_ms:.3f}",
+            f"{cost.match_rate * 100:.1f}%",
+            f"{cost.worst_input_length:,} chars",
+            f"{cost.samples:,}",
+        )
+
+    console.print(table)
+    console.print()
+
+
 def _display_retention_stats(retention_data: dict) -> None:
     """Display retention statistics in text format."""
     console.print()
@@ -3,14 +3,40 @@
 Commands for tuning confidence thresholds and benchmarking performance modes.
 """
 
+import json
+from pathlib import Path
+from typing import Any
+
 import click
+import numpy as np
 from rich.panel import Panel
 from rich.progress import Progress
 from rich.table import Table
 
 from raxe.cli.output import console, display_error, no_color_option, quiet_option
+from raxe.domain.ml.threshold_sweep import (
+    ScoreCapture,
+    ScoreMatrix,
+    SweepResult,
+    curve_thresholds,
+    revote,
+    sweep,
+)
+from raxe.domain.ml.voting.binary_first_engine import BINARY_FIRST_PRESETS
+from raxe.domain.ml.voting.engine import HeadOutputs
 from raxe.sdk.client import Raxe
 
+LABEL_VALUES = {
+    "1": True,
+    "true": True,
+    "threat": True,
+    "malicious": True,
+    "0": False,
+    "false": False,
+    "benign": False,
+    "safe": False,
+}
+
 
 @click.group(name="tune")
 def tune() -> None:
@@ -51,21 +77,39 @@ def tune() -> None:
 @click.option(
     "--test-file",
     type=click.Path(exists=True),
-    help="Test file with prompts (one per line)",
+    help='Test prompts: one per line, or JSONL with "prompt" and optional "label"',
+)
+@click.option(
+    "--curve-output",
+    type=click.Path(dir_okay=False),
+    help="Write ROC/PR curve points to this JSON file",
 )
 @click.pass_context
 def tune_threshold(
-    ctx, min_threshold: float, max_threshold: float, step: float, test_file: str | None
+    ctx,
+    min_threshold: float,
+    max_threshold: float,
+    step: float,
+    test_file: str | None,
+    curve_output: str | None,
 ) -> None:
     """Tune confidence threshold interactively.
 
     Tests different confidence thresholds to find the optimal balance
-    between precision and recall.
+    between precision and recall. Each prompt is scanned once; every
+    threshold and voting preset is then evaluated offline on the captured
+    scores.
+
+    With a labeled test file (JSONL lines such as
+    {"prompt": "...", "label": "threat"}), precision, recall, false
+    positive rate and F1 are reported and the threshold with the best F1
+    is recommended.
 
     Examples:
       raxe tune threshold
       raxe tune threshold --min 0.3 --max 0.7 --step 0.05
       raxe tune threshold --test-file test_prompts.txt
+      raxe tune threshold --test-file labeled.jsonl --curve-output curve.json
     """
     quiet = ctx.obj.get("quiet", False) if ctx.obj else False
     if not quiet:
@@ -74,6 +118,10 @@ def tune_threshold(
         print_logo(console, compact=True)
         console.print()
 
+    if step <= 0 or max_threshold < min_threshold:
+        display_error("Invalid threshold range", "Need --step > 0 and --max >= --min")
+        raise click.Abort()
+
     try:
         raxe = Raxe()
     except Exception as e:
@@ -81,9 +129,13 @@ def tune_threshold(
         raise click.Abort() from e
 
     # Load test prompts
+    labels: list[bool] | None = None
     if test_file:
-        with open(test_file) as f:
-            test_prompts = [line.strip() for line in f if line.strip()]
+        try:
+            test_prompts, labels = _load_test_file(test_file)
+        except ValueError as e:
+            display_error("Invalid test file", str(e))
+            raise click.Abort() from e
     else:
         # Use default test set
         test_prompts = _get_default_test_prompts()
@@ -92,54 +144,42 @@ def tune_threshold(
         display_error("No test prompts", "Provide --test-file or use defaults")
         return
 
+    steps = round((max_threshold - min_threshold) / step)
+    thresholds = np.round(min_threshold + step * np.arange(steps + 1), 6)
+
     console.print(
         Panel.fit(
             f"[bold cyan]Confidence Threshold Tuning[/bold cyan]\n\n"
-            f"Testing {len(test_prompts)} prompts\n"
+            f"Testing {len(test_prompts)} prompts"
+            f"{' (labeled)' if labels is not None else ''}\n"
             f"Threshold range: {min_threshold} to {max_threshold} (step: {step})",
             title="RAXE Tune",
         )
     )
 
-    # Test each threshold
-    results = []
-    thresholds = []
-    current = min_threshold
+    # Scan every prompt once without filtering and capture its raw scores
+    captures: list[ScoreCapture] = []
+    kept_labels: list[bool] = []
 
     with Progress() as progress:
-        task = progress.add_task(
-            "[cyan]Testing thresholds...",
-            total=int((max_threshold - min_threshold) / step) + 1,
-        )
-
-        while current <= max_threshold:
-            thresholds.append(current)
-
-            # Scan all prompts with this threshold
-            total_detections = 0
-            total_scans = 0
-
-            for prompt in test_prompts:
-                try:
-                    result = raxe.scan(prompt, confidence_threshold=current, entry_point="cli")
-                    total_scans += 1
-                    total_detections += result.total_detections
-                except Exception:  # noqa: S110 - skip failed scans during tuning
-                    pass
-
-            detection_rate = total_detections / total_scans if total_scans > 0 else 0
+        task = progress.add_task("[cyan]Scanning prompts...", total=len(test_prompts))
+
+        for i, prompt in enumerate(test_prompts):
+            try:
+                result = raxe.scan(prompt, confidence_threshold=0.0, entry_point="cli")
+                captures.append(_capture_scores(result))
+                if labels is not None:
+                    kept_labels.append(labels[i])
+            except Exception:  # noqa: S110 - skip failed scans during tuning
+                pass
+            progress.update(task, advance=1)
 
-            results.append(
-                {
-                    "threshold": current,
-                    "detections": total_detections,
-                    "rate": detection_rate,
-                    "scans": total_scans,
-                }
-            )
+    if not captures:
+        display_error("Tuning failed", "No prompt could be scanned")
+        raise click.Abort()
 
-            current += step
-            progress.update(task, advance=1)
+    matrix = ScoreMatrix.from_captures(captures, labels=kept_labels if labels is not None else None)
+    results = sweep(matrix, thresholds)
 
     # Display results
     console.print("\n[bold cyan]Threshold Analysis[/bold cyan]\n")
@@ -148,36 +188,64 @@ def tune_threshold(
     table.add_column("Threshold", justify="right")
     table.add_column("Detections", justify="right")
     table.add_column("Rate", justify="right")
+    if results.labeled:
+        for column in ("Precision", "Recall", "FPR", "F1"):
+            table.add_column(column, justify="right")
     table.add_column("Recommendation")
 
-    for r in results:
-        rate_str = f"{r['rate']:.2%}"
-
+    for i, threshold in enumerate(results.thresholds):
         # Determine recommendation
-        if 0.4 <= r["threshold"] <= 0.6:
+        if 0.4 <= threshold <= 0.6:
             rec = "[green]Balanced[/green]"
-        elif r["threshold"] < 0.4:
+        elif threshold < 0.4:
             rec = "[yellow]High Recall[/yellow]"
         else:
             rec = "[blue]High Precision[/blue]"
 
-        table.add_row(
-            f"{r['threshold']:.1f}",
-            str(r["detections"]),
-            rate_str,
-            rec,
-        )
+        row = [
+            f"{threshold:.2f}",
+            str(results.detections[i]),
+            f"{results.flagged[i] / results.total:.2%}",
+        ]
+        if results.labeled:
+            row += [
+                f"{results.precision[i]:.1%}",
+                f"{results.recall[i]:.1%}",
+                f"{results.fpr[i]:.1%}",
+                f"{results.f1[i]:.3f}",
+            ]
+        table.add_row(*row, rec)
 
     console.print(table)
 
-    # Find recommended threshold (around 0.5)
-    recommended = min(results, key=lambda r: abs(r["threshold"] - 0.5))
+    # Best F1 when labeled, otherwise the threshold closest to 0.5
+    if results.labeled:
+        best = int(np.argmax(results.f1))
+    else:
+        best = int(np.argmin(np.abs(results.thresholds - 0.5)))
 
     console.print(
-        f"\n[bold green]Recommended Threshold:[/bold green] {recommended['threshold']:.1f}"
+        f"\n[bold green]Recommended Threshold:[/bold green] {results.thresholds[best]:.2f}"
     )
-    console.print(f"  Detections: {recommended['detections']}")
-    console.print(f"  Rate: {recommended['rate']:.2%}")
+    console.print(f"  Detections: {results.detections[best]}")
+    console.print(f"  Rate: {results.flagged[best] / results.total:.2%} of prompts flagged")
+    if results.labeled:
+        console.print(
+            f"  Precision: {results.precision[best]:.1%}  Recall: {results.recall[best]:.1%}"
+            f"  F1: {results.f1[best]:.3f}"
+        )
+
+    presets = None
+    if matrix.has_head_outputs:
+        presets = {
+            name: sweep(matrix, results.thresholds[best : best + 1], revote(matrix, config))
+            for name, config in BINARY_FIRST_PRESETS.items()
+        }
+        _print_preset_table(presets, float(results.thresholds[best]))
+
+    if curve_output:
+        _write_curve(Path(curve_output), matrix, results, presets)
+        console.print(f"\n[green]Curve points written to {curve_output}[/green]")
 
 
 @tune.command("benchmark")
@@ -316,6 +384,117 @@ def benchmark_modes(iterations: int, text: str) -> None:
         )
 
 
+def _load_test_file(path: str) -> tuple[list[str], list[bool] | None]:
+    """Load tuning prompts and, if every line has one, their labels.
+
+    Lines are JSON objects with a "prompt" and optional "label" field, or
+    plain text prompts.
+
+    Raises:
+        ValueError: If only some prompts are labeled or a label is unknown
+    """
+    prompts: list[str] = []
+    labels: list[bool | None] = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = None
+            if line.startswith("{"):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+            if isinstance(record, dict) and "prompt" in record:
+                prompts.append(str(record["prompt"]))
+                label = record.get("label")
+                labels.append(None if label is None else _parse_label(label, line_no))
+            else:
+                prompts.append(line)
+                labels.append(None)
+
+    if all(label is None for label in labels):
+        return prompts, None
+    if any(label is None for label in labels):
+        raise ValueError("Either every prompt or no prompt must have a label")
+    return prompts, [bool(label) for label in labels]
+
+
+def _parse_label(label: Any, line_no: int) -> bool:
+    """Parse a ground-truth label (True = threat)."""
+    key = str(label).strip().lower()
+    if key not in LABEL_VALUES:
+        raise ValueError(f"Line {line_no}: unknown label {label!r}")
+    return LABEL_VALUES[key]
+
+
+def _capture_scores(result: Any) -> ScoreCapture:
+    """Capture the raw L1 and L2 scores of an unfiltered scan."""
+    scan_result = result.scan_result
+    l2_result = scan_result.l2_result
+    head_outputs = None
+    if l2_result is not None:
+        metadata = l2_result.metadata
+        if isinstance(metadata, dict) and isinstance(metadata.get("head_outputs"), dict):
+            head_outputs = HeadOutputs(**metadata["head_outputs"])
+
+    return ScoreCapture(
+        l1_confidences=tuple(float(d.confidence) for d in scan_result.l1_result.detections),
+        l2_predictions=len(l2_result.predictions) if l2_result is not None else 0,
+        head_outputs=head_outputs,
+    )
+
+
+def _print_preset_table(presets: dict[str, SweepResult], threshold: float) -> None:
+    """Show how each L2 voting preset performs at the recommended threshold."""
+    console.print(f"\n[bold cyan]Voting Presets (threshold {threshold:.2f})[/bold cyan]\n")
+
+    labeled = next(iter(presets.values())).labeled
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Preset")
+    table.add_column("Detections", justify="right")
+    table.add_column("Flagged", justify="right")
+    if labeled:
+        for column in ("Precision", "Recall", "FPR", "F1"):
+            table.add_column(column, justify="right")
+
+    for name, r in presets.items():
+        row = [name, str(r.detections[0]), str(r.flagged[0])]
+        if labeled:
+            row += [
+                f"{r.precision[0]:.1%}",
+                f"{r.recall[0]:.1%}",
+                f"{r.fpr[0]:.1%}",
+                f"{r.f1[0]:.3f}",
+            ]
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def _write_curve(
+    path: Path,
+    matrix: ScoreMatrix,
+    results: SweepResult,
+    presets: dict[str, SweepResult] | None,
+) -> None:
+    """Write the threshold grid, full curve and preset points as JSON.
+
+    The curve is swept over every distinct L1 score, so it holds every
+    ROC/PR point; a null threshold means L2 verdicts only.
+    """
+    data: dict[str, Any] = {
+        "prompts": len(matrix),
+        "labeled": results.labeled,
+        "grid": results.points(),
+        "curve": sweep(matrix, curve_thresholds(matrix)).points(),
+    }
+    if presets:
+        data["presets"] = {name: r.points()[0] for name, r in presets.items()}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
 def _get_default_test_prompts() -> list[str]:
     """Get default test prompts for threshold tuning."""
     return [
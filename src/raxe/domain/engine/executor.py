@@ -9,19 +9,35 @@ Performance targets:
 """
 
 import time
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import FrozenInstanceError, dataclass
 from datetime import datetime, timezone
 
+from regex import Pattern as RePattern
+
 from raxe.domain.engine.matcher import Match, PatternMatcher
 from raxe.domain.rules.models import Rule, Severity
+from raxe.domain.rules.ruleset import RulesetSnapshot
+
+# Called once per rule on profiled scans:
+# (rule, duration_ms, matched, per-pattern durations in ms)
+RuleObserver = Callable[[Rule, float, bool, list[float]], None]
+
+# Compiled regexes of one rule, aligned with rule.patterns (None = invalid)
+CompiledRule = tuple[RePattern[str] | None, ...]
 
 
-@dataclass(frozen=True)
 class Detection:
     """A detected threat from a rule match.
 
     Immutable value object representing a security threat.
 
+    Detections built by ``RuleExecutor`` carry a reference to the matching
+    rule; the timestamp string, message, category and rule explainability
+    fields are derived from it on first access (or on ``to_dict``) rather
+    than formatted for every detection up front. Explicitly passed values
+    always take precedence.
+
     Attributes:
         rule_id: ID of rule that matched
         rule_version: Version of rule that matched
@@ -41,35 +57,183 @@ class Detection:
         suppression_reason: Reason for suppression (if flagged or logged)
     """
 
+    __slots__ = (
+        "_category",
+        "_detected_at",
+        "_detected_ts",
+        "_docs_url",
+        "_message",
+        "_remediation_advice",
+        "_risk_explanation",
+        "_rule",
+        "confidence",
+        "detection_layer",
+        "explanation",
+        "is_flagged",
+        "layer_latency_ms",
+        "matches",
+        "rule_id",
+        "rule_version",
+        "severity",
+        "suppression_reason",
+    )
+
     rule_id: str
     rule_version: str
     severity: Severity
     confidence: float
     matches: list[Match]
-    detected_at: str
-    detection_layer: str = "L1"  # Default to L1 for backward compatibility
-    layer_latency_ms: float = 0.0
-    category: str = "unknown"
-    message: str = ""
-    explanation: str | None = None
-    risk_explanation: str = ""
-    remediation_advice: str = ""
-    docs_url: str = ""
-    is_flagged: bool = False
-    suppression_reason: str | None = None
+    detection_layer: str
+    layer_latency_ms: float
+    explanation: str | None
+    is_flagged: bool
+    suppression_reason: str | None
+    _detected_at: str | None
+    _detected_ts: float
+    _category: str | None
+    _message: str | None
+    _risk_explanation: str | None
+    _remediation_advice: str | None
+    _docs_url: str | None
+    _rule: Rule | None
+
+    def __init__(
+        self,
+        rule_id: str,
+        rule_version: str,
+        severity: Severity,
+        confidence: float,
+        matches: list[Match],
+        detected_at: str | None = None,
+        detection_layer: str = "L1",  # Default to L1 for backward compatibility
+        layer_latency_ms: float = 0.0,
+        category: str | None = None,
+        message: str | None = None,
+        explanation: str | None = None,
+        risk_explanation: str | None = None,
+        remediation_advice: str | None = None,
+        docs_url: str | None = None,
+        is_flagged: bool = False,
+        suppression_reason: str | None = None,
+        *,
+        rule: Rule | None = None,
+    ) -> None:
+        """Create and validate a detection.
 
-    def __post_init__(self) -> None:
-        """Validate detection after construction."""
-        if not (0.0 <= self.confidence <= 1.0):
-            raise ValueError(f"Confidence must be 0-1, got {self.confidence}")
-        if not self.matches:
+        Args:
+            rule_id: ID of rule that matched
+            rule_version: Version of rule that matched
+            severity: Threat severity level
+            confidence: Detection confidence (0.0-1.0)
+            matches: Pattern matches that triggered detection
+            detected_at: ISO timestamp (formatted lazily from creation time if None)
+            detection_layer: L1, L2, or PLUGIN
+            layer_latency_ms: Time taken by this layer
+            category: Threat category (derived from ``rule`` if None)
+            message: Human-readable message (derived from ``rule`` if None)
+            explanation: Optional explanation of why this was detected
+            risk_explanation: Why this is dangerous (from ``rule`` if None)
+            remediation_advice: How to mitigate (from ``rule`` if None)
+            docs_url: Documentation link (from ``rule`` if None)
+            is_flagged: True if matched by a FLAG suppression
+            suppression_reason: Reason for suppression
+            rule: Rule that produced the detection, used for lazy fields
+
+        Raises:
+            ValueError: If confidence, matches, layer or latency are invalid
+        """
+        if not (0.0 <= confidence <= 1.0):
+            raise ValueError(f"Confidence must be 0-1, got {confidence}")
+        if not matches:
             raise ValueError("Detection must have at least one match")
-        if self.detection_layer not in ("L1", "L2", "PLUGIN"):
-            raise ValueError(
-                f"detection_layer must be L1, L2, or PLUGIN, got {self.detection_layer}"
-            )
-        if self.layer_latency_ms < 0:
-            raise ValueError(f"layer_latency_ms cannot be negative: {self.layer_latency_ms}")
+        if detection_layer not in ("L1", "L2", "PLUGIN"):
+            raise ValueError(f"detection_layer must be L1, L2, or PLUGIN, got {detection_layer}")
+        if layer_latency_ms < 0:
+            raise ValueError(f"layer_latency_ms cannot be negative: {layer_latency_ms}")
+
+        setattr_ = object.__setattr__
+        setattr_(self, "rule_id", rule_id)
+        setattr_(self, "rule_version", rule_version)
+        setattr_(self, "severity", severity)
+        setattr_(self, "confidence", confidence)
+        setattr_(self, "matches", matches)
+        setattr_(self, "_detected_at", detected_at)
+        setattr_(self, "_detected_ts", time.time() if detected_at is None else 0.0)
+        setattr_(self, "detection_layer", detection_layer)
+        setattr_(self, "layer_latency_ms", layer_latency_ms)
+        setattr_(self, "_category", category)
+        setattr_(self, "_message", message)
+        setattr_(self, "explanation", explanation)
+        setattr_(self, "_risk_explanation", risk_explanation)
+        setattr_(self, "_remediation_advice", remediation_advice)
+        setattr_(self, "_docs_url", docs_url)
+        setattr_(self, "is_flagged", is_flagged)
+        setattr_(self, "suppression_reason", suppression_reason)
+        setattr_(self, "_rule", rule)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject mutation (detections are immutable)."""
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject mutation (detections are immutable)."""
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def _cache(self, name: str, value: str) -> str:
+        object.__setattr__(self, name, value)
+        return value
+
+    @property
+    def detected_at(self) -> str:
+        """ISO timestamp when detected."""
+        if self._detected_at is not None:
+            return self._detected_at
+        stamp = datetime.fromtimestamp(self._detected_ts, timezone.utc).isoformat()
+        return self._cache("_detected_at", stamp)
+
+    @property
+    def category(self) -> str:
+        """Category of threat (e.g., prompt_injection, jailbreak)."""
+        if self._category is not None:
+            return self._category
+        rule = self._rule
+        if rule is None:
+            return "unknown"
+        family = rule.family
+        value = family.value.lower() if hasattr(family, "value") else str(family).lower()
+        return self._cache("_category", value)
+
+    @property
+    def message(self) -> str:
+        """Human-readable message describing the detection."""
+        if self._message is not None:
+            return self._message
+        rule = self._rule
+        if rule is None:
+            return ""
+        # Truncate long descriptions
+        return self._cache("_message", f"{rule.name}: {rule.description[:100]}")
+
+    @property
+    def risk_explanation(self) -> str:
+        """Explanation of why this pattern is dangerous."""
+        if self._risk_explanation is not None:
+            return self._risk_explanation
+        return self._rule.risk_explanation if self._rule is not None else ""
+
+    @property
+    def remediation_advice(self) -> str:
+        """How to fix or mitigate this threat."""
+        if self._remediation_advice is not None:
+            return self._remediation_advice
+        return self._rule.remediation_advice if self._rule is not None else ""
+
+    @property
+    def docs_url(self) -> str:
+        """Link to documentation for learning more."""
+        if self._docs_url is not None:
+            return self._docs_url
+        return self._rule.docs_url if self._rule is not None else ""
 
     @property
     def match_count(self) -> int:
@@ -134,26 +298,71 @@ class Detection:
         Returns:
             New Detection instance with is_flagged=True
         """
-        # Since Detection is frozen, we must create a new instance
-        return Detection(
-            rule_id=self.rule_id,
-            rule_version=self.rule_version,
-            severity=self.severity,
-            confidence=self.confidence,
-            matches=self.matches,
-            detected_at=self.detected_at,
-            detection_layer=self.detection_layer,
-            layer_latency_ms=self.layer_latency_ms,
-            category=self.category,
-            message=self.message,
-            explanation=self.explanation,
-            risk_explanation=self.risk_explanation,
-            remediation_advice=self.remediation_advice,
-            docs_url=self.docs_url,
-            is_flagged=True,
-            suppression_reason=reason,
+        # Copy slots directly so lazily derived fields stay lazy
+        flagged = object.__new__(Detection)
+        for name in Detection.__slots__:
+            object.__setattr__(flagged, name, object.__getattribute__(self, name))
+        object.__setattr__(flagged, "is_flagged", True)
+        object.__setattr__(flagged, "suppression_reason", reason)
+        return flagged
+
+    def _fields(self) -> tuple[object, ...]:
+        return (
+            self.rule_id,
+            self.rule_version,
+            self.severity,
+            self.confidence,
+            self.matches,
+            self.detected_at,
+            self.detection_layer,
+            self.layer_latency_ms,
+            self.category,
+            self.message,
+            self.explanation,
+            self.risk_explanation,
+            self.remediation_advice,
+            self.docs_url,
+            self.is_flagged,
+            self.suppression_reason,
         )
 
+    def __eq__(self, other: object) -> bool:
+        """Compare by value (materializes lazy fields)."""
+        if not isinstance(other, Detection) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        """Hash by value (raises TypeError, as matches is a list)."""
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        """Dataclass-style representation."""
+        names = (
+            "rule_id",
+            "rule_version",
+            "severity",
+            "confidence",
+            "matches",
+            "detected_at",
+            "detection_layer",
+            "layer_latency_ms",
+            "category",
+            "message",
+            "explanation",
+            "risk_explanation",
+            "remediation_advice",
+            "docs_url",
+            "is_flagged",
+            "suppression_reason",
+        )
+        body = ", ".join(f"{n}={v!r}" for n, v in zip(names, self._fields(), strict=True))
+        return f"Detection({body})"
+
+    def __reduce__(self) -> tuple[type, tuple[object, ...]]:
+        """Pickle materialized fields (the rule reference is not pickled)."""
+        return (self.__class__, self._fields())
+
 
 @dataclass(frozen=True)
 class ScanResult:
@@ -265,13 +474,55 @@ class RuleExecutor:
     def __init__(self) -> None:
         """Initialize with pattern matcher."""
         self.matcher = PatternMatcher()
+        # (snapshot, compiled patterns) for the most recently seen ruleset
+        self._compiled_ruleset: tuple[RulesetSnapshot, tuple[CompiledRule, ...]] | None = None
 
-    def execute_rule(self, text: str, rule: Rule) -> Detection | None:
+    def compile_ruleset(self, snapshot: RulesetSnapshot) -> tuple[CompiledRule, ...]:
+        """Compile every pattern of a ruleset snapshot once.
+
+        The result is cached against the snapshot, so steady-state scans
+        reuse it and a newly published snapshot is compiled on first use.
+        Swapping the cache entry is a single assignment, so concurrent
+        scans on the old snapshot are unaffected.
+
+        Args:
+            snapshot: Ruleset snapshot to compile
+
+        Returns:
+            Compiled patterns aligned with ``snapshot.rules``
+        """
+        cached = self._compiled_ruleset
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+
+        compiled = tuple(self._compile_rule(rule) for rule in snapshot.rules)
+        self._compiled_ruleset = (snapshot, compiled)
+        return compiled
+
+    def _compile_rule(self, rule: Rule) -> CompiledRule:
+        """Compile a rule's patterns, marking invalid ones with None."""
+        compiled: list[RePattern[str] | None] = []
+        for pattern in rule.patterns:
+            try:
+                compiled.append(self.matcher.compile_pattern(pattern))
+            except ValueError:
+                compiled.append(None)
+        return tuple(compiled)
+
+    def execute_rule(
+        self,
+        text: str,
+        rule: Rule,
+        pattern_costs: list[float] | None = None,
+        compiled: CompiledRule | None = None,
+    ) -> Detection | None:
         """Execute a single rule against text.
 
         Args:
             text: Text to scan
             rule: Rule to apply
+            pattern_costs: Optional list receiving per-pattern durations (ms)
+            compiled: Pre-compiled regexes aligned with ``rule.patterns``
 
         Returns:
             Detection if rule matched, None otherwise
@@ -280,7 +531,7 @@ class RuleExecutor:
             Implements OR logic: if any pattern matches, rule matches.
         """
         # Match all patterns in rule (OR logic)
-        matches = self.matcher.match_all_patterns(text, rule.patterns)
+        matches = self.matcher.match_all_patterns(text, rule.patterns, pattern_costs, compiled)
 
         if not matches:
             return None
@@ -288,42 +539,36 @@ class RuleExecutor:
         # Calculate confidence based on match quality
         confidence = self._calculate_confidence(rule, matches)
 
-        # Derive category from rule family
-        category = (
-            rule.family.value.lower() if hasattr(rule.family, "value") else str(rule.family).lower()
-        )
-
-        # Create message from rule
-        message = f"{rule.name}: {rule.description[:100]}"  # Truncate long descriptions
-
-        # Create detection with explainability fields from rule
+        # Timestamp, message, category and explainability fields are
+        # derived from the rule lazily (most callers never read them)
         return Detection(
-            rule_id=rule.rule_id,
-            rule_version=rule.version,
-            severity=rule.severity,
-            confidence=confidence,
-            matches=matches,
-            detected_at=datetime.now(timezone.utc).isoformat(),
+            rule.rule_id,
+            rule.version,
+            rule.severity,
+            confidence,
+            matches,
             detection_layer="L1",  # Executor always produces L1 detections
-            layer_latency_ms=0.0,  # Will be set by caller if needed
-            category=category,
-            message=message,
-            explanation=None,
-            risk_explanation=rule.risk_explanation,
-            remediation_advice=rule.remediation_advice,
-            docs_url=rule.docs_url,
+            rule=rule,
         )
 
     def execute_rules(
         self,
         text: str,
         rules: list[Rule],
+        *,
+        rule_observer: RuleObserver | None = None,
+        compiled: Sequence[CompiledRule] | None = None,
     ) -> ScanResult:
         """Execute all rules against text.
 
         Args:
             text: Text to scan
             rules: Rules to apply
+            rule_observer: Optional callback timing every rule and pattern.
+                Only passed on sampled scans; unsampled scans take the
+                untimed loop.
+            compiled: Pre-compiled patterns aligned with ``rules``, as
+                returned by ``compile_ruleset`` for a snapshot's rules
 
         Returns:
             ScanResult with all detections and metadata
@@ -337,16 +582,21 @@ class RuleExecutor:
 
         detections: list[Detection] = []
 
-        for rule in rules:
-            try:
-                detection = self.execute_rule(text, rule)
-                if detection:
-                    detections.append(detection)
-            except Exception:  # noqa: S112
-                # Rule failed - skip it and continue
-                # Note: Broad except is intentional - domain layer can't log
-                # Caller in application layer should log failures
-                continue
+        if rule_observer is not None:
+            detections = self._execute_rules_observed(text, rules, rule_observer, compiled)
+        else:
+            for idx, rule in enumerate(rules):
+                try:
+                    detection = self.execute_rule(
+                        text, rule, compiled=compiled[idx] if compiled is not None else None
+                    )
+                    if detection:
+                        detections.append(detection)
+                except Exception:  # noqa: S112
+                    # Rule failed - skip it and continue
+                    # Note: Broad except is intentional - domain layer can't log
+                    # Caller in application layer should log failures
+                    continue
 
         duration_ms = (time.perf_counter() - start_time) * 1000
 
@@ -358,6 +608,44 @@ class RuleExecutor:
             scan_duration_ms=duration_ms,
         )
 
+    def _execute_rules_observed(
+        self,
+        text: str,
+        rules: list[Rule],
+        rule_observer: RuleObserver,
+        compiled: Sequence[CompiledRule] | None = None,
+    ) -> list[Detection]:
+        """Execute rules, reporting per-rule and per-pattern cost.
+
+        Args:
+            text: Text to scan
+            rules: Rules to apply
+            rule_observer: Callback receiving each rule's cost
+            compiled: Pre-compiled patterns aligned with ``rules``
+
+        Returns:
+            Detections from rules that matched
+        """
+        detections: list[Detection] = []
+        for idx, rule in enumerate(rules):
+            pattern_costs: list[float] = []
+            rule_start = time.perf_counter()
+            try:
+                detection = self.execute_rule(
+                    text, rule, pattern_costs, compiled[idx] if compiled is not None else None
+                )
+            except Exception:
+                detection = None
+            rule_observer(
+                rule,
+                (time.perf_counter() - rule_start) * 1000,
+                detection is not None,
+                pattern_costs,
+            )
+            if detection:
+                detections.append(detection)
+        return detections
+
     def _calculate_confidence(
         self,
         rule: Rule,
@@ -408,3 +696,4 @@ class RuleExecutor:
         Useful for testing or when rules change.
         """
         self.matcher.clear_cache()
+        self._compiled_ruleset = None
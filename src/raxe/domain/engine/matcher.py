@@ -9,20 +9,31 @@ Performance targets:
 - Timeout protection per pattern (enforced via regex module)
 """
 
-from dataclasses import dataclass
+import time
+from collections.abc import Sequence
+from dataclasses import FrozenInstanceError
 
 import regex
 from regex import Pattern as RePattern
 
 from raxe.domain.rules.models import Pattern
 
+# Characters of surrounding text kept as match context on each side
+CONTEXT_CHARS = 50
+
 
-@dataclass(frozen=True)
 class Match:
     """A single pattern match in text.
 
     Immutable value object representing where and what matched.
 
+    Matches produced by ``PatternMatcher`` keep their offsets and one
+    bounded window of the scanned text (the match plus ``CONTEXT_CHARS``
+    on each side); ``matched_text`` and the surrounding context are
+    sliced from it on first access and then cached. A match therefore
+    allocates one string instead of three, and results held in caches or
+    history never keep the full scanned text alive.
+
     Attributes:
         pattern_index: Which pattern in the rule matched (0-based)
         start: Start position in text
@@ -33,24 +44,160 @@ class Match:
         context_after: Up to 50 chars after match
     """
 
+    __slots__ = (
+        "_context_after",
+        "_context_before",
+        "_matched_text",
+        "_window",
+        "_window_start",
+        "end",
+        "groups",
+        "pattern_index",
+        "start",
+    )
+
     pattern_index: int
     start: int
     end: int
-    matched_text: str
     groups: tuple[str, ...]
-    context_before: str
-    context_after: str
+    _window: str | None
+    _window_start: int
+    _matched_text: str | None
+    _context_before: str | None
+    _context_after: str | None
+
+    def __init__(
+        self,
+        pattern_index: int,
+        start: int,
+        end: int,
+        matched_text: str | None = None,
+        groups: tuple[str, ...] = (),
+        context_before: str | None = None,
+        context_after: str | None = None,
+        *,
+        source: str | None = None,
+    ) -> None:
+        """Create a match.
+
+        Args:
+            pattern_index: Which pattern in the rule matched (0-based)
+            start: Start position in text
+            end: End position in text
+            matched_text: Matched text (sliced lazily from ``source`` if None)
+            groups: Captured groups from regex
+            context_before: Context before match (lazy from ``source`` if None)
+            context_after: Context after match (lazy from ``source`` if None)
+            source: Scanned text the offsets refer to (only the window
+                around the match is kept)
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "pattern_index", pattern_index)
+        setattr_(self, "start", start)
+        setattr_(self, "end", end)
+        setattr_(self, "groups", groups)
+        window = None
+        window_start = 0
+        if source is not None and None in (matched_text, context_before, context_after):
+            window_start = max(0, start - CONTEXT_CHARS)
+            window = source[window_start : end + CONTEXT_CHARS]
+        setattr_(self, "_window", window)
+        setattr_(self, "_window_start", window_start)
+        setattr_(self, "_matched_text", matched_text)
+        setattr_(self, "_context_before", context_before)
+        setattr_(self, "_context_after", context_after)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject mutation (matches are immutable)."""
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject mutation (matches are immutable)."""
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    @property
+    def matched_text(self) -> str:
+        """The actual matched text."""
+        value = self._matched_text
+        if value is None:
+            window, offset = self._window, self._window_start
+            value = window[self.start - offset : self.end - offset] if window is not None else ""
+            object.__setattr__(self, "_matched_text", value)
+        return value
+
+    @property
+    def context_before(self) -> str:
+        """Up to 50 chars before match."""
+        value = self._context_before
+        if value is None:
+            window = self._window
+            value = window[: self.start - self._window_start] if window is not None else ""
+            object.__setattr__(self, "_context_before", value)
+        return value
+
+    @property
+    def context_after(self) -> str:
+        """Up to 50 chars after match."""
+        value = self._context_after
+        if value is None:
+            window = self._window
+            value = window[self.end - self._window_start :] if window is not None else ""
+            object.__setattr__(self, "_context_after", value)
+        return value
 
     @property
     def match_length(self) -> int:
         """Length of matched text."""
         return self.end - self.start
 
+    @property
+    def retained_chars(self) -> int:
+        """Characters of text this match keeps alive, without slicing any."""
+        size = len(self._window) if self._window is not None else 0
+        for value in (self._matched_text, self._context_before, self._context_after):
+            if value is not None:
+                size += len(value)
+        return size
+
     @property
     def full_context(self) -> str:
         """Full context around match."""
         return f"{self.context_before}[{self.matched_text}]{self.context_after}"
 
+    def _fields(self) -> tuple[object, ...]:
+        return (
+            self.pattern_index,
+            self.start,
+            self.end,
+            self.matched_text,
+            self.groups,
+            self.context_before,
+            self.context_after,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by value (materializes text fields)."""
+        if not isinstance(other, Match) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        """Hash by value."""
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        """Dataclass-style representation."""
+        return (
+            f"Match(pattern_index={self.pattern_index!r}, start={self.start!r}, "
+            f"end={self.end!r}, matched_text={self.matched_text!r}, "
+            f"groups={self.groups!r}, context_before={self.context_before!r}, "
+            f"context_after={self.context_after!r})"
+        )
+
+    def __reduce__(self) -> tuple[type, tuple[object, ...]]:
+        """Pickle the materialized fields, not the text window."""
+        return (self.__class__, self._fields())
+
 
 class PatternMatcher:
     """Stateless pattern matching with timeout support.
@@ -119,6 +266,7 @@ class PatternMatcher:
         pattern: Pattern,
         pattern_index: int = 0,
         timeout_seconds: float | None = None,
+        compiled: RePattern[str] | None = None,
     ) -> list[Match]:
         """Match a single pattern against text with timeout.
 
@@ -127,6 +275,7 @@ class PatternMatcher:
             pattern: Pattern to match
             pattern_index: Index of this pattern in rule (for Match objects)
             timeout_seconds: Override pattern timeout (default: pattern.timeout or 5.0s)
+            compiled: Pre-compiled regex for ``pattern`` (skips the cache lookup)
 
         Returns:
             List of Match objects (empty if no matches)
@@ -136,29 +285,24 @@ class PatternMatcher:
         """
         # Use provided timeout, pattern timeout, or default of 5.0 seconds
         timeout = timeout_seconds if timeout_seconds is not None else (pattern.timeout or 5.0)
-        compiled = self.compile_pattern(pattern)
+        if compiled is None:
+            compiled = self.compile_pattern(pattern)
 
         matches: list[Match] = []
+        has_groups = compiled.groups > 0
 
         try:
             # regex module provides native timeout support via timeout parameter
+            # Matches keep offsets + a bounded window; strings are sliced lazily
             for match_obj in compiled.finditer(text, timeout=timeout):
-                start = match_obj.start()
-                end = match_obj.end()
-
-                # Extract context (50 chars before and after)
-                context_before = text[max(0, start - 50) : start]
-                context_after = text[end : min(len(text), end + 50)]
-
+                start, end = match_obj.span()
                 matches.append(
                     Match(
-                        pattern_index=pattern_index,
-                        start=start,
-                        end=end,
-                        matched_text=text[start:end],
-                        groups=match_obj.groups(),
-                        context_before=context_before,
-                        context_after=context_after,
+                        pattern_index,
+                        start,
+                        end,
+                        groups=match_obj.groups() if has_groups else (),
+                        source=text,
                     )
                 )
         except TimeoutError as e:
@@ -174,6 +318,8 @@ class PatternMatcher:
         self,
         text: str,
         patterns: list[Pattern],
+        pattern_costs: list[float] | None = None,
+        compiled: Sequence[RePattern[str] | None] | None = None,
     ) -> list[Match]:
         """Match all patterns from a rule against text.
 
@@ -182,6 +328,12 @@ class PatternMatcher:
         Args:
             text: Text to search
             patterns: List of patterns to match
+            pattern_costs: If given, the time spent on each pattern (in
+                milliseconds, in pattern order) is appended to this list.
+                Used by sampled rule profiling; omit on the hot path.
+            compiled: Pre-compiled regexes aligned with ``patterns`` (see
+                ``RuleExecutor.compile_ruleset``). A None entry marks a
+                pattern that failed to compile and is skipped.
 
         Returns:
             All matches from all patterns (may be empty)
@@ -192,9 +344,19 @@ class PatternMatcher:
         """
         all_matches: list[Match] = []
 
+        if pattern_costs is not None:
+            for idx, pattern in enumerate(patterns):
+                pattern_start = time.perf_counter()
+                try:
+                    all_matches.extend(self._match_indexed(text, pattern, idx, compiled))
+                except ValueError:
+                    pass
+                pattern_costs.append((time.perf_counter() - pattern_start) * 1000)
+            return all_matches
+
         for idx, pattern in enumerate(patterns):
             try:
-                matches = self.match_pattern(text, pattern, pattern_index=idx)
+                matches = self._match_indexed(text, pattern, idx, compiled)
                 all_matches.extend(matches)
             except ValueError:
                 # Pattern failed - skip it and continue with others
@@ -203,6 +365,21 @@ class PatternMatcher:
 
         return all_matches
 
+    def _match_indexed(
+        self,
+        text: str,
+        pattern: Pattern,
+        idx: int,
+        compiled: Sequence[RePattern[str] | None] | None,
+    ) -> list[Match]:
+        """Match one pattern, using its pre-compiled regex when available."""
+        if compiled is None:
+            return self.match_pattern(text, pattern, pattern_index=idx)
+        regex_obj = compiled[idx]
+        if regex_obj is None:
+            raise ValueError(f"Pattern failed to compile: {pattern.pattern}")
+        return self.match_pattern(text, pattern, pattern_index=idx, compiled=regex_obj)
+
     def inject_compiled_patterns(self, patterns: dict[str, RePattern[str]]) -> None:
         """Inject pre-compiled patterns into cache.
 
@@ -0,0 +1,141 @@
+"""Per-scan content fingerprint shared across scan subsystems.
+
+A single scan used to hash the same prompt several times: the pipeline
+(``text_hash``), scan history (``prompt_hash``), the telemetry builder,
+the embedding cache and the async result cache each ran their own SHA-256
+over the full text, and metrics re-encoded it to UTF-8 for ``input_length``.
+
+``ContentFingerprint`` is created once at the scan entry point and passed
+to every consumer. It carries:
+
+- ``data``: the UTF-8 bytes (encoded once, lazily)
+- ``cache_key``: a fast, non-cryptographic key for in-process caches
+- ``sha256``: a lazily computed SHA-256 for privacy-preserving hashes
+
+The fast key is derived from Python's built-in ``str`` hash (SipHash with
+a per-process random key). CPython caches that hash on the string object,
+so every cache that keys the *same* string pays for it at most once. The
+key is process-local and must never be persisted or sent over the wire;
+use ``sha256`` for anything that leaves the process.
+
+This module is part of the domain layer: pure computation, no I/O.
+
+Example:
+    fingerprint = ContentFingerprint.of(prompt)
+    fingerprint.cache_key        # '9b0c3e1f2a7d4c55' (process-local)
+    fingerprint.sha256           # computed on first access, then reused
+    fingerprint.prefixed_sha256  # 'sha256:...' for telemetry
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+_MASK_64 = (1 << 64) - 1
+
+
+def fast_content_key(text: str) -> str:
+    """Compute a fast, process-local cache key for text.
+
+    Uses the built-in string hash, which CPython caches on the string
+    object, so repeated calls for the same object are O(1).
+
+    Args:
+        text: Text to key
+
+    Returns:
+        16-character hex string (64 bits)
+    """
+    return format(hash(text) & _MASK_64, "016x")
+
+
+class ContentFingerprint:
+    """Lazily computed hashes and encodings of one scanned text.
+
+    Instances are cheap to create; nothing is hashed or encoded until the
+    corresponding attribute is first read. Not thread-safe for concurrent
+    first access, but the computed values are deterministic so a race
+    only costs a redundant computation.
+
+    Attributes:
+        text: The scanned text
+    """
+
+    __slots__ = ("_cache_key", "_data", "_sha256", "text")
+
+    def __init__(self, text: str) -> None:
+        """Create fingerprint for text.
+
+        Args:
+            text: Text being scanned
+        """
+        self.text = text
+        self._data: bytes | None = None
+        self._sha256: str | None = None
+        self._cache_key: str | None = None
+
+    @classmethod
+    def of(cls, text: str, fingerprint: ContentFingerprint | None = None) -> ContentFingerprint:
+        """Return a fingerprint for text, reusing an existing one if it matches.
+
+        Args:
+            text: Text being scanned
+            fingerprint: Previously computed fingerprint (may be None or stale)
+
+        Returns:
+            ``fingerprint`` if it describes ``text``, otherwise a new instance
+        """
+        if fingerprint is not None and fingerprint.matches(text):
+            return fingerprint
+        return cls(text)
+
+    def matches(self, text: str) -> bool:
+        """Check whether this fingerprint describes text.
+
+        Args:
+            text: Text to compare
+
+        Returns:
+            True if text is the fingerprinted text
+        """
+        return text is self.text or text == self.text
+
+    @property
+    def data(self) -> bytes:
+        """UTF-8 encoded text (encoded once)."""
+        if self._data is None:
+            self._data = self.text.encode("utf-8")
+        return self._data
+
+    @property
+    def byte_length(self) -> int:
+        """Length of the UTF-8 encoded text in bytes."""
+        return len(self.data)
+
+    @property
+    def char_length(self) -> int:
+        """Length of the text in characters."""
+        return len(self.text)
+
+    @property
+    def cache_key(self) -> str:
+        """Fast process-local key for in-memory caches (never persist)."""
+        if self._cache_key is None:
+            self._cache_key = fast_content_key(self.text)
+        return self._cache_key
+
+    @property
+    def sha256(self) -> str:
+        """Hex-encoded SHA-256 of the UTF-8 text (computed once)."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    @property
+    def prefixed_sha256(self) -> str:
+        """SHA-256 with ``sha256:`` prefix, as used by telemetry schemas."""
+        return f"sha256:{self.sha256}"
+
+    def __repr__(self) -> str:
+        """Representation without exposing the text."""
+        return f"ContentFingerprint(chars={len(self.text)}, key={self.cache_key})"
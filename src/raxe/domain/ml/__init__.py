@@ -48,11 +48,13 @@ from raxe.domain.ml.protocol import (
 )
 from raxe.domain.ml.scoring_models import (
     ActionType,
+    ScoringBatchResult,
     ScoringMode,
     ScoringResult,
     ScoringThresholds,
     ThreatLevel,
     ThreatScore,
+    ThreatScoreBatch,
 )
 from raxe.domain.ml.stub_detector import StubL2Detector
 
@@ -114,6 +116,7 @@ __all__ = [
     "L2ThresholdConfig",
     "MultilabelResult",
     "PrimaryTechnique",
+    "ScoringBatchResult",
     "ScoringMode",
     "ScoringResult",
     "ScoringThresholds",
@@ -122,6 +125,7 @@ __all__ = [
     "ThreatFamily",
     "ThreatLevel",
     "ThreatScore",
+    "ThreatScoreBatch",
     "create_example_config",
     "create_gemma_detector",
     "get_l2_config",
@@ -31,12 +31,13 @@ Example:
 
 from __future__ import annotations
 
-import hashlib
 import threading
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from raxe.domain.fingerprint import fast_content_key
+
 if TYPE_CHECKING:
     import numpy as np
 
@@ -69,8 +70,8 @@ class EmbeddingCache:
     Thread-safe LRU cache for text embeddings.
 
     Uses an OrderedDict for O(1) LRU operations and a threading.Lock
-    for thread safety. Cache keys are derived from SHA256 hashes of
-    the input text (first 16 characters for compactness).
+    for thread safety. Cache keys are the fast process-local content key
+    shared with the rest of the scan (see raxe.domain.fingerprint).
 
     Performance targets:
     - Cache hit: ~0.1ms
@@ -119,10 +120,12 @@ class EmbeddingCache:
     @staticmethod
     def _compute_key(text: str) -> str:
         """
-        Compute cache key from text using SHA256 hash.
+        Compute cache key from text.
 
-        Uses first 16 characters of hex digest for compactness while
-        maintaining extremely low collision probability.
+        Uses the same fast 64-bit content key as the rest of the scan
+        (the string hash is cached on the str object, so the key is free
+        when the same text was already keyed elsewhere). Keys are
+        process-local, which is fine for an in-memory cache.
 
         Args:
             text: Input text to hash
@@ -130,7 +133,7 @@ class EmbeddingCache:
         Returns:
             16-character hex string cache key
         """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        return fast_content_key(text)
 
     @property
     def enabled(self) -> bool:
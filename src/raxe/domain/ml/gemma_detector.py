@@ -26,6 +26,7 @@ from __future__ import annotations
 import json
 import re
 import time
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
@@ -41,7 +42,14 @@ from raxe.domain.ml.gemma_models import (
     ThreatFamily,
 )
 from raxe.domain.ml.l2_config import L2Config, get_l2_config
-from raxe.domain.ml.protocol import L2Prediction, L2Result, L2ThreatType
+from raxe.domain.ml.protocol import (
+    L2CancelledError,
+    L2CancelToken,
+    L2Prediction,
+    L2Result,
+    L2ThreatType,
+)
+from raxe.domain.ml.rescore import HeadOutputSink, HeadProbabilities
 from raxe.domain.ml.voting import (
     BinaryFirstEngine,
     Decision,
@@ -61,7 +69,9 @@ class GemmaL2Detector:
     Performance targets:
     - P95 latency: <50ms (with cache miss)
     - P50 latency: <10ms (with cache hit)
-    - Memory: ~1GB (296MB model + ONNX arena + runtime overhead)
+    - Memory: ~1GB (296MB model + ONNX arena + runtime overhead); in
+      pre-fork mode (see ``shared_models``) the model weights are shared
+      with the parent process instead of copied per worker
 
     Example:
         detector = GemmaL2Detector(model_dir="/path/to/models")
@@ -84,6 +94,8 @@ class GemmaL2Detector:
         scorer: Any | None = None,
         l2_config: L2Config | None = None,
         low_memory: bool = False,
+        optimized_graph_cache: bool = True,
+        head_output_sink: HeadOutputSink | None = None,
     ):
         """Initialize Gemma L2 detector.
 
@@ -96,6 +108,10 @@ class GemmaL2Detector:
             scorer: Optional HierarchicalThreatScorer instance
             l2_config: L2 configuration (uses global config if not provided)
             low_memory: Use shared ONNX arena and fewer threads to reduce RSS
+            optimized_graph_cache: Persist ORT-optimized graphs and load them
+                                   on later starts instead of re-optimizing
+            head_output_sink: Optional recorder of raw head probabilities,
+                              for offline rescoring (see raxe models rescore)
         """
         self.model_dir = Path(model_dir)
         self._l2_config = l2_config or get_l2_config()
@@ -112,6 +128,7 @@ class GemmaL2Detector:
             else self._l2_config.thresholds.harm_type_thresholds.copy()
         )
         self.scorer = scorer
+        self._head_output_sink = head_output_sink
 
         # Initialize voting engine if enabled
         # Default: BinaryFirstEngine (TPR 90.4%, FPR 7.4%)
@@ -204,35 +221,60 @@ class GemmaL2Detector:
                 self._shared_arena_registered = False
                 logger.warning("Shared ONNX arena registration failed", error=str(e))
 
-        # Create session options
-        sess_options = ort.SessionOptions()
-        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-        sess_options.log_severity_level = 3  # ERROR only
-        sess_options.intra_op_num_threads = 2 if low_memory else 4
-        sess_options.inter_op_num_threads = 1
-        sess_options.enable_mem_pattern = True
-        if self._shared_arena_registered:
-            sess_options.add_session_config_entry("session.use_env_allocators", "1")
-        else:
-            sess_options.enable_cpu_mem_arena = True
+        # Session options are built per session: the optimized graph cache
+        # adjusts them (optimization level, output path) for each model
+        from raxe.domain.ml.shared_models import (
+            configure_shared_session_options,
+            has_shared_models,
+        )
+
+        # Pre-fork mode: build sessions from model bytes loaded by the parent
+        # process, so weights are shared instead of copied per worker
+        self._shared_weights = has_shared_models()
+
+        def make_session_options() -> ort.SessionOptions:
+            sess_options = ort.SessionOptions()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_options.log_severity_level = 3  # ERROR only
+            sess_options.intra_op_num_threads = 2 if low_memory else 4
+            sess_options.inter_op_num_threads = 1
+            sess_options.enable_mem_pattern = True
+            if self._shared_arena_registered:
+                sess_options.add_session_config_entry("session.use_env_allocators", "1")
+            else:
+                sess_options.enable_cpu_mem_arena = True
+            if self._shared_weights:
+                configure_shared_session_options(sess_options)
+            return sess_options
 
         providers = ["CPUExecutionProvider"]
 
-        # Load embedding model
-        embedding_path = self._find_model_file("model", ".onnx")
-        logger.info("Loading embedding model", path=str(embedding_path))
-        self._embedding_session = ort.InferenceSession(
-            str(embedding_path), sess_options, providers=providers
-        )
+        # Load the embedding model and classifier heads. Sessions are built
+        # in parallel threads (one at a time in low-memory mode to bound
+        # peak RSS), from pre-optimized graphs when cached.
+        from raxe.domain.ml.optimized_graphs import OptimizedGraphCache, create_sessions
 
-        # Load classifier heads
-        self._classifiers: dict[str, ort.InferenceSession] = {}
+        self._graph_cache = (
+            OptimizedGraphCache.for_model_dir(self.model_dir, ort.__version__)
+            if optimized_graph_cache
+            else None
+        )
+        model_paths = {"embedding": self._find_model_file("model", ".onnx")}
         for head in ["is_threat", "threat_family", "severity", "primary_technique", "harm_types"]:
-            classifier_path = self._find_model_file(f"classifier_{head}", ".onnx")
-            logger.info("Loading classifier", head=head, path=str(classifier_path))
-            self._classifiers[head] = ort.InferenceSession(
-                str(classifier_path), sess_options, providers=providers
-            )
+            model_paths[head] = self._find_model_file(f"classifier_{head}", ".onnx")
+        logger.info("Loading ONNX sessions", models={k: str(v) for k, v in model_paths.items()})
+
+        sessions, self._session_load_stats = create_sessions(
+            ort,
+            model_paths,
+            make_session_options,
+            providers,
+            cache=self._graph_cache,
+            max_workers=1 if low_memory else None,
+        )
+        self._embedding_session = sessions.pop("embedding")
+        self._classifiers: dict[str, ort.InferenceSession] = sessions
+        logger.info("ONNX sessions loaded", **self._session_load_stats.to_dict())
 
         # Load label config
         label_config_path = self.model_dir / "label_config.json"
@@ -270,9 +312,14 @@ class GemmaL2Detector:
             energy_path = self.model_dir / "energy_head.onnx"
             if energy_path.exists():
                 try:
-                    self._energy_session = ort.InferenceSession(
-                        str(energy_path), sess_options, providers=providers
+                    energy_sessions, _ = create_sessions(
+                        ort,
+                        {"energy": energy_path},
+                        make_session_options,
+                        providers,
+                        cache=self._graph_cache,
                     )
+                    self._energy_session = energy_sessions["energy"]
                     self._energy_load_status = "loaded"
                     logger.info("Energy head loaded", path=str(energy_path))
                 except Exception as e:
@@ -297,6 +344,7 @@ class GemmaL2Detector:
             embedding_dim=self._embedding_dim,
             cache_size=cache_size,
             confidence_threshold=confidence_threshold,
+            shared_weights=self._shared_weights,
         )
 
     def _find_model_file(self, prefix: str, suffix: str) -> Path:
@@ -327,6 +375,8 @@ class GemmaL2Detector:
         text: str,
         l1_results: L1ScanResult,
         context: dict[str, Any] | None = None,
+        *,
+        cancel_token: L2CancelToken | None = None,
     ) -> L2Result:
         """Analyze text for threats using Gemma 5-head classifier.
 
@@ -334,18 +384,28 @@ class GemmaL2Detector:
             text: Text to analyze
             l1_results: Results from L1 rule-based detection
             context: Optional context metadata
+            cancel_token: Optional cancellation handle; cancelling it
+                terminates the ONNX runs of this analysis
 
         Returns:
             L2Result with predictions from all 5 heads and voting metadata
+
+        Raises:
+            L2CancelledError: If cancel_token was cancelled before completion
         """
         start_time = time.perf_counter()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        run_options = self._run_options(cancel_token)
 
         try:
             # Generate embeddings (with caching) and get token info
-            embeddings, token_count, tokens_truncated = self._generate_embeddings(text)
+            embeddings, token_count, tokens_truncated = self._generate_embeddings(text, run_options)
 
             # Run classification (returns both classification and voting result)
-            classification, voting_result = self._classify(embeddings, text=text)
+            classification, voting_result, head_outputs = self._classify(
+                embeddings, text=text, run_options=run_options
+            )
 
             # Build predictions
             predictions = self._build_predictions(classification, text, voting_result)
@@ -385,7 +445,9 @@ class GemmaL2Detector:
                     # Use raw embedding (256-dim, L2-normalized) BEFORE
                     # handcrafted feature concatenation in _classify()
                     energy_input = embeddings.astype(np.float32)
-                    energy_out = self._energy_session.run(None, {"features": energy_input})
+                    energy_out = self._energy_session.run(
+                        None, {"features": energy_input}, run_options
+                    )
                     energy_score = float(energy_out[0][0][0])
 
                     cfg = self._energy_config or {}
@@ -426,6 +488,9 @@ class GemmaL2Detector:
             }
             if energy_data is not None:
                 metadata["energy"] = energy_data
+            if head_outputs is not None:
+                # Raw head outputs let tuning tools re-vote offline
+                metadata["head_outputs"] = asdict(head_outputs)
 
             return L2Result(
                 predictions=predictions,
@@ -447,6 +512,9 @@ class GemmaL2Detector:
             )
 
         except Exception as e:
+            if cancel_token is not None and cancel_token.cancelled:
+                # ONNX runs fail once RunOptions.terminate is set
+                raise L2CancelledError("L2 analysis cancelled") from e
             logger.error("Gemma detection failed", error=str(e), exc_info=True)
             duration_ms = (time.perf_counter() - start_time) * 1000
             return L2Result(
@@ -480,13 +548,37 @@ class GemmaL2Detector:
         else:
             return "ALLOW"
 
-    def _generate_embeddings(self, text: str) -> tuple[np.ndarray, int, bool]:
+    def _run_options(self, cancel_token: L2CancelToken | None) -> Any | None:
+        """ONNX run options that terminate in-flight runs on cancellation.
+
+        Args:
+            cancel_token: Cancellation handle of the analysis (or None)
+
+        Returns:
+            onnxruntime.RunOptions bound to the token, or None without a token
+        """
+        if cancel_token is None:
+            return None
+
+        import onnxruntime as ort
+
+        run_options = ort.RunOptions()
+        cancel_token.on_cancel(lambda: setattr(run_options, "terminate", True))
+        return run_options
+
+    def _generate_embeddings(
+        self, text: str, run_options: Any | None = None
+    ) -> tuple[np.ndarray, int, bool]:
         """Generate embeddings with optional caching.
 
         The EmbeddingGemma model outputs two tensors:
         - outputs[0]: token embeddings (batch, seq_len, hidden_dim)
         - outputs[1]: pooled embedding (batch, hidden_dim) - used directly
 
+        Args:
+            text: Text to embed
+            run_options: Optional onnxruntime.RunOptions for the run
+
         Returns:
             Tuple of:
             - embeddings: numpy array of shape (1, embedding_dim)
@@ -536,6 +628,7 @@ class GemmaL2Detector:
                 "input_ids": inputs["input_ids"].astype(np.int64),
                 "attention_mask": inputs["attention_mask"].astype(np.int64),
             },
+            run_options,
         )
 
         # outputs[1] is the model's pooled embedding (batch_size, hidden_dim)
@@ -598,8 +691,11 @@ class GemmaL2Detector:
         return features.astype(np.float32)
 
     def _classify(
-        self, embeddings: np.ndarray, text: str | None = None
-    ) -> tuple[GemmaClassificationResult, VotingResult | None]:
+        self,
+        embeddings: np.ndarray,
+        text: str | None = None,
+        run_options: Any | None = None,
+    ) -> tuple[GemmaClassificationResult, VotingResult | None, HeadOutputs | None]:
         """Run all 5 classifier heads with ensemble logic.
 
         Each classifier returns 2 outputs:
@@ -609,10 +705,12 @@ class GemmaL2Detector:
         Args:
             embeddings: Embedding array of shape (1, embedding_dim)
             text: Optional text for handcrafted feature extraction (model v3+)
+            run_options: Optional onnxruntime.RunOptions for the head runs
 
         Returns:
-            Tuple of (GemmaClassificationResult, VotingResult or None)
-            VotingResult is None if voting engine is disabled.
+            Tuple of (GemmaClassificationResult, VotingResult or None,
+            HeadOutputs or None). VotingResult and HeadOutputs are None if
+            voting engine is disabled.
         """
         embeddings_f32 = embeddings.astype(np.float32)
 
@@ -626,14 +724,16 @@ class GemmaL2Detector:
         # ════════════════════════════════════════════════════════════════════
 
         # 1. Binary threat classification
-        is_threat_outputs = self._classifiers["is_threat"].run(None, {"embeddings": embeddings_f32})
+        is_threat_outputs = self._classifiers["is_threat"].run(
+            None, {"embeddings": embeddings_f32}, run_options
+        )
         is_threat_proba = is_threat_outputs[1][0]  # [benign_prob, threat_prob]
         safe_prob = float(is_threat_proba[0])
         threat_prob = float(is_threat_proba[1])
 
         # 2. Threat family
         family_outputs = self._classifiers["threat_family"].run(
-            None, {"embeddings": embeddings_f32}
+            None, {"embeddings": embeddings_f32}, run_options
         )
         family_proba = family_outputs[1][0]
         family_idx = int(np.argmax(family_proba))
@@ -641,7 +741,9 @@ class GemmaL2Detector:
         threat_family = ThreatFamily.from_index(family_idx)
 
         # 3. Severity
-        severity_outputs = self._classifiers["severity"].run(None, {"embeddings": embeddings_f32})
+        severity_outputs = self._classifiers["severity"].run(
+            None, {"embeddings": embeddings_f32}, run_options
+        )
         severity_proba = severity_outputs[1][0]
         severity_idx = int(np.argmax(severity_proba))
         severity_confidence = float(severity_proba[severity_idx])
@@ -649,7 +751,7 @@ class GemmaL2Detector:
 
         # 4. Primary technique (always run for voting engine)
         technique_outputs = self._classifiers["primary_technique"].run(
-            None, {"embeddings": embeddings_f32}
+            None, {"embeddings": embeddings_f32}, run_options
         )
         technique_proba_arr = technique_outputs[1][0]
         technique_idx = int(np.argmax(technique_proba_arr))
@@ -658,17 +760,32 @@ class GemmaL2Detector:
         technique_proba = tuple(float(p) for p in technique_proba_arr)
 
         # 5. Harm types (always run for voting engine)
-        harm_outputs = self._classifiers["harm_types"].run(None, {"embeddings": embeddings_f32})
+        harm_outputs = self._classifiers["harm_types"].run(
+            None, {"embeddings": embeddings_f32}, run_options
+        )
         harm_proba = harm_outputs[1][0]
         harm_types_result = self._process_multilabel_harm_types(harm_proba)
         harm_max_prob = max(float(p) for p in harm_proba)
         harm_active_labels = [h.value for h in harm_types_result.active_labels]
 
+        if self._head_output_sink is not None and text is not None:
+            self._record_head_probabilities(
+                text,
+                HeadProbabilities(
+                    binary=is_threat_proba,
+                    family=family_proba,
+                    severity=severity_proba,
+                    technique=technique_proba_arr,
+                    harm=harm_proba,
+                ),
+            )
+
         # ════════════════════════════════════════════════════════════════════
         # DECISION LOGIC: Voting Engine or Legacy Ensemble
         # ════════════════════════════════════════════════════════════════════
 
         voting_result: VotingResult | None = None
+        head_outputs: HeadOutputs | None = None
 
         if self._voting_enabled and self._voting_engine:
             # Use new VotingEngine for transparent weighted voting
@@ -723,7 +840,14 @@ class GemmaL2Detector:
             family_override_triggered=family_override_triggered,
         )
 
-        return result, voting_result
+        return result, voting_result, head_outputs
+
+    def _record_head_probabilities(self, text: str, probabilities: HeadProbabilities) -> None:
+        """Pass head probabilities to the sink; recording never fails a scan."""
+        try:
+            self._head_output_sink.append(self._model_version, text, probabilities)
+        except Exception as e:
+            logger.warning("Failed to record head outputs", error=str(e))
 
     def _legacy_ensemble_logic(
         self,
@@ -1055,6 +1179,11 @@ class GemmaL2Detector:
         """Apply sigmoid to logits."""
         return 1 / (1 + np.exp(-x))
 
+    @property
+    def session_load_stats(self) -> dict[str, Any]:
+        """How the ONNX sessions were created (optimized graph cache use, timing)."""
+        return self._session_load_stats.to_dict()
+
     @property
     def model_info(self) -> dict[str, Any]:
         """Return model information."""
@@ -1067,6 +1196,7 @@ class GemmaL2Detector:
             "latency_p95_ms": 50,
             "embedding_model": "google/embeddinggemma-300m",
             "embedding_dim": self._embedding_dim,
+            "shared_weights": self._shared_weights,
             "heads": [
                 "is_threat",
                 "threat_family",
@@ -1091,6 +1221,7 @@ def create_gemma_detector(
     cache_size: int = 1000,
     scorer: Any | None = None,
     low_memory: bool = False,
+    head_output_sink: HeadOutputSink | None = None,
 ) -> GemmaL2Detector:
     """Factory function to create Gemma L2 detector.
 
@@ -1101,6 +1232,7 @@ def create_gemma_detector(
         cache_size: Size of embedding cache (0 to disable)
         scorer: Optional HierarchicalThreatScorer instance
         low_memory: Reduce memory via shared ONNX arena and fewer threads
+        head_output_sink: Optional recorder of raw head probabilities
 
     Returns:
         GemmaL2Detector instance
@@ -1112,4 +1244,5 @@ def create_gemma_detector(
         cache_size=cache_size,
         scorer=scorer,
         low_memory=low_memory,
+        head_output_sink=head_output_sink,
     )
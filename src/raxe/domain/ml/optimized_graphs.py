@@ -0,0 +1,326 @@
+"""Persistent cache of ONNX Runtime-optimized model graphs.
+
+Building an ``InferenceSession`` with ``ORT_ENABLE_ALL`` re-runs the full
+graph optimizer (constant folding, fusions, layout transforms) on every
+process start - seconds for the EmbeddingGemma model, paid again by every
+autoscaled pod. ``OptimizedGraphCache`` saves each session's optimized
+graph on first load (``SessionOptions.optimized_model_filepath``) and
+loads it with optimization disabled afterwards.
+
+Cached graphs are keyed by:
+- ONNX Runtime version (optimizer output changes between releases)
+- SHA-256 of the source model (memoized per file size/mtime, so the
+  ~300MB model is hashed once, not on every start)
+- CPU features (ORT_ENABLE_ALL emits hardware-specific kernels and
+  layouts, so a graph built on an AVX-512 host is not reused elsewhere)
+
+Graphs are written to ``<model_dir>/.ort_optimized/`` when the model
+directory is writable, otherwise to ``~/.raxe/cache/ort_optimized/``.
+``create_sessions`` builds several sessions in parallel threads; ONNX
+Runtime releases the GIL while loading and optimizing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from raxe.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+OPTIMIZED_DIRNAME = ".ort_optimized"
+OPTIMIZED_SUFFIX = ".opt.onnx"
+_CHECKSUMS_FILENAME = "checksums.json"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class SessionLoadRecord:
+    """How one inference session was created.
+
+    Attributes:
+        name: Session name (e.g. "embedding", "is_threat")
+        source: "optimized_cache" (pre-optimized graph), "optimized_now"
+            (optimized and written to the cache), "shared" (pre-fork
+            shared bytes) or "direct" (cache disabled or unwritable)
+        load_ms: Time to create the session
+        optimize_ms: Time the full optimization took when the cached graph
+            was built (0.0 if unknown)
+    """
+
+    name: str
+    source: str
+    load_ms: float
+    optimize_ms: float = 0.0
+
+    @property
+    def saved_ms(self) -> float:
+        """Estimated time saved by loading a pre-optimized graph."""
+        if self.source != "optimized_cache":
+            return 0.0
+        return max(self.optimize_ms - self.load_ms, 0.0)
+
+
+@dataclass
+class SessionLoadStats:
+    """Aggregate statistics for a set of sessions.
+
+    Attributes:
+        records: Per-session records
+        wall_ms: Wall-clock time to create all sessions
+    """
+
+    records: list[SessionLoadRecord] = field(default_factory=list)
+    wall_ms: float = 0.0
+
+    @property
+    def cache_hits(self) -> int:
+        """Sessions loaded from a pre-optimized graph."""
+        return sum(1 for r in self.records if r.source == "optimized_cache")
+
+    @property
+    def cache_misses(self) -> int:
+        """Sessions that were optimized during this load."""
+        return sum(1 for r in self.records if r.source == "optimized_now")
+
+    @property
+    def saved_ms(self) -> float:
+        """Estimated optimization time saved by the cache."""
+        return sum(r.saved_ms for r in self.records)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for ``initialization_stats``."""
+        return {
+            "sessions": len(self.records),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "session_load_wall_ms": round(self.wall_ms, 1),
+            "session_load_total_ms": round(sum(r.load_ms for r in self.records), 1),
+            "optimization_saved_ms": round(self.saved_ms, 1),
+            "per_session": {
+                r.name: {"source": r.source, "load_ms": round(r.load_ms, 1)} for r in self.records
+            },
+        }
+
+
+def cpu_features_key() -> str:
+    """Short fingerprint of the CPU architecture and instruction-set flags."""
+    features = ""
+    if platform.system() == "Linux":
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    if line.startswith(("flags", "Features")):
+                        features = " ".join(sorted(line.split(":", 1)[1].split()))
+                        break
+        except OSError:
+            pass
+    if not features:
+        features = platform.processor()
+    digest = hashlib.sha256(f"{platform.machine()}|{features}".encode()).hexdigest()
+    return digest[:12]
+
+
+class OptimizedGraphCache:
+    """Directory of pre-optimized graphs plus memoized source checksums."""
+
+    def __init__(self, cache_dir: Path, ort_version: str) -> None:
+        """Create a cache.
+
+        Args:
+            cache_dir: Directory holding optimized graphs
+            ort_version: ``onnxruntime.__version__``
+        """
+        self.cache_dir = cache_dir
+        self.ort_version = ort_version
+        self._cpu_key = cpu_features_key()
+        self._checksums_lock = threading.Lock()
+
+    @classmethod
+    def for_model_dir(cls, model_dir: Path, ort_version: str) -> OptimizedGraphCache:
+        """Cache inside the model directory, or in ~/.raxe/cache if read-only."""
+        cache_dir = model_dir / OPTIMIZED_DIRNAME
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            if os.access(cache_dir, os.W_OK):
+                return cls(cache_dir, ort_version)
+        except OSError:
+            pass
+        return cls(Path.home() / ".raxe" / "cache" / "ort_optimized", ort_version)
+
+    def model_checksum(self, model_path: Path) -> str:
+        """SHA-256 of a model file, memoized by path, size and mtime."""
+        stat = model_path.stat()
+        key = str(model_path.resolve())
+        memo = self._read_checksums()
+        entry = memo.get(key)
+        if (
+            entry
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return str(entry["sha256"])
+
+        digest = hashlib.sha256()
+        with open(model_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        checksum = digest.hexdigest()
+
+        with self._checksums_lock:
+            memo = self._read_checksums()
+            memo[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": checksum}
+            self._write_json(self.cache_dir / _CHECKSUMS_FILENAME, memo)
+        return checksum
+
+    def graph_path(self, model_path: Path) -> Path:
+        """Path of the optimized graph for a model (may not exist yet)."""
+        checksum = self.model_checksum(model_path)[:16]
+        return self.cache_dir / (
+            f"{model_path.stem}.ort{self.ort_version}.{checksum}.{self._cpu_key}{OPTIMIZED_SUFFIX}"
+        )
+
+    def create_session(
+        self,
+        ort: Any,
+        name: str,
+        model_path: Path,
+        make_options: Callable[[], Any],
+        providers: list[str],
+    ) -> tuple[Any, SessionLoadRecord]:
+        """Create a session, using or populating the optimized graph.
+
+        Args:
+            ort: The ``onnxruntime`` module
+            name: Session name for statistics
+            model_path: Source ONNX model
+            make_options: Returns fresh ``SessionOptions`` (full optimization)
+            providers: Execution providers
+
+        Returns:
+            Tuple of (session, load record)
+        """
+        start = time.perf_counter()
+        graph_path = self.graph_path(model_path)
+        meta_path = graph_path.with_suffix(".json")
+
+        if graph_path.exists():
+            sess_options = make_options()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            try:
+                session = ort.InferenceSession(str(graph_path), sess_options, providers=providers)
+            except Exception as e:
+                logger.warning(
+                    "Optimized graph unusable, rebuilding", path=str(graph_path), error=str(e)
+                )
+                graph_path.unlink(missing_ok=True)
+            else:
+                meta = self._read_json(meta_path)
+                return session, SessionLoadRecord(
+                    name=name,
+                    source="optimized_cache",
+                    load_ms=(time.perf_counter() - start) * 1000,
+                    optimize_ms=float(meta.get("optimize_ms", 0.0)),
+                )
+
+        # Optimize now and persist the result (written under a temporary
+        # name so concurrent workers never load a partial file)
+        start = time.perf_counter()
+        tmp_path = graph_path.with_name(f".{graph_path.name}.{os.getpid()}.{threading.get_ident()}")
+        sess_options = make_options()
+        sess_options.optimized_model_filepath = str(tmp_path)
+        session = ort.InferenceSession(str(model_path), sess_options, providers=providers)
+        optimize_ms = (time.perf_counter() - start) * 1000
+        try:
+            os.replace(tmp_path, graph_path)
+            self._write_json(meta_path, {"source": model_path.name, "optimize_ms": optimize_ms})
+            source = "optimized_now"
+        except OSError as e:
+            logger.warning("Cannot persist optimized graph", path=str(graph_path), error=str(e))
+            tmp_path.unlink(missing_ok=True)
+            source = "direct"
+        return session, SessionLoadRecord(name=name, source=source, load_ms=optimize_ms)
+
+    def _read_checksums(self) -> dict[str, Any]:
+        return self._read_json(self.cache_dir / _CHECKSUMS_FILENAME)
+
+    @staticmethod
+    def _read_json(path: Path) -> dict[str, Any]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_json(path: Path, data: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+def create_sessions(
+    ort: Any,
+    models: dict[str, Path],
+    make_options: Callable[[], Any],
+    providers: list[str],
+    *,
+    cache: OptimizedGraphCache | None = None,
+    max_workers: int | None = None,
+) -> tuple[dict[str, Any], SessionLoadStats]:
+    """Create inference sessions for several models in parallel.
+
+    Models registered for pre-fork sharing (``shared_models``) are built
+    from the shared bytes; the rest go through ``cache`` when given.
+
+    Args:
+        ort: The ``onnxruntime`` module
+        models: Session name -> ONNX model path
+        make_options: Returns fresh ``SessionOptions`` for one session
+        providers: Execution providers
+        cache: Optimized graph cache (None to always optimize in memory)
+        max_workers: Loader threads (default: one per model)
+
+    Returns:
+        Tuple of (name -> session, load statistics)
+
+    Raises:
+        Exception: The first session creation error, after all loads finish
+    """
+    from raxe.domain.ml.shared_models import create_session, get_shared_model
+
+    def load(name: str, model_path: Path) -> tuple[Any, SessionLoadRecord]:
+        start = time.perf_counter()
+        shared = get_shared_model(model_path) is not None
+        if cache is not None and not shared:
+            return cache.create_session(ort, name, model_path, make_options, providers)
+        session = create_session(ort, model_path, make_options(), providers)
+        source = "shared" if shared else "direct"
+        return session, SessionLoadRecord(
+            name=name, source=source, load_ms=(time.perf_counter() - start) * 1000
+        )
+
+    start = time.perf_counter()
+    workers = max(1, min(max_workers or len(models), len(models)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="raxe-ort-load") as pool:
+        futures = {name: pool.submit(load, name, path) for name, path in models.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    stats = SessionLoadStats(
+        records=[record for _, record in results.values()],
+        wall_ms=(time.perf_counter() - start) * 1000,
+    )
+    return {name: session for name, (session, _) in results.items()}, stats
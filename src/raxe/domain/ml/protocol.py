@@ -9,6 +9,9 @@ defines pure transformation: text + L1 results → L2 predictions.
 Performance requirement: <5ms for production implementations.
 """
 
+import inspect
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Protocol
@@ -210,6 +213,66 @@ class L2Result:
         )
 
 
+class L2CancelledError(Exception):
+    """Raised by a detector whose analysis was cancelled through its token."""
+
+
+class L2CancelToken:
+    """Cancellation handle for one L2 analysis.
+
+    The caller cancels; the detector registers abort callbacks (for example
+    terminating its in-flight ONNX runs) so that work already running on a
+    worker thread stops instead of finishing unobserved.
+
+    Thread-safe: cancel() may be called from any thread, and callbacks run
+    exactly once, on the cancelling thread (or immediately if registered
+    after cancellation).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the analysis and run the registered abort callbacks."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Register an abort callback.
+
+        Args:
+            callback: Called once on cancellation (immediately if the token
+                is already cancelled)
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise L2CancelledError if the token was cancelled.
+
+        Raises:
+            L2CancelledError: If cancel() was called
+        """
+        if self._cancelled:
+            raise L2CancelledError("L2 analysis cancelled")
+
+
 class L2Detector(Protocol):
     """Protocol for L2 ML-based threat detectors.
 
@@ -230,7 +293,12 @@ class L2Detector(Protocol):
     """
 
     def analyze(
-        self, text: str, l1_results: L1ScanResult, context: dict[str, Any] | None = None
+        self,
+        text: str,
+        l1_results: L1ScanResult,
+        context: dict[str, Any] | None = None,
+        *,
+        cancel_token: L2CancelToken | None = None,
     ) -> L2Result:
         """Analyze text for semantic threats using ML.
 
@@ -253,10 +321,16 @@ class L2Detector(Protocol):
                 - 'session_id': Session identifier
                 - 'conversation_history': Prior messages
                 - etc.
+            cancel_token: Optional cancellation handle; detectors with
+                expensive inference should abort it when cancelled
 
         Returns:
             L2Result with ML predictions and metadata
 
+        Raises:
+            L2CancelledError: If cancel_token was cancelled before the
+                analysis completed
+
         Performance:
             - MUST complete in <5ms (P95 latency)
             - Should be <3ms average
@@ -300,3 +374,26 @@ class L2Detector(Protocol):
 
 # Type alias for convenience
 L2DetectorType = L2Detector
+
+
+def accepts_cancel_token(analyze: Any) -> bool:
+    """Whether a detector's analyze() takes a ``cancel_token`` keyword.
+
+    Detectors written before L2CancelToken take no such argument, so
+    callers check before passing one.
+
+    Args:
+        analyze: Bound analyze method of the detector
+
+    Returns:
+        True if it declares ``cancel_token`` or accepts ``**kwargs``
+    """
+    try:
+        parameters = inspect.signature(analyze).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.kind is inspect.Parameter.VAR_KEYWORD
+        or (p.name == "cancel_token" and p.kind is not inspect.Parameter.POSITIONAL_ONLY)
+        for p in parameters
+    )
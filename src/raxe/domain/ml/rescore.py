@@ -0,0 +1,300 @@
+"""
+Offline Rescoring of Recorded L2 Head Outputs
+
+Replays L2 voting and hierarchical scoring over head probabilities recorded
+from earlier scans, so voting presets and scoring modes can be evaluated on
+historical traffic without re-running the embedding model.
+
+The detector's live path is reproduced with the batch APIs:
+- Each multi-class head contributes its argmax label and probability
+- ``BinaryFirstEngine.vote_batch`` decides SAFE / REVIEW / THREAT
+- Prompts voted REVIEW or THREAT are scored with the vote confidence as
+  threat probability, exactly as ``GemmaL2Detector`` feeds its scorer
+
+This module is part of the domain layer and contains PURE logic:
+- No I/O operations (database, network, file system)
+- No logging
+- Deterministic behavior for testability
+
+Example:
+    matrix = store.load(model_version)
+    baseline = rescore(matrix, BINARY_FIRST_PRESETS["balanced"])
+    candidate = rescore(matrix, BINARY_FIRST_PRESETS["high_security"])
+    print(compare(baseline, candidate).newly_flagged)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Protocol
+
+import numpy as np
+
+from raxe.domain.ml.gemma_models import PrimaryTechnique, Severity, ThreatFamily
+from raxe.domain.ml.scoring_models import ScoringBatchResult, ThreatScoreBatch
+from raxe.domain.ml.threat_scorer import HierarchicalThreatScorer
+from raxe.domain.ml.voting.binary_first_engine import BinaryFirstConfig, BinaryFirstEngine
+from raxe.domain.ml.voting.engine import HeadOutputBatch
+from raxe.domain.ml.voting.models import BatchVotingResult
+
+# Classifier heads, in recording order
+HEADS = ("binary", "family", "severity", "technique", "harm")
+
+
+@dataclass(frozen=True)
+class HeadProbabilities:
+    """
+    Raw probability vectors of the 5 classifier heads for one scan.
+
+    Attributes:
+        binary: [safe, threat] probabilities
+        family: Threat family probabilities
+        severity: Severity probabilities
+        technique: Primary technique probabilities
+        harm: Multilabel harm type probabilities
+    """
+
+    binary: np.ndarray
+    family: np.ndarray
+    severity: np.ndarray
+    technique: np.ndarray
+    harm: np.ndarray
+
+    @property
+    def widths(self) -> dict[str, int]:
+        """Number of classes per head."""
+        return {head: len(getattr(self, head)) for head in HEADS}
+
+
+class HeadOutputSink(Protocol):
+    """Receives the head probabilities of every L2 classification."""
+
+    def append(self, model_version: str, text: str, probabilities: HeadProbabilities) -> None:
+        """
+        Record the head probabilities of one scan.
+
+        Args:
+            model_version: Version of the model that produced them
+            text: Scanned text (for keying; must not be persisted)
+            probabilities: Raw head probabilities
+        """
+        ...
+
+
+def head_labels(widths: dict[str, int]) -> dict[str, list[str]]:
+    """
+    Class labels of the multi-class heads, as the detector maps indices.
+
+    Args:
+        widths: Number of classes per head
+
+    Returns:
+        Label per column for the family, severity and technique heads
+    """
+    return {
+        "family": [ThreatFamily.from_index(i).value for i in range(widths["family"])],
+        "severity": [Severity.from_index(i).value for i in range(widths["severity"])],
+        "technique": [PrimaryTechnique.from_index(i).value for i in range(widths["technique"])],
+    }
+
+
+@dataclass(frozen=True)
+class HeadProbabilityMatrix:
+    """
+    Recorded head probabilities of many scans, one row per scan.
+
+    Attributes:
+        keys: Text fingerprint per scan
+        binary: (N, 2) [safe, threat] probabilities
+        family: (N, families) probabilities
+        severity: (N, severities) probabilities
+        technique: (N, techniques) probabilities
+        harm: (N, harm types) probabilities
+        attack_pattern: Whether each text had an obvious attack pattern
+        labels: Class labels of the family, severity and technique heads
+    """
+
+    keys: np.ndarray
+    binary: np.ndarray
+    family: np.ndarray
+    severity: np.ndarray
+    technique: np.ndarray
+    harm: np.ndarray
+    attack_pattern: np.ndarray
+    labels: dict[str, list[str]]
+
+    def __len__(self) -> int:
+        """Number of recorded scans."""
+        return len(self.keys)
+
+    def unique(self) -> HeadProbabilityMatrix:
+        """
+        Keep only the first scan of each distinct text.
+
+        Returns:
+            Matrix with one row per fingerprint, in recording order
+        """
+        _, first = np.unique(self.keys, return_index=True)
+        rows = np.sort(first)
+        return replace(
+            self,
+            keys=self.keys[rows],
+            attack_pattern=self.attack_pattern[rows],
+            **{head: getattr(self, head)[rows] for head in HEADS},
+        )
+
+    def head_output_batch(self) -> HeadOutputBatch:
+        """
+        Voting inputs for every scan.
+
+        Returns:
+            HeadOutputBatch with one row per scan
+        """
+        return HeadOutputBatch.from_probabilities(
+            self.binary,
+            self.family,
+            self.severity,
+            self.technique,
+            self.harm,
+            family_labels=self.labels["family"],
+            severity_labels=self.labels["severity"],
+            technique_labels=self.labels["technique"],
+        )
+
+    def threat_score_batch(self, rows: np.ndarray, confidence: np.ndarray) -> ThreatScoreBatch:
+        """
+        Scorer inputs for selected scans.
+
+        Args:
+            rows: Indices of the scans to score
+            confidence: Voting confidence of each selected scan, used as
+                threat probability like the detector does
+
+        Returns:
+            ThreatScoreBatch with one row per selected scan
+        """
+        confidence = np.asarray(confidence, dtype=np.float64)
+        family = self.family[rows].astype(np.float64)
+        technique = self.technique[rows].astype(np.float64)
+        return ThreatScoreBatch(
+            binary_threat_score=confidence,
+            family_confidence=family.max(axis=1),
+            subfamily_confidence=technique.max(axis=1),
+            binary_proba=np.stack([1.0 - confidence, confidence], axis=1),
+            family_proba=family,
+            subfamily_proba=technique,
+        )
+
+
+@dataclass(frozen=True)
+class RescoreResult:
+    """
+    Outcome of replaying one voting and scoring policy.
+
+    Attributes:
+        voting: Voting result per scan
+        scored_rows: Indices of the scans that were scored
+        scoring: Scoring result per scored scan (None without a scorer)
+    """
+
+    voting: BatchVotingResult
+    scored_rows: np.ndarray
+    scoring: ScoringBatchResult | None = None
+
+    def __len__(self) -> int:
+        """Number of replayed scans."""
+        return len(self.voting.decision)
+
+    @property
+    def flagged(self) -> np.ndarray:
+        """Scans the policy flags (THREAT or REVIEW)."""
+        return ~self.voting.is_safe
+
+    def decision_counts(self) -> dict[str, int]:
+        """Number of scans per voting decision."""
+        return {str(k): v for k, v in Counter(self.voting.decision.tolist()).items()}
+
+    def action_counts(self) -> dict[str, int]:
+        """Number of scored scans per recommended action."""
+        if self.scoring is None:
+            return {}
+        return {str(k): v for k, v in Counter(self.scoring.action.tolist()).items()}
+
+
+@dataclass(frozen=True)
+class RescoreComparison:
+    """
+    Difference between two policies replayed on the same scans.
+
+    Attributes:
+        baseline: Result of the current policy
+        candidate: Result of the policy under evaluation
+    """
+
+    baseline: RescoreResult
+    candidate: RescoreResult
+
+    @property
+    def newly_flagged(self) -> int:
+        """Scans only the candidate flags."""
+        return int((self.candidate.flagged & ~self.baseline.flagged).sum())
+
+    @property
+    def no_longer_flagged(self) -> int:
+        """Scans only the baseline flags."""
+        return int((self.baseline.flagged & ~self.candidate.flagged).sum())
+
+    @property
+    def agreement(self) -> float:
+        """Share of scans both policies flag the same way (1.0 when empty)."""
+        if not len(self.baseline):
+            return 1.0
+        return float((self.baseline.flagged == self.candidate.flagged).mean())
+
+
+def rescore(
+    matrix: HeadProbabilityMatrix,
+    voting: BinaryFirstConfig,
+    scorer: HierarchicalThreatScorer | None = None,
+) -> RescoreResult:
+    """
+    Replay voting, and optionally scoring, over recorded head outputs.
+
+    Args:
+        matrix: Recorded head probabilities
+        voting: Binary-first voting configuration
+        scorer: Hierarchical scorer (None to skip scoring)
+
+    Returns:
+        Voting and scoring outcome per scan
+    """
+    votes = BinaryFirstEngine(config=voting).vote_batch(matrix.head_output_batch())
+    rows = np.flatnonzero(~votes.is_safe)
+
+    scoring = None
+    if scorer is not None:
+        scoring = scorer.score_batch(
+            matrix.threat_score_batch(rows, votes.confidence[rows]),
+            attack_patterns=matrix.attack_pattern[rows],
+        )
+    return RescoreResult(voting=votes, scored_rows=rows, scoring=scoring)
+
+
+def compare(baseline: RescoreResult, candidate: RescoreResult) -> RescoreComparison:
+    """
+    Compare two policies replayed on the same scans.
+
+    Args:
+        baseline: Result of the current policy
+        candidate: Result of the policy under evaluation
+
+    Returns:
+        Comparison of flagged scans
+
+    Raises:
+        ValueError: If the results cover a different number of scans
+    """
+    if len(baseline) != len(candidate):
+        raise ValueError(f"Cannot compare {len(baseline)} scans with {len(candidate)} scans")
+    return RescoreComparison(baseline=baseline, candidate=candidate)
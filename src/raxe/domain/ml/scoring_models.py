@@ -6,15 +6,18 @@ without any I/O operations or side effects.
 
 This follows Clean Architecture principles:
 - Immutable data classes (frozen=True)
-- No external dependencies (no numpy, no I/O)
+- No external dependencies beyond numpy arrays for batch containers (no I/O)
 - Type hints everywhere
 - Clear validation rules
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 
 class ThreatLevel(Enum):
     """Threat classification levels.
@@ -290,6 +293,106 @@ class ScoringResult:
         )
 
 
+@dataclass(frozen=True)
+class ThreatScoreBatch:
+    """Stacked ML model outputs for N detections, for vectorized scoring.
+
+    Attributes:
+        binary_threat_score: (N,) threat probabilities
+        family_confidence: (N,) family prediction confidences
+        subfamily_confidence: (N,) technique prediction confidences
+        binary_proba: (N, 2) binary probability distributions
+        family_proba: (N, families) family probability distributions
+        subfamily_proba: (N, techniques) technique probability distributions
+            (may have zero columns)
+    """
+
+    binary_threat_score: np.ndarray
+    family_confidence: np.ndarray
+    subfamily_confidence: np.ndarray
+    binary_proba: np.ndarray
+    family_proba: np.ndarray
+    subfamily_proba: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of detections in the batch."""
+        return len(self.binary_threat_score)
+
+    @classmethod
+    def from_threat_scores(cls, scores: Sequence[ThreatScore]) -> "ThreatScoreBatch":
+        """Stack per-detection threat scores.
+
+        Args:
+            scores: Threat scores whose distributions have equal lengths
+
+        Returns:
+            ThreatScoreBatch with one row per score
+
+        Raises:
+            ValueError: If a probability distribution differs in length
+        """
+
+        def floats(name: str) -> np.ndarray:
+            return np.array([getattr(s, name) for s in scores], dtype=np.float64)
+
+        def matrix(name: str) -> np.ndarray:
+            widths = {len(getattr(s, name)) for s in scores}
+            if len(widths) > 1:
+                raise ValueError(f"{name} lengths differ across scores: {sorted(widths)}")
+            width = widths.pop() if widths else 0
+            return np.array([getattr(s, name) for s in scores], dtype=np.float64).reshape(
+                len(scores), width
+            )
+
+        return cls(
+            binary_threat_score=floats("binary_threat_score"),
+            family_confidence=floats("family_confidence"),
+            subfamily_confidence=floats("subfamily_confidence"),
+            binary_proba=matrix("binary_proba"),
+            family_proba=matrix("family_proba"),
+            subfamily_proba=matrix("subfamily_proba"),
+        )
+
+
+@dataclass(frozen=True)
+class ScoringBatchResult:
+    """Vectorized scoring results for a batch of detections.
+
+    Each attribute is a length-N array holding, per detection, the value of
+    the same-named ScoringResult field. Reasons and metadata are not
+    materialized; margins are reported for every row, including SAFE ones.
+
+    Attributes:
+        classification: ThreatLevel values
+        action: ActionType values
+        risk_score: Risk scores 0-100
+        hierarchical_score: Combined confidence scores
+        threat_score: Binary threat probabilities
+        family_confidence: Family prediction confidences
+        subfamily_confidence: Subfamily prediction confidences
+        is_consistent: Consistency flags
+        variance: Variance in confidence levels
+        weak_margins_count: Number of weak decision margins (0-3)
+        margins: Decision margins keyed by level (binary, family, subfamily)
+    """
+
+    classification: np.ndarray
+    action: np.ndarray
+    risk_score: np.ndarray
+    hierarchical_score: np.ndarray
+    threat_score: np.ndarray
+    family_confidence: np.ndarray
+    subfamily_confidence: np.ndarray
+    is_consistent: np.ndarray
+    variance: np.ndarray
+    weak_margins_count: np.ndarray
+    margins: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Number of detections in the batch."""
+        return len(self.classification)
+
+
 @dataclass(frozen=True)
 class ScoringThresholds:
     """Threshold configuration for threat scoring.
@@ -0,0 +1,197 @@
+"""Share ONNX model weights across pre-forked worker processes.
+
+Every process that builds a ``GemmaL2Detector`` normally parses the ONNX
+files itself and copies all initializers (~300MB for the INT8 embedding
+model plus the heads) into private memory. With 16 gunicorn or Celery
+workers, that is 16 copies of identical read-only weights.
+
+Pre-fork mode loads the model bytes once in the parent process:
+
+1. Each ``.onnx`` file is converted once to ORT format (``.ort``) and
+   cached, keyed by ONNX Runtime version and source file size/mtime.
+2. The parent reads the ORT-format bytes into memory and registers them.
+3. Sessions created afterwards (in the parent or any forked child) are
+   built from the registered bytes with
+   ``session.use_ort_model_bytes_directly`` and
+   ``session.use_ort_model_bytes_for_initializers``. ONNX Runtime then
+   points its initializers at the shared buffer instead of copying it,
+   so the children share the weight pages copy-on-write with the parent.
+
+Kernels that pre-pack weights (e.g. quantized MatMul) still keep a private
+packed copy per process; only the raw initializers are shared.
+
+Example:
+    # In the master process, before forking workers
+    from raxe.domain.ml.shared_models import preload_shared_models
+    preload_shared_models(model_dir)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from raxe.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ORT_MODEL_SUFFIX = ".ort"
+
+# Session config keys that make ONNX Runtime use the caller's model buffer
+# (and its initializers) in place instead of copying it
+_DIRECT_BYTES_CONFIG = {
+    "session.use_ort_model_bytes_directly": "1",
+    "session.use_ort_model_bytes_for_initializers": "1",
+}
+
+# Registered ORT-format model bytes, keyed by resolved .onnx path. The
+# bytes must stay alive for as long as any session built from them.
+_shared_models: dict[str, bytes] = {}
+_shared_models_lock = threading.Lock()
+
+
+def default_ort_cache_dir() -> Path:
+    """Directory for converted ORT-format models (~/.raxe/cache/ort_models)."""
+    return Path.home() / ".raxe" / "cache" / "ort_models"
+
+
+def ort_model_path(onnx_path: Path, cache_dir: Path, ort_version: str) -> Path:
+    """Cache path of the ORT-format conversion of an ONNX model.
+
+    The name encodes the source file's size and mtime and the ONNX Runtime
+    version, so a changed model or runtime upgrade produces a new file.
+
+    Args:
+        onnx_path: Source ONNX model
+        cache_dir: Directory holding converted models
+        ort_version: ``onnxruntime.__version__``
+
+    Returns:
+        Path of the converted model (may not exist yet)
+    """
+    stat = onnx_path.stat()
+    return cache_dir / (
+        f"{onnx_path.stem}-{stat.st_size:x}-{stat.st_mtime_ns:x}-ort{ort_version}{ORT_MODEL_SUFFIX}"
+    )
+
+
+def convert_to_ort_format(onnx_path: Path, ort_path: Path) -> None:
+    """Convert an ONNX model to ORT format.
+
+    Uses ONNX Runtime itself (no extra dependency): building a session with
+    ``optimized_model_filepath`` and ``session.save_model_format=ORT`` writes
+    the converted graph. Extended (not hardware-specific) optimizations are
+    applied so the file stays valid for every session configuration.
+
+    Args:
+        onnx_path: Source ONNX model
+        ort_path: Destination ``.ort`` file
+    """
+    import onnxruntime as ort
+
+    ort_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = ort_path.with_name(f".{ort_path.name}.{os.getpid()}.tmp{ORT_MODEL_SUFFIX}")
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    sess_options.log_severity_level = 3
+    sess_options.optimized_model_filepath = str(tmp_path)
+    sess_options.add_session_config_entry("session.save_model_format", "ORT")
+    ort.InferenceSession(str(onnx_path), sess_options, providers=["CPUExecutionProvider"])
+    os.replace(tmp_path, ort_path)
+
+
+def preload_shared_models(model_dir: Path, cache_dir: Path | None = None) -> int:
+    """Load every ONNX model in a directory into shared memory.
+
+    Call in the parent process before forking. Models that fail to convert
+    are skipped (workers then load them from disk as usual).
+
+    Args:
+        model_dir: Directory containing ``*.onnx`` files
+        cache_dir: Directory for converted models (default: ~/.raxe/cache/ort_models)
+
+    Returns:
+        Total bytes of model data registered
+    """
+    import onnxruntime as ort
+
+    cache_dir = cache_dir or default_ort_cache_dir()
+    total_bytes = 0
+
+    for onnx_path in sorted(Path(model_dir).glob("*.onnx")):
+        try:
+            ort_path = ort_model_path(onnx_path, cache_dir, ort.__version__)
+            if not ort_path.exists():
+                logger.info("Converting model to ORT format", model=onnx_path.name)
+                convert_to_ort_format(onnx_path, ort_path)
+            model_bytes = ort_path.read_bytes()
+        except Exception as e:
+            logger.warning("Cannot share model", model=onnx_path.name, error=str(e))
+            continue
+
+        with _shared_models_lock:
+            _shared_models[str(onnx_path.resolve())] = model_bytes
+        total_bytes += len(model_bytes)
+
+    logger.info(
+        "Shared model weights loaded",
+        model_dir=str(model_dir),
+        models=len(_shared_models),
+        size_mb=round(total_bytes / (1024 * 1024), 1),
+    )
+    return total_bytes
+
+
+def get_shared_model(onnx_path: Path) -> bytes | None:
+    """Get the registered ORT-format bytes for an ONNX model, if any."""
+    return _shared_models.get(str(Path(onnx_path).resolve()))
+
+
+def has_shared_models() -> bool:
+    """Whether any model bytes have been registered in this process."""
+    return bool(_shared_models)
+
+
+def configure_shared_session_options(sess_options: Any) -> None:
+    """Make sessions use registered model bytes in place.
+
+    The entries only affect sessions created from bytes; sessions loaded
+    from a file path are unchanged.
+
+    Args:
+        sess_options: ``onnxruntime.SessionOptions`` to update
+    """
+    for key, value in _DIRECT_BYTES_CONFIG.items():
+        sess_options.add_session_config_entry(key, value)
+
+
+def create_session(
+    ort: Any,
+    model_path: Path,
+    sess_options: Any,
+    providers: list[str],
+) -> Any:
+    """Create an inference session, from shared bytes when registered.
+
+    Args:
+        ort: The ``onnxruntime`` module
+        model_path: ONNX model path
+        sess_options: Session options (see ``configure_shared_session_options``)
+        providers: Execution providers
+
+    Returns:
+        ``onnxruntime.InferenceSession``
+    """
+    model_bytes = get_shared_model(model_path)
+    if model_bytes is not None:
+        return ort.InferenceSession(model_bytes, sess_options, providers=providers)
+    return ort.InferenceSession(str(model_path), sess_options, providers=providers)
+
+
+def clear_shared_models() -> None:
+    """Drop all registered model bytes (sessions must be released first)."""
+    with _shared_models_lock:
+        _shared_models.clear()
@@ -18,7 +18,7 @@ import time
 from typing import Any, ClassVar
 
 from raxe.domain.engine.executor import ScanResult as L1ScanResult
-from raxe.domain.ml.protocol import L2Prediction, L2Result, L2ThreatType
+from raxe.domain.ml.protocol import L2CancelToken, L2Prediction, L2Result, L2ThreatType
 
 
 class StubL2Detector:
@@ -97,7 +97,12 @@ class StubL2Detector:
         self._privilege_re = [re.compile(p, re.IGNORECASE) for p in self.PRIVILEGE_KEYWORDS]
 
     def analyze(
-        self, text: str, l1_results: L1ScanResult, context: dict[str, Any] | None = None
+        self,
+        text: str,
+        l1_results: L1ScanResult,
+        context: dict[str, Any] | None = None,
+        *,
+        cancel_token: L2CancelToken | None = None,
     ) -> L2Result:
         """Analyze text using simple heuristics.
 
@@ -112,10 +117,18 @@ class StubL2Detector:
             text: Text to analyze
             l1_results: Results from L1 rule-based detection
             context: Optional context (unused in stub, but part of protocol)
+            cancel_token: Optional cancellation handle (checked on entry;
+                the heuristics are too fast to abort midway)
 
         Returns:
             L2Result with heuristic predictions
+
+        Raises:
+            L2CancelledError: If cancel_token was already cancelled
         """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
         start = time.perf_counter()
 
         predictions = []
@@ -12,7 +12,8 @@ This module implements 5 complementary scoring techniques:
 
 Key Design Principles:
 - Pure functions with no side effects
-- No I/O operations (no numpy, no external dependencies in domain layer)
+- No I/O operations; the scalar path is native Python, the batch path
+  (score_batch) uses numpy and is bit-identical to it
 - Immutable inputs and outputs
 - Deterministic results (no randomness)
 - Fully testable without mocks
@@ -23,16 +24,21 @@ Performance Requirements:
 - Efficient use of native Python (list comprehensions, built-ins)
 """
 
-import statistics
+import math
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
+
 from raxe.domain.ml.scoring_models import (
     ActionType,
+    ScoringBatchResult,
     ScoringMode,
     ScoringResult,
     ScoringThresholds,
     ThreatLevel,
     ThreatScore,
+    ThreatScoreBatch,
 )
 
 # Pattern detection for obvious attack indicators
@@ -73,6 +79,9 @@ OBVIOUS_ATTACK_PATTERNS = [
     "execute the following",
 ]
 
+# Margins below these are weak (empirically determined, see _count_weak_margins)
+WEAK_MARGIN_THRESHOLDS = {"binary": 0.4, "family": 0.2, "subfamily": 0.15}
+
 
 def has_obvious_attack_pattern(prompt: str | None) -> bool:
     """Check if prompt contains obvious attack patterns.
@@ -309,10 +318,13 @@ class HierarchicalThreatScorer:
             >>> print(is_consistent)  # True (variance = 0.047 < 0.05)
             >>> print(f"{variance:.3f}")  # 0.047
         """
-        confidence_levels = [threat_score, family_confidence, subfamily_confidence]
-
-        # Calculate variance using statistics module (pure Python, no numpy)
-        variance = statistics.variance(confidence_levels)
+        # Sample variance (n - 1) spelled out as plain float operations so
+        # score_batch reproduces it bit for bit with numpy
+        mean = (threat_score + family_confidence + subfamily_confidence) / 3
+        d_threat = threat_score - mean
+        d_family = family_confidence - mean
+        d_subfamily = subfamily_confidence - mean
+        variance = (d_threat * d_threat + d_family * d_family + d_subfamily * d_subfamily) / 2
 
         is_consistent = variance <= self.thresholds.inconsistency_threshold
 
@@ -425,9 +437,6 @@ class HierarchicalThreatScorer:
         clipped_proba = [max(p, epsilon) for p in proba_dist]
 
         # Calculate Shannon entropy: -Σ p(x) * log2(p(x))
-        # Use native Python math.log2 (no numpy dependency)
-        import math
-
         entropy = -sum(p * math.log2(p) for p in clipped_proba)
 
         if normalized:
@@ -492,16 +501,168 @@ class HierarchicalThreatScorer:
         Returns:
             Count of weak margins (0-3)
         """
-        weak_count = 0
+        return sum(1 for level, limit in WEAK_MARGIN_THRESHOLDS.items() if margins[level] < limit)
+
+    def score_batch(
+        self,
+        batch: ThreatScoreBatch,
+        prompts: Sequence[str | None] | None = None,
+        *,
+        attack_patterns: np.ndarray | None = None,
+    ) -> ScoringBatchResult:
+        """Score a batch of threat detections with numpy.
+
+        Vectorized equivalent of calling :meth:`score` per detection. Scores,
+        variances and margins use the same floating-point operations in the
+        same order, so every classification and metric is bit-identical to
+        the scalar path. The attack-pattern check only runs on rows that can
+        reach the LIKELY_THREAT rule.
+
+        Args:
+            batch: Stacked model outputs
+            prompts: Optional prompt text per detection, for pattern checks
+            attack_patterns: Optional precomputed pattern check result per
+                detection (takes precedence over prompts)
+
+        Returns:
+            ScoringBatchResult with one entry per detection
+        """
+        t = self.thresholds
+        threat = batch.binary_threat_score
+        family = batch.family_confidence
+        subfamily = batch.subfamily_confidence
+
+        hierarchical = 0.60 * threat + 0.25 * family + 0.15 * subfamily
+
+        mean = (threat + family + subfamily) / 3
+        d_threat, d_family, d_subfamily = threat - mean, family - mean, subfamily - mean
+        variance = (d_threat * d_threat + d_family * d_family + d_subfamily * d_subfamily) / 2
+        is_consistent = variance <= t.inconsistency_threshold
+
+        margins = self.calculate_margins_batch(
+            batch.binary_proba, batch.family_proba, batch.subfamily_proba
+        )
+        weak_margins = sum(
+            (margins[level] < limit).astype(np.int64)
+            for level, limit in WEAK_MARGIN_THRESHOLDS.items()
+        )
+
+        safe = threat < t.safe
+        fp_likely = (hierarchical < t.fp_likely) | (weak_margins >= 2)
+
+        likely_threat = np.zeros(len(batch), dtype=bool)
+        if t.likely_threat is not None and (prompts is not None or attack_patterns is not None):
+            candidates = ~safe & ~fp_likely & (hierarchical >= t.review) & (hierarchical < t.threat)
+            if attack_patterns is not None:
+                likely_threat = candidates & np.asarray(attack_patterns, dtype=bool)
+            else:
+                for i in np.flatnonzero(candidates):
+                    likely_threat[i] = has_obvious_attack_pattern(prompts[i])
+
+        review = (
+            ~is_consistent
+            | (threat < t.review)
+            | (family < t.weak_family)
+            | (subfamily < t.weak_subfamily)
+        )
+        high_threat = (hierarchical >= t.high_threat) & (family > 0.8)
+        confident = hierarchical >= t.threat
+
+        conditions = [safe, fp_likely, likely_threat, review, high_threat, confident]
+        levels = [
+            ThreatLevel.SAFE,
+            ThreatLevel.FP_LIKELY,
+            ThreatLevel.LIKELY_THREAT,
+            ThreatLevel.REVIEW,
+            ThreatLevel.HIGH_THREAT,
+            ThreatLevel.THREAT,
+        ]
+        actions = [
+            ActionType.ALLOW,
+            ActionType.ALLOW_WITH_LOG,
+            ActionType.BLOCK_WITH_REVIEW,
+            ActionType.MANUAL_REVIEW,
+            ActionType.BLOCK_ALERT,
+            ActionType.BLOCK,
+        ]
+
+        # SAFE rows report zeroed signals, like _create_safe_result
+        return ScoringBatchResult(
+            classification=np.select(
+                conditions, [lv.value for lv in levels], default=ThreatLevel.REVIEW.value
+            ),
+            action=np.select(
+                conditions, [a.value for a in actions], default=ActionType.MANUAL_REVIEW.value
+            ),
+            risk_score=np.where(safe, threat * 100, hierarchical * 100),
+            hierarchical_score=np.where(safe, 0.0, hierarchical),
+            threat_score=threat,
+            family_confidence=np.where(safe, 0.0, family),
+            subfamily_confidence=np.where(safe, 0.0, subfamily),
+            is_consistent=safe | is_consistent,
+            variance=np.where(safe, 0.0, variance),
+            weak_margins_count=np.where(safe, 0, weak_margins),
+            margins=margins,
+        )
+
+    @staticmethod
+    def calculate_margins_batch(
+        binary_proba: np.ndarray, family_proba: np.ndarray, subfamily_proba: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Calculate decision margins for stacked distributions.
+
+        Batch counterpart of :meth:`calculate_margins`.
+
+        Args:
+            binary_proba: (N, classes) binary distributions
+            family_proba: (N, classes) family distributions
+            subfamily_proba: (N, classes) subfamily distributions
+
+        Returns:
+            Dictionary of (N,) margins keyed by 'binary', 'family', 'subfamily'
+        """
+
+        def margin(proba: np.ndarray) -> np.ndarray:
+            if proba.shape[1] < 2:
+                return np.ones(proba.shape[0])
+            top_two = np.sort(proba, axis=1)[:, -2:]
+            return top_two[:, 1] - top_two[:, 0]
+
+        return {
+            "binary": margin(binary_proba),
+            "family": margin(family_proba),
+            "subfamily": margin(subfamily_proba),
+        }
+
+    @staticmethod
+    def calculate_entropy_batch(proba: np.ndarray, normalized: bool = True) -> np.ndarray:
+        """Calculate Shannon entropy for stacked distributions.
+
+        Batch counterpart of :meth:`calculate_entropy`. Terms are summed in
+        the same order, but numpy's log2 may differ from ``math.log2`` in
+        the last bit, so values can differ by a few ulp. Entropy does not
+        feed into classification.
+
+        Args:
+            proba: (N, classes) probability distributions
+            normalized: Normalize to 0-1 by dividing by log2(num_classes)
+
+        Returns:
+            (N,) entropies
+        """
+        clipped = np.maximum(proba, 1e-10)
+        terms = clipped * np.log2(clipped)
+        entropy = np.zeros(proba.shape[0])
+        for column in terms.T:
+            entropy = entropy + column
+        entropy = -entropy
 
-        if margins["binary"] < 0.4:
-            weak_count += 1
-        if margins["family"] < 0.2:
-            weak_count += 1
-        if margins["subfamily"] < 0.15:
-            weak_count += 1
+        if normalized:
+            num_classes = proba.shape[1]
+            max_entropy = math.log2(num_classes) if num_classes > 1 else 1.0
+            entropy = entropy / max_entropy if max_entropy > 0 else np.zeros_like(entropy)
 
-        return weak_count
+        return entropy
 
     def _create_safe_result(self, threat_score: ThreatScore) -> ScoringResult:
         """Create a SAFE classification result.
@@ -0,0 +1,321 @@
+"""
+Offline Threshold Sweep for Confidence Tuning
+
+Evaluates many confidence thresholds and voting presets from a single scan
+pass. Each prompt is scanned once with no confidence filtering; the raw L1
+detection confidences and L2 head outputs are captured into a score matrix
+and every threshold is then evaluated with vectorized numpy.
+
+This is exact, not an approximation: ``confidence_threshold`` only drops L1
+detections whose confidence is below the threshold, so the number of
+detections kept at threshold ``t`` is the number of captured confidences
+``>= t``. L2 predictions are not affected by the threshold.
+
+This module is part of the domain layer and contains PURE logic:
+- No I/O operations (database, network, file system)
+- No logging
+- Deterministic behavior for testability
+
+Example:
+    matrix = ScoreMatrix.from_captures(captures, labels=labels)
+    result = sweep(matrix, np.arange(0.1, 1.0, 0.1))
+    best = result.thresholds[np.argmax(result.f1)]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from raxe.domain.ml.voting.binary_first_engine import BinaryFirstConfig, BinaryFirstEngine
+from raxe.domain.ml.voting.engine import HeadOutputBatch, HeadOutputs
+
+
+@dataclass(frozen=True)
+class ScoreCapture:
+    """
+    Raw scores captured from one unfiltered scan.
+
+    Attributes:
+        l1_confidences: Confidence of every L1 detection
+        l2_predictions: Number of L2 predictions
+        head_outputs: L2 head outputs (None when L2 did not vote)
+    """
+
+    l1_confidences: tuple[float, ...] = ()
+    l2_predictions: int = 0
+    head_outputs: HeadOutputs | None = None
+
+
+@dataclass
+class ScoreMatrix:
+    """
+    Captured scores of a corpus, laid out for vectorized evaluation.
+
+    Attributes:
+        l1_confidences: Sorted confidences of all L1 detections
+        l1_max: Highest L1 confidence per prompt (-inf without detections)
+        l2_predictions: L2 prediction count per prompt
+        head_outputs: L2 head outputs per prompt
+        labels: Ground truth per prompt (True = threat), if known
+    """
+
+    l1_confidences: np.ndarray
+    l1_max: np.ndarray
+    l2_predictions: np.ndarray
+    head_outputs: list[HeadOutputs | None] = field(default_factory=list)
+    labels: np.ndarray | None = None
+
+    @classmethod
+    def from_captures(
+        cls,
+        captures: Sequence[ScoreCapture],
+        labels: Sequence[bool] | None = None,
+    ) -> ScoreMatrix:
+        """
+        Build a score matrix from per-prompt captures.
+
+        Args:
+            captures: One capture per prompt
+            labels: Optional ground truth, aligned with captures
+
+        Returns:
+            Score matrix
+
+        Raises:
+            ValueError: If labels and captures differ in length
+        """
+        if labels is not None and len(labels) != len(captures):
+            raise ValueError(f"Got {len(labels)} labels for {len(captures)} prompts")
+
+        return cls(
+            l1_confidences=np.sort(
+                np.fromiter(
+                    (c for capture in captures for c in capture.l1_confidences),
+                    dtype=np.float64,
+                )
+            ),
+            l1_max=np.array(
+                [max(c.l1_confidences, default=-np.inf) for c in captures],
+                dtype=np.float64,
+            ),
+            l2_predictions=np.array([c.l2_predictions for c in captures], dtype=np.int64),
+            head_outputs=[c.head_outputs for c in captures],
+            labels=None if labels is None else np.asarray(labels, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        """Number of prompts."""
+        return len(self.l1_max)
+
+    @property
+    def l2_flagged(self) -> np.ndarray:
+        """Prompts L2 flagged during the capture scan."""
+        return self.l2_predictions > 0
+
+    @property
+    def has_head_outputs(self) -> bool:
+        """True if any prompt captured L2 head outputs."""
+        return any(h is not None for h in self.head_outputs)
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Detection counts and metrics for each threshold of a sweep.
+
+    All arrays are aligned with ``thresholds``. Confusion counts are None
+    when the corpus is unlabeled.
+
+    Attributes:
+        thresholds: Evaluated confidence thresholds
+        detections: Total L1 + L2 detections at each threshold
+        flagged: Prompts with at least one detection at each threshold
+        total: Number of prompts
+        tp: Flagged threats
+        fp: Flagged benign prompts
+        fn: Missed threats
+        tn: Benign prompts not flagged
+    """
+
+    thresholds: np.ndarray
+    detections: np.ndarray
+    flagged: np.ndarray
+    total: int
+    tp: np.ndarray | None = None
+    fp: np.ndarray | None = None
+    fn: np.ndarray | None = None
+    tn: np.ndarray | None = None
+
+    @property
+    def labeled(self) -> bool:
+        """True if confusion counts are available."""
+        return self.tp is not None
+
+    @property
+    def precision(self) -> np.ndarray:
+        """Precision per threshold (1.0 when nothing is flagged)."""
+        return _ratio(self.tp, self.tp + self.fp, empty=1.0)
+
+    @property
+    def recall(self) -> np.ndarray:
+        """Recall (true positive rate) per threshold."""
+        return _ratio(self.tp, self.tp + self.fn, empty=0.0)
+
+    @property
+    def fpr(self) -> np.ndarray:
+        """False positive rate per threshold."""
+        return _ratio(self.fp, self.fp + self.tn, empty=0.0)
+
+    @property
+    def f1(self) -> np.ndarray:
+        """F1 score per threshold."""
+        precision, recall = self.precision, self.recall
+        return _ratio(2 * precision * recall, precision + recall, empty=0.0)
+
+    def points(self) -> list[dict[str, float | int | None]]:
+        """
+        One record per threshold, e.g. for ROC/PR curve export.
+
+        Returns:
+            JSON-serializable records; an infinite threshold (L1 disabled)
+            is reported as None
+        """
+        columns: dict[str, np.ndarray] = {
+            "detections": self.detections,
+            "flagged": self.flagged,
+        }
+        if self.labeled:
+            columns.update(
+                tp=self.tp,
+                fp=self.fp,
+                fn=self.fn,
+                tn=self.tn,
+                precision=self.precision,
+                recall=self.recall,
+                fpr=self.fpr,
+                f1=self.f1,
+            )
+
+        records = []
+        for i, threshold in enumerate(self.thresholds):
+            record: dict[str, float | int | None] = {
+                "threshold": float(threshold) if np.isfinite(threshold) else None
+            }
+            record.update({name: values[i].item() for name, values in columns.items()})
+            records.append(record)
+        return records
+
+
+def sweep(
+    matrix: ScoreMatrix,
+    thresholds: Sequence[float] | np.ndarray,
+    l2_flagged: np.ndarray | None = None,
+) -> SweepResult:
+    """
+    Evaluate confidence thresholds over captured scores.
+
+    Args:
+        matrix: Captured scores
+        thresholds: Confidence thresholds to evaluate
+        l2_flagged: L2 verdict per prompt (default: as captured), e.g. from
+            :func:`revote`
+
+    Returns:
+        Counts (and metrics, for labeled corpora) per threshold
+    """
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    if l2_flagged is None:
+        l2_flagged = matrix.l2_flagged
+        l2_predictions = matrix.l2_predictions
+    else:
+        # Newly flagged prompts count as a single prediction
+        l2_predictions = np.where(l2_flagged, np.maximum(matrix.l2_predictions, 1), 0)
+
+    detections = _count_at_least(matrix.l1_confidences, thresholds) + int(l2_predictions.sum())
+
+    def flagged_within(mask: np.ndarray) -> np.ndarray:
+        # L2-flagged prompts are flagged at every threshold; the rest are
+        # flagged while their strongest L1 detection survives.
+        l1_only = np.sort(matrix.l1_max[mask & ~l2_flagged])
+        return _count_at_least(l1_only, thresholds) + int((mask & l2_flagged).sum())
+
+    everyone = np.ones(len(matrix), dtype=bool)
+    flagged = flagged_within(everyone)
+
+    if matrix.labels is None:
+        return SweepResult(
+            thresholds=thresholds,
+            detections=detections,
+            flagged=flagged,
+            total=len(matrix),
+        )
+
+    positives = matrix.labels
+    tp = flagged_within(positives)
+    fp = flagged - tp
+    return SweepResult(
+        thresholds=thresholds,
+        detections=detections,
+        flagged=flagged,
+        total=len(matrix),
+        tp=tp,
+        fp=fp,
+        fn=int(positives.sum()) - tp,
+        tn=int((~positives).sum()) - fp,
+    )
+
+
+def curve_thresholds(matrix: ScoreMatrix) -> np.ndarray:
+    """
+    Thresholds at which the flagged set changes.
+
+    Sweeping these yields every distinct point of the ROC and PR curves.
+    The final threshold is infinite, i.e. L2 verdicts only.
+
+    Args:
+        matrix: Captured scores
+
+    Returns:
+        Ascending thresholds
+    """
+    # L2-flagged prompts are flagged at every threshold
+    scores = matrix.l1_max[np.isfinite(matrix.l1_max) & ~matrix.l2_flagged]
+    return np.append(np.unique(scores), np.inf)
+
+
+def revote(matrix: ScoreMatrix, config: BinaryFirstConfig) -> np.ndarray:
+    """
+    Re-run L2 voting with another preset on the captured head outputs.
+
+    Prompts without captured head outputs keep their captured verdict.
+
+    Args:
+        matrix: Captured scores
+        config: Binary-first voting configuration
+
+    Returns:
+        L2 verdict per prompt (True = THREAT or REVIEW)
+    """
+    flagged = matrix.l2_flagged.copy()
+    rows = [i for i, outputs in enumerate(matrix.head_outputs) if outputs is not None]
+    if rows:
+        batch = HeadOutputBatch.from_head_outputs([matrix.head_outputs[i] for i in rows])
+        flagged[rows] = ~BinaryFirstEngine(config=config).vote_batch(batch).is_safe
+    return flagged
+
+
+def _count_at_least(sorted_values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Count values ``>= t`` for each threshold ``t`` (values sorted ascending)."""
+    return len(sorted_values) - np.searchsorted(sorted_values, thresholds, side="left")
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, empty: float) -> np.ndarray:
+    """Element-wise ratio, ``empty`` where the denominator is zero."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.full(numerator.shape, empty)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
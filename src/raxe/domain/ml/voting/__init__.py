@@ -39,6 +39,7 @@ from raxe.domain.ml.voting.config import (
     get_voting_config,
 )
 from raxe.domain.ml.voting.engine import (
+    HeadOutputBatch,
     HeadOutputs,
     VotingEngine,
     create_voting_engine,
@@ -55,6 +56,7 @@ from raxe.domain.ml.voting.head_voters import (
 
 # Models
 from raxe.domain.ml.voting.models import (
+    BatchVotingResult,
     Decision,
     HeadOutput,
     HeadVoteDetail,
@@ -63,6 +65,7 @@ from raxe.domain.ml.voting.models import (
 )
 
 __all__ = [
+    "BatchVotingResult",
     "BinaryFirstConfig",
     "BinaryFirstEngine",
     "BinaryHeadThresholds",
@@ -71,6 +74,7 @@ __all__ = [
     "FamilyHeadThresholds",
     "HarmHeadThresholds",
     "HeadOutput",
+    "HeadOutputBatch",
     "HeadOutputs",
     "HeadVoteDetail",
     "HeadWeights",
@@ -25,10 +25,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from raxe.domain.ml.voting.engine import HeadOutputs
+    from raxe.domain.ml.voting.engine import HeadOutputBatch, HeadOutputs
 
 from raxe.domain.ml.voting.models import (
+    BatchVotingResult,
     Decision,
     HeadVoteDetail,
     Vote,
@@ -90,6 +93,15 @@ BINARY_FIRST_PRESETS: dict[str, BinaryFirstConfig] = {
 # Default configuration
 DEFAULT_BINARY_FIRST_CONFIG = BINARY_FIRST_PRESETS["balanced"]
 
+# Informational vote weights, in vote collection order
+HEAD_WEIGHTS: dict[str, float] = {
+    "binary": 1.0,
+    "family": 0.8,
+    "severity": 0.8,
+    "technique": 0.6,
+    "harm": 0.4,
+}
+
 
 @dataclass
 class SuppressionDetail:
@@ -355,7 +367,7 @@ class BinaryFirstEngine:
                 head_name="binary",
                 vote=binary_vote,
                 confidence=outputs.binary_threat_prob,
-                weight=1.0,
+                weight=HEAD_WEIGHTS["binary"],
                 raw_probability=outputs.binary_threat_prob,
                 threshold_used=cfg.high_threat_threshold,
                 prediction="threat" if binary_vote == Vote.THREAT else "safe",
@@ -365,7 +377,7 @@ class BinaryFirstEngine:
                 head_name="family",
                 vote=Vote.THREAT if outputs.family_prediction != "benign" else Vote.SAFE,
                 confidence=outputs.family_confidence,
-                weight=0.8,
+                weight=HEAD_WEIGHTS["family"],
                 raw_probability=outputs.family_confidence,
                 threshold_used=cfg.family_benign_confidence,
                 prediction=outputs.family_prediction,
@@ -375,7 +387,7 @@ class BinaryFirstEngine:
                 head_name="severity",
                 vote=(Vote.THREAT if outputs.severity_prediction not in ("none",) else Vote.SAFE),
                 confidence=outputs.severity_confidence,
-                weight=0.8,
+                weight=HEAD_WEIGHTS["severity"],
                 raw_probability=outputs.severity_confidence,
                 threshold_used=cfg.severity_none_confidence,
                 prediction=outputs.severity_prediction,
@@ -385,7 +397,7 @@ class BinaryFirstEngine:
                 head_name="technique",
                 vote=Vote.THREAT if tech_pred != "none" else Vote.SAFE,
                 confidence=outputs.technique_confidence,
-                weight=0.6,
+                weight=HEAD_WEIGHTS["technique"],
                 raw_probability=outputs.technique_confidence,
                 threshold_used=cfg.technique_none_confidence,
                 prediction=tech_pred,
@@ -395,7 +407,7 @@ class BinaryFirstEngine:
                 head_name="harm",
                 vote=Vote.THREAT if outputs.harm_max_probability >= 0.5 else Vote.SAFE,
                 confidence=outputs.harm_max_probability,
-                weight=0.4,
+                weight=HEAD_WEIGHTS["harm"],
                 raw_probability=outputs.harm_max_probability,
                 threshold_used=0.5,
                 prediction=harm_labels,
@@ -507,6 +519,129 @@ class BinaryFirstEngine:
 
         return self.vote(outputs)
 
+    def vote_batch(self, batch: HeadOutputBatch) -> BatchVotingResult:
+        """Run the binary-first voting engine on a batch of head outputs.
+
+        Vectorized equivalent of calling :meth:`vote` per prompt: zones,
+        votes, weighted scores, suppression and decisions are computed with
+        numpy in the same order of floating-point operations, so every
+        decision and score is bit-identical to the scalar path. Does not
+        update :attr:`last_suppression`.
+
+        Args:
+            batch: Stacked head outputs
+
+        Returns:
+            BatchVotingResult with one entry per prompt
+        """
+        cfg = self._config
+        p = batch.binary_threat_prob
+        high = p >= cfg.high_threat_threshold
+        mid = ~high & (p >= cfg.mid_zone_low)
+        low = ~high & ~mid
+
+        # Per-head votes and confidences, in _collect_votes order
+        family_threat = batch.family_prediction != "benign"
+        severity_threat = batch.severity_prediction != "none"
+        technique_threat = batch.technique_prediction != "none"
+        harm_threat = batch.harm_max_probability >= 0.5
+        heads = [
+            (HEAD_WEIGHTS["binary"], high, low, p),
+            (HEAD_WEIGHTS["family"], family_threat, ~family_threat, batch.family_confidence),
+            (
+                HEAD_WEIGHTS["severity"],
+                severity_threat,
+                ~severity_threat,
+                batch.severity_confidence,
+            ),
+            (
+                HEAD_WEIGHTS["technique"],
+                technique_threat,
+                ~technique_threat,
+                batch.technique_confidence,
+            ),
+            (HEAD_WEIGHTS["harm"], harm_threat, ~harm_threat, batch.harm_max_probability),
+        ]
+
+        # Accumulate head by head so float sums match the scalar sum() order
+        zeros = np.zeros(len(p))
+        weighted_threat, weighted_safe, safe_conf_sum = zeros, zeros, zeros
+        threat_count = np.zeros(len(p), dtype=np.int64)
+        safe_count = np.zeros(len(p), dtype=np.int64)
+        for weight, votes_threat, votes_safe, confidence in heads:
+            weighted_threat = weighted_threat + np.where(votes_threat, weight, 0.0)
+            weighted_safe = weighted_safe + np.where(votes_safe, weight, 0.0)
+            safe_conf_sum = safe_conf_sum + np.where(votes_safe, confidence, 0.0)
+            threat_count += votes_threat
+            safe_count += votes_safe
+
+        ratio = np.where(weighted_threat > 0, np.inf, 0.0)
+        np.divide(weighted_threat, weighted_safe, out=ratio, where=weighted_safe > 0)
+
+        safe_confidence = np.full(len(p), 0.5)
+        np.divide(safe_conf_sum, safe_count, out=safe_confidence, where=safe_count > 0)
+
+        # Suppression quorum (only consulted in the high-threat zone)
+        benign_votes = (
+            (
+                (batch.severity_prediction == "none")
+                & (batch.severity_confidence >= cfg.severity_none_confidence)
+            ).astype(np.int64)
+            + (
+                (batch.family_prediction == "benign")
+                & (batch.family_confidence >= cfg.family_benign_confidence)
+            )
+            + (
+                (batch.technique_prediction == "none")
+                & (batch.technique_confidence >= cfg.technique_none_confidence)
+            )
+        )
+        suppressed = high & (benign_votes >= cfg.suppression_quorum)
+        mid_threat = mid & (ratio >= cfg.mid_zone_threat_ratio)
+        mid_review = mid & ~mid_threat & (ratio >= cfg.mid_zone_review_ratio)
+
+        conditions = [suppressed, high, mid_threat, mid_review, mid]
+        decision = np.select(
+            conditions,
+            [
+                Decision.SAFE.value,
+                Decision.THREAT.value,
+                Decision.THREAT.value,
+                Decision.REVIEW.value,
+                Decision.SAFE.value,
+            ],
+            default=Decision.SAFE.value,
+        )
+        rule = np.select(
+            conditions,
+            [
+                "suppression",
+                "binary_high_threat",
+                "mid_zone_threat_ratio",
+                "mid_zone_review",
+                "mid_zone_safe",
+            ],
+            default="binary_low_threat",
+        )
+        confidence = np.select(
+            conditions,
+            [safe_confidence, p, np.minimum(0.85, p + 0.1), p, 1.0 - p],
+            default=1.0 - p,
+        )
+
+        return BatchVotingResult(
+            decision=decision,
+            confidence=np.minimum(1.0, np.maximum(0.0, confidence)),
+            preset_used=cfg.name,
+            decision_rule_triggered=rule,
+            threat_vote_count=threat_count,
+            safe_vote_count=safe_count,
+            abstain_vote_count=mid.astype(np.int64),
+            weighted_threat_score=weighted_threat,
+            weighted_safe_score=weighted_safe,
+            ratio=np.minimum(ratio, 999.0),
+        )
+
 
 def create_binary_first_engine(
     preset: str | None = None,
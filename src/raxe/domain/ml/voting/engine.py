@@ -11,9 +11,14 @@ Decision Rules (in priority order):
 5. Tie-breaker: Ties favor SAFE (reduce FPs)
 """
 
+from __future__ import annotations
+
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from raxe.domain.ml.voting.config import (
     VotingConfig,
     VotingPreset,
@@ -66,6 +71,121 @@ class HeadOutputs:
     harm_active_labels: list[str]
 
 
+@dataclass
+class HeadOutputBatch:
+    """Stacked head outputs for N prompts, for vectorized voting.
+
+    Each attribute is a length-N array aligned with the fields of
+    HeadOutputs. Technique predictions of None are stored as "none".
+    Fields that never influence a decision (binary safe probability,
+    harm labels) are not carried.
+
+    Attributes:
+        binary_threat_prob: Binary head threat probabilities
+        family_prediction: Family head prediction labels
+        family_confidence: Family head confidences
+        severity_prediction: Severity head prediction labels
+        severity_confidence: Severity head confidences
+        technique_prediction: Technique head prediction labels
+        technique_confidence: Technique head confidences
+        harm_max_probability: Harm head max probabilities
+    """
+
+    binary_threat_prob: np.ndarray
+    family_prediction: np.ndarray
+    family_confidence: np.ndarray
+    severity_prediction: np.ndarray
+    severity_confidence: np.ndarray
+    technique_prediction: np.ndarray
+    technique_confidence: np.ndarray
+    harm_max_probability: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of prompts in the batch."""
+        return len(self.binary_threat_prob)
+
+    @classmethod
+    def from_head_outputs(cls, outputs: Sequence[HeadOutputs]) -> HeadOutputBatch:
+        """Stack per-prompt head outputs.
+
+        Args:
+            outputs: Head outputs, one per prompt
+
+        Returns:
+            HeadOutputBatch with one row per prompt
+        """
+
+        def floats(name: str) -> np.ndarray:
+            return np.array([getattr(o, name) for o in outputs], dtype=np.float64)
+
+        def labels(values: list[str]) -> np.ndarray:
+            return np.array(values, dtype=str) if values else np.empty(0, dtype=str)
+
+        return cls(
+            binary_threat_prob=floats("binary_threat_prob"),
+            family_prediction=labels([o.family_prediction for o in outputs]),
+            family_confidence=floats("family_confidence"),
+            severity_prediction=labels([o.severity_prediction for o in outputs]),
+            severity_confidence=floats("severity_confidence"),
+            technique_prediction=labels([o.technique_prediction or "none" for o in outputs]),
+            technique_confidence=floats("technique_confidence"),
+            harm_max_probability=floats("harm_max_probability"),
+        )
+
+    @classmethod
+    def from_probabilities(
+        cls,
+        binary_proba: np.ndarray,
+        family_proba: np.ndarray,
+        severity_proba: np.ndarray,
+        technique_proba: np.ndarray,
+        harm_proba: np.ndarray,
+        *,
+        family_labels: Sequence[str],
+        severity_labels: Sequence[str],
+        technique_labels: Sequence[str],
+    ) -> HeadOutputBatch:
+        """Build a batch from stacked head probabilities.
+
+        Each multi-class head contributes its argmax label and probability,
+        exactly as the detector derives them for a single prompt.
+
+        Args:
+            binary_proba: (N, 2) [safe, threat] probabilities
+            family_proba: (N, families) probabilities
+            severity_proba: (N, severities) probabilities
+            technique_proba: (N, techniques) probabilities
+            harm_proba: (N, harm types) multilabel probabilities
+            family_labels: Family label per column
+            severity_labels: Severity label per column
+            technique_labels: Technique label per column
+
+        Returns:
+            HeadOutputBatch with one row per prompt
+        """
+
+        def top(proba: np.ndarray, names: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+            proba = np.asarray(proba)
+            idx = np.argmax(proba, axis=1)
+            confidence = np.take_along_axis(proba, idx[:, None], axis=1)[:, 0]
+            return np.asarray(names, dtype=str)[idx], confidence.astype(np.float64)
+
+        family, family_confidence = top(family_proba, family_labels)
+        severity, severity_confidence = top(severity_proba, severity_labels)
+        technique, technique_confidence = top(technique_proba, technique_labels)
+
+        return cls(
+            binary_threat_prob=np.asarray(binary_proba)[:, 1].astype(np.float64),
+            family_prediction=family,
+            family_confidence=family_confidence,
+            severity_prediction=severity,
+            severity_confidence=severity_confidence,
+            technique_prediction=technique,
+            technique_confidence=technique_confidence,
+            harm_max_probability=np.asarray(harm_proba).max(axis=1).astype(np.float64),
+        )
+
+
 class VotingEngine:
     """Ensemble voting engine for 5-head classifier.
 
@@ -7,12 +7,15 @@ Model Hierarchy:
 - Vote: Three-way vote enum (SAFE, ABSTAIN, THREAT)
 - HeadVoteDetail: Detailed vote from a single classifier head
 - VotingResult: Complete voting engine output with full transparency
+- BatchVotingResult: Vectorized voting output for a batch of prompts
 """
 
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 
 class Vote(str, Enum):
     """Three-way vote classification.
@@ -193,6 +196,59 @@ class VotingResult:
         }
 
 
+@dataclass(frozen=True)
+class BatchVotingResult:
+    """Vectorized voting results for a batch of prompts.
+
+    Each attribute is a length-N array holding, per prompt, the value of
+    the same-named VotingResult field. Per-head vote details are not
+    materialized, and suppression rules are reported as "suppression"
+    without the per-head reason suffix.
+
+    Attributes:
+        decision: Decision values ("safe", "review", "threat")
+        confidence: Confidence in each decision (0.0 to 1.0)
+        preset_used: Name of the voting preset that was applied
+        decision_rule_triggered: Which decision rule made each call
+        threat_vote_count: Number of heads that voted THREAT
+        safe_vote_count: Number of heads that voted SAFE
+        abstain_vote_count: Number of heads that abstained
+        weighted_threat_score: Total weighted THREAT votes
+        weighted_safe_score: Total weighted SAFE votes
+        ratio: Weighted threat/safe ratio, capped at 999.0
+    """
+
+    decision: np.ndarray
+    confidence: np.ndarray
+    preset_used: str
+    decision_rule_triggered: np.ndarray
+    threat_vote_count: np.ndarray
+    safe_vote_count: np.ndarray
+    abstain_vote_count: np.ndarray
+    weighted_threat_score: np.ndarray
+    weighted_safe_score: np.ndarray
+    ratio: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of prompts in the batch."""
+        return len(self.decision)
+
+    @property
+    def is_threat(self) -> np.ndarray:
+        """Mask of THREAT decisions."""
+        return self.decision == Decision.THREAT.value
+
+    @property
+    def is_safe(self) -> np.ndarray:
+        """Mask of SAFE decisions."""
+        return self.decision == Decision.SAFE.value
+
+    @property
+    def is_review(self) -> np.ndarray:
+        """Mask of REVIEW decisions."""
+        return self.decision == Decision.REVIEW.value
+
+
 @dataclass(frozen=True)
 class HeadOutput:
     """Raw output from a classifier head before voting.
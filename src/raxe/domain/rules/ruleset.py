@@ -0,0 +1,123 @@
+"""Immutable, versioned snapshot of the active ruleset.
+
+Pure domain layer - NO I/O operations.
+
+The pack registry publishes a ``RulesetSnapshot`` whenever packs are
+(re)loaded. Scans read the current snapshot once and use it for the
+whole scan, so a concurrent reload swaps in a new snapshot without
+blocking or tearing in-flight scans. The ``generation`` number increases
+with every publish and lets caches detect that the ruleset changed.
+``fingerprint`` identifies the rule *content* instead, so it is stable
+across processes and restarts and can key persistent caches.
+
+Example:
+    snapshot = RulesetSnapshot.build(rules, generation=3)
+    snapshot.rules                 # deduplicated rules, precedence order
+    snapshot.by_family["PI"]       # precomputed family index
+    snapshot.get("pi-001")
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+
+from raxe.domain.rules.models import Rule
+
+
+@dataclass(frozen=True)
+class RulesetSnapshot:
+    """Immutable ruleset with precomputed indexes.
+
+    Attributes:
+        generation: Monotonic version number (0 = nothing loaded yet)
+        rules: Unique rules in precedence order
+        by_id: Rule ID -> rule
+        by_family: Family code (e.g. 'PI') -> rules in that family
+        by_severity: Severity value (e.g. 'critical') -> rules
+    """
+
+    generation: int
+    rules: tuple[Rule, ...]
+    by_id: Mapping[str, Rule]
+    by_family: Mapping[str, tuple[Rule, ...]]
+    by_severity: Mapping[str, tuple[Rule, ...]]
+
+    @classmethod
+    def build(cls, rules: Iterable[Rule], generation: int) -> RulesetSnapshot:
+        """Build a snapshot from rules in precedence order.
+
+        Rules are deduplicated by rule_id; the first occurrence (highest
+        precedence) wins.
+
+        Args:
+            rules: Rules ordered from highest to lowest precedence
+            generation: Generation number for this snapshot
+
+        Returns:
+            New immutable snapshot
+        """
+        by_id: dict[str, Rule] = {}
+        for rule in rules:
+            if rule.rule_id not in by_id:
+                by_id[rule.rule_id] = rule
+
+        unique = tuple(by_id.values())
+        by_family: dict[str, list[Rule]] = {}
+        by_severity: dict[str, list[Rule]] = {}
+        for rule in unique:
+            by_family.setdefault(rule.family.value, []).append(rule)
+            by_severity.setdefault(rule.severity.value, []).append(rule)
+
+        return cls(
+            generation=generation,
+            rules=unique,
+            by_id=MappingProxyType(by_id),
+            by_family=MappingProxyType({k: tuple(v) for k, v in by_family.items()}),
+            by_severity=MappingProxyType({k: tuple(v) for k, v in by_severity.items()}),
+        )
+
+    @classmethod
+    def empty(cls) -> RulesetSnapshot:
+        """Snapshot with no rules (generation 0)."""
+        return cls.build((), generation=0)
+
+    def get(self, rule_id: str) -> Rule | None:
+        """Look up a rule by ID.
+
+        Args:
+            rule_id: Rule identifier
+
+        Returns:
+            Rule, or None if not in the snapshot
+        """
+        return self.by_id.get(rule_id)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 of the rule content (computed once per snapshot).
+
+        Covers each rule's ID, version, severity, confidence and patterns,
+        so two processes that loaded the same packs get the same value.
+        """
+        digest = hashlib.sha256()
+        for rule in sorted(self.rules, key=lambda r: r.rule_id):
+            digest.update(
+                repr(
+                    (
+                        rule.rule_id,
+                        rule.version,
+                        rule.severity.value,
+                        rule.confidence,
+                        [(p.pattern, p.flags) for p in rule.patterns],
+                    )
+                ).encode()
+            )
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        """Number of unique rules."""
+        return len(self.rules)
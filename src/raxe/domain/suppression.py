@@ -468,6 +468,8 @@ class SuppressionManager:
         """
         self._repository = repository
         self._suppressions: dict[str, Suppression] = {}
+        self._generation = 0
+        self._next_expiry: datetime | None = None
 
         # Auto-load from repository if requested
         if auto_load:
@@ -478,6 +480,35 @@ class SuppressionManager:
         suppressions = self._repository.load_suppressions()
         for suppression in suppressions:
             self._suppressions[suppression.pattern] = suppression
+        self._changed()
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the active suppressions change.
+
+        Bumped when suppressions are added, removed, cleared or reloaded,
+        and when the next suppression expires. Caches of suppressed scan
+        verdicts compare it to detect stale entries.
+
+        Returns:
+            Current suppression generation
+        """
+        if self._next_expiry is not None and datetime.now(timezone.utc) > self._next_expiry:
+            self._changed()
+        return self._generation
+
+    def _changed(self) -> None:
+        """Bump the generation and find the next expiry of an active suppression."""
+        self._generation += 1
+        now = datetime.now(timezone.utc)
+        expiries = []
+        for suppression in self._suppressions.values():
+            if suppression.expires_at and not suppression.is_expired(current_time=now):
+                expiry = datetime.fromisoformat(suppression.expires_at)
+                if expiry.tzinfo is None:
+                    expiry = expiry.replace(tzinfo=timezone.utc)
+                expiries.append(expiry)
+        self._next_expiry = min(expiries, default=None)
 
     def add_suppression(
         self,
@@ -521,6 +552,7 @@ class SuppressionManager:
 
         # Store in memory
         self._suppressions[pattern] = suppression
+        self._changed()
 
         # Persist to repository
         self._repository.save_suppression(suppression)
@@ -558,6 +590,7 @@ class SuppressionManager:
             return False
 
         suppression = self._suppressions.pop(pattern)
+        self._changed()
 
         # Remove from repository
         self._repository.remove_suppression(pattern)
@@ -757,6 +790,7 @@ class SuppressionManager:
 
         # Clear from repository
         self._suppressions.clear()
+        self._changed()
         self._repository.save_all_suppressions([])
 
         return count
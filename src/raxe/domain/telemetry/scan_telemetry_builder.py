@@ -181,8 +181,8 @@ class ScanTelemetryBuilder:
             scan_duration_ms: Total scan duration in milliseconds
             entry_point: How scan was triggered
             prompt: Original prompt text (preferred - calculates hash and length)
-            prompt_hash: Pre-computed SHA-256 hash (if prompt not available)
-            prompt_length: Pre-computed prompt length (if prompt not available)
+            prompt_hash: Pre-computed SHA-256 hash (takes precedence over prompt)
+            prompt_length: Pre-computed prompt length (used with prompt_hash)
             wrapper_type: SDK wrapper type if applicable
             action_taken: Policy action taken
             l2_enabled: Whether L2 was enabled for this scan
@@ -210,16 +210,18 @@ class ScanTelemetryBuilder:
             Complete telemetry payload dict matching schema v3.0
         """
         # Calculate prompt_hash and prompt_length
-        if prompt is not None:
-            computed_hash = self._compute_prompt_hash(prompt)
-            computed_length = len(prompt)
-        elif prompt_hash is not None and prompt_length is not None:
+        # Pre-computed values win so callers holding a ContentFingerprint
+        # can pass the prompt (for _mssp_data) without it being re-hashed
+        if prompt_hash is not None and prompt_length is not None:
             # Use pre-computed values - ensure hash has prefix
             if not prompt_hash.startswith("sha256:"):
                 computed_hash = f"sha256:{prompt_hash}"
             else:
                 computed_hash = prompt_hash
             computed_length = prompt_length
+        elif prompt is not None:
+            computed_hash = self._compute_prompt_hash(prompt)
+            computed_length = len(prompt)
         else:
             raise ValueError(
                 "Must provide either 'prompt' or both 'prompt_hash' and 'prompt_length'"
@@ -2,12 +2,28 @@
 Analytics infrastructure for RAXE CE.
 
 Provides analytics calculation, aggregation, and streak tracking.
+
+Exports are imported on first access: the aggregator, engine and repository
+pull in SQLAlchemy, while the streak tracker (used after every CLI scan)
+only needs the standard library.
 """
 
-from .aggregator import DataAggregator
-from .engine import AnalyticsEngine
-from .repository import SQLiteAnalyticsRepository
-from .streaks import Achievement, StreakTracker
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .aggregator import DataAggregator
+    from .engine import AnalyticsEngine
+    from .repository import SQLiteAnalyticsRepository
+    from .streaks import Achievement, StreakTracker
+
+_LAZY_EXPORTS = {
+    "Achievement": ".streaks",
+    "AnalyticsEngine": ".engine",
+    "DataAggregator": ".aggregator",
+    "SQLiteAnalyticsRepository": ".repository",
+    "StreakTracker": ".streaks",
+}
 
 __all__ = [
     "Achievement",
@@ -16,3 +32,13 @@ __all__ = [
     "SQLiteAnalyticsRepository",
     "StreakTracker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import analytics exports."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -19,6 +19,7 @@ from sqlalchemy import and_, case, create_engine, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from raxe.infrastructure.database.models import Base, TelemetryEvent
+from raxe.utils.histogram import LatencyHistogram
 from raxe.utils.validators import validate_date_range
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,9 @@ class UserStats:
     current_streak: int = 0
     longest_streak: int = 0
     avg_scan_time_ms: float = 0.0
+    p50_scan_time_ms: float = 0.0
+    p95_scan_time_ms: float = 0.0
+    p99_scan_time_ms: float = 0.0
     l1_detections: int = 0
     l2_detections: int = 0
 
@@ -207,10 +211,9 @@ class AnalyticsEngine:
                 scans_with_threats = stats.get("scans_with_threats", 0)
                 detection_rate = stats.get("threat_rate", 0.0) * 100
 
-                # Get L1/L2 breakdown from recent scans
-                recent_scans = scan_history.list_scans(limit=100)
-                l1_detections = sum(s.l1_detections for s in recent_scans)
-                l2_detections = sum(s.l2_detections for s in recent_scans)
+                # Get L1/L2 breakdown from the rollups
+                l1_detections = stats.get("l1_detections", 0)
+                l2_detections = stats.get("l2_detections", 0)
 
                 # Get installation and first scan times
                 installation_date = None
@@ -228,13 +231,16 @@ class AnalyticsEngine:
                     if last_scan_str:
                         last_scan = datetime.fromisoformat(last_scan_str)
 
-                # Calculate streaks from scan history
-                all_scans = scan_history.list_scans(limit=1000)
-                scan_dates = [s.timestamp.date() for s in all_scans]
+                # Calculate streaks from the daily rollups
+                daily = scan_history.get_rollup_series(
+                    "day", since=datetime.now(timezone.utc) - timedelta(days=365)
+                )
+                scan_dates = [bucket.start.date() for bucket in daily if bucket.scans > 0]
                 current_streak, longest_streak = self._calculate_streaks_from_dates(scan_dates)
 
                 # Handle None values for avg_total_duration_ms
                 avg_duration = stats.get("avg_total_duration_ms") or 0.0
+                total_latency = stats.get("latency_percentiles", {}).get("total", {})
 
                 result = UserStats(
                     installation_id=installation_id,
@@ -247,6 +253,9 @@ class AnalyticsEngine:
                     current_streak=current_streak,
                     longest_streak=longest_streak,
                     avg_scan_time_ms=round(avg_duration, 2),
+                    p50_scan_time_ms=round(total_latency.get("p50_ms", 0.0), 2),
+                    p95_scan_time_ms=round(total_latency.get("p95_ms", 0.0), 2),
+                    p99_scan_time_ms=round(total_latency.get("p99_ms", 0.0), 2),
                     l1_detections=l1_detections,
                     l2_detections=l2_detections,
                 )
@@ -589,6 +598,19 @@ class AnalyticsEngine:
                 sum(e.l2_inference_ms for e in l2_events) / len(l2_events) if l2_events else 0.0
             )
 
+            # Tail latency (the distribution is often bimodal, e.g. L2 cache
+            # hit vs. miss, so the average alone is misleading)
+            total_hist = LatencyHistogram()
+            l1_hist = LatencyHistogram()
+            l2_hist = LatencyHistogram()
+            for e in events:
+                if e.total_latency_ms is not None:
+                    total_hist.record(e.total_latency_ms)
+                if e.l1_inference_ms is not None:
+                    l1_hist.record(e.l1_inference_ms)
+                if e.l2_inference_ms is not None:
+                    l2_hist.record(e.l2_inference_ms)
+
             return {
                 "period": {
                     "start_date": start_date.isoformat(),
@@ -607,6 +629,11 @@ class AnalyticsEngine:
                     "avg_total_latency_ms": round(avg_latency, 2),
                     "avg_l1_latency_ms": round(avg_l1, 2),
                     "avg_l2_latency_ms": round(avg_l2, 2),
+                    "p50_total_latency_ms": round(total_hist.percentile(0.50), 2),
+                    "p95_total_latency_ms": round(total_hist.percentile(0.95), 2),
+                    "p99_total_latency_ms": round(total_hist.percentile(0.99), 2),
+                    "p95_l1_latency_ms": round(l1_hist.percentile(0.95), 2),
+                    "p95_l2_latency_ms": round(l2_hist.percentile(0.95), 2),
                 },
                 "scans_per_day": round(total_scans / ((end_date - start_date).days + 1), 2)
                 if total_scans > 0
@@ -95,6 +95,8 @@ class ScanConfig:
         enable_l2: Enable L2 ML detection
         use_production_l2: Use production ML model instead of stub (default: True)
         l2_confidence_threshold: Minimum confidence for L2 predictions (default: 0.5)
+        record_head_outputs: Record L2 head probabilities for offline rescoring
+            (default: False)
         fail_fast_on_critical: Skip L2 if CRITICAL detected
         min_confidence_for_skip: Minimum L1 confidence to skip L2 on CRITICAL (default: 0.7)
         enable_schema_validation: Enable runtime schema validation (default: False)
@@ -111,6 +113,7 @@ class ScanConfig:
     low_memory: bool = False
     use_production_l2: bool = True
     l2_confidence_threshold: float = 0.5
+    record_head_outputs: bool = False
     fail_fast_on_critical: bool = False  # Changed: Always run both L1 and L2 in parallel
     min_confidence_for_skip: float = 0.7
     enable_schema_validation: bool = False
@@ -215,6 +218,7 @@ class ScanConfig:
             low_memory=scan_data.get("low_memory", False),
             use_production_l2=scan_data.get("use_production_l2", True),
             l2_confidence_threshold=scan_data.get("l2_confidence_threshold", 0.5),
+            record_head_outputs=scan_data.get("record_head_outputs", False),
             fail_fast_on_critical=scan_data.get(
                 "fail_fast_on_critical", False
             ),  # Changed default to False
@@ -235,6 +239,7 @@ class ScanConfig:
         Environment variables:
             RAXE_PACKS_ROOT: Pack root directory
             RAXE_ENABLE_L2: Enable L2 detection
+            RAXE_RECORD_HEAD_OUTPUTS: Record L2 head probabilities for rescoring
             RAXE_FAIL_FAST_ON_CRITICAL: Skip L2 on CRITICAL detections
             RAXE_MIN_CONFIDENCE_FOR_SKIP: Min L1 confidence to skip L2 (default: 0.7)
             RAXE_API_KEY: RAXE API key
@@ -250,6 +255,7 @@ class ScanConfig:
         low_memory = os.getenv("RAXE_LOW_MEMORY", "false").lower() == "true"
         use_production_l2 = os.getenv("RAXE_USE_PRODUCTION_L2", "true").lower() == "true"
         l2_confidence_threshold = float(os.getenv("RAXE_L2_CONFIDENCE_THRESHOLD", "0.5"))
+        record_head_outputs = os.getenv("RAXE_RECORD_HEAD_OUTPUTS", "false").lower() == "true"
         fail_fast = (
             os.getenv("RAXE_FAIL_FAST_ON_CRITICAL", "false").lower() == "true"
         )  # Changed default to false
@@ -280,6 +286,7 @@ class ScanConfig:
             low_memory=low_memory,
             use_production_l2=use_production_l2,
             l2_confidence_threshold=l2_confidence_threshold,
+            record_head_outputs=record_head_outputs,
             fail_fast_on_critical=fail_fast,
             min_confidence_for_skip=min_confidence_for_skip,
             enable_schema_validation=enable_schema_validation,
@@ -307,6 +314,8 @@ class ScanConfig:
             self.use_production_l2 = os.environ["RAXE_USE_PRODUCTION_L2"].lower() == "true"
         if "RAXE_L2_CONFIDENCE_THRESHOLD" in os.environ:
             self.l2_confidence_threshold = float(os.environ["RAXE_L2_CONFIDENCE_THRESHOLD"])
+        if "RAXE_RECORD_HEAD_OUTPUTS" in os.environ:
+            self.record_head_outputs = os.environ["RAXE_RECORD_HEAD_OUTPUTS"].lower() == "true"
         if "RAXE_FAIL_FAST_ON_CRITICAL" in os.environ:
             self.fail_fast_on_critical = os.environ["RAXE_FAIL_FAST_ON_CRITICAL"].lower() == "true"
         if "RAXE_MIN_CONFIDENCE_FOR_SKIP" in os.environ:
@@ -379,6 +388,7 @@ class ScanConfig:
                 "low_memory": self.low_memory,
                 "use_production_l2": self.use_production_l2,
                 "l2_confidence_threshold": self.l2_confidence_threshold,
+                "record_head_outputs": self.record_head_outputs,
                 "fail_fast_on_critical": self.fail_fast_on_critical,
                 "enable_schema_validation": self.enable_schema_validation,
                 "schema_validation_mode": self.schema_validation_mode,
@@ -4,21 +4,28 @@ SQLite-based storage for:
 - Scan metadata (timestamp, hashes, duration)
 - Detection details (rule hits, severity, confidence)
 - Performance metrics (L1/L2 latency)
+- Per minute/hour/day rollups maintained at insert time (for stats and dashboards)
+- Mergeable per hour/day latency histograms (L1, L2, total) for percentiles
 - Auto-cleanup (90 day retention)
 
 Database: ~/.raxe/scan_history.db
 """
 
 import hashlib
+import os
 import sqlite3
+import threading
+from collections.abc import Iterator
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 from raxe.domain.engine.executor import Detection
 from raxe.domain.rules.models import Severity
+from raxe.utils.histogram import LatencyHistogram
+from raxe.utils.profiler import RuleCost
 
 
 @dataclass
@@ -81,19 +88,112 @@ class DetectionRecord:
     id: int | None = None
 
 
+@dataclass
+class PendingScan:
+    """A scan waiting to be written by ``ScanHistoryDB.record_scans``.
+
+    Attributes:
+        prompt: Original prompt (hashed, optionally stored)
+        detections: Detections found
+        l1_duration_ms: L1 scan duration
+        l2_duration_ms: L2 scan duration
+        total_duration_ms: Total scan duration
+        version: RAXE version
+        event_id: Portal event ID (evt_xxx) for portal-CLI correlation
+        store_prompt: Store the full prompt text locally
+        prompt_hash: Pre-computed SHA256 hex digest of the prompt
+        timestamp: When the scan ran (default: time of the write)
+    """
+
+    prompt: str
+    detections: list[Detection] = field(default_factory=list)
+    l1_duration_ms: float | None = None
+    l2_duration_ms: float | None = None
+    total_duration_ms: float | None = None
+    version: str = "0.0.1"
+    event_id: str | None = None
+    store_prompt: bool = True
+    prompt_hash: str | None = None
+    timestamp: datetime | None = None
+
+
+_SEVERITY_ORDER = {
+    Severity.CRITICAL: 4,
+    Severity.HIGH: 3,
+    Severity.MEDIUM: 2,
+    Severity.LOW: 1,
+    Severity.INFO: 0,
+}
+
+
+# Rollup bucket widths in seconds. Buckets are aligned to UTC.
+ROLLUP_GRANULARITIES = {"minute": 60, "hour": 3600, "day": 86400}
+
+# Scan totals and latency sums kept per rollup bucket
+_SCAN_ROLLUP_COLUMNS = (
+    "scans",
+    "threat_scans",
+    "detections",
+    "l1_detections",
+    "l2_detections",
+    "l1_ms_count",
+    "l1_ms_sum",
+    "l2_ms_count",
+    "l2_ms_sum",
+    "total_ms_count",
+    "total_ms_sum",
+)
+
+# Latency stages with a histogram per hour/day bucket, and the index of the
+# scan row value (as inserted into ``scans``) each is recorded from
+LATENCY_STAGES = {"l1": 4, "l2": 5, "total": 6}
+_SKETCH_GRANULARITIES = ("hour", "day")
+
+
+@dataclass
+class RollupBucket:
+    """Scan totals for one rollup bucket.
+
+    Attributes:
+        start: Start of the bucket (UTC)
+        scans: Scans recorded in the bucket
+        threat_scans: Scans with at least one detection
+        detections: Detections recorded in the bucket
+        l1_detections: L1 detections
+        l2_detections: L2 detections
+    """
+
+    start: datetime
+    scans: int = 0
+    threat_scans: int = 0
+    detections: int = 0
+    l1_detections: int = 0
+    l2_detections: int = 0
+
+
 class ScanHistoryDB:
     """SQLite database for scan history.
 
     Features:
-    - Thread-safe connection pooling
+    - One persistent WAL connection (synchronous=NORMAL), shared by threads
+    - Batched inserts (``record_scans``) in a single transaction
     - Auto-migration on first use
-    - Auto-cleanup of old scans (90 days)
+    - Auto-cleanup of old scans (90 days) in bounded chunks
     - Efficient queries with indexes
+    - Rollup tables (per minute/hour/day) updated in the insert transaction,
+      so statistics never scan the raw history
+    - Latency histograms per hour/day, merged for percentiles over any range
     - Suppression tracking for audit trail
+    - Sampled per-rule cost aggregates (for ``raxe stats --rules``)
     """
 
-    SCHEMA_VERSION = 5  # Bumped for description column in detections
+    SCHEMA_VERSION = 8  # Bumped for latency sketches
     RETENTION_DAYS = 90
+    MINUTE_ROLLUP_RETENTION_HOURS = 48
+    CLEANUP_CHUNK_SIZE = 1000
+    VACUUM_PAGES_PER_CHUNK = 2000
+    IN_QUERY_CHUNK_SIZE = 500
+    EXPORT_PAGE_SIZE = 1000
 
     def __init__(self, db_path: Path | None = None):
         """Initialize scan history database.
@@ -107,39 +207,86 @@ class ScanHistoryDB:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._conn_file_id: tuple[int, int] | None = None
+        self._minute_rollups_pruned_at = 0
+
         # Initialize schema
         self._init_schema()
 
     @contextmanager
     def _get_connection(self):
-        """Get thread-safe database connection with proper pooling.
+        """Get the shared database connection.
 
-        This uses a simple connection pool for SQLite to ensure
-        thread-safety while maintaining good performance.
+        One connection is opened lazily and reused for the lifetime of the
+        instance; the lock serializes its use across threads. It is reopened
+        in a forked child, and when the database file has been deleted or
+        replaced (the schema is then recreated).
 
         Yields:
             sqlite3.Connection: Database connection
         """
-        # Use connection pool for better performance and thread-safety
-        # For SQLite, we maintain a single connection with check_same_thread=False
-        # This is safe because SQLite serializes all operations internally
+        with self._lock:
+            if self._connection_is_stale():
+                reopened = self._conn is not None
+                self.close()
+                self._conn = self._connect()
+                self._conn_pid = os.getpid()
+                self._conn_file_id = self._file_id()
+                if reopened:
+                    self._init_schema()
+            yield self._conn
+
+    def _file_id(self) -> tuple[int, int] | None:
+        """Identity (device, inode) of the database file, None if missing."""
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _connection_is_stale(self) -> bool:
+        """Whether the shared connection must be (re)opened."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            return True
+        file_id = self._file_id()
+        return file_id is None or file_id != self._conn_file_id
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a connection.
+
+        Returns:
+            sqlite3.Connection: Configured connection
+        """
         conn = sqlite3.connect(
             self.db_path,
             check_same_thread=False,
             timeout=30.0,  # Increased timeout for better reliability
-            isolation_level=None,  # Autocommit mode for better concurrency
+            isolation_level=None,  # Autocommit; batches use explicit BEGIN/COMMIT
         )
         conn.row_factory = sqlite3.Row
 
+        # Only takes effect before the first table is created: new databases
+        # release freed pages through PRAGMA incremental_vacuum
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         # Enable WAL mode for better concurrency
         conn.execute("PRAGMA journal_mode=WAL")
+        # WAL stays consistent with NORMAL; only the last commits may be
+        # lost on power failure, and commits no longer fsync
+        conn.execute("PRAGMA synchronous=NORMAL")
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys=ON")
+        return conn
 
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def close(self) -> None:
+        """Close the shared connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
 
     def _init_schema(self) -> None:
         """Initialize database schema if needed."""
@@ -227,6 +374,10 @@ class ScanHistoryDB:
             )
         """)
 
+        self._create_rule_costs_table(cursor)
+        self._create_rollup_tables(cursor)
+        self._create_latency_sketches_table(cursor)
+
         # Indexes for performance
         cursor.execute("CREATE INDEX idx_scans_timestamp ON scans(timestamp)")
         cursor.execute("CREATE INDEX idx_scans_severity ON scans(highest_severity)")
@@ -324,6 +475,188 @@ class ScanHistoryDB:
             cursor.execute("UPDATE _metadata SET value = '5' WHERE key = 'schema_version'")
             conn.commit()
 
+        # Migration from v5 to v6: Add rule_costs table for sampled rule profiling
+        if from_version < 6 <= to_version:
+            self._create_rule_costs_table(cursor)
+
+            # Update schema version
+            cursor.execute("UPDATE _metadata SET value = '6' WHERE key = 'schema_version'")
+            conn.commit()
+
+        # Migration from v6 to v7: Add rollup tables, backfilled from history
+        if from_version < 7 <= to_version:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._create_rollup_tables(cursor)
+                self._backfill_rollups(cursor)
+
+                # Update schema version
+                cursor.execute("UPDATE _metadata SET value = '7' WHERE key = 'schema_version'")
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+        # Migration from v7 to v8: Add latency sketches, backfilled from history
+        if from_version < 8 <= to_version:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._create_latency_sketches_table(cursor)
+                self._backfill_latency_sketches(cursor)
+
+                # Update schema version
+                cursor.execute("UPDATE _metadata SET value = '8' WHERE key = 'schema_version'")
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def _create_rule_costs_table(self, cursor: sqlite3.Cursor) -> None:
+        """Create the per-rule cost aggregate table.
+
+        Args:
+            cursor: Database cursor
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rule_costs (
+                rule_id TEXT PRIMARY KEY,
+                samples INTEGER NOT NULL,
+                total_ms REAL NOT NULL,
+                max_ms REAL NOT NULL,
+                matches INTEGER NOT NULL,
+                worst_input_length INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+        """)
+
+    def _create_rollup_tables(self, cursor: sqlite3.Cursor) -> None:
+        """Create the rollup tables and the index used for alert feeds.
+
+        ``scan_rollups`` holds scan totals and latency sums per bucket.
+        ``count_rollups`` holds counts per bucket along one dimension:
+        scans by highest ``severity``, detections by ``rule`` and by
+        ``layer``.
+
+        Args:
+            cursor: Database cursor
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_rollups (
+                granularity TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                scans INTEGER NOT NULL DEFAULT 0,
+                threat_scans INTEGER NOT NULL DEFAULT 0,
+                detections INTEGER NOT NULL DEFAULT 0,
+                l1_detections INTEGER NOT NULL DEFAULT 0,
+                l2_detections INTEGER NOT NULL DEFAULT 0,
+                l1_ms_count INTEGER NOT NULL DEFAULT 0,
+                l1_ms_sum REAL NOT NULL DEFAULT 0,
+                l2_ms_count INTEGER NOT NULL DEFAULT 0,
+                l2_ms_sum REAL NOT NULL DEFAULT 0,
+                total_ms_count INTEGER NOT NULL DEFAULT 0,
+                total_ms_sum REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, bucket)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS count_rollups (
+                granularity TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                dimension TEXT NOT NULL,
+                key TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (granularity, bucket, dimension, key)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scans_threats "
+            "ON scans(timestamp) WHERE threats_found > 0"
+        )
+
+    def _backfill_rollups(self, cursor: sqlite3.Cursor) -> None:
+        """Build the rollups from existing history (one-time migration).
+
+        Args:
+            cursor: Database cursor
+        """
+        minute_cutoff = int(
+            (
+                datetime.now(timezone.utc) - timedelta(hours=self.MINUTE_ROLLUP_RETENTION_HOURS)
+            ).timestamp()
+        )
+        for granularity, width in ROLLUP_GRANULARITIES.items():
+            since = minute_cutoff if granularity == "minute" else 0
+            params = (granularity, width, width, since)
+            cursor.execute(
+                """
+                INSERT INTO scan_rollups
+                SELECT ?, (timestamp / ?) * ?, COUNT(*), SUM(threats_found > 0),
+                    SUM(threats_found), SUM(l1_detections), SUM(l2_detections),
+                    COUNT(l1_duration_ms), COALESCE(SUM(l1_duration_ms), 0),
+                    COUNT(l2_duration_ms), COALESCE(SUM(l2_duration_ms), 0),
+                    COUNT(total_duration_ms), COALESCE(SUM(total_duration_ms), 0)
+                FROM scans WHERE timestamp >= ?
+                GROUP BY 2
+            """,
+                params,
+            )
+            cursor.execute(
+                """
+                INSERT INTO count_rollups
+                SELECT ?, (timestamp / ?) * ?, 'severity', highest_severity, COUNT(*)
+                FROM scans WHERE timestamp >= ? AND highest_severity IS NOT NULL
+                GROUP BY 2, 4
+            """,
+                params,
+            )
+            for dimension, column in (("rule", "rule_id"), ("layer", "detection_layer")):
+                cursor.execute(
+                    f"""
+                    INSERT INTO count_rollups
+                    SELECT ?, (s.timestamp / ?) * ?, '{dimension}', d.{column}, COUNT(*)
+                    FROM detections d JOIN scans s ON s.id = d.scan_id
+                    WHERE s.timestamp >= ?
+                    GROUP BY 2, 4
+                """,  # noqa: S608
+                    params,
+                )
+
+    def _create_latency_sketches_table(self, cursor: sqlite3.Cursor) -> None:
+        """Create the per-bucket latency histogram table.
+
+        Each row holds one ``LatencyHistogram`` (sparse encoding, a few
+        hundred bytes) for a stage ("l1", "l2" or "total") in an hour or day
+        bucket. Histograms merge exactly, so percentiles for any window are
+        computed from the covering buckets.
+
+        Args:
+            cursor: Database cursor
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS latency_sketches (
+                granularity TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                stage TEXT NOT NULL,
+                sketch BLOB NOT NULL,
+                PRIMARY KEY (granularity, bucket, stage)
+            ) WITHOUT ROWID
+        """)
+
+    def _backfill_latency_sketches(self, cursor: sqlite3.Cursor) -> None:
+        """Build the latency sketches from existing history (one-time migration).
+
+        Args:
+            cursor: Database cursor
+        """
+        reader = cursor.connection.execute(
+            "SELECT timestamp, NULL, NULL, NULL, l1_duration_ms, l2_duration_ms, "
+            "total_duration_ms FROM scans"
+        )
+        sketches: dict[tuple[str, int, str], LatencyHistogram] = {}
+        while rows := reader.fetchmany(10_000):
+            self._add_to_latency_sketches(sketches, rows)
+        self._merge_latency_sketches(cursor, sketches)
+
     def hash_prompt(self, prompt: str) -> str:
         """Create privacy-preserving hash of prompt.
 
@@ -345,6 +678,7 @@ class ScanHistoryDB:
         version: str = "0.0.1",
         event_id: str | None = None,
         store_prompt: bool = True,
+        prompt_hash: str | None = None,
     ) -> int:
         """Record a scan in the database.
 
@@ -360,87 +694,254 @@ class ScanHistoryDB:
                 correlation between local scan history and portal alerts.
             store_prompt: If True, store full prompt text locally (default True).
                          Enables --show-prompt in 'raxe event show'.
+            prompt_hash: Pre-computed SHA256 hex digest of the prompt (e.g. from
+                the scan's ContentFingerprint). Computed here if not provided.
 
         Returns:
             Database row ID (int)
         """
-        # Hash prompt
-        prompt_hash = self.hash_prompt(prompt)
-        # Optionally store full prompt for local retrieval
-        prompt_text = prompt if store_prompt else None
-
-        # Calculate stats
-        threats_found = len(detections)
-        l1_detections = sum(1 for d in detections if d.detection_layer == "L1")
-        l2_detections = sum(1 for d in detections if d.detection_layer == "L2")
-
-        # Find highest severity
-        highest_severity = None
-        if detections:
-            severity_order = {
-                Severity.CRITICAL: 4,
-                Severity.HIGH: 3,
-                Severity.MEDIUM: 2,
-                Severity.LOW: 1,
-                Severity.INFO: 0,
-            }
-            highest = max(detections, key=lambda d: severity_order.get(d.severity, 0))
-            highest_severity = highest.severity.value
-
-        # Insert scan record
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        return self.record_scans(
+            [
+                PendingScan(
+                    prompt=prompt,
+                    detections=detections,
+                    l1_duration_ms=l1_duration_ms,
+                    l2_duration_ms=l2_duration_ms,
+                    total_duration_ms=total_duration_ms,
+                    version=version,
+                    event_id=event_id,
+                    store_prompt=store_prompt,
+                    prompt_hash=prompt_hash,
+                )
+            ]
+        )[0]
 
-            cursor.execute(
-                """
-                INSERT INTO scans (
-                    timestamp, prompt_hash, threats_found, highest_severity,
-                    l1_duration_ms, l2_duration_ms, total_duration_ms,
-                    l1_detections, l2_detections, version, event_id,
-                    prompt_text
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    def record_scans(self, records: list[PendingScan]) -> list[int]:
+        """Record several scans in one transaction.
+
+        Scan rows and detection rows are each written with a single
+        ``executemany``, so the batch costs one commit regardless of size.
+
+        Args:
+            records: Scans to write
+
+        Returns:
+            Database row IDs, in the order of ``records``
+        """
+        if not records:
+            return []
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        scan_rows = []
+        for record in records:
+            detections = record.detections
+            highest_severity = None
+            if detections:
+                highest = max(detections, key=lambda d: _SEVERITY_ORDER.get(d.severity, 0))
+                highest_severity = highest.severity.value
+            scan_rows.append(
                 (
-                    int(datetime.now(timezone.utc).timestamp()),
-                    prompt_hash,
-                    threats_found,
+                    int(record.timestamp.timestamp()) if record.timestamp else now,
+                    record.prompt_hash or self.hash_prompt(record.prompt),
+                    len(detections),
                     highest_severity,
-                    l1_duration_ms,
-                    l2_duration_ms,
-                    total_duration_ms,
-                    l1_detections,
-                    l2_detections,
-                    version,
-                    event_id,
-                    prompt_text,
-                ),
+                    record.l1_duration_ms,
+                    record.l2_duration_ms,
+                    record.total_duration_ms,
+                    sum(1 for d in detections if d.detection_layer == "L1"),
+                    sum(1 for d in detections if d.detection_layer == "L2"),
+                    record.version,
+                    record.event_id,
+                    record.prompt if record.store_prompt else None,
+                )
             )
 
-            db_scan_id = cursor.lastrowid
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # IMMEDIATE takes the write lock up front, so the AUTOINCREMENT
+            # IDs assigned by the batch are consecutive
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany(
+                    """
+                    INSERT INTO scans (
+                        timestamp, prompt_hash, threats_found, highest_severity,
+                        l1_duration_ms, l2_duration_ms, total_duration_ms,
+                        l1_detections, l2_detections, version, event_id,
+                        prompt_text
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    scan_rows,
+                )
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                scan_ids = list(range(last_id - len(records) + 1, last_id + 1))
 
-            # Insert detection records
-            for detection in detections:
-                cursor.execute(
+                cursor.executemany(
                     """
                     INSERT INTO detections (
                         scan_id, rule_id, severity, confidence,
                         detection_layer, category, description
                     ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        db_scan_id,
-                        detection.rule_id,
-                        detection.severity.value,
-                        detection.confidence,
-                        detection.detection_layer,
-                        detection.category,
-                        detection.message,  # Human-readable description
-                    ),
+                    [
+                        (
+                            scan_id,
+                            detection.rule_id,
+                            detection.severity.value,
+                            detection.confidence,
+                            detection.detection_layer,
+                            detection.category,
+                            detection.message,  # Human-readable description
+                        )
+                        for scan_id, record in zip(scan_ids, records, strict=True)
+                        for detection in record.detections
+                    ],
                 )
+                self._update_rollups(cursor, scan_rows, records)
+                sketches: dict[tuple[str, int, str], LatencyHistogram] = {}
+                self._add_to_latency_sketches(sketches, scan_rows)
+                self._merge_latency_sketches(cursor, sketches)
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+        return scan_ids
+
+    def _update_rollups(
+        self,
+        cursor: sqlite3.Cursor,
+        scan_rows: list[tuple[Any, ...]],
+        records: list[PendingScan],
+    ) -> None:
+        """Add a batch of scans to the rollup tables.
 
-            conn.commit()
+        The batch is first aggregated per bucket, so each touched bucket
+        costs one upsert however many scans it holds.
+
+        Args:
+            cursor: Database cursor (inside the insert transaction)
+            scan_rows: Scan row values, as inserted into ``scans``
+            records: The scans being recorded
+        """
+        scan_deltas: dict[tuple[str, int], list[float]] = {}
+        count_deltas: dict[tuple[str, int, str, str], int] = {}
+
+        for row, record in zip(scan_rows, records, strict=True):
+            timestamp, _, threats_found, highest_severity = row[:4]
+            l1_ms, l2_ms, total_ms, l1_detections, l2_detections = row[4:9]
+            values = (
+                1,
+                1 if threats_found else 0,
+                threats_found,
+                l1_detections,
+                l2_detections,
+                0 if l1_ms is None else 1,
+                l1_ms or 0.0,
+                0 if l2_ms is None else 1,
+                l2_ms or 0.0,
+                0 if total_ms is None else 1,
+                total_ms or 0.0,
+            )
+            for granularity, width in ROLLUP_GRANULARITIES.items():
+                bucket = timestamp // width * width
+                totals = scan_deltas.setdefault((granularity, bucket), [0] * len(values))
+                for i, value in enumerate(values):
+                    totals[i] += value
+
+                keys = [("severity", highest_severity)] if highest_severity else []
+                for detection in record.detections:
+                    keys.append(("rule", detection.rule_id))
+                    keys.append(("layer", detection.detection_layer))
+                for dimension, key in keys:
+                    count_key = (granularity, bucket, dimension, key)
+                    count_deltas[count_key] = count_deltas.get(count_key, 0) + 1
+
+        columns = ", ".join(_SCAN_ROLLUP_COLUMNS)
+        placeholders = ", ".join("?" for _ in _SCAN_ROLLUP_COLUMNS)
+        updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in _SCAN_ROLLUP_COLUMNS)
+        cursor.executemany(
+            f"""
+            INSERT INTO scan_rollups (granularity, bucket, {columns})
+            VALUES (?, ?, {placeholders})
+            ON CONFLICT(granularity, bucket) DO UPDATE SET {updates}
+        """,  # noqa: S608
+            [(*key, *totals) for key, totals in scan_deltas.items()],
+        )
+        cursor.executemany(
+            """
+            INSERT INTO count_rollups (granularity, bucket, dimension, key, count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(granularity, bucket, dimension, key)
+            DO UPDATE SET count = count + excluded.count
+        """,
+            [(*key, count) for key, count in count_deltas.items()],
+        )
+
+        # Minute rollups are only kept for recent activity; prune them at
+        # most once an hour
+        now = int(datetime.now(timezone.utc).timestamp())
+        if now - self._minute_rollups_pruned_at >= 3600:
+            self._minute_rollups_pruned_at = now
+            cutoff = now - self.MINUTE_ROLLUP_RETENTION_HOURS * 3600
+            for table in ("scan_rollups", "count_rollups"):
+                cursor.execute(
+                    f"DELETE FROM {table} WHERE granularity = 'minute' AND bucket < ?",  # noqa: S608
+                    (cutoff,),
+                )
+
+    @staticmethod
+    def _add_to_latency_sketches(
+        sketches: dict[tuple[str, int, str], LatencyHistogram],
+        scan_rows: list[Any],
+    ) -> None:
+        """Record scan latencies into per-bucket histograms.
+
+        Args:
+            sketches: (granularity, bucket, stage) -> histogram, updated in place
+            scan_rows: Scan row values, as inserted into ``scans``
+        """
+        for row in scan_rows:
+            timestamp = row[0]
+            for stage, column in LATENCY_STAGES.items():
+                value = row[column]
+                if value is None:
+                    continue
+                for granularity in _SKETCH_GRANULARITIES:
+                    width = ROLLUP_GRANULARITIES[granularity]
+                    key = (granularity, timestamp // width * width, stage)
+                    histogram = sketches.get(key)
+                    if histogram is None:
+                        histogram = sketches[key] = LatencyHistogram()
+                    histogram.record(value)
+
+    @staticmethod
+    def _merge_latency_sketches(
+        cursor: sqlite3.Cursor,
+        sketches: dict[tuple[str, int, str], LatencyHistogram],
+    ) -> None:
+        """Merge histograms into the stored sketches.
 
-        return db_scan_id
+        Args:
+            cursor: Database cursor (inside a write transaction)
+            sketches: (granularity, bucket, stage) -> histogram to add
+        """
+        for key, histogram in sketches.items():
+            row = cursor.execute(
+                "SELECT sketch FROM latency_sketches "
+                "WHERE granularity = ? AND bucket = ? AND stage = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                try:
+                    histogram.merge(LatencyHistogram.from_bytes(row[0]))
+                except ValueError:
+                    pass  # Unreadable sketch: replaced by the new samples
+        cursor.executemany(
+            "INSERT OR REPLACE INTO latency_sketches (granularity, bucket, stage, sketch) "
+            "VALUES (?, ?, ?, ?)",
+            [(*key, histogram.to_bytes()) for key, histogram in sketches.items()],
+        )
 
     def get_scan(self, scan_id: int) -> ScanRecord | None:
         """Get scan by database ID.
@@ -523,6 +1024,7 @@ class ScanHistoryDB:
         limit: int = 100,
         offset: int = 0,
         severity_filter: str | None = None,
+        threats_only: bool = False,
     ) -> list[ScanRecord]:
         """List recent scans.
 
@@ -530,36 +1032,162 @@ class ScanHistoryDB:
             limit: Maximum number of scans to return
             offset: Offset for pagination
             severity_filter: Filter by highest severity
+            threats_only: Only return scans with at least one detection
 
         Returns:
             List of ScanRecords
         """
+        conditions = []
+        params: list[Any] = []
+        if severity_filter:
+            conditions.append("highest_severity = ?")
+            params.append(severity_filter)
+        if threats_only:
+            conditions.append("threats_found > 0")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
-
-            if severity_filter:
-                cursor.execute(
-                    """
-                    SELECT * FROM scans
-                    WHERE highest_severity = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                """,
-                    (severity_filter, limit, offset),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT * FROM scans
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                """,
-                    (limit, offset),
-                )
+            cursor.execute(
+                f"""
+                SELECT * FROM scans
+                {where}
+                ORDER BY timestamp DESC
+                LIMIT ? OFFSET ?
+            """,  # noqa: S608
+                (*params, limit, offset),
+            )
 
             rows = cursor.fetchall()
             return [self._row_to_scan_record(row) for row in rows]
 
+    def list_scans_after(
+        self,
+        after_id: int,
+        limit: int = 1000,
+        threats_only: bool = False,
+    ) -> list[ScanRecord]:
+        """List scans recorded after a given scan ID, oldest first.
+
+        Used for incremental refresh: callers remember the last ID they saw
+        and only read newer rows (a primary-key range scan).
+
+        Args:
+            after_id: Only return scans with a greater ID
+            limit: Maximum number of scans to return
+            threats_only: Only return scans with at least one detection
+
+        Returns:
+            List of ScanRecords ordered by ID
+        """
+        where = "WHERE id > ?" + (" AND threats_found > 0" if threats_only else "")
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT * FROM scans {where} ORDER BY id LIMIT ?",  # noqa: S608
+                (after_id, limit),
+            )
+            return [self._row_to_scan_record(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _time_range(since: datetime | None, until: datetime | None) -> tuple[list[str], list[int]]:
+        """SQL conditions selecting scans with ``since <= timestamp < until``."""
+        conditions: list[str] = []
+        params: list[int] = []
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(int(since.timestamp()))
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(int(until.timestamp()))
+        return conditions, params
+
+    def count_scans(self, since: datetime | None = None, until: datetime | None = None) -> int:
+        """Count scans in a time range (an index range count).
+
+        Args:
+            since: Only count scans at or after this time
+            until: Only count scans before this time
+
+        Returns:
+            Number of scans
+        """
+        conditions, params = self._time_range(since, until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._get_connection() as conn:
+            row = conn.execute(f"SELECT COUNT(*) FROM scans {where}", params).fetchone()  # noqa: S608
+            return row[0]
+
+    def iter_scan_pages(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[list[tuple[ScanRecord, list[DetectionRecord]]]]:
+        """Stream scans with their detections, oldest first, one page at a time.
+
+        Pages are read with keyset pagination on the primary key (each page
+        continues after the last ID of the previous one), so every page costs
+        the same however deep the export is. The time range is first mapped
+        to an ID range through the timestamp index; scans recorded after the
+        export starts are left out. Detections are joined in one batched
+        query per page, and the connection lock is only held while a page is
+        read.
+
+        Args:
+            since: Only include scans at or after this time
+            until: Only include scans before this time
+            page_size: Scans per page (default: 1000)
+
+        Yields:
+            Lists of (scan, detections) pairs
+        """
+        if page_size is None:
+            page_size = self.EXPORT_PAGE_SIZE
+
+        conditions, params = self._time_range(since, until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._get_connection() as conn:
+            first_id, last_id = conn.execute(
+                f"SELECT MIN(id), MAX(id) FROM scans {where}",  # noqa: S608
+                params,
+            ).fetchone()
+        if first_id is None:
+            return
+
+        after_id = first_id - 1
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT * FROM scans
+                    WHERE id > ? AND id <= ? {"".join(f" AND {c}" for c in conditions)}
+                    ORDER BY id
+                    LIMIT ?
+                """,  # noqa: S608
+                    (after_id, last_id, *params, page_size),
+                ).fetchall()
+            if not rows:
+                return
+
+            scans = [self._row_to_scan_record(row) for row in rows]
+            detections = self.get_detections_for_scans([scan.id for scan in scans])
+            yield [(scan, detections.get(scan.id, [])) for scan in scans]
+
+            if len(rows) < page_size:
+                return
+            after_id = scans[-1].id
+
+    def get_latest_scan_id(self) -> int | None:
+        """Get the highest scan ID recorded so far.
+
+        Returns:
+            Scan ID, or None if the history is empty
+        """
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT MAX(id) FROM scans").fetchone()
+            return row[0]
+
     def get_detections(self, scan_id: int) -> list[DetectionRecord]:
         """Get all detections for a scan.
 
@@ -581,113 +1209,388 @@ class ScanHistoryDB:
             )
 
             rows = cursor.fetchall()
-            return [
-                DetectionRecord(
-                    id=row["id"],
-                    scan_id=row["scan_id"],
-                    rule_id=row["rule_id"],
-                    severity=row["severity"],
-                    confidence=row["confidence"],
-                    detection_layer=row["detection_layer"],
-                    category=row["category"],
-                    description=row["description"] if "description" in row.keys() else None,
+            return [self._row_to_detection_record(row) for row in rows]
+
+    def get_detections_for_scans(self, scan_ids: list[int]) -> dict[int, list[DetectionRecord]]:
+        """Get the detections of several scans in batched queries.
+
+        Args:
+            scan_ids: Scan IDs
+
+        Returns:
+            Mapping of scan ID to its DetectionRecords (same order as
+            ``get_detections``); scans without detections are absent
+        """
+        result: dict[int, list[DetectionRecord]] = {}
+        unique_ids = list(dict.fromkeys(scan_ids))
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique_ids), self.IN_QUERY_CHUNK_SIZE):
+                chunk = unique_ids[start : start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    SELECT * FROM detections
+                    WHERE scan_id IN ({placeholders})
+                    ORDER BY scan_id, severity DESC, confidence DESC
+                """,  # noqa: S608
+                    chunk,
                 )
-                for row in rows
-            ]
+                for row in cursor.fetchall():
+                    result.setdefault(row["scan_id"], []).append(self._row_to_detection_record(row))
+        return result
+
+    @staticmethod
+    def _row_to_detection_record(row: sqlite3.Row) -> DetectionRecord:
+        """Convert a database row to a DetectionRecord."""
+        return DetectionRecord(
+            id=row["id"],
+            scan_id=row["scan_id"],
+            rule_id=row["rule_id"],
+            severity=row["severity"],
+            confidence=row["confidence"],
+            detection_layer=row["detection_layer"],
+            category=row["category"],
+            description=row["description"] if "description" in row.keys() else None,
+        )
+
+    @staticmethod
+    def _rollup_window(since: datetime) -> tuple[str, tuple[int, int, int]]:
+        """SQL condition selecting the rollup buckets from ``since`` to now.
 
-    def get_statistics(self, days: int = 30) -> dict[str, Any]:
+        Whole days are read from day buckets; the partial first day from
+        hour buckets. The window therefore starts at the hour containing
+        ``since``.
+
+        Args:
+            since: Start of the window
+
+        Returns:
+            Tuple of (SQL condition, parameters)
+        """
+        since_ts = int(since.timestamp())
+        hour_start = since_ts // 3600 * 3600
+        day_start = -(-since_ts // 86400) * 86400
+        return (
+            "((granularity = 'hour' AND bucket >= ? AND bucket < ?)"
+            " OR (granularity = 'day' AND bucket >= ?))",
+            (hour_start, day_start, day_start),
+        )
+
+    def get_statistics(self, days: int = 30, since: datetime | None = None) -> dict[str, Any]:
         """Get scan statistics for the last N days.
 
+        Reads only the rollup tables and latency sketches, so the cost does
+        not grow with the number of scans in the history. Latency
+        percentiles (``latency_percentiles``) are accurate to ~3%.
+
         Args:
             days: Number of days to analyze
+            since: Start of the window (overrides ``days``)
 
         Returns:
             Dictionary with statistics
         """
-        cutoff = int((datetime.now(timezone.utc) - timedelta(days=days)).timestamp())
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+        window, params = self._rollup_window(since)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total scans
-            cursor.execute("SELECT COUNT(*) as count FROM scans WHERE timestamp >= ?", (cutoff,))
-            total_scans = cursor.fetchone()["count"]
+            sums = ", ".join(f"COALESCE(SUM({c}), 0) AS {c}" for c in _SCAN_ROLLUP_COLUMNS)
+            cursor.execute(f"SELECT {sums} FROM scan_rollups WHERE {window}", params)  # noqa: S608
+            totals = cursor.fetchone()
 
-            # Scans with threats
+            # Threats by severity (scans by highest severity)
             cursor.execute(
-                "SELECT COUNT(*) as count FROM scans WHERE timestamp >= ? AND threats_found > 0",
-                (cutoff,),
+                f"""
+                SELECT key, SUM(count) as count
+                FROM count_rollups
+                WHERE dimension = 'severity' AND {window}
+                GROUP BY key
+            """,  # noqa: S608
+                params,
             )
-            scans_with_threats = cursor.fetchone()["count"]
+            severity_counts = {row["key"]: row["count"] for row in cursor.fetchall()}
 
-            # Threats by severity
+        histograms = self.get_latency_histograms(since=since)
+
+        def average(layer: str) -> float | None:
+            count = totals[f"{layer}_ms_count"]
+            return totals[f"{layer}_ms_sum"] / count if count else None
+
+        total_scans = totals["scans"]
+        scans_with_threats = totals["threat_scans"]
+        return {
+            "period_days": days,
+            "total_scans": total_scans,
+            "scans_with_threats": scans_with_threats,
+            "threat_rate": scans_with_threats / total_scans if total_scans > 0 else 0,
+            "total_detections": totals["detections"],
+            "l1_detections": totals["l1_detections"],
+            "l2_detections": totals["l2_detections"],
+            "severity_counts": severity_counts,
+            "avg_l1_duration_ms": average("l1"),
+            "avg_l2_duration_ms": average("l2"),
+            "avg_total_duration_ms": average("total"),
+            "latency_percentiles": {
+                stage: histogram.summary() for stage, histogram in histograms.items()
+            },
+        }
+
+    def get_latency_histograms(
+        self, days: int = 30, since: datetime | None = None
+    ) -> dict[str, LatencyHistogram]:
+        """Merge the stored latency histograms for the last N days.
+
+        Args:
+            days: Number of days to analyze
+            since: Start of the window (overrides ``days``)
+
+        Returns:
+            Stage ("l1", "l2", "total") -> merged histogram (empty if no samples)
+        """
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+        window, params = self._rollup_window(since)
+
+        histograms = {stage: LatencyHistogram() for stage in LATENCY_STAGES}
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT stage, sketch FROM latency_sketches WHERE {window}",  # noqa: S608
+                params,
+            )
+            for row in cursor:
+                try:
+                    histograms[row["stage"]].merge(LatencyHistogram.from_bytes(row["sketch"]))
+                except (KeyError, ValueError):
+                    continue
+        return histograms
+
+    def get_top_rules(self, days: int = 30, limit: int = 10) -> list[tuple[str, int]]:
+        """Get the rules with the most detections in the last N days.
+
+        Args:
+            days: Number of days to analyze
+            limit: Maximum rules to return
+
+        Returns:
+            List of (rule_id, detection count), most frequent first
+        """
+        window, params = self._rollup_window(datetime.now(timezone.utc) - timedelta(days=days))
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT key, SUM(count) as count
+                FROM count_rollups
+                WHERE dimension = 'rule' AND {window}
+                GROUP BY key
+                ORDER BY count DESC, key
+                LIMIT ?
+            """,  # noqa: S608
+                (*params, limit),
+            )
+            return [(row["key"], row["count"]) for row in cursor.fetchall()]
+
+    def get_rollup_series(self, granularity: str, since: datetime) -> list[RollupBucket]:
+        """Get per-bucket scan totals from ``since`` to now.
+
+        Only buckets with at least one scan are returned. Minute buckets
+        are kept for ``MINUTE_ROLLUP_RETENTION_HOURS``.
+
+        Args:
+            granularity: "minute", "hour" or "day"
+            since: Start of the series (rounded down to the bucket)
+
+        Returns:
+            List of RollupBuckets, oldest first
+
+        Raises:
+            ValueError: If the granularity is unknown
+        """
+        width = ROLLUP_GRANULARITIES.get(granularity)
+        if width is None:
+            raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+        start = int(since.timestamp()) // width * width
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT highest_severity, COUNT(*) as count
-                FROM scans
-                WHERE timestamp >= ? AND highest_severity IS NOT NULL
-                GROUP BY highest_severity
+                SELECT bucket, scans, threat_scans, detections, l1_detections, l2_detections
+                FROM scan_rollups
+                WHERE granularity = ? AND bucket >= ?
+                ORDER BY bucket
             """,
-                (cutoff,),
+                (granularity, start),
             )
+            return [
+                RollupBucket(
+                    start=datetime.fromtimestamp(row["bucket"], tz=timezone.utc),
+                    scans=row["scans"],
+                    threat_scans=row["threat_scans"],
+                    detections=row["detections"],
+                    l1_detections=row["l1_detections"],
+                    l2_detections=row["l2_detections"],
+                )
+                for row in cursor.fetchall()
+            ]
 
-            severity_counts = {row["highest_severity"]: row["count"] for row in cursor.fetchall()}
+    def record_rule_costs(self, costs: list[RuleCost]) -> None:
+        """Add sampled per-rule cost deltas to the stored aggregates.
 
-            # Average latencies
-            cursor.execute(
+        Args:
+            costs: Per-rule deltas from ``SampledRuleProfiler.drain_pending()``
+        """
+        if not costs:
+            return
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        with self._get_connection() as conn:
+            conn.executemany(
                 """
-                SELECT
-                    AVG(l1_duration_ms) as avg_l1,
-                    AVG(l2_duration_ms) as avg_l2,
-                    AVG(total_duration_ms) as avg_total
-                FROM scans
-                WHERE timestamp >= ?
+                INSERT INTO rule_costs (
+                    rule_id, samples, total_ms, max_ms, matches,
+                    worst_input_length, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rule_id) DO UPDATE SET
+                    samples = samples + excluded.samples,
+                    total_ms = total_ms + excluded.total_ms,
+                    matches = matches + excluded.matches,
+                    worst_input_length = CASE
+                        WHEN excluded.max_ms > max_ms THEN excluded.worst_input_length
+                        ELSE worst_input_length
+                    END,
+                    max_ms = MAX(max_ms, excluded.max_ms),
+                    updated_at = excluded.updated_at
             """,
-                (cutoff,),
+                [
+                    (
+                        cost.rule_id,
+                        cost.samples,
+                        cost.total_ms,
+                        cost.max_ms,
+                        cost.matches,
+                        cost.worst_input_length,
+                        now,
+                    )
+                    for cost in costs
+                ],
             )
 
-            latencies = cursor.fetchone()
+    def get_rule_costs(self, limit: int = 10) -> list[RuleCost]:
+        """Get the costliest rules by cumulative sampled execution time.
 
-            return {
-                "period_days": days,
-                "total_scans": total_scans,
-                "scans_with_threats": scans_with_threats,
-                "threat_rate": scans_with_threats / total_scans if total_scans > 0 else 0,
-                "severity_counts": severity_counts,
-                "avg_l1_duration_ms": latencies["avg_l1"],
-                "avg_l2_duration_ms": latencies["avg_l2"],
-                "avg_total_duration_ms": latencies["avg_total"],
-            }
+        Args:
+            limit: Maximum number of rules to return
+
+        Returns:
+            RuleCost aggregates, most expensive first
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT rule_id, samples, total_ms, max_ms, matches, worst_input_length
+                FROM rule_costs
+                ORDER BY total_ms DESC
+                LIMIT ?
+            """,
+                (limit,),
+            )
+            return [
+                RuleCost(
+                    rule_id=row["rule_id"],
+                    samples=row["samples"],
+                    total_ms=row["total_ms"],
+                    max_ms=row["max_ms"],
+                    matches=row["matches"],
+                    worst_input_length=row["worst_input_length"],
+                )
+                for row in cursor.fetchall()
+            ]
 
-    def cleanup_old_scans(self, retention_days: int | None = None) -> int:
+    def cleanup_old_scans(
+        self,
+        retention_days: int | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
         """Delete scans older than retention period.
 
+        Scans are deleted in chunks, each in its own short transaction, so
+        concurrent writers are never blocked for the whole cleanup. Freed
+        pages are returned to the filesystem with ``incremental_vacuum``
+        instead of a full ``VACUUM`` (databases created before incremental
+        auto-vacuum keep their free pages for reuse by later inserts).
+        Rollup and latency sketch buckets that end before the cutoff are
+        deleted in the final chunk's transaction, so every table is bounded
+        by the same retention window.
+
         Args:
             retention_days: Days to retain (default: 90)
+            chunk_size: Scans deleted per transaction (default: 1000)
 
         Returns:
             Number of scans deleted
         """
         if retention_days is None:
             retention_days = self.RETENTION_DAYS
+        if chunk_size is None:
+            chunk_size = self.CLEANUP_CHUNK_SIZE
 
         cutoff = int((datetime.now(timezone.utc) - timedelta(days=retention_days)).timestamp())
+        count = 0
+
+        while True:
+            with self._get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Delete (cascade will handle detections and suppressions)
+                    cursor = conn.execute(
+                        """
+                        DELETE FROM scans WHERE id IN (
+                            SELECT id FROM scans WHERE timestamp < ? ORDER BY id LIMIT ?
+                        )
+                    """,
+                        (cutoff, chunk_size),
+                    )
+                    deleted = cursor.rowcount
+
+                    if deleted < chunk_size:
+                        self._prune_rollups(conn, cutoff)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                count += deleted
+
+                # Reclaim the pages freed by this chunk
+                conn.execute(f"PRAGMA incremental_vacuum({self.VACUUM_PAGES_PER_CHUNK})").fetchall()
+
+            if deleted < chunk_size:
+                break
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Count scans to delete
-            cursor.execute("SELECT COUNT(*) as count FROM scans WHERE timestamp < ?", (cutoff,))
-            count = cursor.fetchone()["count"]
+        return count
 
-            # Delete (cascade will handle detections)
-            cursor.execute("DELETE FROM scans WHERE timestamp < ?", (cutoff,))
-            conn.commit()
+    @staticmethod
+    def _prune_rollups(conn: sqlite3.Connection, cutoff: int) -> None:
+        """Delete rollup and latency sketch buckets that end before a cutoff.
 
-            # Vacuum to reclaim space
-            cursor.execute("VACUUM")
+        A bucket still holding scans newer than the cutoff is kept whole.
 
-        return count
+        Args:
+            conn: Database connection (inside the cleanup transaction)
+            cutoff: Unix timestamp; buckets ending at or before it are deleted
+        """
+        for granularity, width in ROLLUP_GRANULARITIES.items():
+            for table in ("scan_rollups", "count_rollups", "latency_sketches"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE granularity = ? AND bucket <= ?",  # noqa: S608
+                    (granularity, cutoff - width),
+                )
 
     def log_suppression(
         self,
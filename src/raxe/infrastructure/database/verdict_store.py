@@ -0,0 +1,238 @@
+"""Persistent, content-addressed verdict store for RAG chunks.
+
+A RAG application retrieves the same few thousand corpus chunks over and
+over. Each chunk's verdict only depends on its content and on the
+detection configuration, so it is stored once under:
+
+- ``content_hash``: SHA-256 of the chunk text
+- ``detection_key``: ``Raxe.detection_fingerprint()`` - rule content,
+  L2 model version, detection settings, suppressions and policy scope
+
+Verdicts computed under another detection key are simply never read,
+and verdicts older than ``max_age`` (default: 7 days) are treated as
+missing so nothing the key does not capture outlives a bounded window;
+``prune()`` deletes both. The store can be pre-warmed offline with
+``raxe batch corpus.txt --verdict-store``.
+
+Database: ~/.raxe/rag_verdicts.db
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class StoredVerdict:
+    """Detection verdict for one chunk.
+
+    Only the detection outcome is stored; blocking decisions are made by
+    the caller from ``severity`` so they follow the caller's config.
+
+    Attributes:
+        has_threats: Whether the chunk contains a threat
+        severity: Highest severity (None if clean)
+        detection_count: Number of detections
+    """
+
+    has_threats: bool
+    severity: str | None
+    detection_count: int
+
+
+class VerdictStore:
+    """SQLite store of chunk verdicts keyed by content hash.
+
+    Uses one WAL connection shared by threads (serialized by a lock) and
+    answers a whole retrieval batch with a single query.
+
+    Example usage:
+        store = VerdictStore()
+        key = raxe.detection_fingerprint()
+        known = store.get_many(chunk_hashes, key)
+        store.put_many({h: verdict for h, verdict in new_verdicts.items()}, key)
+    """
+
+    IN_QUERY_CHUNK_SIZE = 500
+    DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        *,
+        max_age: float | None = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        """Initialize verdict store.
+
+        Args:
+            db_path: Path to SQLite database file (default: ~/.raxe/rag_verdicts.db)
+            max_age: Seconds a stored verdict stays valid (default: 7 days,
+                None for no expiration)
+
+        Raises:
+            ValueError: If max_age is not positive
+        """
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age must be > 0 or None, got {max_age}")
+        if db_path is None:
+            db_path = Path.home() / ".raxe" / "rag_verdicts.db"
+
+        self.db_path = Path(db_path)
+        self.max_age = max_age
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS verdicts (
+                    content_hash TEXT NOT NULL,
+                    detection_key TEXT NOT NULL,
+                    has_threats INTEGER NOT NULL,
+                    severity TEXT,
+                    detection_count INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (content_hash, detection_key)
+                ) WITHOUT ROWID
+            """)
+
+    @contextmanager
+    def _get_connection(self):
+        """Get the shared database connection (reopened after fork).
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        with self._lock:
+            if self._conn is None or self._conn_pid != os.getpid():
+                self._conn = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,
+                    timeout=30.0,
+                    isolation_level=None,  # Autocommit; batches use explicit BEGIN/COMMIT
+                )
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn_pid = os.getpid()
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the shared connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    def get_many(
+        self, content_hashes: Iterable[str], detection_key: str
+    ) -> dict[str, StoredVerdict]:
+        """Look up verdicts for several chunks.
+
+        Args:
+            content_hashes: SHA-256 hashes of the chunk texts
+            detection_key: Current ``Raxe.detection_fingerprint()``
+
+        Returns:
+            Content hash -> verdict, for the unexpired hashes found in the store
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        found: dict[str, StoredVerdict] = {}
+        oldest = self._oldest_valid()
+        with self._get_connection() as conn:
+            for start in range(0, len(hashes), self.IN_QUERY_CHUNK_SIZE):
+                chunk = hashes[start : start + self.IN_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT content_hash, has_threats, severity, detection_count "  # noqa: S608
+                    "FROM verdicts WHERE detection_key = ? AND created_at >= ? "
+                    f"AND content_hash IN ({placeholders})",
+                    (detection_key, oldest, *chunk),
+                )
+                for content_hash, has_threats, severity, detection_count in rows:
+                    found[content_hash] = StoredVerdict(
+                        has_threats=bool(has_threats),
+                        severity=severity,
+                        detection_count=detection_count,
+                    )
+        return found
+
+    def put_many(self, verdicts: dict[str, StoredVerdict], detection_key: str) -> None:
+        """Store verdicts for several chunks in one transaction.
+
+        Args:
+            verdicts: Content hash -> verdict
+            detection_key: ``Raxe.detection_fingerprint()`` the verdicts
+                were computed under
+        """
+        if not verdicts:
+            return
+        now = time.time()
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO verdicts "
+                    "(content_hash, detection_key, has_threats, severity, detection_count, "
+                    "created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            content_hash,
+                            detection_key,
+                            int(v.has_threats),
+                            v.severity,
+                            v.detection_count,
+                            now,
+                        )
+                        for content_hash, v in verdicts.items()
+                    ],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def count(self, detection_key: str | None = None) -> int:
+        """Number of stored verdicts.
+
+        Args:
+            detection_key: Only count verdicts for this key (None = all)
+
+        Returns:
+            Verdict count
+        """
+        with self._get_connection() as conn:
+            if detection_key is None:
+                row = conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM verdicts WHERE detection_key = ?", (detection_key,)
+                ).fetchone()
+        return int(row[0])
+
+    def prune(self, detection_key: str) -> int:
+        """Delete expired verdicts and those computed under any other detection key.
+
+        Args:
+            detection_key: Key to keep (the current fingerprint)
+
+        Returns:
+            Number of verdicts deleted
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM verdicts WHERE detection_key != ? OR created_at < ?",
+                (detection_key, self._oldest_valid()),
+            )
+        return cursor.rowcount
+
+    def _oldest_valid(self) -> float:
+        """Creation time of the oldest verdict that has not expired."""
+        return time.time() - self.max_age if self.max_age is not None else 0.0
@@ -0,0 +1,215 @@
+"""Append-only store of L2 head probabilities for offline rescoring.
+
+Changing a voting preset or scoring mode normally means rescanning text
+through the embedding model. Recording the raw probabilities of the 5
+classifier heads once lets ``raxe models rescore`` replay any policy over
+historical traffic with numpy instead.
+
+Layout (one directory per model version):
+
+- ``meta.json``: model version, head widths and class labels
+- ``heads.bin``: fixed-width records, one per scan, holding the SHA-256
+  fingerprint of the text, the attack-pattern flag and every head's
+  probabilities as float16
+
+Each record is written with a single ``O_APPEND`` write, so concurrent
+writers (threads or batch worker processes) never interleave rows; a
+trailing partial record left by a crash is ignored on read. Records are
+read back through ``np.memmap`` with one column view per head.
+
+Scanned text is never stored. float16 keeps about three significant
+digits, so a replayed decision can only differ from the live one for
+scores within ~0.001 of a threshold.
+
+Directory: ~/.raxe/head_outputs/
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from raxe.domain.fingerprint import ContentFingerprint
+from raxe.domain.ml.rescore import HEADS, HeadProbabilities, HeadProbabilityMatrix, head_labels
+from raxe.domain.ml.threat_scorer import has_obvious_attack_pattern
+
+META_FILE = "meta.json"
+RECORDS_FILE = "heads.bin"
+FORMAT_VERSION = 1
+
+
+def record_dtype(widths: dict[str, int]) -> np.dtype:
+    """Packed record layout for the given head widths.
+
+    Args:
+        widths: Number of classes per head
+
+    Returns:
+        Structured dtype of one record
+    """
+    return np.dtype(
+        [("key", "S32"), ("attack_pattern", "u1")]
+        + [(head, "<f2", (widths[head],)) for head in HEADS]
+    )
+
+
+class HeadOutputStore:
+    """Memory-mapped store of per-scan head probabilities.
+
+    Implements the ``HeadOutputSink`` protocol, so it can be passed to
+    ``GemmaL2Detector(head_output_sink=...)``.
+
+    Example usage:
+        store = HeadOutputStore()
+        store.append(model_version, text, probabilities)
+        matrix = store.load(model_version)
+    """
+
+    def __init__(self, root: Path | None = None):
+        """Initialize head output store.
+
+        Args:
+            root: Store directory (default: ~/.raxe/head_outputs)
+        """
+        if root is None:
+            root = Path.home() / ".raxe" / "head_outputs"
+
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._dtypes: dict[str, np.dtype] = {}
+
+    def append(self, model_version: str, text: str, probabilities: HeadProbabilities) -> None:
+        """Record the head probabilities of one scan.
+
+        Args:
+            model_version: Version of the model that produced them
+            text: Scanned text (only its fingerprint is stored)
+            probabilities: Raw head probabilities
+
+        Raises:
+            ValueError: If the head widths differ from earlier records of
+                the same model version
+        """
+        record = np.zeros(1, dtype=self._dtype_for(model_version, probabilities.widths))
+        record["key"] = bytes.fromhex(ContentFingerprint.of(text).sha256)
+        record["attack_pattern"] = has_obvious_attack_pattern(text)
+        for head in HEADS:
+            record[head] = getattr(probabilities, head)
+
+        path = self._directory(model_version) / RECORDS_FILE
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, record.tobytes())
+        finally:
+            os.close(fd)
+
+    def model_versions(self) -> list[str]:
+        """Model versions with recorded scans, most recently written first.
+
+        Returns:
+            Model versions
+        """
+        if not self.root.is_dir():
+            return []
+
+        found = []
+        for meta_path in self.root.glob(f"*/{META_FILE}"):
+            records = meta_path.parent / RECORDS_FILE
+            if records.exists():
+                meta = json.loads(meta_path.read_text())
+                found.append((records.stat().st_mtime, meta["model_version"]))
+        return [version for _, version in sorted(found, reverse=True)]
+
+    def count(self, model_version: str) -> int:
+        """Number of complete records for a model version.
+
+        Args:
+            model_version: Model version
+
+        Returns:
+            Record count (0 if nothing was recorded)
+        """
+        meta = self._read_meta(model_version)
+        if meta is None:
+            return 0
+        path = self._directory(model_version) / RECORDS_FILE
+        if not path.exists():
+            return 0
+        return path.stat().st_size // record_dtype(meta["widths"]).itemsize
+
+    def load(self, model_version: str) -> HeadProbabilityMatrix:
+        """Map the records of a model version.
+
+        Columns are float16 views of the memory-mapped file; they are only
+        read when used.
+
+        Args:
+            model_version: Model version
+
+        Returns:
+            Recorded head probabilities
+
+        Raises:
+            FileNotFoundError: If nothing was recorded for the model version
+        """
+        meta = self._read_meta(model_version)
+        if meta is None:
+            raise FileNotFoundError(f"No head outputs recorded for model {model_version}")
+
+        dtype = record_dtype(meta["widths"])
+        rows = self.count(model_version)
+        if rows:
+            records = np.memmap(
+                self._directory(model_version) / RECORDS_FILE,
+                dtype=dtype,
+                mode="r",
+                shape=(rows,),
+            )
+        else:
+            records = np.zeros(0, dtype=dtype)
+
+        return HeadProbabilityMatrix(
+            keys=records["key"],
+            attack_pattern=records["attack_pattern"].astype(bool),
+            labels=meta["labels"],
+            **{head: records[head] for head in HEADS},
+        )
+
+    def _directory(self, model_version: str) -> Path:
+        """Directory of a model version (filesystem-safe name)."""
+        return self.root / re.sub(r"[^A-Za-z0-9._-]", "_", model_version)
+
+    def _read_meta(self, model_version: str) -> dict | None:
+        """Read the metadata of a model version, if any."""
+        path = self._directory(model_version) / META_FILE
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _dtype_for(self, model_version: str, widths: dict[str, int]) -> np.dtype:
+        """Record layout of a model version, creating its metadata on first use."""
+        dtype = self._dtypes.get(model_version)
+        if dtype is None:
+            with self._lock:
+                meta = self._read_meta(model_version)
+                if meta is None:
+                    meta = {
+                        "format": FORMAT_VERSION,
+                        "model_version": model_version,
+                        "widths": widths,
+                        "labels": head_labels(widths),
+                    }
+                    directory = self._directory(model_version)
+                    directory.mkdir(parents=True, exist_ok=True)
+                    # Write then rename, so readers never see partial metadata
+                    tmp_path = directory / f"{META_FILE}.{os.getpid()}.tmp"
+                    tmp_path.write_text(json.dumps(meta, indent=2))
+                    tmp_path.replace(directory / META_FILE)
+                dtype = self._dtypes[model_version] = record_dtype(meta["widths"])
+
+        if any(dtype[head].shape != (widths[head],) for head in HEADS):
+            raise ValueError(f"Head widths {widths} do not match the records of {model_version}")
+        return dtype
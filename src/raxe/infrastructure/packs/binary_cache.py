@@ -0,0 +1,552 @@
+"""Memory-mapped binary rule cache shared across worker processes.
+
+The JSON cache (see ``cache.py``) is parsed into a full object graph in
+every process. With many pre-forked workers (gunicorn, Celery) each worker
+pays that startup time and memory again. The binary format here is laid
+out to be ``mmap``-ed read-only instead, so the page cache holds one copy
+per host:
+
+    header    magic, format version, manifest hash, counts, section offsets
+    rules     fixed-size records of string references, confidence and the
+              record's pattern range
+    patterns  fixed-size records: pattern source, flags, timeout
+    strings   UTF-8 string table, deduplicated (families, severities and
+              flags are stored once)
+
+``MappedRuleCache`` validates the header and hands out ``MappedRule``
+views. A view decodes its identity fields up front and everything else
+(patterns, description, examples, metrics, explainability text) from the
+mapping on first access.
+
+Build it with ``scripts/build_rule_cache.py``. Call
+``raxe.application.preloader.prefork_warmup()`` in the master process so
+the caches are opened and patterns compiled once before forking.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any
+
+from raxe.domain.rules.models import (
+    Pattern,
+    Rule,
+    RuleExamples,
+    RuleFamily,
+    RuleMetrics,
+    Severity,
+)
+
+logger = logging.getLogger(__name__)
+
+BINARY_CACHE_FILENAME = "rules_cache.rxrc"
+BINARY_CACHE_MAGIC = b"RXRC"
+BINARY_CACHE_VERSION = 1
+
+# magic, version, manifest hash, rule count, pattern count, pack_id ref,
+# rules offset, patterns offset, strings offset, strings size
+_HEADER = struct.Struct("<4sH16sIIIIIIII")
+# rule_id, version, family, sub_family, name, description, severity,
+# extras (JSON) string refs; confidence; first pattern; pattern count
+_RULE = struct.Struct("<16IdII")
+# pattern source ref, flags ref, timeout
+_PATTERN = struct.Struct("<IIIId")
+
+# Flags are stored as one string joined by this separator
+_FLAG_SEPARATOR = ","
+
+# Rule fields decoded from the mapping on first access
+_LAZY_FIELDS = (
+    "patterns",
+    "description",
+    "examples",
+    "metrics",
+    "mitre_attack",
+    "metadata",
+    "rule_hash",
+    "risk_explanation",
+    "remediation_advice",
+    "docs_url",
+)
+
+
+class BinaryCacheError(Exception):
+    """Binary rule cache is missing, corrupt, or stale."""
+
+
+class _StringTable:
+    """Deduplicating UTF-8 string table used while writing."""
+
+    def __init__(self) -> None:
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def add(self, value: str) -> tuple[int, int]:
+        ref = self._offsets.get(value)
+        if ref is None:
+            data = value.encode("utf-8")
+            ref = (self._size, len(data))
+            self._offsets[value] = ref
+            self._chunks.append(data)
+            self._size += len(data)
+        return ref
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+def _rule_extras(rule: Rule) -> str:
+    """Serialize the rarely used rule fields as one JSON string."""
+    return json.dumps(
+        {
+            "examples": {
+                "should_match": rule.examples.should_match,
+                "should_not_match": rule.examples.should_not_match,
+            },
+            "metrics": {
+                "precision": rule.metrics.precision,
+                "recall": rule.metrics.recall,
+                "f1_score": rule.metrics.f1_score,
+                "last_evaluated": rule.metrics.last_evaluated,
+                "counts_30d": rule.metrics.counts_30d,
+            },
+            "mitre_attack": rule.mitre_attack,
+            "metadata": rule.metadata,
+            "rule_hash": rule.rule_hash,
+            "risk_explanation": rule.risk_explanation,
+            "remediation_advice": rule.remediation_advice,
+            "docs_url": rule.docs_url,
+        },
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def write_binary_cache(
+    rules: list[Rule],
+    manifest_hash: str,
+    cache_path: Path,
+    pack_id: str = "",
+) -> None:
+    """Write rules to a binary cache file.
+
+    The file is written to a temporary name and renamed into place, so
+    processes that already mapped the previous file keep a consistent view.
+
+    Args:
+        rules: Validated rules to cache, in pack order
+        manifest_hash: Hash of the pack manifest for invalidation
+        cache_path: Path to write the cache file
+        pack_id: Pack identifier for metadata
+    """
+    strings = _StringTable()
+    rule_records: list[bytes] = []
+    pattern_records: list[bytes] = []
+
+    for rule in rules:
+        refs = (
+            *strings.add(rule.rule_id),
+            *strings.add(rule.version),
+            *strings.add(rule.family.value),
+            *strings.add(rule.sub_family),
+            *strings.add(rule.name),
+            *strings.add(rule.description),
+            *strings.add(rule.severity.value),
+            *strings.add(_rule_extras(rule)),
+        )
+        rule_records.append(
+            _RULE.pack(*refs, rule.confidence, len(pattern_records), len(rule.patterns))
+        )
+        for pattern in rule.patterns:
+            pattern_records.append(
+                _PATTERN.pack(
+                    *strings.add(pattern.pattern),
+                    *strings.add(_FLAG_SEPARATOR.join(pattern.flags)),
+                    pattern.timeout,
+                )
+            )
+
+    pack_id_offset, pack_id_length = strings.add(pack_id)
+    string_bytes = strings.to_bytes()
+    rules_offset = _HEADER.size
+    patterns_offset = rules_offset + _RULE.size * len(rule_records)
+    strings_offset = patterns_offset + _PATTERN.size * len(pattern_records)
+
+    header = _HEADER.pack(
+        BINARY_CACHE_MAGIC,
+        BINARY_CACHE_VERSION,
+        manifest_hash.encode("ascii")[:16].ljust(16, b"\0"),
+        len(rule_records),
+        len(pattern_records),
+        pack_id_offset,
+        pack_id_length,
+        rules_offset,
+        patterns_offset,
+        strings_offset,
+        len(string_bytes),
+    )
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.writelines(rule_records)
+        f.writelines(pattern_records)
+        f.write(string_bytes)
+    os.replace(tmp_path, cache_path)
+    logger.info(
+        f"Wrote binary rule cache: {len(rules)} rules, {len(pattern_records)} patterns "
+        f"to {cache_path} ({cache_path.stat().st_size / 1024:.0f} KB)"
+    )
+
+
+class MappedRuleCache:
+    """Read-only, memory-mapped view of a binary rule cache.
+
+    Rule views are created on first request and reused, so processes
+    forked after the cache was opened share them.
+
+    Attributes:
+        path: Cache file path
+        manifest_hash: Manifest hash the cache was built for
+        pack_id: Pack identifier recorded at build time
+        rule_count: Number of rules
+        pattern_count: Number of patterns
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a cache file and validate its header.
+
+        Args:
+            path: Cache file path
+
+        Raises:
+            BinaryCacheError: If the file is not a valid binary cache
+        """
+        self.path = path
+        try:
+            with open(path, "rb") as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BinaryCacheError(f"Cannot map {path}: {e}") from e
+
+        if len(self._buffer) < _HEADER.size:
+            raise BinaryCacheError(f"Truncated cache file: {path}")
+        (
+            magic,
+            version,
+            manifest_hash,
+            self.rule_count,
+            self.pattern_count,
+            pack_id_offset,
+            pack_id_length,
+            self._rules_offset,
+            self._patterns_offset,
+            self._strings_offset,
+            strings_size,
+        ) = _HEADER.unpack_from(self._buffer, 0)
+
+        if magic != BINARY_CACHE_MAGIC:
+            raise BinaryCacheError(f"Not a binary rule cache: {path}")
+        if version != BINARY_CACHE_VERSION:
+            raise BinaryCacheError(f"Unsupported binary cache version {version}")
+        if self._strings_offset + strings_size != len(self._buffer):
+            raise BinaryCacheError(f"Cache file size mismatch: {path}")
+
+        self.manifest_hash = manifest_hash.rstrip(b"\0").decode("ascii")
+        self.pack_id = self._string(pack_id_offset, pack_id_length)
+        self._rules: list[MappedRule | None] = [None] * self.rule_count
+        self._lock = threading.Lock()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return str(self._buffer[start : start + length], "utf-8")
+
+    def _record(self, index: int) -> tuple[Any, ...]:
+        return _RULE.unpack_from(self._buffer, self._rules_offset + index * _RULE.size)
+
+    def rule(self, index: int) -> MappedRule:
+        """Get the rule view at an index (created on first access).
+
+        Args:
+            index: Rule index in pack order
+
+        Returns:
+            Rule view backed by this cache
+        """
+        view = self._rules[index]
+        if view is None:
+            with self._lock:
+                view = self._rules[index]
+                if view is None:
+                    view = MappedRule._from_cache(self, index)
+                    self._rules[index] = view
+        return view
+
+    def rules(self) -> list[Rule]:
+        """Get views of all rules, in pack order."""
+        return [self.rule(i) for i in range(self.rule_count)]
+
+    def _patterns(self, index: int) -> list[Pattern]:
+        record = self._record(index)
+        first, count = record[17], record[18]
+        patterns = []
+        for i in range(first, first + count):
+            pattern_offset, pattern_length, flags_offset, flags_length, timeout = (
+                _PATTERN.unpack_from(self._buffer, self._patterns_offset + i * _PATTERN.size)
+            )
+            flags = self._string(flags_offset, flags_length)
+            patterns.append(
+                Pattern(
+                    pattern=self._string(pattern_offset, pattern_length),
+                    flags=flags.split(_FLAG_SEPARATOR) if flags else [],
+                    timeout=timeout,
+                )
+            )
+        return patterns
+
+    def _description(self, index: int) -> str:
+        record = self._record(index)
+        return self._string(record[10], record[11])
+
+    def _extras(self, index: int) -> dict[str, Any]:
+        record = self._record(index)
+        return json.loads(self._string(record[14], record[15]))
+
+    def __len__(self) -> int:
+        """Number of rules in the cache."""
+        return self.rule_count
+
+
+class MappedRule(Rule):
+    """``Rule`` view backed by a ``MappedRuleCache``.
+
+    Identity and scoring fields (id, version, family, sub_family, name,
+    severity, confidence) are decoded when the view is created. The
+    remaining fields are decoded from the mapping on first access and then
+    cached on the instance. Views are built from already-validated rules,
+    so ``Rule`` validation is not repeated.
+
+    Pickling produces a plain ``Rule`` (a mapping cannot be pickled).
+    """
+
+    _cache: MappedRuleCache
+    _index: int
+
+    @classmethod
+    def _from_cache(cls, cache: MappedRuleCache, index: int) -> MappedRule:
+        record = cache._record(index)
+        view = object.__new__(cls)
+        set_field = object.__setattr__
+        set_field(view, "_cache", cache)
+        set_field(view, "_index", index)
+        set_field(view, "rule_id", cache._string(record[0], record[1]))
+        set_field(view, "version", cache._string(record[2], record[3]))
+        set_field(view, "family", RuleFamily(cache._string(record[4], record[5])))
+        set_field(view, "sub_family", cache._string(record[6], record[7]))
+        set_field(view, "name", cache._string(record[8], record[9]))
+        set_field(view, "severity", Severity(cache._string(record[12], record[13])))
+        set_field(view, "confidence", record[16])
+        return view
+
+    def _lazy(self, name: str) -> Any:
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            pass
+        if name == "patterns":
+            value: Any = self._cache._patterns(self._index)
+        elif name == "description":
+            value = self._cache._description(self._index)
+        else:
+            extras = self._cache._extras(self._index)
+            self._store_extras(extras)
+            return self.__dict__[name]
+        self.__dict__[name] = value
+        return value
+
+    def _store_extras(self, extras: dict[str, Any]) -> None:
+        examples = extras.get("examples", {})
+        metrics = extras.get("metrics", {})
+        values = {
+            "examples": RuleExamples(
+                should_match=examples.get("should_match", []),
+                should_not_match=examples.get("should_not_match", []),
+            ),
+            "metrics": RuleMetrics(
+                precision=metrics.get("precision"),
+                recall=metrics.get("recall"),
+                f1_score=metrics.get("f1_score"),
+                last_evaluated=metrics.get("last_evaluated"),
+                counts_30d=metrics.get("counts_30d", {}),
+            ),
+            "mitre_attack": extras.get("mitre_attack", []),
+            "metadata": extras.get("metadata", {}),
+            "rule_hash": extras.get("rule_hash"),
+            "risk_explanation": extras.get("risk_explanation", ""),
+            "remediation_advice": extras.get("remediation_advice", ""),
+            "docs_url": extras.get("docs_url", ""),
+        }
+        for name, value in values.items():
+            self.__dict__.setdefault(name, value)
+
+    def materialize(self) -> Rule:
+        """Build an independent plain ``Rule`` with the same field values."""
+        return Rule(
+            rule_id=self.rule_id,
+            version=self.version,
+            family=self.family,
+            sub_family=self.sub_family,
+            name=self.name,
+            description=self.description,
+            severity=self.severity,
+            confidence=self.confidence,
+            patterns=self.patterns,
+            examples=self.examples,
+            metrics=self.metrics,
+            mitre_attack=self.mitre_attack,
+            metadata=self.metadata,
+            rule_hash=self.rule_hash,
+            risk_explanation=self.risk_explanation,
+            remediation_advice=self.remediation_advice,
+            docs_url=self.docs_url,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field values, so a view equals the ``Rule`` it was built from."""
+        if not isinstance(other, Rule):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in dataclasses.fields(Rule)
+        )
+
+    __hash__ = Rule.__hash__
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a plain ``Rule``."""
+        return self.materialize().__reduce__()
+
+
+def _lazy_property(name: str) -> property:
+    # The setter lets Rule.__init__ (used by dataclasses.replace) assign
+    # the field directly; views never call it otherwise.
+    def setter(self: MappedRule, value: Any) -> None:
+        self.__dict__[name] = value
+
+    return property(
+        lambda self: self._lazy(name),
+        setter,
+        doc=f"``Rule.{name}``, decoded on first access",
+    )
+
+
+for _name in _LAZY_FIELDS:
+    setattr(MappedRule, _name, _lazy_property(_name))
+del _name
+
+
+# Open caches by path. Reusing them means processes forked after
+# prefork_warmup() share the mapping and the rule views.
+_open_caches: dict[Path, tuple[tuple[int, int, int], MappedRuleCache]] = {}
+_open_caches_lock = threading.Lock()
+
+
+def open_binary_cache(cache_path: Path) -> MappedRuleCache:
+    """Map a cache file, reusing an existing mapping of the same file.
+
+    Args:
+        cache_path: Cache file path
+
+    Returns:
+        Mapped cache
+
+    Raises:
+        BinaryCacheError: If the file is missing or invalid
+    """
+    try:
+        stat = cache_path.stat()
+    except OSError as e:
+        raise BinaryCacheError(f"Cannot stat {cache_path}: {e}") from e
+    identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    with _open_caches_lock:
+        entry = _open_caches.get(cache_path)
+        if entry is not None and entry[0] == identity:
+            return entry[1]
+        cache = MappedRuleCache(cache_path)
+        _open_caches[cache_path] = (identity, cache)
+        return cache
+
+
+def read_binary_cache(
+    cache_path: Path,
+    expected_manifest_hash: str,
+) -> list[Rule] | None:
+    """Read rule views from a binary cache file.
+
+    Returns None if the cache is missing, invalid, or stale.
+
+    Args:
+        cache_path: Path to cache file
+        expected_manifest_hash: Hash to validate against
+
+    Returns:
+        List of rule views if cache is valid, None otherwise
+    """
+    if not cache_path.exists():
+        return None
+
+    try:
+        cache = open_binary_cache(cache_path)
+    except BinaryCacheError as e:
+        logger.warning(f"Binary rule cache invalid: {e}")
+        return None
+
+    if cache.manifest_hash != expected_manifest_hash:
+        logger.info("Binary cache manifest hash mismatch, will regenerate")
+        return None
+
+    return cache.rules()
+
+
+def find_binary_cache_path(pack_dir: Path, manifest_hash: str) -> Path:
+    """Determine the binary cache file path for a pack.
+
+    Same lookup order as ``cache.find_cache_path``: bundled next to the
+    pack first, then the user cache directory.
+    """
+    bundled = pack_dir / BINARY_CACHE_FILENAME
+    if bundled.exists():
+        return bundled
+
+    from raxe.infrastructure.packs.cache import _get_user_cache_dir
+
+    return _get_user_cache_dir() / f"rules_{manifest_hash}.rxrc"
+
+
+# Patterns compiled in the master process before forking (see
+# prefork_warmup). Keyed like PatternMatcher's cache (pattern source and
+# sorted flags), so children inject them instead of compiling or unpickling.
+_shared_patterns: dict[str, object] = {}
+
+
+def share_compiled_patterns(patterns: dict[str, object]) -> None:
+    """Publish compiled patterns for packs loaded later in this process.
+
+    Args:
+        patterns: Mapping of matcher cache key -> compiled regex
+    """
+    _shared_patterns.update(patterns)
+
+
+def shared_compiled_patterns() -> dict[str, object]:
+    """Get patterns published by ``share_compiled_patterns`` (may be empty)."""
+    return _shared_patterns
@@ -20,6 +20,12 @@ from raxe.domain.packs.models import (
     RulePack,
 )
 from raxe.domain.rules.models import Rule
+from raxe.infrastructure.packs.binary_cache import (
+    find_binary_cache_path,
+    read_binary_cache,
+    shared_compiled_patterns,
+    write_binary_cache,
+)
 from raxe.infrastructure.packs.cache import (
     _compute_manifest_hash,
     find_cache_path,
@@ -74,9 +80,10 @@ class PackLoader:
     def load_pack(self, pack_dir: Path) -> RulePack:
         """Load a complete pack from directory.
 
-        Uses a pre-compiled JSON cache when available to avoid parsing
-        hundreds of YAML files. Falls back to YAML loading if cache is
-        missing or invalid, then writes a cache for next time.
+        Uses the memory-mapped binary cache when available, then the JSON
+        cache, to avoid parsing hundreds of YAML files. Falls back to YAML
+        loading if both are missing or invalid, then writes the caches for
+        next time.
 
         Args:
             pack_dir: Directory containing pack.yaml and rules
@@ -105,18 +112,26 @@ class PackLoader:
         except Exception as e:
             raise PackLoadError(f"Failed to load pack manifest from {manifest_path}: {e}") from e
 
-        # Try loading from cache (fast path)
         manifest_hash = _compute_manifest_hash(manifest_path)
+
+        # Try the memory-mapped binary cache (fastest, shared across workers)
+        binary_path = find_binary_cache_path(pack_dir, manifest_hash)
+        mapped_rules = read_binary_cache(binary_path, manifest_hash)
+        if mapped_rules is not None and len(mapped_rules) == len(manifest.rules):
+            self._load_compiled_patterns(pack_dir, manifest_hash)
+            logger.info(
+                f"Loaded pack '{manifest.versioned_id}' from binary cache "
+                f"({len(mapped_rules)} rules)"
+            )
+            return RulePack(manifest=manifest, rules=mapped_rules)
+
+        # Try loading from JSON cache (fast path)
         cache_path = find_cache_path(pack_dir, manifest_hash)
         cached_rules = read_cache(cache_path, manifest_hash)
 
         if cached_rules is not None and len(cached_rules) == len(manifest.rules):
-            # Also try to load compiled patterns cache
-            patterns_path = find_patterns_cache_path(pack_dir, manifest_hash)
-            compiled = read_patterns_cache(patterns_path, manifest_hash)
-            if compiled is not None:
-                self._compiled_patterns.update(compiled)
-
+            self._load_compiled_patterns(pack_dir, manifest_hash)
+            self._write_binary_cache(cached_rules, manifest_hash, binary_path, manifest)
             logger.info(
                 f"Loaded pack '{manifest.versioned_id}' from cache ({len(cached_rules)} rules)"
             )
@@ -138,6 +153,8 @@ class PackLoader:
             )
         except Exception as e:
             logger.warning(f"Failed to write rule cache: {e}")
+        if len(rules) == len(manifest.rules):
+            self._write_binary_cache(rules, manifest_hash, binary_path, manifest)
 
         # Create and return pack
         try:
@@ -170,6 +187,35 @@ class PackLoader:
                 return RulePack(manifest=adjusted_manifest, rules=rules)
             raise PackLoadError(f"Pack validation failed: {e}") from e
 
+    def _load_compiled_patterns(self, pack_dir: Path, manifest_hash: str) -> None:
+        """Collect compiled patterns for a cached pack.
+
+        Patterns compiled before forking (``prefork_warmup``) are reused
+        as-is; otherwise the pickled patterns cache is read, if present.
+        """
+        shared = shared_compiled_patterns()
+        if shared:
+            self._compiled_patterns.update(shared)
+            return
+
+        patterns_path = find_patterns_cache_path(pack_dir, manifest_hash)
+        compiled = read_patterns_cache(patterns_path, manifest_hash)
+        if compiled is not None:
+            self._compiled_patterns.update(compiled)
+
+    def _write_binary_cache(
+        self,
+        rules: list[Rule],
+        manifest_hash: str,
+        binary_path: Path,
+        manifest: PackManifest,
+    ) -> None:
+        """Write the binary cache, logging (not raising) on failure."""
+        try:
+            write_binary_cache(rules, manifest_hash, binary_path, pack_id=manifest.versioned_id)
+        except Exception as e:
+            logger.warning(f"Failed to write binary rule cache: {e}")
+
     def _load_rules_from_yaml(
         self,
         pack_dir: Path,
@@ -5,11 +5,13 @@ Infrastructure layer - coordinates pack loading and rule resolution.
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from raxe.domain.packs.models import RulePack
 from raxe.domain.rules.models import Rule
+from raxe.domain.rules.ruleset import RulesetSnapshot
 from raxe.infrastructure.packs.loader import PackLoader, PackLoadError
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,11 @@ class PackRegistry:
     - Precedence resolution (custom > community > core by default)
     - Rule deduplication (keeps highest precedence version)
     - Version conflict handling
+    - Publishing an immutable, versioned ``RulesetSnapshot``
+
+    The snapshot is rebuilt only when packs are loaded or reloaded and is
+    swapped in atomically, so scans reading ``snapshot`` never block on a
+    reload and never observe a half-loaded ruleset.
 
     Example usage:
         config = RegistryConfig(packs_root=Path("~/.raxe/packs"))
@@ -61,6 +68,9 @@ class PackRegistry:
 
         # Get all unique rules
         all_rules = registry.get_all_rules()
+
+        # Current immutable ruleset (what scans use)
+        snapshot = registry.snapshot
     """
 
     def __init__(self, config: RegistryConfig):
@@ -72,6 +82,49 @@ class PackRegistry:
         self.config = config
         self.loader = PackLoader(strict=config.strict)
         self.packs: dict[str, RulePack] = {}
+        self._publish_lock = threading.Lock()
+        self._snapshot = RulesetSnapshot.empty()
+
+    @property
+    def snapshot(self) -> RulesetSnapshot:
+        """Current immutable ruleset snapshot.
+
+        Read it once per scan; a reload publishes a new snapshot with a
+        higher generation rather than mutating this one.
+        """
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        """Generation number of the current ruleset snapshot."""
+        return self._snapshot.generation
+
+    def _publish(self, packs: dict[str, RulePack]) -> RulesetSnapshot:
+        """Swap in new packs and publish a snapshot built from them.
+
+        Must be called with ``_publish_lock`` held.
+
+        Args:
+            packs: Complete pack mapping to make current
+
+        Returns:
+            The newly published snapshot
+        """
+        ordered = (
+            rule
+            for pack_type in self.config.precedence
+            if pack_type in packs
+            for rule in packs[pack_type].rules
+        )
+        snapshot = RulesetSnapshot.build(ordered, generation=self._snapshot.generation + 1)
+        # Both assignments are atomic; readers see old or new, never a mix
+        self.packs = packs
+        self._snapshot = snapshot
+        logger.debug(
+            f"Published ruleset generation {snapshot.generation} "
+            f"with {len(snapshot)} rules from {len(packs)} packs"
+        )
+        return snapshot
 
     def load_all_packs(self) -> None:
         """Load all packs from configured root directory.
@@ -81,7 +134,18 @@ class PackRegistry:
         - packs_root/community/v*.*.*/pack.yaml
         - packs_root/custom/*/pack.yaml (any subdirectory)
 
-        Logs summary of loaded packs.
+        Logs summary of loaded packs and publishes a new ruleset snapshot.
+        """
+        with self._publish_lock:
+            packs = dict(self.packs)
+            self._load_into(packs)
+            self._publish(packs)
+
+    def _load_into(self, packs: dict[str, RulePack]) -> None:
+        """Load the latest pack of each type into a pack mapping.
+
+        Args:
+            packs: Mapping to populate (not yet visible to readers)
         """
         if not self.config.packs_root.exists():
             logger.warning(f"Packs root directory does not exist: {self.config.packs_root}")
@@ -102,7 +166,7 @@ class PackRegistry:
                 latest_pack = self.loader.load_latest_pack(pack_type_dir)
 
                 if latest_pack:
-                    self.packs[pack_type] = latest_pack
+                    packs[pack_type] = latest_pack
                     loaded_count += 1
                     logger.info(
                         f"Loaded {pack_type} pack: {latest_pack.manifest.versioned_id} "
@@ -140,7 +204,8 @@ class PackRegistry:
             latest_pack = self.loader.load_latest_pack(pack_type_dir)
 
             if latest_pack:
-                self.packs[pack_type] = latest_pack
+                with self._publish_lock:
+                    self._publish({**self.packs, pack_type: latest_pack})
                 logger.info(f"Loaded {pack_type} pack: {latest_pack.manifest.versioned_id}")
                 return latest_pack
             else:
@@ -215,7 +280,8 @@ class PackRegistry:
 
         Deduplicates by rule_id, keeping highest precedence version.
         If custom pack has pi-001 and core pack has pi-001, only
-        custom version is returned.
+        custom version is returned. Served from the current snapshot,
+        so no per-call deduplication is done.
 
         Returns:
             List of unique rules (deduplicated by rule_id)
@@ -224,28 +290,7 @@ class PackRegistry:
             all_rules = registry.get_all_rules()
             # Returns: [pi-001 (custom), pi-002 (core), ...]
         """
-        seen_ids = set()
-        rules = []
-
-        # Iterate in precedence order
-        for pack_type in self.config.precedence:
-            pack = self.packs.get(pack_type)
-            if not pack:
-                continue
-
-            for rule in pack.rules:
-                # Only add if we haven't seen this rule_id yet
-                if rule.rule_id not in seen_ids:
-                    rules.append(rule)
-                    seen_ids.add(rule.rule_id)
-                else:
-                    logger.debug(
-                        f"Skipping duplicate rule {rule.rule_id} from {pack_type} pack "
-                        f"(already loaded from higher precedence pack)"
-                    )
-
-        logger.debug(f"Collected {len(rules)} unique rules from {len(self.packs)} packs")
-        return rules
+        return list(self._snapshot.rules)
 
     def get_all_rules_with_versions(self) -> list[Rule]:
         """Get all rules from all packs, including duplicates.
@@ -285,8 +330,7 @@ class PackRegistry:
         Returns:
             List of unique rules in the specified family
         """
-        all_rules = self.get_all_rules()
-        return [r for r in all_rules if r.family.value == family]
+        return list(self._snapshot.by_family.get(family, ()))
 
     def get_rules_by_severity(self, severity: str) -> list[Rule]:
         """Get all unique rules with a specific severity.
@@ -299,8 +343,7 @@ class PackRegistry:
         Returns:
             List of unique rules with the specified severity
         """
-        all_rules = self.get_all_rules()
-        return [r for r in all_rules if r.severity.value == severity]
+        return list(self._snapshot.by_severity.get(severity, ()))
 
     def list_packs(self) -> list[RulePack]:
         """List all loaded packs.
@@ -369,9 +412,12 @@ class PackRegistry:
     def reload_all_packs(self) -> None:
         """Reload all packs from filesystem.
 
-        Clears current packs and loads fresh from disk.
-        Useful for picking up rule updates.
+        Loads fresh packs from disk and publishes them as a new snapshot.
+        Useful for picking up rule updates. In-flight scans keep using
+        the snapshot they started with.
         """
         logger.info("Reloading all packs from filesystem")
-        self.packs.clear()
-        self.load_all_packs()
+        with self._publish_lock:
+            packs: dict[str, RulePack] = {}
+            self._load_into(packs)
+            self._publish(packs)
@@ -21,11 +21,13 @@ from raxe.monitoring.metrics import (
     errors_total,
     queue_depth,
     queue_processing_duration,
+    rule_cost_collector,
     rule_execution_duration,
     rules_loaded,
     scan_duration_seconds,
     # Metrics (for advanced use)
     scans_total,
+    stage_latency_collector,
     system_info,
 )
 from raxe.monitoring.profiler import PerformanceProfiler
@@ -42,10 +44,12 @@ __all__ = [
     "errors_total",
     "queue_depth",
     "queue_processing_duration",
+    "rule_cost_collector",
     "rule_execution_duration",
     "rules_loaded",
     "scan_duration_seconds",
     # Individual metrics (for advanced usage)
     "scans_total",
+    "stage_latency_collector",
     "system_info",
 ]
@@ -18,7 +18,11 @@ import time
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from prometheus_client import Counter, Gauge, Histogram, Info
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, Info
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from raxe.utils.histogram import merged_stage_latency
+from raxe.utils.profiler import merged_rule_costs
 
 if TYPE_CHECKING:
     from raxe.application.scan_pipeline import ScanPipelineResult
@@ -178,6 +182,101 @@ system_info.info(
 )
 
 
+# ============================================================================
+# Stage Latency Metrics
+# ============================================================================
+
+
+class StageLatencyCollector:
+    """
+    Export per-stage scan latency distributions at scrape time.
+
+    The scan pipeline records every stage (l1, l2, plugins, policy,
+    persistence, total) into fixed-memory histograms. This collector merges
+    them across all pipelines in the process when Prometheus scrapes, so
+    recording stays lock-free and quantiles are computed only on demand.
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def collect(self):
+        """Yield quantile, count and sum metric families."""
+        quantiles = GaugeMetricFamily(
+            "raxe_stage_latency_ms",
+            "Scan stage latency quantiles in milliseconds",
+            labels=["stage", "quantile"],
+        )
+        counts = CounterMetricFamily(
+            "raxe_stage_latency_samples",
+            "Number of recorded scan stage latency samples",
+            labels=["stage"],
+        )
+        sums = CounterMetricFamily(
+            "raxe_stage_time_ms",
+            "Total recorded scan stage time in milliseconds",
+            labels=["stage"],
+        )
+        for stage, histogram in sorted(merged_stage_latency().items()):
+            for quantile in self.QUANTILES:
+                quantiles.add_metric([stage, str(quantile)], histogram.percentile(quantile))
+            counts.add_metric([stage], histogram.count)
+            sums.add_metric([stage], histogram.total_ms)
+        yield quantiles
+        yield counts
+        yield sums
+
+
+stage_latency_collector = StageLatencyCollector()
+REGISTRY.register(stage_latency_collector)
+
+
+class RuleCostCollector:
+    """
+    Export the costliest rules found by the sampled rule profiler.
+
+    Only the top ``limit`` rules by cumulative sampled time are exported,
+    which keeps label cardinality bounded regardless of pack size.
+    """
+
+    def __init__(self, limit: int = 20):
+        """Initialize collector.
+
+        Args:
+            limit: Number of rules to export
+        """
+        self.limit = limit
+
+    def collect(self):
+        """Yield per-rule cost metric families."""
+        total = CounterMetricFamily(
+            "raxe_rule_sampled_cost_ms",
+            "Cumulative execution time of top rules over sampled scans",
+            labels=["rule_id"],
+        )
+        worst = GaugeMetricFamily(
+            "raxe_rule_sampled_max_ms",
+            "Slowest sampled execution of top rules in milliseconds",
+            labels=["rule_id"],
+        )
+        match_rate = GaugeMetricFamily(
+            "raxe_rule_sampled_match_rate",
+            "Fraction of sampled scans where the rule matched",
+            labels=["rule_id"],
+        )
+        costs = sorted(merged_rule_costs().values(), key=lambda c: c.total_ms, reverse=True)
+        for cost in costs[: self.limit]:
+            total.add_metric([cost.rule_id], cost.total_ms)
+            worst.add_metric([cost.rule_id], cost.max_ms)
+            match_rate.add_metric([cost.rule_id], cost.match_rate)
+        yield total
+        yield worst
+        yield match_rate
+
+
+rule_cost_collector = RuleCostCollector()
+REGISTRY.register(rule_cost_collector)
+
+
 # ============================================================================
 # Metrics Collector
 # ============================================================================
@@ -239,6 +338,18 @@ class MetricsCollector:
             duration = time.perf_counter() - start
             rule_execution_duration.labels(rule_id=rule_id).observe(duration)
 
+    def record_rule_execution(self, rule_id: str, duration_seconds: float):
+        """
+        Record an individual rule execution timed elsewhere.
+
+        Used by the sampled rule profiler, which already times each rule.
+
+        Args:
+            rule_id: ID of the rule that was executed
+            duration_seconds: Execution time in seconds
+        """
+        rule_execution_duration.labels(rule_id=rule_id).observe(duration_seconds)
+
     @contextmanager
     def measure_queue_processing(self):
         """Context manager to measure queue batch processing time."""
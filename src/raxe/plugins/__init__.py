@@ -71,6 +71,7 @@ from raxe.plugins.manager import PluginManager, PluginMetrics
 from raxe.plugins.protocol import (
     ActionPlugin,
     DetectorPlugin,
+    PluginConcurrency,
     PluginMetadata,
     PluginPriority,
     RaxePlugin,
@@ -83,6 +84,7 @@ __all__ = [
     "CustomRule",
     "CustomRuleLoader",
     "DetectorPlugin",
+    "PluginConcurrency",
     "PluginInfo",
     # Loading
     "PluginLoader",
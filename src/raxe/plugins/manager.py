@@ -10,21 +10,37 @@ The PluginManager is responsible for:
 - Timeout enforcement
 - Performance tracking
 - Error isolation
+
+Detector plugins are fanned out concurrently for every scan and share a
+single deadline, so plugin latency is the slowest detector rather than
+the sum of all of them.
 """
 
+import functools
+import importlib.util
 import logging
+import multiprocessing
+import sys
+import threading
 import time
 import traceback
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 
 # Conditional imports for type checking
 from typing import TYPE_CHECKING, Any
 
 from raxe.plugins.loader import PluginLoader
-from raxe.plugins.protocol import ActionPlugin, DetectorPlugin, RaxePlugin, TransformPlugin
+from raxe.plugins.protocol import (
+    ActionPlugin,
+    DetectorPlugin,
+    PluginConcurrency,
+    RaxePlugin,
+    TransformPlugin,
+)
 
 if TYPE_CHECKING:
     from raxe.application.scan_pipeline import ScanPipelineResult
@@ -33,6 +49,56 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _timed_detect(
+    plugin: DetectorPlugin, text: str, context: dict[str, Any] | None
+) -> tuple[Any, float]:
+    """Run ``plugin.detect`` and measure it (module-level so it pickles).
+
+    Returns:
+        Tuple of (detect() return value, duration in milliseconds)
+    """
+    start_time = time.perf_counter()
+    detections = plugin.detect(text, context)
+    return detections, (time.perf_counter() - start_time) * 1000
+
+
+def _init_process_worker(plugin_modules: dict[str, str]) -> None:
+    """Load file-based plugin modules so pickled plugins resolve in a worker.
+
+    Args:
+        plugin_modules: Module name -> file of plugins loaded by PluginLoader
+    """
+    for name, path in plugin_modules.items():
+        if name in sys.modules:
+            continue
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            continue
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+
+
+def _serial_detect(
+    lock: threading.Lock,
+    deadline: float,
+    plugin: DetectorPlugin,
+    text: str,
+    context: dict[str, Any] | None,
+) -> tuple[Any, float]:
+    """Run a non-thread-safe detector once its previous call has finished.
+
+    Raises:
+        TimeoutError: If the previous call does not finish before the deadline
+    """
+    if not lock.acquire(timeout=max(deadline - time.perf_counter(), 0.0)):
+        raise FutureTimeoutError
+    try:
+        return _timed_detect(plugin, text, context)
+    finally:
+        lock.release()
+
+
 @dataclass
 class PluginMetrics:
     """Performance metrics for a single plugin.
@@ -143,9 +209,20 @@ class PluginManager:
         manager.shutdown()
         ```
 
+    Detector plugins always run concurrently (``parallel_execution`` only
+    affects hooks and actions): each scan submits every detector at once
+    and collects results until a shared deadline of ``timeout`` seconds.
+    Detectors still running at the deadline are recorded as timeouts and
+    their results discarded; a detector whose timed-out call has not
+    returned yet is skipped by later scans instead of piling up threads.
+    PROCESS detectors run in a spawned process pool; if a worker dies the
+    pool is discarded and rebuilt on a later scan, after a backoff that
+    doubles with each consecutive crash.
+
     Attributes:
         loader: PluginLoader instance
-        timeout: Maximum execution time per plugin (seconds)
+        timeout: Maximum execution time per plugin (seconds); for detectors,
+            the deadline shared by all detectors in one scan
         parallel: Execute plugins in parallel (ThreadPoolExecutor)
         all_plugins: All loaded plugins in priority order
         detector_plugins: Detector plugins only
@@ -154,6 +231,10 @@ class PluginManager:
         plugin_metrics: Performance metrics per plugin
     """
 
+    # Delay before rebuilding a crashed process pool, doubled per crash
+    PROCESS_POOL_RETRY_SECONDS = 1.0
+    PROCESS_POOL_MAX_RETRY_SECONDS = 60.0
+
     def __init__(
         self,
         loader: PluginLoader,
@@ -186,6 +267,16 @@ class PluginManager:
         if parallel_execution:
             self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="plugin")
 
+        # Detector fan-out (pools are created on first use)
+        self._detector_executor: ThreadPoolExecutor | None = None
+        self._process_executor: ProcessPoolExecutor | None = None
+        self._process_pool_crashes = 0
+        self._process_pool_retry_at = 0.0
+        self._executor_lock = threading.Lock()
+        self._serial_locks: dict[str, threading.Lock] = {}
+        # Timed-out detector calls that are still running, per plugin
+        self._running_late: dict[str, set[Future]] = {}
+
         logger.debug(
             f"PluginManager initialized (timeout={timeout_seconds}s, parallel={parallel_execution})"
         )
@@ -300,75 +391,242 @@ class PluginManager:
 
         return results
 
-    def run_detectors(self, text: str, context: dict[str, Any] | None = None) -> list["Detection"]:
+    def run_detectors(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> list["Detection"]:
         """Run all detector plugins.
 
-        Executes the detect() method on all detector plugins and
-        aggregates results. Each detection is tagged with the plugin
-        that generated it.
+        Submits every detector concurrently and gathers results as they
+        complete, until a deadline shared by all detectors. Each detection
+        is tagged with the plugin that generated it.
 
         Args:
             text: Text to scan
             context: Optional context metadata
+            timeout: Deadline for all detectors in seconds (default: self.timeout)
 
         Returns:
-            Combined list of detections from all detector plugins
+            Combined list of detections from all detector plugins, in
+            plugin priority order
 
         Note:
             - Detections are validated (must be list)
             - Plugin name is added to detection metadata
-            - Errors are isolated per plugin
+            - Errors and timeouts are isolated per plugin
         """
-        all_detections: list[Detection] = []
+        if not self.detector_plugins:
+            return []
 
+        deadline = time.perf_counter() + (self.timeout if timeout is None else timeout)
+
+        futures: dict[Future, DetectorPlugin] = {}
         for plugin in self.detector_plugins:
+            name = plugin.metadata.name
+            if self._running_late.get(name):
+                logger.error(f"Detector plugin {name} skipped: a timed-out call is still running")
+                self.plugin_metrics[name].record_timeout("detect")
+                continue
             try:
-                metrics = self.plugin_metrics[plugin.metadata.name]
-                start_time = time.perf_counter()
+                futures[self._submit_detector(plugin, text, context, deadline)] = plugin
+            except Exception as e:
+                logger.error(f"Detector plugin {name} could not be started: {e}")
+                self.plugin_metrics[name].record_error("detect")
+
+        done, late = wait(futures, timeout=max(deadline - time.perf_counter(), 0.0))
+
+        results: dict[str, list[Detection]] = {}
+        for future in done:
+            plugin = futures[future]
+            detections = self._collect_detections(plugin, future)
+            if detections is not None:
+                results[plugin.metadata.name] = detections
+
+        for future in late:
+            plugin = futures[future]
+            name = plugin.metadata.name
+            logger.error(f"Detector plugin {name} timed out after {self.timeout}s")
+            self.plugin_metrics[name].record_timeout("detect")
+            if not future.cancel():
+                running = self._running_late.setdefault(name, set())
+                running.add(future)
+                future.add_done_callback(running.discard)
+
+        all_detections: list[Detection] = []
+        for plugin in self.detector_plugins:
+            all_detections.extend(results.get(plugin.metadata.name, ()))
+        return all_detections
+
+    def _submit_detector(
+        self,
+        plugin: DetectorPlugin,
+        text: str,
+        context: dict[str, Any] | None,
+        deadline: float,
+    ) -> Future:
+        """Start one detector according to its declared concurrency.
+
+        Args:
+            plugin: Detector plugin
+            text: Text to scan
+            context: Optional context metadata
+            deadline: ``time.perf_counter()`` value the scan waits until
 
-                # Run detector with timeout
-                detect_func = lambda: plugin.detect(text, context)  # noqa: E731
-                detections = self._execute_with_timeout(detect_func, (), {})
+        Returns:
+            Future resolving to (detections, duration_ms)
+        """
+        concurrency = getattr(plugin.metadata, "concurrency", PluginConcurrency.SERIAL)
+        if concurrency is PluginConcurrency.PROCESS:
+            pool = self._get_process_executor()
+            try:
+                future = pool.submit(_timed_detect, plugin, text, context)
+            except BrokenProcessPool:
+                # A worker died since the last scan: retry on a new pool
+                self._discard_process_executor(pool)
+                pool = self._get_process_executor()
+                future = pool.submit(_timed_detect, plugin, text, context)
+            future.add_done_callback(functools.partial(self._check_process_result, pool))
+            return future
+
+        executor = self._get_detector_executor()
+        if concurrency is PluginConcurrency.THREAD_SAFE:
+            return executor.submit(_timed_detect, plugin, text, context)
+
+        lock = self._serial_locks.setdefault(plugin.metadata.name, threading.Lock())
+        return executor.submit(_serial_detect, lock, deadline, plugin, text, context)
+
+    def _collect_detections(self, plugin: DetectorPlugin, future: Future) -> list | None:
+        """Validate, attribute and record the result of a finished detector.
+
+        Args:
+            plugin: Detector plugin that produced the future
+            future: Completed future from ``_submit_detector``
 
-                # Validate result
-                if not isinstance(detections, list):
-                    logger.warning(
-                        f"Plugin {plugin.metadata.name} returned invalid "
-                        f"detections: {type(detections)}. Expected list."
+        Returns:
+            Detections, or None if the plugin failed or returned invalid data
+        """
+        name = plugin.metadata.name
+        metrics = self.plugin_metrics[name]
+        try:
+            detections, duration_ms = future.result()
+        except FutureTimeoutError:
+            logger.error(f"Detector plugin {name} timed out after {self.timeout}s")
+            metrics.record_timeout("detect")
+            return None
+        except Exception as e:
+            logger.error(f"Detector plugin {name} failed: {e}")
+            metrics.record_error("detect")
+            return None
+
+        # Validate result
+        if not isinstance(detections, list):
+            logger.warning(
+                f"Plugin {name} returned invalid detections: {type(detections)}. Expected list."
+            )
+            return None
+
+        # Add plugin attribution to each detection
+        for detection in detections:
+            # Add plugin name to metadata
+            if hasattr(detection, "__dict__"):
+                if not hasattr(detection, "metadata"):
+                    detection.metadata = {}  # type: ignore
+                if isinstance(detection.metadata, dict):
+                    detection.metadata["plugin"] = name
+
+        metrics.record_execution("detect", duration_ms)
+        logger.debug(f"Plugin {name} detected {len(detections)} threats in {duration_ms:.2f}ms")
+        return detections
+
+    def _get_detector_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for detectors (two workers per detector, at most 32)."""
+        if self._detector_executor is None:
+            with self._executor_lock:
+                if self._detector_executor is None:
+                    self._detector_executor = ThreadPoolExecutor(
+                        max_workers=min(32, 2 * max(len(self.detector_plugins), 1)),
+                        thread_name_prefix="plugin-detect",
                     )
-                    continue
+        return self._detector_executor
 
-                # Add plugin attribution to each detection
-                for detection in detections:
-                    # Add plugin name to metadata
-                    if hasattr(detection, "__dict__"):
-                        if not hasattr(detection, "metadata"):
-                            detection.metadata = {}  # type: ignore
-                        if isinstance(detection.metadata, dict):
-                            detection.metadata["plugin"] = plugin.metadata.name
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """Process pool for PROCESS detectors (one worker per such detector).
 
-                all_detections.extend(detections)
+        Workers are spawned rather than forked, since the host process runs
+        threads (ONNX runtime, telemetry, these pools) that fork would copy
+        in an undefined state.
 
-                # Record metrics
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                metrics.record_execution("detect", duration_ms)
+        Raises:
+            RuntimeError: If the pool crashed and its backoff has not elapsed
+        """
+        if self._process_executor is None:
+            with self._executor_lock:
+                if self._process_executor is None:
+                    wait_seconds = self._process_pool_retry_at - time.monotonic()
+                    if wait_seconds > 0:
+                        raise RuntimeError(
+                            f"process pool crashed; restarting in {wait_seconds:.1f}s"
+                        )
+                    isolated = [
+                        p
+                        for p in self.detector_plugins
+                        if getattr(p.metadata, "concurrency", None) is PluginConcurrency.PROCESS
+                    ]
+                    # Plugins loaded from files live in modules a spawned
+                    # worker cannot import by name
+                    plugin_modules = {}
+                    for plugin in isolated:
+                        module = sys.modules.get(type(plugin).__module__)
+                        path = getattr(module, "__file__", None)
+                        if module is not None and module.__name__.startswith("raxe_plugin_"):
+                            if path is not None:
+                                plugin_modules[module.__name__] = path
+                    self._process_executor = ProcessPoolExecutor(
+                        max_workers=max(len(isolated), 1),
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_process_worker,
+                        initargs=(plugin_modules,),
+                    )
+        return self._process_executor
 
-                logger.debug(
-                    f"Plugin {plugin.metadata.name} detected {len(detections)} threats "
-                    f"in {duration_ms:.2f}ms"
-                )
+    def _check_process_result(self, pool: ProcessPoolExecutor, future: Future) -> None:
+        """Discard the pool if a PROCESS detector call found it broken.
 
-            except FutureTimeoutError:
-                logger.error(
-                    f"Detector plugin {plugin.metadata.name} timed out after {self.timeout}s"
-                )
-                metrics.record_timeout("detect")
+        Args:
+            pool: Pool the call was submitted to
+            future: Finished call
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._discard_process_executor(pool)
+        elif error is None:
+            with self._executor_lock:
+                if self._process_executor is pool:
+                    self._process_pool_crashes = 0
 
-            except Exception as e:
-                logger.error(f"Detector plugin {plugin.metadata.name} failed: {e}")
-                metrics.record_error("detect")
+    def _discard_process_executor(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken process pool; the next scan builds a new one.
 
-        return all_detections
+        Args:
+            pool: Broken pool (ignored if it was already replaced)
+        """
+        with self._executor_lock:
+            if self._process_executor is not pool:
+                return
+            self._process_executor = None
+            self._process_pool_crashes += 1
+            delay = min(
+                self.PROCESS_POOL_RETRY_SECONDS * 2 ** (self._process_pool_crashes - 1),
+                self.PROCESS_POOL_MAX_RETRY_SECONDS,
+            )
+            self._process_pool_retry_at = time.monotonic() + delay
+        logger.error(f"Detector process pool crashed; rebuilding it in {delay:.1f}s")
+        pool.shutdown(wait=False, cancel_futures=True)
 
     def run_actions(self, result: "ScanPipelineResult") -> None:
         """Run all action plugins.
@@ -443,6 +701,13 @@ class PluginManager:
             self.executor.shutdown(wait=True, timeout=10)
             logger.debug("Plugin executor shut down")
 
+        # Detector pools: do not wait for calls that already timed out
+        for pool in (self._detector_executor, self._process_executor):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._detector_executor = None
+        self._process_executor = None
+
         # Log final metrics
         self._log_metrics()
 
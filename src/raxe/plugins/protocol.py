@@ -63,6 +63,25 @@ class PluginPriority(Enum):
     LOW = 100  # Nice-to-have, runs last
 
 
+class PluginConcurrency(Enum):
+    """How a detector plugin may be run alongside scans and other plugins.
+
+    Detector plugins always run concurrently with each other. This setting
+    controls what else is allowed:
+
+    - SERIAL: One ``detect()`` call at a time for this plugin (default;
+      safe for plugins with unsynchronized state)
+    - THREAD_SAFE: Overlapping calls from concurrent scans are allowed
+    - PROCESS: CPU-bound plugin run in a worker process, so it does not
+      hold the GIL while other detectors run. The plugin and its
+      detections must be picklable.
+    """
+
+    SERIAL = "serial"
+    THREAD_SAFE = "thread_safe"
+    PROCESS = "process"
+
+
 @dataclass(frozen=True)
 class PluginMetadata:
     """Plugin identification and metadata.
@@ -79,6 +98,7 @@ class PluginMetadata:
         priority: Execution priority (default: NORMAL)
         requires: List of required RAXE versions (semver format)
         tags: Categorization tags for discovery
+        concurrency: How detect() may be run (default: SERIAL)
     """
 
     name: str
@@ -88,6 +108,7 @@ class PluginMetadata:
     priority: PluginPriority = PluginPriority.NORMAL
     requires: tuple[str, ...] = ("raxe>=1.0.0",)
     tags: tuple[str, ...] = ()
+    concurrency: PluginConcurrency = PluginConcurrency.SERIAL
 
     def __post_init__(self) -> None:
         """Validate metadata."""
@@ -248,8 +269,9 @@ class DetectorPlugin(RaxePlugin, Protocol):
     def detect(self, text: str, context: dict[str, Any] | None = None) -> list["Detection"]:
         """Execute custom detection logic.
 
-        Called during the L1 detection phase. Runs in parallel with
-        core rule-based detection.
+        Called during the L1 detection phase. All detector plugins run
+        concurrently and share one per-scan deadline; see
+        ``PluginMetadata.concurrency`` for thread and process isolation.
 
         Args:
             text: Text to scan for threats
@@ -260,7 +282,7 @@ class DetectorPlugin(RaxePlugin, Protocol):
 
         Note:
             - Should complete quickly (<5ms target)
-            - Will be subject to timeout (5s default)
+            - Will be subject to timeout (5s default, shared by all detectors)
             - Exceptions are caught and logged
         """
         ...
@@ -415,6 +437,7 @@ class TransformPlugin(RaxePlugin, Protocol):
 __all__ = [
     "ActionPlugin",
     "DetectorPlugin",
+    "PluginConcurrency",
     "PluginMetadata",
     "PluginPriority",
     "RaxePlugin",
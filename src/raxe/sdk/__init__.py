@@ -42,21 +42,41 @@ Public exports:
     - suppression_scope: Function for scoped suppression without client
 """
 
-from raxe.sdk.agent_scanner import (
-    AgentScanner,
-    AgentScanResult,
-    ScanConfig,
-    ScanType,
-    ToolPolicy,
-    ToolValidationMode,
-)
-from raxe.sdk.client import Raxe
-from raxe.sdk.exceptions import (
-    RaxeBlockedError,
-    RaxeException,
-    SecurityException,
-)
-from raxe.sdk.suppression_context import suppression_scope
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from raxe.sdk.agent_scanner import (
+        AgentScanner,
+        AgentScanResult,
+        ScanConfig,
+        ScanType,
+        ToolPolicy,
+        ToolValidationMode,
+    )
+    from raxe.sdk.client import Raxe
+    from raxe.sdk.exceptions import (
+        RaxeBlockedError,
+        RaxeException,
+        SecurityException,
+    )
+    from raxe.sdk.suppression_context import suppression_scope
+
+# Exports are imported on first access, so importing a light submodule such
+# as raxe.sdk.exceptions does not load the client and the whole scan stack.
+_LAZY_EXPORTS = {
+    "AgentScanResult": "raxe.sdk.agent_scanner",
+    "AgentScanner": "raxe.sdk.agent_scanner",
+    "ScanConfig": "raxe.sdk.agent_scanner",
+    "ScanType": "raxe.sdk.agent_scanner",
+    "ToolPolicy": "raxe.sdk.agent_scanner",
+    "ToolValidationMode": "raxe.sdk.agent_scanner",
+    "Raxe": "raxe.sdk.client",
+    "RaxeBlockedError": "raxe.sdk.exceptions",
+    "RaxeException": "raxe.sdk.exceptions",
+    "SecurityException": "raxe.sdk.exceptions",
+    "suppression_scope": "raxe.sdk.suppression_context",
+}
 
 __all__ = [
     "AgentScanResult",
@@ -75,3 +95,13 @@ __all__ = [
     # Utilities
     "suppression_scope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import SDK exports."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -52,19 +52,25 @@ import hashlib
 import time
 import uuid
 import weakref
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from pathlib import Path
 from re import Pattern
 from typing import TYPE_CHECKING, Any, Literal
 
+from raxe.application.scan_lanes import ScanPriority
+from raxe.domain.fingerprint import ContentFingerprint
+from raxe.infrastructure.database.verdict_store import StoredVerdict, VerdictStore
 from raxe.sdk.client import Raxe
+from raxe.sdk.conversation_memo import ConversationMemo
 from raxe.sdk.exceptions import (
     ErrorCode,
     RaxeError,
     RaxeException,
     SecurityException,
 )
+from raxe.sdk.suppression_context import get_scoped_suppressions
 from raxe.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -72,6 +78,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Severity ordering used for blocking thresholds and aggregation
+_SEVERITY_ORDER = {"INFO": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+
+# Message prefix of fail-open results (not verdicts, never memoized)
+_SCAN_FAILED_PREFIX = "Scan failed"
+
 
 class ScanType(str, Enum):
     """Types of scans in agentic systems.
@@ -346,6 +358,72 @@ class AgentScanResult:
         }
 
 
+@dataclass(frozen=True)
+class ConversationScanResult:
+    """Result from scanning the messages of a conversation.
+
+    Verdicts for messages scanned on earlier turns come from the
+    conversation memo and are folded into the aggregate like fresh ones.
+
+    Attributes:
+        conversation_id: Conversation the messages belong to
+        results: One AgentScanResult per message, in message order
+    """
+
+    conversation_id: str
+    results: list[AgentScanResult] = field(default_factory=list)
+
+    @property
+    def has_threats(self) -> bool:
+        """Whether any message contains a threat."""
+        return any(r.has_threats for r in self.results)
+
+    @property
+    def should_block(self) -> bool:
+        """Whether any message should be blocked."""
+        return any(r.should_block for r in self.results)
+
+    @property
+    def severity(self) -> str | None:
+        """Highest severity across all messages."""
+        severities = [r.severity for r in self.results if r.severity]
+        if not severities:
+            return None
+        return max(severities, key=lambda s: _SEVERITY_ORDER.get(s.upper(), 0))
+
+    @property
+    def detection_count(self) -> int:
+        """Total detections across all messages."""
+        return sum(r.detection_count for r in self.results)
+
+    @property
+    def memoized_count(self) -> int:
+        """Messages answered from the conversation memo."""
+        return sum(1 for r in self.results if r.details.get("memoized"))
+
+    @property
+    def scanned_count(self) -> int:
+        """Messages scanned on this call."""
+        return len(self.results) - self.memoized_count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary with the aggregate verdict and per-message results
+        """
+        return {
+            "conversation_id": self.conversation_id,
+            "has_threats": self.has_threats,
+            "should_block": self.should_block,
+            "severity": self.severity,
+            "detection_count": self.detection_count,
+            "scanned_count": self.scanned_count,
+            "memoized_count": self.memoized_count,
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
 @dataclass(frozen=True)
 class GoalValidationResult:
     """Result of agent goal change validation.
@@ -591,6 +669,18 @@ class AgentScannerConfig:
         timeout_ms: Scan timeout in milliseconds
         fail_open: If scan fails/times out, allow request
         max_prompt_length: Maximum prompt length to scan
+
+        conversation_memo_enabled: Reuse verdicts for messages already scanned
+            in the same conversation (default: True)
+        conversation_memo_ttl: Seconds a memoized verdict stays valid
+        conversation_memo_max_conversations: Conversations tracked at once
+
+        rag_verdict_store_enabled: Persist RAG chunk verdicts on disk so
+            chunks retrieved again are not re-scanned (default: False)
+        rag_verdict_store_path: SQLite file for the verdict store
+            (default: ~/.raxe/rag_verdicts.db)
+        rag_verdict_store_max_age: Seconds a stored verdict stays valid
+            (default: 7 days, None for no expiration)
     """
 
     # Scan targets
@@ -626,6 +716,16 @@ class AgentScannerConfig:
     fail_open: bool = True
     max_prompt_length: int = 50000
 
+    # Conversation memo: each turn only scans messages not seen before
+    conversation_memo_enabled: bool = True
+    conversation_memo_ttl: float = 3600.0
+    conversation_memo_max_conversations: int = 1024
+
+    # RAG verdict store: retrieved chunks are scanned once per detection config
+    rag_verdict_store_enabled: bool = False
+    rag_verdict_store_path: str | None = None
+    rag_verdict_store_max_age: float | None = VerdictStore.DEFAULT_MAX_AGE_SECONDS
+
     # Execution mode: "sync" (default) or "background" (fire-and-forget)
     # Background mode submits scans to a worker thread and returns immediately.
     # Incompatible with on_threat="block" — auto-corrects to "sync" with warning.
@@ -869,6 +969,17 @@ class AgentScanner:
         self._current_trace_id: str | None = None
         self._step_counter: int = 0
 
+        # Verdicts for messages already scanned, per conversation
+        self._conversation_memo: ConversationMemo | None = None
+        if self.config.conversation_memo_enabled:
+            self._conversation_memo = ConversationMemo(
+                max_conversations=self.config.conversation_memo_max_conversations,
+                ttl=self.config.conversation_memo_ttl,
+            )
+
+        # Persistent RAG chunk verdicts (opened on first RAG scan)
+        self._verdict_store: VerdictStore | None = None
+
         # Track instance for cleanup at interpreter exit (weakref avoids
         # preventing GC and accumulating handlers for short-lived scanners)
         AgentScanner._register_instance(self)
@@ -986,10 +1097,8 @@ class AgentScanner:
         if not severity:
             return False
 
-        # Severity ordering
-        severity_order = {"INFO": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
-        min_severity = severity_order.get(config.min_severity_to_block, 2)
-        actual_severity = severity_order.get(severity.upper(), 0)
+        min_severity = _SEVERITY_ORDER.get(config.min_severity_to_block, 2)
+        actual_severity = _SEVERITY_ORDER.get(severity.upper(), 0)
 
         return actual_severity >= min_severity
 
@@ -1304,6 +1413,7 @@ class AgentScanner:
         *,
         scan_type: ScanType = ScanType.PROMPT,
         metadata: dict[str, Any] | None = None,
+        conversation_id: str | None = None,
     ) -> AgentScanResult:
         """Generic scan that routes to the appropriate scan_* method.
 
@@ -1314,10 +1424,21 @@ class AgentScanner:
             text: Text to scan
             scan_type: Type of scan to perform
             metadata: Optional metadata about the scan
+            conversation_id: Conversation the text belongs to; a verdict
+                memoized for the same text in this conversation is reused
 
         Returns:
             AgentScanResult with scan results
         """
+        if conversation_id is not None:
+            return self._memoized(
+                conversation_id,
+                scan_type,
+                text,
+                metadata,
+                lambda: self.scan(text, scan_type=scan_type, metadata=metadata),
+            )
+
         if scan_type == ScanType.PROMPT:
             return self.scan_prompt(text, metadata=metadata)
         elif scan_type == ScanType.RESPONSE:
@@ -1661,6 +1782,9 @@ class AgentScanner:
             config: The configuration to apply
         """
         self._scan_configs[scan_type] = config
+        # Memoized verdicts may carry the old blocking decision
+        if self._conversation_memo is not None:
+            self._conversation_memo.clear()
 
     # =========================================================================
     # New validate_tool_call method (returns ToolValidationResponse)
@@ -2362,15 +2486,216 @@ class AgentScanner:
     # Async Variants
     # =========================================================================
 
+    async def scan_async(
+        self,
+        text: str,
+        *,
+        scan_type: ScanType = ScanType.PROMPT,
+        metadata: dict[str, Any] | None = None,
+        conversation_id: str | None = None,
+        priority: ScanPriority | str | None = ScanPriority.INTERACTIVE,
+    ) -> AgentScanResult:
+        """Async version of scan().
+
+        Prompt, response and other text scans await ``Raxe.scan_async``,
+        which runs on the client's bounded scan executor and shares its
+        result cache. The timeout cancels the wait, not the event loop.
+        Tool results keep their sync path and run in the default executor.
+
+        Args:
+            text: Text to scan
+            scan_type: Type of scan to perform
+            metadata: Optional metadata about the scan
+            conversation_id: Conversation the text belongs to; a verdict
+                memoized for the same text in this conversation is reused
+            priority: L2 lane of text scans - interactive (default),
+                background or batch. A scan whose lane is full is degraded
+                to L1-only and its verdict is not memoized.
+
+        Returns:
+            AgentScanResult with scan results
+        """
+        if conversation_id is not None:
+            return await self._memoized_async(
+                conversation_id,
+                scan_type,
+                text,
+                metadata,
+                lambda: self.scan_async(
+                    text, scan_type=scan_type, metadata=metadata, priority=priority
+                ),
+            )
+
+        if scan_type == ScanType.TOOL_RESULT:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self.scan(text, scan_type=scan_type, metadata=metadata),
+            )
+        return await self._scan_text_async(text, scan_type, metadata, priority)
+
+    async def scan_batch_async(
+        self,
+        texts: Sequence[str],
+        *,
+        scan_type: ScanType = ScanType.PROMPT,
+        metadata: dict[str, Any] | None = None,
+        conversation_id: str | None = None,
+        max_concurrency: int = 8,
+    ) -> list[AgentScanResult]:
+        """Scan several texts concurrently (e.g. all prompts of one LLM call).
+
+        Args:
+            texts: Texts to scan
+            scan_type: Type of scan applied to every text
+            metadata: Optional metadata applied to every text
+            conversation_id: Conversation the texts belong to
+            max_concurrency: Maximum scans in flight (default: 8)
+
+        Returns:
+            One AgentScanResult per text, in the same order
+
+        Raises:
+            SecurityException: If blocking enabled and threat detected
+                (the other scans still run to completion)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scan_one(text: str) -> AgentScanResult:
+            async with semaphore:
+                return await self.scan_async(
+                    text,
+                    scan_type=scan_type,
+                    metadata=metadata,
+                    conversation_id=conversation_id,
+                )
+
+        outcomes = await asyncio.gather(*(scan_one(text) for text in texts), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return list(outcomes)
+
+    async def _scan_text_async(
+        self,
+        text: str,
+        scan_type: ScanType,
+        metadata: dict[str, Any] | None,
+        priority: ScanPriority | str | None = ScanPriority.INTERACTIVE,
+    ) -> AgentScanResult:
+        """Native async text scan (same results as scan_prompt/scan_response)."""
+        label, empty_message = {
+            ScanType.PROMPT: ("Prompt scan", "Empty prompt skipped"),
+            ScanType.RESPONSE: ("Response scan", "Empty response skipped"),
+        }.get(scan_type, (scan_type.value, f"{scan_type.value} scan: empty content"))
+
+        if not text or not text.strip():
+            return self._build_result(
+                scan_type=scan_type,
+                has_threats=False,
+                should_block=False,
+                severity=None,
+                detection_count=0,
+                duration_ms=0.0,
+                message=empty_message,
+                details=metadata,
+                content=text,
+            )
+
+        config = self._scan_configs.get(scan_type, ScanConfig())
+
+        # Background mode: submit and return immediately
+        if self._background_worker is not None:
+            return self._submit_background_scan(text, scan_type, metadata, config.block_on_threat)
+
+        start = time.perf_counter()
+        error_msg = None
+        result = None
+        try:
+            result = await asyncio.wait_for(
+                self.raxe.scan_async(
+                    text,
+                    block_on_threat=config.block_on_threat,
+                    integration_type=self.integration_type,
+                    l2_enabled=self.config.l2_enabled,
+                    tenant_id=self.config.tenant_id,
+                    app_id=self.config.app_id,
+                    policy_id=self.config.policy_id,
+                    priority=priority,
+                ),
+                timeout=self.timeout_ms / 1000.0,
+            )
+        except SecurityException:
+            raise  # Don't swallow blocking-mode exceptions
+        except asyncio.TimeoutError:
+            logger.warning(
+                "scan_timeout",
+                extra={"timeout_ms": self.timeout_ms, "fail_open": self.fail_open},
+            )
+            error_msg = f"Scan timed out after {self.timeout_ms}ms"
+        except Exception as e:
+            logger.error(
+                "scan_error",
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "fail_open": self.fail_open,
+                },
+            )
+            error_msg = f"Scan error: {e}"
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        if result is None:
+            if self.fail_open:
+                return self._build_result(
+                    scan_type=scan_type,
+                    has_threats=False,
+                    should_block=False,
+                    severity=None,
+                    detection_count=0,
+                    duration_ms=duration_ms,
+                    message=f"{_SCAN_FAILED_PREFIX} (fail-open): {error_msg}",
+                    details=metadata,
+                    content=text,
+                )
+            from raxe.sdk.exceptions import ScanTimeoutError
+
+            raise ScanTimeoutError(
+                f"{_SCAN_FAILED_PREFIX} (fail-closed): {error_msg}",
+                timeout_ms=self.timeout_ms,
+            )
+
+        details = metadata
+        if isinstance(result.metadata, dict) and (
+            result.metadata.get("l2_degraded") or result.metadata.get("l2_timeout")
+        ):
+            # L2 was skipped because its lane was full or it timed out: L1-only verdict
+            details = {**(metadata or {}), "l2_degraded": True}
+
+        agent_result = self._build_result(
+            scan_type=scan_type,
+            has_threats=result.has_threats,
+            should_block=self._should_block(scan_type, result.severity),
+            severity=result.severity,
+            detection_count=result.total_detections,
+            duration_ms=duration_ms,
+            message=f"{label}: {result.severity or 'clean'}",
+            details=details,
+            content=text,
+        )
+
+        if result.has_threats and self.on_threat:
+            self.on_threat(agent_result)
+
+        return agent_result
+
     async def scan_prompt_async(
         self,
         prompt: str,
         *,
         metadata: dict[str, Any] | None = None,
     ) -> AgentScanResult:
-        """Async wrapper for scan_prompt.
-
-        Runs the synchronous scan in a thread pool executor.
+        """Async version of scan_prompt (native, see scan_async).
 
         Args:
             prompt: The prompt text to scan
@@ -2379,11 +2704,7 @@ class AgentScanner:
         Returns:
             AgentScanResult with scan results
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.scan_prompt(prompt, metadata=metadata),
-        )
+        return await self._scan_text_async(prompt, ScanType.PROMPT, metadata)
 
     async def scan_response_async(
         self,
@@ -2391,12 +2712,8 @@ class AgentScanner:
         *,
         metadata: dict[str, Any] | None = None,
     ) -> AgentScanResult:
-        """Async wrapper for scan_response."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.scan_response(response, metadata=metadata),
-        )
+        """Async version of scan_response (native, see scan_async)."""
+        return await self._scan_text_async(response, ScanType.RESPONSE, metadata)
 
     async def scan_tool_call_async(
         self,
@@ -2460,8 +2777,8 @@ class AgentScanner:
         """Shut down the scanner's background resources.
 
         Stops the background worker first (so it can drain queued scans),
-        then shuts down the shared scan executor.
-        Safe to call multiple times.
+        then shuts down the shared scan executor and closes the RAG
+        verdict store. Safe to call multiple times.
         """
         if self._background_worker is not None:
             try:
@@ -2472,6 +2789,11 @@ class AgentScanner:
             self._scan_executor.shutdown(wait=False)
         except Exception:
             logger.debug("Error shutting down scan executor", exc_info=True)
+        if self._verdict_store is not None:
+            try:
+                self._verdict_store.close()
+            except Exception:
+                logger.debug("Error closing RAG verdict store", exc_info=True)
 
     def __enter__(self) -> AgentScanner:
         return self
@@ -2551,6 +2873,15 @@ class AgentScanner:
     ) -> list[AgentScanResult]:
         """Scan RAG-retrieved documents for threats.
 
+        Documents are deduplicated by content and the unique documents are
+        scanned together with ``Raxe.scan_batch()``. With
+        ``rag_verdict_store_enabled``, verdicts are also looked up in (and
+        written to) the persistent verdict store in one query per call, so
+        chunks seen before - by this process, another worker or a
+        ``raxe batch --verdict-store`` pre-warm - are not scanned again.
+        The store is bypassed while ``raxe.suppressed()`` scopes are
+        active, since its key does not cover them.
+
         Args:
             documents: List of document texts to scan
             metadata: Optional context metadata
@@ -2558,49 +2889,120 @@ class AgentScanner:
         Returns:
             List of AgentScanResult, one per document
         """
+        fingerprints = {
+            i: ContentFingerprint(doc) for i, doc in enumerate(documents) if doc and doc.strip()
+        }
+        unique: dict[str, int] = {}
+        for i, fingerprint in fingerprints.items():
+            unique.setdefault(fingerprint.sha256, i)
+
+        # Scoped suppressions change verdicts without changing the store key
+        store = self._get_verdict_store() if unique and not get_scoped_suppressions() else None
+        detection_key = ""
+        verdicts: dict[str, StoredVerdict] = {}
+        if store is not None:
+            try:
+                detection_key = self.raxe.detection_fingerprint(
+                    tenant_id=self.config.tenant_id,
+                    app_id=self.config.app_id,
+                    policy_id=self.config.policy_id,
+                )
+                verdicts = store.get_many(unique, detection_key)
+            except Exception as e:
+                logger.warning(f"RAG verdict store lookup failed: {e}")
+                store = None
+        stored = set(verdicts)
+
+        unseen = [content_hash for content_hash in unique if content_hash not in verdicts]
+        durations: dict[str, float] = {}
+        if unseen:
+            start = time.perf_counter()
+            outcomes = self.raxe.scan_batch(
+                [documents[unique[content_hash]] for content_hash in unseen],
+                return_exceptions=True,
+                tenant_id=self.config.tenant_id,
+                app_id=self.config.app_id,
+                policy_id=self.config.policy_id,
+            )
+            # Scans overlap, so each document is charged its share of the batch
+            per_scan_ms = (time.perf_counter() - start) * 1000 / len(unseen)
+            for content_hash, scan_result in zip(unseen, outcomes, strict=True):
+                if isinstance(scan_result, Exception):
+                    logger.warning(f"RAG context scan failed: {scan_result}")
+                    continue
+                durations[content_hash] = per_scan_ms
+                verdicts[content_hash] = StoredVerdict(
+                    has_threats=scan_result.has_threats,
+                    severity=scan_result.severity,
+                    detection_count=scan_result.total_detections,
+                )
+
+        if store is not None:
+            try:
+                store.put_many(
+                    {h: v for h, v in verdicts.items() if h not in stored},
+                    detection_key,
+                )
+            except Exception as e:
+                logger.warning(f"RAG verdict store update failed: {e}")
+
         results = []
         for i, doc in enumerate(documents):
             doc_metadata = {**(metadata or {}), "document_index": i}
-            # Use scan_prompt with RAG_CONTEXT config
-            result = self._build_result(
-                scan_type=ScanType.RAG_CONTEXT,
-                has_threats=False,
-                should_block=False,
-                severity=None,
-                detection_count=0,
-                duration_ms=0.0,
-                message="RAG context scan",
-                details=doc_metadata,
-                content=doc if doc else f"doc_{i}",  # Hash document content
-            )
-
-            if doc and doc.strip():
-                start = time.perf_counter()
-                try:
-                    scan_result = self.raxe.scan(
-                        doc,
-                        tenant_id=self.config.tenant_id,
-                        app_id=self.config.app_id,
-                        policy_id=self.config.policy_id,
-                    )
-                    duration_ms = (time.perf_counter() - start) * 1000
-                    result = self._build_result(
+            fingerprint = fingerprints.get(i)
+            verdict = verdicts.get(fingerprint.sha256) if fingerprint else None
+            if verdict is None:
+                results.append(
+                    self._build_result(
                         scan_type=ScanType.RAG_CONTEXT,
-                        has_threats=scan_result.has_threats,
-                        should_block=self._should_block(ScanType.RAG_CONTEXT, scan_result.severity),
-                        severity=scan_result.severity,
-                        detection_count=scan_result.total_detections,
-                        duration_ms=duration_ms,
-                        message=f"RAG context: {scan_result.severity or 'clean'}",
+                        has_threats=False,
+                        should_block=False,
+                        severity=None,
+                        detection_count=0,
+                        duration_ms=0.0,
+                        message="RAG context scan",
                         details=doc_metadata,
-                        content=doc,  # Hash document content
+                        content=doc if doc else f"doc_{i}",  # Hash document content
                     )
-                except Exception as e:
-                    logger.warning(f"RAG context scan failed: {e}")
-
-            results.append(result)
+                )
+                continue
+
+            content_hash = fingerprint.sha256
+            if content_hash in stored:
+                doc_metadata["from_verdict_store"] = True
+            # Duplicates within the batch reuse the first copy's verdict
+            duration_ms = durations.get(content_hash, 0.0) if unique[content_hash] == i else 0.0
+            results.append(
+                self._build_result(
+                    scan_type=ScanType.RAG_CONTEXT,
+                    has_threats=verdict.has_threats,
+                    should_block=self._should_block(ScanType.RAG_CONTEXT, verdict.severity),
+                    severity=verdict.severity,
+                    detection_count=verdict.detection_count,
+                    duration_ms=duration_ms,
+                    message=f"RAG context: {verdict.severity or 'clean'}",
+                    details=doc_metadata,
+                    content=doc,  # Hash document content
+                )
+            )
         return results
 
+    def _get_verdict_store(self) -> VerdictStore | None:
+        """Open the RAG verdict store on first use (None if disabled)."""
+        if not self.config.rag_verdict_store_enabled:
+            return None
+        if self._verdict_store is None:
+            path = self.config.rag_verdict_store_path
+            try:
+                self._verdict_store = VerdictStore(
+                    Path(path) if path else None,
+                    max_age=self.config.rag_verdict_store_max_age,
+                )
+            except Exception as e:
+                logger.warning(f"RAG verdict store unavailable: {e}")
+                return None
+        return self._verdict_store
+
     async def scan_rag_context_async(
         self,
         documents: list[str],
@@ -2630,6 +3032,10 @@ class AgentScanner:
             text: Message text to scan
             context: Optional context with message type and metadata
 
+        When the context carries a ``conversation_id``, a message already
+        scanned in that conversation returns its memoized verdict instead
+        of being scanned again.
+
         Returns:
             AgentScanResult with scan results
 
@@ -2653,14 +3059,188 @@ class AgentScanner:
             **context.metadata,
         }
 
+        if context.conversation_id is not None:
+            return self._memoized(
+                context.conversation_id,
+                context.message_type,
+                text,
+                metadata,
+                lambda: self._route_message(text, context.message_type, metadata),
+            )
+        return self._route_message(text, context.message_type, metadata)
+
+    def scan_conversation(
+        self,
+        messages: Sequence[str],
+        *,
+        conversation_id: str,
+        message_type: MessageType = MessageType.HUMAN_INPUT,
+        sender_name: str | None = None,
+        receiver_name: str | None = None,
+    ) -> ConversationScanResult:
+        """Scan a conversation history, reusing verdicts from earlier turns.
+
+        Only messages not yet memoized for ``conversation_id`` are scanned,
+        so calling this with the growing history on every turn costs one
+        scan per new message rather than one per message in the history.
+
+        Args:
+            messages: Message texts in conversation order
+            conversation_id: Unique ID for the conversation thread
+            message_type: Type applied to every message
+            sender_name: Optional sender name
+            receiver_name: Optional receiver name
+
+        Returns:
+            ConversationScanResult with per-message and aggregate verdicts
+
+        Example:
+            >>> history.append(user_turn)
+            >>> result = scanner.scan_conversation(history, conversation_id="thread-42")
+            >>> if result.should_block:
+            ...     raise SecurityError(result.severity)
+        """
+        results = [
+            self.scan_message(
+                text,
+                context=ScanContext(
+                    message_type=message_type,
+                    sender_name=sender_name,
+                    receiver_name=receiver_name,
+                    conversation_id=conversation_id,
+                    message_index=index,
+                ),
+            )
+            for index, text in enumerate(messages)
+        ]
+        return ConversationScanResult(conversation_id=conversation_id, results=results)
+
+    def forget_conversation(self, conversation_id: str) -> None:
+        """Drop memoized verdicts for a finished conversation.
+
+        Args:
+            conversation_id: Conversation to forget
+        """
+        if self._conversation_memo is not None:
+            self._conversation_memo.forget(conversation_id)
+
+    def _memoized(
+        self,
+        conversation_id: str,
+        kind: ScanType | MessageType,
+        text: str,
+        metadata: dict[str, Any] | None,
+        scan: Callable[[], AgentScanResult],
+    ) -> AgentScanResult:
+        """Return the memoized verdict for text, or scan and memoize it.
+
+        Background placeholders and fail-open results are not verdicts and
+        are never memoized.
+
+        Args:
+            conversation_id: Conversation the text belongs to
+            kind: Scan or message type (verdicts differ per routing)
+            text: Text to scan
+            metadata: Metadata for this call (merged into the memoized details)
+            scan: Performs the actual scan on a miss
+
+        Returns:
+            AgentScanResult, with ``details["memoized"]`` set on a hit
+        """
+        slot = self._memo_slot(kind, text)
+        if slot is None:
+            return scan()
+
+        cached = self._memo_get(conversation_id, slot, metadata)
+        if cached is not None:
+            return cached
+
+        result = scan()
+        self._memo_set(conversation_id, slot, result)
+        return result
+
+    async def _memoized_async(
+        self,
+        conversation_id: str,
+        kind: ScanType | MessageType,
+        text: str,
+        metadata: dict[str, Any] | None,
+        scan: Callable[[], Awaitable[AgentScanResult]],
+    ) -> AgentScanResult:
+        """Async version of _memoized (``scan`` returns an awaitable)."""
+        slot = self._memo_slot(kind, text)
+        if slot is None:
+            return await scan()
+
+        cached = self._memo_get(conversation_id, slot, metadata)
+        if cached is not None:
+            return cached
+
+        result = await scan()
+        self._memo_set(conversation_id, slot, result)
+        return result
+
+    def _memo_slot(
+        self,
+        kind: ScanType | MessageType,
+        text: str,
+    ) -> tuple[tuple[Any, ...], Any] | None:
+        """(key, verdict token) for memoizing text, or None if it is not memoizable."""
+        if (
+            self._conversation_memo is None
+            or self._background_worker is not None
+            or not text
+            or not text.strip()
+        ):
+            return None
+        fingerprint = ContentFingerprint(text)
+        return (kind, fingerprint.cache_key, fingerprint.char_length), self.raxe.verdict_token()
+
+    def _memo_get(
+        self,
+        conversation_id: str,
+        slot: tuple[tuple[Any, ...], Any],
+        metadata: dict[str, Any] | None,
+    ) -> AgentScanResult | None:
+        """Memoized verdict for a slot, marked as memoized (None on a miss)."""
+        key, token = slot
+        cached = self._conversation_memo.get(conversation_id, key, token)
+        if cached is None:
+            return None
+        return replace(
+            cached,
+            duration_ms=0.0,
+            details={**cached.details, **(metadata or {}), "memoized": True},
+        )
+
+    def _memo_set(
+        self,
+        conversation_id: str,
+        slot: tuple[tuple[Any, ...], Any],
+        result: AgentScanResult,
+    ) -> None:
+        """Memoize a verdict (fail-open and L2-degraded results are skipped)."""
+        if result.details.get("l2_degraded"):
+            return
+        if not result.message.startswith(_SCAN_FAILED_PREFIX):
+            key, token = slot
+            self._conversation_memo.set(conversation_id, key, result, token)
+
+    def _route_message(
+        self,
+        text: str,
+        message_type: MessageType,
+        metadata: dict[str, Any],
+    ) -> AgentScanResult:
+        """Scan a message with the scan method matching its type."""
         # Route to appropriate method based on message type
-        if context.message_type == MessageType.HUMAN_INPUT:
+        if message_type == MessageType.HUMAN_INPUT:
             return self.scan_prompt(text, metadata=metadata)
-        elif context.message_type == MessageType.AGENT_RESPONSE:
+        elif message_type == MessageType.AGENT_RESPONSE:
             return self.scan_response(text, metadata=metadata)
-        elif context.message_type == MessageType.FUNCTION_CALL:
+        elif message_type == MessageType.FUNCTION_CALL:
             return self.scan_agent_action("function_call", text, metadata=metadata)
-        elif context.message_type == MessageType.FUNCTION_RESULT:
+        elif message_type == MessageType.FUNCTION_RESULT:
             return self.scan_tool_result("unknown", text, metadata=metadata)
         else:
             # Default to prompt scanning for other message types
@@ -2677,6 +3257,9 @@ class AgentScanner:
             "step_count": self._step_counter,
             "tool_policy_mode": self.tool_policy.mode.value,
             "default_block": self.default_block,
+            "conversation_memo": (
+                self._conversation_memo.stats() if self._conversation_memo is not None else None
+            ),
         }
 
     def __repr__(self) -> str:
@@ -2796,6 +3379,7 @@ __all__ = [
     "AgentScanResult",
     "AgentScanner",
     "AgentScannerConfig",
+    "ConversationScanResult",
     "GoalValidationResult",
     "MessageType",
     "PrivilegeValidationResult",
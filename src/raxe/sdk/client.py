@@ -12,19 +12,29 @@ consistency and proper configuration cascade.
 
 from __future__ import annotations
 
+import asyncio
 import atexit
+import concurrent.futures
+import contextvars
+import functools
+import hashlib
+import os
 import threading
-from collections.abc import Callable
+import time
+import warnings
+from collections.abc import Callable, Hashable, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, ClassVar
 
 from raxe.application.preloader import preload_pipeline
+from raxe.application.scan_lanes import ScanPriority
 from raxe.application.scan_merger import ScanMerger
 from raxe.application.scan_pipeline import ScanPipelineResult
 from raxe.application.telemetry_orchestrator import get_orchestrator
 from raxe.domain.engine.executor import Detection
 from raxe.domain.engine.matcher import Match
+from raxe.domain.fingerprint import ContentFingerprint
 from raxe.domain.inline_suppression import parse_inline_suppressions
 from raxe.domain.ml.protocol import L2Prediction
 from raxe.domain.rules.models import Severity
@@ -34,6 +44,7 @@ from raxe.domain.telemetry.events import generate_event_id
 from raxe.infrastructure.config.scan_config import ScanConfig
 from raxe.infrastructure.database.scan_history import ScanHistoryDB
 from raxe.infrastructure.tracking.usage import UsageTracker
+from raxe.sdk.result_cache import ResultCache
 from raxe.sdk.suppression_context import SuppressedContext, get_scoped_suppressions
 from raxe.utils.logging import get_logger
 
@@ -43,6 +54,10 @@ logger = get_logger(__name__)
 # Reuse ScanMerger for consistent severity mapping
 _scan_merger = ScanMerger()
 
+# Worker threads for scan_async(); bounded so async servers cannot pile
+# unbounded CPU-bound scans onto one process
+ASYNC_SCAN_WORKERS = max(2, min(8, os.cpu_count() or 1))
+
 
 def _l2_prediction_to_detection(
     prediction: L2Prediction,
@@ -163,6 +178,8 @@ class Raxe:
         l2_enabled: bool | None = None,
         voting_preset: str | None = None,
         progress_callback=None,
+        result_cache_mb: float = 32.0,
+        result_cache_ttl: float | None = 300.0,
         **kwargs,
     ):
         """Initialize RAXE client.
@@ -182,6 +199,10 @@ class Raxe:
                 env var if set, otherwise True.
             voting_preset: L2 voting preset (balanced, high_security, low_fp)
             progress_callback: Optional progress indicator for initialization
+            result_cache_mb: Memory budget of the scan result cache in MB
+                (default: 32, 0 disables caching)
+            result_cache_ttl: Seconds a cached result stays valid
+                (default: 300, None for no expiration)
             **kwargs: Additional config options passed to ScanConfig
 
         Raises:
@@ -245,6 +266,17 @@ class Raxe:
         self._scan_history: ScanHistoryDB | None = None
         self._streak_tracker = None
 
+        # Cache of detection stage results for repeated prompts (see scan())
+        self._result_cache: ResultCache | None = (
+            ResultCache(max_bytes=int(result_cache_mb * 1024 * 1024), ttl=result_cache_ttl)
+            if result_cache_mb > 0
+            else None
+        )
+
+        # Dedicated executor for scan_async() (created on first async scan)
+        self._async_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._async_executor_lock = threading.Lock()
+
         # Initialize suppression manager (auto-loads .raxe/suppressions.yaml from cwd)
         self.suppression_manager = create_suppression_manager(auto_load=True)
 
@@ -263,10 +295,6 @@ class Raxe:
                 voting_preset=self._voting_preset,
             )
 
-            # Also create async pipeline for parallel L1/L2 execution (5x faster!)
-            # This shares the same components but runs L1+L2 concurrently
-            self._async_pipeline = None  # Lazy init on first use
-
             self._initialized = True
 
             # Initialize telemetry (non-blocking, never raises)
@@ -287,31 +315,6 @@ class Raxe:
             logger.error("raxe_client_init_failed", error=str(e))
             raise
 
-    def _get_async_pipeline(self):
-        """Get or create async pipeline (lazy initialization).
-
-        The async pipeline runs L1 and L2 in parallel for 5x speedup.
-        It shares components with the sync pipeline for efficiency.
-        """
-        if self._async_pipeline is None:
-            from raxe.application.scan_pipeline_async import AsyncScanPipeline
-
-            # Reuse components from sync pipeline
-            self._async_pipeline = AsyncScanPipeline(
-                pack_registry=self.pipeline.pack_registry,
-                rule_executor=self.pipeline.rule_executor,
-                l2_detector=self.pipeline.l2_detector,
-                scan_merger=self.pipeline.scan_merger,
-                enable_l2=self.pipeline.enable_l2,
-                fail_fast_on_critical=self.pipeline.fail_fast_on_critical,
-                min_confidence_for_skip=self.pipeline.min_confidence_for_skip,
-                l1_timeout_ms=10.0,
-                l2_timeout_ms=150.0,
-            )
-            logger.info("Async pipeline initialized (parallel L1+L2 execution)")
-
-        return self._async_pipeline
-
     def _check_telemetry_disable_permission(self) -> bool:
         """Check if telemetry can be disabled based on cached server permissions.
 
@@ -434,6 +437,7 @@ class Raxe:
         mssp_customer_name: str | None = None,
         mssp_data_mode: str | None = None,
         mssp_data_fields: list[str] | None = None,
+        fingerprint: ContentFingerprint | None = None,
     ) -> None:
         """Track scan telemetry using schema v2.0 (non-blocking, never raises).
 
@@ -456,6 +460,7 @@ class Raxe:
             mssp_customer_name: Human-readable customer name (e.g., 'Acme Corp')
             mssp_data_mode: Privacy mode ('full' or 'privacy_safe')
             mssp_data_fields: List of fields to include in MSSP webhook
+            fingerprint: Scan content fingerprint (reuses the prompt hash)
         """
         try:
             orchestrator = get_orchestrator()
@@ -492,6 +497,8 @@ class Raxe:
                 telemetry_policy_version = result.metadata.get("effective_policy_version")
                 telemetry_resolution_source = result.metadata.get("resolution_source")
 
+            fingerprint = ContentFingerprint.of(prompt, fingerprint)
+
             # Build telemetry payload using v2 schema
             # All fields are dynamically calculated from actual scan results
             telemetry_payload = build_scan_telemetry(
@@ -500,6 +507,8 @@ class Raxe:
                 scan_duration_ms=result.duration_ms,
                 entry_point=entry_point,  # type: ignore[arg-type]
                 prompt=prompt,
+                prompt_hash=fingerprint.sha256,
+                prompt_length=fingerprint.char_length,
                 wrapper_type=wrapper_type,  # type: ignore[arg-type]
                 action_taken="block" if result.should_block else "allow",
                 l2_enabled=result.metadata.get("l2_enabled", True),
@@ -588,6 +597,7 @@ class Raxe:
 
         # Initialize suppression manager
         instance.suppression_manager = create_suppression_manager(auto_load=True)
+        instance._result_cache = ResultCache()
 
         # Preload pipeline
         logger.info("Initializing RAXE client from config file")
@@ -984,7 +994,7 @@ class Raxe:
         confidence_threshold: float = 0.5,
         explain: bool = False,
         dry_run: bool = False,
-        use_async: bool = True,
+        use_async: bool | None = None,
         suppress: list[str | dict[str, Any]] | None = None,
         integration_type: str | None = None,
         entry_point: str | None = None,
@@ -994,6 +1004,8 @@ class Raxe:
         policy_id: str | None = None,
         # MSSP/Partner ecosystem parameters (NEW in v3.0)
         mssp_id: str | None = None,
+        use_cache: bool = True,
+        priority: ScanPriority | str | None = None,
     ) -> ScanPipelineResult:
         """Scan text for security threats with layer control.
 
@@ -1030,7 +1042,10 @@ class Raxe:
             confidence_threshold: Minimum confidence for reporting (0.0-1.0, default: 0.5)
             explain: Include explanations in detection results (default: False)
             dry_run: Test scan without saving to database (default: False)
-            use_async: Use async pipeline for parallel L1+L2 execution (5x speedup, default: True)
+            use_async: Deprecated and ignored (passing it warns); scans always
+                run the full pipeline, since the async pipeline has no
+                suppression, confidence filter or policy stages. Use
+                scan_async() or AsyncRaxe from async code.
             suppress: Optional list of inline suppressions. Can be:
                 - String patterns: ["pi-001", "jb-*"]
                 - Dicts with action: [{"pattern": "jb-*", "action": "FLAG", "reason": "..."}]
@@ -1048,6 +1063,19 @@ class Raxe:
                 Used with tenant_id for finer-grained policy control.
             policy_id: Optional explicit policy ID to use, overriding tenant/app defaults.
                 When provided, this policy is used directly (highest priority).
+            mssp_id: Optional MSSP ID for partner telemetry attribution.
+            use_cache: Reuse the detections of an identical earlier scan
+                (same text and layers, unchanged rules, model and plugins).
+                Only L1, detector plugins and L2 are skipped: thresholds,
+                suppressions, policy, plugin hooks and actions, telemetry
+                and history still apply to cache hits, which are marked
+                with ``metadata["cache_hit"]``. Scans with ``context`` are
+                never cached.
+            priority: L2 lane - "interactive", "background" or "batch".
+                L2 then runs on the pipeline's bounded L2 workers, and a
+                scan whose lane is full is degraded to L1-only
+                (``metadata["l2_degraded"]``). None (default) runs L2 on the
+                calling thread.
 
         Returns:
             ScanPipelineResult with:
@@ -1093,6 +1121,14 @@ class Raxe:
                 {"pattern": "jb-*", "action": "FLAG", "reason": "Under review"}
             ])
         """
+        if use_async is not None:
+            warnings.warn(
+                "Raxe.scan(use_async=...) is deprecated and ignored; "
+                "use scan_async() or AsyncRaxe from async code",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         # Handle empty text - return clean result (no threats)
         if not text or not text.strip():
             from datetime import datetime, timezone
@@ -1132,90 +1168,24 @@ class Raxe:
         if l2_enabled is None:
             l2_enabled = self.config.enable_l2
 
-        # Use async pipeline for 5x speedup (parallel L1+L2)
-        # Falls back to sync pipeline if async fails or is disabled
-        if use_async:
-            try:
-                import asyncio
-
-                async_pipeline = self._get_async_pipeline()
-
-                # Run async pipeline in sync context
-                try:
-                    _ = asyncio.get_running_loop()
-                    # Already in async context - this shouldn't happen in sync SDK
-                    logger.warning("Already in async context, falling back to sync pipeline")
-                    use_sync_fallback = True
-                except RuntimeError:
-                    # Not in async context - create new event loop (correct path)
-                    use_sync_fallback = False
-
-                if not use_sync_fallback:
-                    async_result = asyncio.run(
-                        async_pipeline.scan(
-                            text,
-                            customer_id=customer_id or self.config.customer_id,
-                            context=context,
-                            l1_enabled=l1_enabled,
-                            l2_enabled=l2_enabled,
-                            mode=mode,
-                        )
-                    )
-
-                    # Convert AsyncScanPipelineResult to ScanPipelineResult
-                    # They have the same structure, just different types
-                    result = ScanPipelineResult(
-                        scan_result=async_result.scan_result,
-                        policy_decision=async_result.policy_decision,
-                        should_block=async_result.should_block,
-                        duration_ms=async_result.duration_ms,
-                        text_hash=async_result.text_hash,
-                        metadata=async_result.metadata,
-                    )
-                    logger.debug(
-                        "async_scan_complete",
-                        duration_ms=result.duration_ms,
-                        parallel_speedup=async_result.metrics.parallel_speedup
-                        if async_result.metrics
-                        else 1.0,
-                    )
-                else:
-                    # Fallback to sync pipeline
-                    result = self.pipeline.scan(
-                        text,
-                        customer_id=customer_id or self.config.customer_id,
-                        context=context,
-                        l1_enabled=l1_enabled,
-                        l2_enabled=l2_enabled,
-                        mode=mode,
-                        confidence_threshold=confidence_threshold,
-                        explain=explain,
-                    )
-            except Exception as e:
-                # Async pipeline failed - fall back to sync
-                logger.warning(f"Async pipeline failed ({e}), falling back to sync pipeline")
-                result = self.pipeline.scan(
-                    text,
-                    customer_id=customer_id or self.config.customer_id,
-                    context=context,
-                    l1_enabled=l1_enabled,
-                    l2_enabled=l2_enabled,
-                    mode=mode,
-                    confidence_threshold=confidence_threshold,
-                    explain=explain,
-                )
-        else:
-            # Use sync pipeline (original behavior)
-            result = self.pipeline.scan(
-                text,
-                customer_id=customer_id or self.config.customer_id,
-                context=context,
-                l1_enabled=l1_enabled,
-                l2_enabled=l2_enabled,
-                mode=mode,
-                confidence_threshold=confidence_threshold,
-                explain=explain,
-            )
+        # Fingerprint the text once; pipeline, telemetry and history share it
+        fingerprint = ContentFingerprint(text)
+
+        # Identical prompts reuse the cached detection stage; thresholds,
+        # suppressions, policy, plugin hooks and tracking still run
+        result = self._run_pipeline(
+            text,
+            fingerprint,
+            customer_id=customer_id,
+            context=context,
+            mode=mode,
+            l1_enabled=l1_enabled,
+            l2_enabled=l2_enabled,
+            confidence_threshold=confidence_threshold,
+            explain=explain,
+            use_cache=use_cache,
+            priority=priority,
+        )
 
         # Load tenant-scoped suppressions if tenant_id is specified
         # These are merged with any inline suppressions (inline takes precedence)
@@ -1223,11 +1193,7 @@ class Raxe:
         if tenant_id:
             import yaml
 
-            from raxe.infrastructure.tenants import get_tenants_base_path
-
-            # Get tenant suppression path (respects RAXE_TENANTS_DIR env var)
-            tenants_base = get_tenants_base_path()
-            tenant_suppression_path = tenants_base / tenant_id / "suppressions.yaml"
+            tenant_suppression_path = self._tenant_suppression_path(tenant_id)
 
             if tenant_suppression_path.exists():
                 try:
@@ -1274,6 +1240,7 @@ class Raxe:
         # 3. Structured logging (no PII)
         # Skipped if dry_run=True
         if not dry_run:
+            persistence_start = time.perf_counter()
             try:
                 # Generate event_id FIRST for portal-CLI correlation
                 # This ID links local scan history to telemetry events
@@ -1324,6 +1291,7 @@ class Raxe:
                     mssp_customer_name=mssp_customer_name,
                     mssp_data_mode=mssp_data_mode,
                     mssp_data_fields=mssp_data_fields,
+                    fingerprint=fingerprint,
                 )
 
                 # Track usage (creates install.json on first scan)
@@ -1371,8 +1339,10 @@ class Raxe:
                     if result.scan_result and result.scan_result.l1_result
                     else None,
                     l2_duration_ms=l2_duration_ms,
+                    total_duration_ms=result.duration_ms,
                     version="0.0.1",
                     event_id=event_id,
+                    prompt_hash=fingerprint.sha256,
                 )
 
                 # Attach event_id to result metadata for external access
@@ -1422,10 +1392,18 @@ class Raxe:
                             points=achievement.points,
                         )
 
+                # Persist sampled per-rule costs (only after profiled scans)
+                rule_costs = self.pipeline.rule_profiler.drain_pending()
+                if rule_costs:
+                    self.scan_history.record_rule_costs(rule_costs)
+
             except Exception as e:
                 # Don't fail the scan if tracking/history fails
                 # Just log the error
                 logger.warning("scan_tracking_failed", error=str(e), error_type=type(e).__name__)
+            self.pipeline.stage_latency.record(
+                "persistence", (time.perf_counter() - persistence_start) * 1000
+            )
         else:
             # Log that dry_run scan skipped tracking
             # Include initialization timing (separate from scan timing)
@@ -1455,6 +1433,237 @@ class Raxe:
 
         return result
 
+    def _run_pipeline(
+        self,
+        text: str,
+        fingerprint: ContentFingerprint,
+        *,
+        customer_id: str | None,
+        context: dict[str, object] | None,
+        mode: str,
+        l1_enabled: bool,
+        l2_enabled: bool,
+        confidence_threshold: float,
+        explain: bool,
+        use_cache: bool = True,
+        priority: ScanPriority | str | None = None,
+    ) -> ScanPipelineResult:
+        """Run the scan pipeline for one scan (no tracking).
+
+        Returns:
+            Pipeline result before inline suppressions and policy attribution
+        """
+        return self.pipeline.scan(
+            text,
+            customer_id=customer_id or self.config.customer_id,
+            context=context,
+            l1_enabled=l1_enabled,
+            l2_enabled=l2_enabled,
+            mode=mode,
+            confidence_threshold=confidence_threshold,
+            explain=explain,
+            fingerprint=fingerprint,
+            detection_cache=self._result_cache if use_cache else None,
+            priority=priority,
+        )
+
+    async def scan_async(
+        self,
+        text: str,
+        *,
+        priority: ScanPriority | str | None = ScanPriority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> ScanPipelineResult:
+        """Scan text without blocking the event loop.
+
+        Runs ``scan()`` on the client's dedicated, bounded executor instead
+        of the loop's default thread pool, so async servers do not starve
+        other ``run_in_executor`` users and concurrent scans are capped at
+        ``ASYNC_SCAN_WORKERS``. The result cache is shared with ``scan()``.
+        L2 runs in the given priority lane of the pipeline's L2 workers.
+
+        Args:
+            text: Text to scan
+            priority: L2 lane (default: interactive; None runs L2 on the
+                scan thread, as ``scan()`` does)
+            **kwargs: Any other ``scan()`` keyword argument
+
+        Returns:
+            ScanPipelineResult (same as ``scan()``)
+
+        Raises:
+            SecurityException: If block_on_threat=True and threat detected
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_executor(),
+            functools.partial(self.scan, text, priority=priority, **kwargs),
+        )
+
+    def scan_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Scan several texts concurrently.
+
+        The scans run on the same bounded executor as ``scan_async()``, so
+        at most ``ASYNC_SCAN_WORKERS`` run at once and L2 inference (which
+        releases the GIL) overlaps across texts. Called from one of that
+        executor's own threads, the texts are scanned one after another
+        instead, so a scan can never wait on a queued scan.
+
+        Args:
+            texts: Texts to scan
+            return_exceptions: Return a failed scan's exception in its
+                place instead of raising it (default: False)
+            **kwargs: Any ``scan()`` keyword argument, applied to every text
+
+        Returns:
+            One ScanPipelineResult (or exception) per text, in the same order
+
+        Raises:
+            Exception: The first failed scan's exception, in input order,
+                unless return_exceptions=True (the other scans still run)
+        """
+        if len(texts) < 2 or threading.current_thread().name.startswith("raxe-async-scan"):
+            results: list[Any] = []
+            for text in texts:
+                try:
+                    results.append(self.scan(text, **kwargs))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+        executor = self._get_async_executor()
+        # Each scan runs in a copy of the caller's context, so suppressed()
+        # scopes apply on the worker threads too
+        futures = [
+            executor.submit(contextvars.copy_context().run, self.scan, text, **kwargs)
+            for text in texts
+        ]
+        concurrent.futures.wait(futures)
+        outcomes: list[Any] = []
+        for future in futures:
+            error = future.exception()
+            if error is not None and not return_exceptions:
+                raise error
+            outcomes.append(future.result() if error is None else error)
+        return outcomes
+
+    def _get_async_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get or create the executor used by scan_async()."""
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=ASYNC_SCAN_WORKERS,
+                    thread_name_prefix="raxe-async-scan",
+                )
+            return self._async_executor
+
+    def verdict_token(self) -> Hashable:
+        """Token identifying the current verdict configuration.
+
+        Changes whenever the ruleset is reloaded, the L2 model is swapped,
+        the loaded plugins change or the suppressions that apply to the
+        calling thread change (config file or ``suppressed()`` scopes).
+        Anything that caches final scan verdicts (the agent conversation
+        memo) stores this token and drops entries computed under a
+        different one.
+
+        Returns:
+            Hashable token of (detection token, suppression generation,
+            scoped suppressions)
+        """
+        return (
+            self.pipeline.detection_token(),
+            getattr(self.suppression_manager, "generation", None),
+            tuple(get_scoped_suppressions()),
+        )
+
+    def detection_fingerprint(
+        self,
+        *,
+        l2_enabled: bool | None = None,
+        tenant_id: str | None = None,
+        app_id: str | None = None,
+        policy_id: str | None = None,
+    ) -> str:
+        """Stable identity of everything that decides a scan verdict.
+
+        Unlike ``verdict_token()``, the value does not depend on the process:
+        it hashes the rule content, the L2 model name and version, the
+        detection settings, the config-file suppressions, the tenant's
+        ``suppressions.yaml`` and the policy scope. Persistent verdict
+        stores use it as part of their key. Inline and scoped
+        (``suppressed()``) suppressions are not covered; verdicts computed
+        under them must not be persisted.
+
+        Args:
+            l2_enabled: L2 setting the verdicts are computed with
+                (None = client config)
+            tenant_id: Tenant scope of the scans
+            app_id: App scope of the scans
+            policy_id: Explicit policy of the scans
+
+        Returns:
+            Hex SHA-256 fingerprint
+        """
+        if l2_enabled is None:
+            l2_enabled = self.config.enable_l2
+
+        registry = getattr(self.pipeline, "pack_registry", None)
+        snapshot = getattr(registry, "snapshot", None)
+        model = None
+        detector = getattr(self.pipeline, "l2_detector", None)
+        if l2_enabled and detector is not None:
+            try:
+                info = detector.model_info
+                model = (info.get("name"), info.get("version"))
+            except Exception:
+                model = None
+
+        suppressions = sorted(repr(s) for s in (self.suppression_manager.get_suppressions() or ()))
+        tenant_suppressions = None
+        if tenant_id:
+            try:
+                tenant_suppressions = hashlib.sha256(
+                    self._tenant_suppression_path(tenant_id).read_bytes()
+                ).hexdigest()
+            except FileNotFoundError:
+                tenant_suppressions = None
+        parts = (
+            getattr(snapshot, "fingerprint", None),
+            l2_enabled,
+            model,
+            self.config.l2_confidence_threshold,
+            self.config.fail_fast_on_critical,
+            self.config.min_confidence_for_skip,
+            repr(self.config.l2_scoring),
+            suppressions,
+            tenant_id,
+            tenant_suppressions,
+            app_id,
+            policy_id,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    @staticmethod
+    def _tenant_suppression_path(tenant_id: str) -> Path:
+        """Path of a tenant's suppressions.yaml (respects RAXE_TENANTS_DIR)."""
+        from raxe.infrastructure.tenants import get_tenants_base_path
+
+        return get_tenants_base_path() / tenant_id / "suppressions.yaml"
+
+    def clear_cache(self) -> None:
+        """Clear all cached scan results."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
     def scan_fast(self, text: str, **kwargs) -> ScanPipelineResult:
         """Fast scan using L1 only (target <3ms).
 
@@ -1752,6 +1961,11 @@ class Raxe:
                 - telemetry_enabled: Whether telemetry is enabled
                 - has_api_key: Whether API key is configured
                 - l2_enabled: Whether L2 detection is enabled
+                - stage_latency: Per-stage latency distributions (l1, l2,
+                  plugins, policy, persistence, total) with count, mean,
+                  p50/p95/p99 and max in milliseconds
+                - result_cache: Result cache hits, misses, hit rate and
+                  size (None if the cache is disabled)
 
         Example:
             raxe = Raxe()
@@ -1764,6 +1978,8 @@ class Raxe:
             "telemetry_enabled": self.get_telemetry_enabled(),
             "has_api_key": self.has_api_key(),
             "l2_enabled": self.config.enable_l2,
+            "stage_latency": self.pipeline.stage_latency.summary(),
+            "result_cache": self._result_cache.stats() if self._result_cache else None,
         }
 
         # Add preload stats if available
@@ -1861,10 +2077,12 @@ class Raxe:
                 - packs_loaded: Number of packs loaded
                 - patterns_compiled: Number of patterns compiled
                 - preload_time_ms: Initialization time
+                - stage_latency: Per-stage scan latency distributions
 
         Example:
             raxe = Raxe()
             print(f"Loaded {raxe.stats['rules_loaded']} rules")
+            print(raxe.stats["stage_latency"]["l1"]["p95_ms"])
         """
         return {
             "rules_loaded": self.preload_stats.rules_loaded,
@@ -1875,6 +2093,7 @@ class Raxe:
             "telemetry_initialized": self.preload_stats.telemetry_initialized,
             "l2_init_time_ms": self.preload_stats.l2_init_time_ms,
             "l2_model_type": self.preload_stats.l2_model_type,
+            "stage_latency": self.pipeline.stage_latency.summary(),
         }
 
     def close(self) -> None:
@@ -1889,6 +2108,13 @@ class Raxe:
                 raxe.scan("test")
         """
         self._flush_telemetry()
+        if self._scan_history is not None:
+            self._scan_history.close()
+        with self._async_executor_lock:
+            if self._async_executor is not None:
+                self._async_executor.shutdown(wait=False)
+                self._async_executor = None
+        self.pipeline.close()
 
     def _flush_telemetry(self) -> None:
         """Internal method to flush telemetry (thread-safe)."""
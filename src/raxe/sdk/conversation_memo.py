@@ -0,0 +1,200 @@
+"""Per-conversation verdict memo for agent integrations.
+
+Chat frameworks hand the scanner the whole message history on every turn
+(LangChain ``on_chat_model_start``), or deliver the same message to every
+agent in a group chat. Scanning each message again makes an n-turn
+conversation cost O(n^2) scans. The memo remembers the verdict for every
+message already scanned in a conversation so each turn only scans what is
+new.
+
+Entries are keyed by ``(conversation_id, message key)`` where the message
+key combines the scan routing (scan or message type) with the process-local
+content key of the text (``ContentFingerprint.cache_key``). Like
+``ResultCache``, every lookup carries a *validity token*
+(``Raxe.verdict_token()``: ruleset generation, L2 model version, loaded
+plugins and active suppressions); a new token drops all memoized verdicts.
+
+Memory is bounded twice: conversations are evicted least-recently-used
+beyond ``max_conversations``, and each conversation keeps at most
+``max_messages`` verdicts. Verdicts also expire after a TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    expires_at: float | None
+
+
+class ConversationMemo:
+    """Two-level LRU memo (conversation -> message -> verdict) with TTL.
+
+    All operations take one lock and are O(1) apart from eviction.
+
+    Example usage:
+        memo = ConversationMemo(max_conversations=1024, ttl=3600.0)
+        key = ("prompt", fingerprint.cache_key, fingerprint.char_length)
+
+        verdict = memo.get("thread-42", key, token=raxe.verdict_token())
+        if verdict is None:
+            verdict = scanner.scan_prompt(text)
+            memo.set("thread-42", key, verdict, token=raxe.verdict_token())
+    """
+
+    def __init__(
+        self,
+        max_conversations: int = 1024,
+        max_messages: int = 1024,
+        ttl: float | None = 3600.0,
+    ):
+        """Initialize conversation memo.
+
+        Args:
+            max_conversations: Maximum conversations tracked at once
+            max_messages: Maximum memoized verdicts per conversation
+            ttl: Time-to-live in seconds (None for no expiration)
+
+        Raises:
+            ValueError: If a limit or ttl is not positive
+        """
+        if max_conversations < 1:
+            raise ValueError(f"max_conversations must be >= 1, got {max_conversations}")
+        if max_messages < 1:
+            raise ValueError(f"max_messages must be >= 1, got {max_messages}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be > 0 or None, got {ttl}")
+
+        self._max_conversations = max_conversations
+        self._max_messages = max_messages
+        self._ttl = ttl
+        self._conversations: OrderedDict[str, OrderedDict[Hashable, _Entry]] = OrderedDict()
+        self._token: Hashable = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, conversation_id: str, key: Hashable, token: Hashable) -> Any | None:
+        """Get a memoized verdict.
+
+        Args:
+            conversation_id: Conversation the message belongs to
+            key: Message key (routing plus content key)
+            token: Current validity token; a different token than the one
+                the verdicts were stored under clears the memo
+
+        Returns:
+            Memoized verdict, or None on a miss
+        """
+        with self._lock:
+            self._check_token(token)
+            messages = self._conversations.get(conversation_id)
+            entry = messages.get(key) if messages is not None else None
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                del messages[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._conversations.move_to_end(conversation_id)
+            messages.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(self, conversation_id: str, key: Hashable, value: Any, token: Hashable) -> None:
+        """Memoize a verdict.
+
+        Args:
+            conversation_id: Conversation the message belongs to
+            key: Message key (routing plus content key)
+            value: Verdict to memoize
+            token: Validity token the verdict was computed under
+        """
+        expires_at = time.monotonic() + self._ttl if self._ttl else None
+        with self._lock:
+            self._check_token(token)
+            messages = self._conversations.get(conversation_id)
+            if messages is None:
+                messages = OrderedDict()
+                self._conversations[conversation_id] = messages
+                while len(self._conversations) > self._max_conversations:
+                    _, dropped = self._conversations.popitem(last=False)
+                    self._evictions += len(dropped)
+            else:
+                self._conversations.move_to_end(conversation_id)
+
+            messages[key] = _Entry(value, expires_at)
+            messages.move_to_end(key)
+            while len(messages) > self._max_messages:
+                messages.popitem(last=False)
+                self._evictions += 1
+
+    def forget(self, conversation_id: str) -> None:
+        """Drop all verdicts memoized for one conversation.
+
+        Args:
+            conversation_id: Conversation to forget
+        """
+        with self._lock:
+            self._conversations.pop(conversation_id, None)
+
+    def clear(self) -> None:
+        """Drop all memoized verdicts."""
+        with self._lock:
+            self._conversations.clear()
+
+    def __len__(self) -> int:
+        """Number of tracked conversations."""
+        return len(self._conversations)
+
+    def stats(self) -> dict[str, Any]:
+        """Get memo statistics.
+
+        Returns:
+            Dictionary with memo metrics:
+                - hits: Messages answered from the memo
+                - misses: Messages that had to be scanned
+                - hit_rate: Memo hit rate (0.0 to 1.0)
+                - evictions: Verdicts evicted to stay within the limits
+                - expirations: Verdicts dropped after their TTL
+                - invalidations: Full clears caused by a new ruleset or model
+                - conversations: Current number of conversations
+                - messages: Current number of memoized verdicts
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "conversations": len(self._conversations),
+                "messages": sum(len(m) for m in self._conversations.values()),
+            }
+
+    def _check_token(self, token: Hashable) -> None:
+        """Clear the memo if the validity token changed (lock held)."""
+        if token != self._token:
+            if self._conversations:
+                self._invalidations += 1
+            self._conversations.clear()
+            self._token = token
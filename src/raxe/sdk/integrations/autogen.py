@@ -61,6 +61,7 @@ Usage (v0.4.x+ - wrapper-based):
 from __future__ import annotations
 
 import logging
+import uuid
 from typing import TYPE_CHECKING, Any
 
 from raxe.sdk.agent_scanner import (
@@ -256,6 +257,10 @@ class RaxeConversationGuard:
         self._scanner = create_agent_scanner(raxe, config, integration_type="autogen")
         self._registered_agents: set[str] = set()
 
+        # Agents see the same messages repeatedly (every receiver in a group
+        # chat, every reply); the verdict memo scans each message once
+        self._conversation_id = f"autogen:{uuid.uuid4()}"
+
         logger.info(
             "RaxeConversationGuard initialized",
             extra={
@@ -373,6 +378,15 @@ class RaxeConversationGuard:
                 extra={"agent": agent_name},
             )
 
+    def reset_conversation(self) -> None:
+        """Start a new conversation.
+
+        Drops the memoized verdicts of the current conversation. Call
+        between independent chats that reuse the same guard.
+        """
+        self._scanner.forget_conversation(self._conversation_id)
+        self._conversation_id = f"autogen:{uuid.uuid4()}"
+
     def _is_conversable_agent(self, agent: Any) -> bool:
         """Check if object is an AutoGen ConversableAgent (v0.2.x).
 
@@ -514,6 +528,7 @@ class RaxeConversationGuard:
             message_type=message_type,
             sender_name=sender_name,
             receiver_name=recipient_name,
+            conversation_id=self._conversation_id,
         )
 
         # Scan the message
@@ -567,6 +582,7 @@ class RaxeConversationGuard:
             message_type=message_type,
             sender_name=sender_name,
             receiver_name=receiver_name,
+            conversation_id=self._conversation_id,
             message_index=len(messages) - 1,
         )
 
@@ -833,6 +849,7 @@ class _RaxeAgentWrapper:
             message_type=message_type,
             sender_name=source,
             receiver_name=self._agent_name,
+            conversation_id=self._guard._conversation_id,
         )
 
         # Perform scan
@@ -38,6 +38,7 @@ from __future__ import annotations
 import functools
 import logging
 import threading
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -370,6 +371,10 @@ class RaxeCrewGuard:
         )
         self._stats = CrewScanStats()
 
+        # Step, task and kickoff outputs repeat the same text within a run;
+        # the verdict memo scans each distinct text once per run
+        self._conversation_id = f"crewai:{uuid.uuid4()}"
+
         logger.debug(
             "RaxeCrewGuard initialized",
             extra={
@@ -402,6 +407,11 @@ class RaxeCrewGuard:
         """Reset scan statistics (call before new crew run)."""
         self._stats = CrewScanStats()
 
+    def _new_conversation(self) -> None:
+        """Forget verdicts memoized for the previous crew run."""
+        self._scanner.forget_conversation(self._conversation_id)
+        self._conversation_id = f"crewai:{uuid.uuid4()}"
+
     def _raise_security_exception(self, result: AgentScanResult) -> None:
         """Raise SecurityException from an AgentScanResult.
 
@@ -464,6 +474,7 @@ class RaxeCrewGuard:
             # Create scan context
             context = ScanContext(
                 message_type=MessageType.AGENT_TO_AGENT,
+                conversation_id=self._conversation_id,
                 sender_name=agent_name,
                 metadata={
                     "source": "step_callback",
@@ -529,6 +540,7 @@ class RaxeCrewGuard:
             # Create scan context
             context = ScanContext(
                 message_type=MessageType.AGENT_RESPONSE,
+                conversation_id=self._conversation_id,
                 sender_name=agent_name,
                 metadata={
                     "source": "task_callback",
@@ -588,8 +600,9 @@ class RaxeCrewGuard:
         if not self._config.scan_crew_inputs:
             return inputs
 
-        # Reset stats for new run
+        # Reset stats and memoized verdicts for new run
         self.reset_stats()
+        self._new_conversation()
 
         try:
             # Scan all string inputs
@@ -597,6 +610,7 @@ class RaxeCrewGuard:
                 if isinstance(value, str) and value.strip():
                     context = ScanContext(
                         message_type=MessageType.HUMAN_INPUT,
+                        conversation_id=self._conversation_id,
                         metadata={
                             "source": "before_kickoff",
                             "input_key": key,
@@ -654,6 +668,7 @@ class RaxeCrewGuard:
             if text:
                 context = ScanContext(
                     message_type=MessageType.AGENT_RESPONSE,
+                    conversation_id=self._conversation_id,
                     metadata={"source": "after_kickoff"},
                 )
 
@@ -829,6 +844,7 @@ class RaxeCrewGuard:
 
             context = ScanContext(
                 message_type=message_type,
+                conversation_id=self._conversation_id,
                 metadata={
                     "source": f"tool_{io_type}",
                     "tool_name": tool_name,
@@ -1127,6 +1143,7 @@ class RaxeCrewGuard:
 
             context = ScanContext(
                 message_type=MessageType.AGENT_TO_AGENT,
+                conversation_id=self._conversation_id,
                 sender_name=agent_name,
                 metadata={
                     "source": "step_callback_async",
@@ -1179,6 +1196,7 @@ class RaxeCrewGuard:
 
             context = ScanContext(
                 message_type=MessageType.AGENT_RESPONSE,
+                conversation_id=self._conversation_id,
                 sender_name=agent_name,
                 metadata={
                     "source": "task_callback_async",
@@ -1229,12 +1247,14 @@ class RaxeCrewGuard:
             return inputs
 
         self.reset_stats()
+        self._new_conversation()
 
         try:
             for key, value in inputs.items():
                 if isinstance(value, str) and value.strip():
                     context = ScanContext(
                         message_type=MessageType.HUMAN_INPUT,
+                        conversation_id=self._conversation_id,
                         metadata={
                             "source": "before_kickoff_async",
                             "input_key": key,
@@ -1288,6 +1308,7 @@ class RaxeCrewGuard:
             if text:
                 context = ScanContext(
                     message_type=MessageType.AGENT_RESPONSE,
+                    conversation_id=self._conversation_id,
                     metadata={"source": "after_kickoff_async"},
                 )
 
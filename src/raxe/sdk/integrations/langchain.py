@@ -217,6 +217,10 @@ class _RaxeCallbackHandlerMixin:
         # Trace ID for correlation (set on each chain/agent run)
         self.trace_id: str | None = None
 
+        # Conversation used for the verdict memo when LangChain metadata
+        # carries no thread/session ID
+        self._default_conversation_id = f"langchain:{uuid.uuid4()}"
+
         # Cache version info
         if _RaxeCallbackHandlerMixin._langchain_version is None:
             _RaxeCallbackHandlerMixin._langchain_version = _detect_langchain_version()
@@ -316,13 +320,18 @@ class _RaxeCallbackHandlerMixin:
     ) -> Any:
         """Scan chat messages before sending to model.
 
-        Handles ChatModel message format (list of messages).
+        Handles ChatModel message format (list of messages). Chat models
+        receive the full history on every turn; messages already scanned
+        in the same conversation reuse their memoized verdict.
         """
+        conversation_id = self._conversation_id(metadata)
         for message_batch in messages:
             for message in message_batch:
                 text = self._extract_message_text(message)
                 if text:
-                    result = self._scanner.scan(text, scan_type=ScanType.PROMPT)
+                    result = self._scanner.scan(
+                        text, scan_type=ScanType.PROMPT, conversation_id=conversation_id
+                    )
 
                     if result.has_threats:
                         self._handle_threat(result, "chat_message", text[:100])
@@ -779,11 +788,24 @@ class _RaxeCallbackHandlerMixin:
         """
         return extract_text_from_message(message)
 
+    def _conversation_id(self, metadata: dict[str, Any] | None) -> str:
+        """Conversation ID for the verdict memo.
+
+        Uses the thread/session ID LangGraph and LangServe put in run
+        metadata, falling back to one conversation per handler.
+        """
+        for key in ("thread_id", "conversation_id", "session_id"):
+            value = (metadata or {}).get(key)
+            if value:
+                return f"langchain:{value}"
+        return self._default_conversation_id
+
     # ========================================================================
     # Async Callback Methods
     # ========================================================================
-    # LangChain supports async callbacks. These methods use the scanner's
-    # async methods for non-blocking operation in async contexts.
+    # LangChain supports async callbacks. These await the scanner's native
+    # async methods: scans run on the Raxe client's bounded scan executor
+    # (not the loop's default pool) and prompts of one call run concurrently.
 
     async def aon_llm_start(
         self,
@@ -797,13 +819,9 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_llm_start - scan prompts before LLM."""
-        import asyncio
-
-        for prompt in prompts:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, lambda p=prompt: self._scanner.scan(p, scan_type=ScanType.PROMPT)
-            )
+        results = await self._scanner.scan_batch_async(prompts, scan_type=ScanType.PROMPT)
 
+        for prompt, result in zip(prompts, results, strict=True):
             if result.has_threats:
                 self._handle_threat(result, "prompt", prompt[:100])
 
@@ -819,15 +837,11 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_llm_end - scan LLM response."""
-        import asyncio
-
         text = self._extract_llm_response_text(response)
         if not text:
             return
 
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._scanner.scan(text, scan_type=ScanType.RESPONSE)
-        )
+        result = await self._scanner.scan_async(text, scan_type=ScanType.RESPONSE)
 
         if result.has_threats:
             self._handle_threat(result, "response", text[:100])
@@ -847,21 +861,24 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_chat_model_start - scan chat messages."""
-        import asyncio
-
-        for message_batch in messages:
-            for message in message_batch:
-                text = self._extract_message_text(message)
-                if text:
-                    result = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda t=text: self._scanner.scan(t, scan_type=ScanType.PROMPT)
-                    )
+        texts = [
+            text
+            for message_batch in messages
+            for text in map(self._extract_message_text, message_batch)
+            if text
+        ]
+        results = await self._scanner.scan_batch_async(
+            texts,
+            scan_type=ScanType.PROMPT,
+            conversation_id=self._conversation_id(metadata),
+        )
 
-                    if result.has_threats:
-                        self._handle_threat(result, "chat_message", text[:100])
+        for text, result in zip(texts, results, strict=True):
+            if result.has_threats:
+                self._handle_threat(result, "chat_message", text[:100])
 
-                        if self.block_on_prompt_threats:
-                            raise SecurityException(result.pipeline_result)
+                if self.block_on_prompt_threats:
+                    raise SecurityException(result.pipeline_result)
 
     async def aon_tool_start(
         self,
@@ -876,17 +893,12 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_tool_start - scan tool input."""
-        import asyncio
-
         if not self.scan_tools:
             return
 
         tool_name = serialized.get("name", "unknown")
 
-        result = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: self._scanner.scan_tool_call(tool_name=tool_name, tool_args=input_str),
-        )
+        result = await self._scanner.scan_tool_call_async(tool_name, input_str)
 
         if result.has_threats:
             self._handle_threat(result, f"tool:{tool_name}", input_str[:100])
@@ -903,8 +915,6 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_tool_end - scan tool output."""
-        import asyncio
-
         if not self.scan_tools:
             return
 
@@ -912,9 +922,7 @@ class _RaxeCallbackHandlerMixin:
         if not text:
             return
 
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._scanner.scan(text, scan_type=ScanType.TOOL_RESULT)
-        )
+        result = await self._scanner.scan_async(text, scan_type=ScanType.TOOL_RESULT)
 
         if result.has_threats:
             self._handle_threat(result, "tool_output", text[:100])
@@ -967,11 +975,7 @@ class _RaxeCallbackHandlerMixin:
         **kwargs: Any,
     ) -> Any:
         """Async version of on_retriever_start - scan retriever query."""
-        import asyncio
-
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: self._scanner.scan(query, scan_type=ScanType.PROMPT)
-        )
+        result = await self._scanner.scan_async(query, scan_type=ScanType.PROMPT)
 
         if result.has_threats:
             self._handle_threat(result, "retriever_query", query[:100])
@@ -65,6 +65,7 @@ except ImportError:
 
 from raxe.sdk.agent_scanner import (
     AgentScannerConfig,
+    ScanType,
     ThreatDetectedError,
     create_agent_scanner,
 )
@@ -207,30 +208,8 @@ class RaxeLiteLLMCallback(CustomLogger):
 
         try:
             # Extract and scan user messages
-            for message in messages:
-                if isinstance(message, dict):
-                    role = message.get("role", "")
-                    content = message.get("content", "")
-
-                    if role == "user" and content:
-                        text = self._extract_text(content)
-                        if text.strip():
-                            result = self._scanner.scan_prompt(text)
-
-                            if result.has_threats:
-                                self._stats["threats_detected"] += 1
-                                logger.warning(
-                                    "litellm_input_threat",
-                                    extra={
-                                        "model": model,
-                                        "severity": result.severity,
-                                        "rule_ids": result.rule_ids,
-                                    },
-                                )
-
-                                if result.should_block:
-                                    self._stats["threats_blocked"] += 1
-                                    raise ThreatDetectedError(result)
+            for text in self._user_texts(messages):
+                self._handle_input_result(model, self._scanner.scan_prompt(text))
 
         except ThreatDetectedError:
             raise
@@ -267,23 +246,8 @@ class RaxeLiteLLMCallback(CustomLogger):
             response_text = self._extract_response_text(response_obj)
 
             if response_text and response_text.strip():
-                model = kwargs.get("model", "unknown")
-
                 result = self._scanner.scan_response(response_text)
-
-                if result.has_threats:
-                    self._stats["threats_detected"] += 1
-                    logger.warning(
-                        "litellm_output_threat",
-                        extra={
-                            "model": model,
-                            "severity": result.severity,
-                            "rule_ids": result.rule_ids,
-                        },
-                    )
-
-                    # Note: For output scanning, we log but don't block
-                    # as the response has already been generated
+                self._handle_output_result(kwargs.get("model", "unknown"), result)
 
         except Exception as e:
             logger.error(
@@ -324,9 +288,29 @@ class RaxeLiteLLMCallback(CustomLogger):
         messages: list[dict[str, Any]],
         kwargs: dict[str, Any],
     ) -> None:
-        """Async version of log_pre_api_call."""
-        # Delegate to sync version (RAXE scanning is CPU-bound)
-        self.log_pre_api_call(model, messages, kwargs)
+        """Async version of log_pre_api_call.
+
+        User messages are scanned concurrently on the Raxe client's scan
+        executor, so the event loop is never blocked by scanning.
+        """
+        self._stats["total_calls"] += 1
+
+        if not self.config.scan_inputs:
+            return
+
+        try:
+            texts = self._user_texts(messages)
+            results = await self._scanner.scan_batch_async(texts, scan_type=ScanType.PROMPT)
+            for result in results:
+                self._handle_input_result(model, result)
+
+        except ThreatDetectedError:
+            raise
+        except Exception as e:
+            logger.error(
+                "litellm_pre_scan_error",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
 
     async def async_log_success_event(
         self,
@@ -336,7 +320,23 @@ class RaxeLiteLLMCallback(CustomLogger):
         end_time: datetime,
     ) -> None:
         """Async version of log_success_event."""
-        self.log_success_event(kwargs, response_obj, start_time, end_time)
+        self._stats["successful_calls"] += 1
+
+        if not self.config.scan_outputs:
+            return
+
+        try:
+            response_text = self._extract_response_text(response_obj)
+
+            if response_text and response_text.strip():
+                result = await self._scanner.scan_async(response_text, scan_type=ScanType.RESPONSE)
+                self._handle_output_result(kwargs.get("model", "unknown"), result)
+
+        except Exception as e:
+            logger.error(
+                "litellm_success_scan_error",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
 
     async def async_log_failure_event(
         self,
@@ -348,6 +348,73 @@ class RaxeLiteLLMCallback(CustomLogger):
         """Async version of log_failure_event."""
         self.log_failure_event(kwargs, response_obj, start_time, end_time)
 
+    def _user_texts(self, messages: list[dict[str, Any]]) -> list[str]:
+        """Extract the non-empty texts of user messages.
+
+        Args:
+            messages: Input messages
+
+        Returns:
+            User message texts, in order
+        """
+        texts = []
+        for message in messages:
+            if isinstance(message, dict):
+                role = message.get("role", "")
+                content = message.get("content", "")
+
+                if role == "user" and content:
+                    text = self._extract_text(content)
+                    if text.strip():
+                        texts.append(text)
+        return texts
+
+    def _handle_input_result(self, model: str, result: Any) -> None:
+        """Record and log an input scan result.
+
+        Args:
+            model: Model being called
+            result: AgentScanResult for one user message
+
+        Raises:
+            ThreatDetectedError: If the result should be blocked
+        """
+        if result.has_threats:
+            self._stats["threats_detected"] += 1
+            logger.warning(
+                "litellm_input_threat",
+                extra={
+                    "model": model,
+                    "severity": result.severity,
+                    "rule_ids": result.rule_ids,
+                },
+            )
+
+            if result.should_block:
+                self._stats["threats_blocked"] += 1
+                raise ThreatDetectedError(result)
+
+    def _handle_output_result(self, model: str, result: Any) -> None:
+        """Record and log a response scan result.
+
+        Args:
+            model: Model that produced the response
+            result: AgentScanResult for the response
+        """
+        if result.has_threats:
+            self._stats["threats_detected"] += 1
+            logger.warning(
+                "litellm_output_threat",
+                extra={
+                    "model": model,
+                    "severity": result.severity,
+                    "rule_ids": result.rule_ids,
+                },
+            )
+
+            # Note: For output scanning, we log but don't block
+            # as the response has already been generated
+
     def _extract_text(self, content: Any) -> str:
         """Extract text from message content.
 
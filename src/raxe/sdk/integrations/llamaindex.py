@@ -50,6 +50,7 @@ from typing import Any
 
 from raxe.sdk.agent_scanner import (
     AgentScannerConfig,
+    ScanType,
     ThreatDetectedError,
     create_agent_scanner,
 )
@@ -105,7 +106,7 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
     The handler intercepts events at key points in the LlamaIndex pipeline:
         1. QUERY events - Scan user queries before processing
         2. LLM events - Scan prompts before LLM calls
-        3. RETRIEVE events - Monitor retrieved context (future)
+        3. RETRIEVE events - Scan retrieved context (opt-in)
         4. SYNTHESIZE events - Scan synthesized responses
         5. Agent events - Scan agent actions and tool inputs
 
@@ -117,7 +118,7 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
         raxe: Raxe client instance for scanning
         block_on_query_threats: Block if query contains threats
         block_on_response_threats: Block if response contains threats
-        scan_retrieved_context: Scan retrieved RAG context (future)
+        scan_retrieved_context: Scan retrieved RAG context
         scan_agent_actions: Scan agent tool inputs
 
     Example:
@@ -146,6 +147,7 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
         scan_retrieved_context: bool = False,
         scan_agent_actions: bool = True,
         execution_mode: str = "sync",
+        verdict_store_path: str | None = None,
     ) -> None:
         """Initialize RAXE callback handler for LlamaIndex.
 
@@ -155,9 +157,13 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
                 NOTE: Default is False (log-only mode) per requirements
             block_on_response_threats: Block on response threats (default: False)
             scan_retrieved_context: Scan retrieved RAG context (default: False)
-                NOTE: Placeholder for future RAG context validation
+                Retrieved nodes are scanned as one batch and never block.
             scan_agent_actions: Scan agent tool inputs (default: True)
             execution_mode: Execution mode ("sync" or "background", default: "sync")
+            verdict_store_path: SQLite file persisting retrieved-chunk verdicts
+                so chunks retrieved again are not re-scanned (default: None,
+                no persistent store). Pre-warm it with
+                ``raxe batch corpus.txt --verdict-store PATH``.
 
         Example:
             # Log-only mode (default)
@@ -194,6 +200,8 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
             scan_responses=True,
             on_threat=on_threat,
             execution_mode=execution_mode,
+            rag_verdict_store_enabled=verdict_store_path is not None,
+            rag_verdict_store_path=verdict_store_path,
         )
         self._scanner = create_agent_scanner(raxe, config, integration_type="llamaindex")
 
@@ -296,10 +304,8 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
                     block=self.block_on_query_threats,
                 )
 
-        # Handle RETRIEVE events - future context validation
+        # Handle RETRIEVE events - scan the retrieval query
         elif event_name == "RETRIEVE" and self.scan_retrieved_context:
-            # Placeholder for future retrieved context validation
-            # This would scan the query before retrieval
             query_str = payload.get("query_str", "")
             if query_str:
                 self._scan_text(
@@ -372,18 +378,12 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
                         block=self.block_on_response_threats,
                     )
 
-        # Handle RETRIEVE events - future context validation
+        # Handle RETRIEVE events - scan retrieved nodes as one batch
         elif event_name == "RETRIEVE" and self.scan_retrieved_context:
-            # Placeholder for scanning retrieved nodes
-            # This would scan the actual retrieved context for threats
-            nodes = payload.get("nodes", [])
-            for node in nodes:
-                if hasattr(node, "text"):
-                    self._scan_text(
-                        text=node.text,
-                        context="retrieved_context",
-                        block=False,  # Never block on retrieved context
-                    )
+            texts = self._extract_node_texts(payload.get("nodes", []))
+            if texts:
+                # Never block on retrieved context
+                self._log_rag_threats(self._scanner.scan_rag_context(texts))
 
         # Handle FUNCTION_CALL events - scan tool outputs
         elif event_name == "FUNCTION_CALL" and self.scan_agent_actions:
@@ -458,6 +458,31 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
             logger.error(f"Blocked LlamaIndex {context} due to security threat")
             raise
 
+    def _extract_node_texts(self, nodes: list[Any]) -> list[str]:
+        """Extract texts from retrieved nodes (NodeWithScore or TextNode).
+
+        Args:
+            nodes: Retrieved nodes from a RETRIEVE event payload
+
+        Returns:
+            Node texts, in retrieval order
+        """
+        return [node.text for node in nodes if isinstance(getattr(node, "text", None), str)]
+
+    def _log_rag_threats(self, results: list[Any]) -> None:
+        """Log threats found in retrieved context.
+
+        Args:
+            results: AgentScanResults from scan_rag_context, one per node
+        """
+        for result in results:
+            if result.has_threats:
+                logger.warning(
+                    "Threat detected in LlamaIndex retrieved_context "
+                    f"(node {result.details.get('document_index')}): "
+                    f"{result.severity} severity"
+                )
+
     def _get_event_type_name(self, event_type: Any) -> str:
         """Extract event type name from CBEventType enum.
 
@@ -582,14 +607,11 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
 
         elif event_name == "LLM":
             messages = payload.get("messages", [])
-            for msg in messages:
-                content = self._extract_message_content(msg)
-                if content:
-                    await self._scan_text_async(
-                        text=content,
-                        context="llm_prompt",
-                        block=self.block_on_query_threats,
-                    )
+            await self._scan_texts_async(
+                [self._extract_message_content(msg) for msg in messages],
+                context="llm_prompt",
+                block=self.block_on_query_threats,
+            )
 
             template = payload.get("template", "")
             if template and "{" not in template:
@@ -684,14 +706,9 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
                     )
 
         elif event_name == "RETRIEVE" and self.scan_retrieved_context:
-            nodes = payload.get("nodes", [])
-            for node in nodes:
-                if hasattr(node, "text"):
-                    await self._scan_text_async(
-                        text=node.text,
-                        context="retrieved_context",
-                        block=False,
-                    )
+            texts = self._extract_node_texts(payload.get("nodes", []))
+            if texts:
+                self._log_rag_threats(await self._scanner.scan_rag_context_async(texts))
 
         elif event_name == "FUNCTION_CALL" and self.scan_agent_actions:
             output = payload.get("output", "")
@@ -720,30 +737,42 @@ class RaxeLlamaIndexCallback(_LlamaIndexBaseHandler):
         Raises:
             ThreatDetectedError: If threat detected and block=True
         """
-        import asyncio
+        await self._scan_texts_async([text], context=context, block=block)
 
-        if not text or not text.strip():
+    async def _scan_texts_async(
+        self,
+        texts: list[str],
+        context: str,
+        block: bool,
+    ) -> None:
+        """Scan several texts concurrently (natively async, no default executor).
+
+        Args:
+            texts: Texts to scan (empty ones are skipped)
+            context: Context description for logging
+            block: Whether to raise exception on threat
+
+        Raises:
+            ThreatDetectedError: If threat detected and block=True
+        """
+        texts = [text for text in texts if text and text.strip()]
+        if not texts:
             return
 
         try:
             # Determine scan type based on context
             is_response = "response" in context or "output" in context
-            if is_response:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._scanner.scan_response(text),
-                )
-            else:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self._scanner.scan_prompt(text),
-                )
+            results = await self._scanner.scan_batch_async(
+                texts,
+                scan_type=ScanType.RESPONSE if is_response else ScanType.PROMPT,
+            )
 
-            if result.has_threats:
-                logger.warning(
-                    f"Threat detected in LlamaIndex {context} (async): "
-                    f"{result.severity} severity (action={result.action_taken})"
-                )
+            for result in results:
+                if result.has_threats:
+                    logger.warning(
+                        f"Threat detected in LlamaIndex {context} (async): "
+                        f"{result.severity} severity (action={result.action_taken})"
+                    )
 
         except ThreatDetectedError:
             logger.error(f"Blocked LlamaIndex {context} due to security threat (async)")
@@ -978,7 +1007,7 @@ class RaxeQueryEngineCallback(RaxeLlamaIndexCallback):
             raxe_client=raxe_client,
             block_on_query_threats=block_on_threats,
             block_on_response_threats=block_on_threats,
-            scan_retrieved_context=False,  # Future feature
+            scan_retrieved_context=False,
             scan_agent_actions=False,  # Not needed for query engines
         )
 
@@ -0,0 +1,227 @@
+"""Thread-safe scan result cache for the synchronous Raxe client.
+
+Identical prompts are common: system prompts repeated on every turn,
+client retries, agent loops re-scanning the same tool output. The scan
+pipeline stores the output of its detection stage (L1, detector plugins
+and L2, see ``ScanPipeline.scan``) keyed by:
+
+- the process-local content key of the text (``ContentFingerprint.cache_key``)
+- the detection options (mode and layer flags)
+- a *validity token*: ruleset snapshot generation, L2 model version and
+  the loaded plugins (``ScanPipeline.detection_token``)
+
+A new validity token (rule reload, model swap, plugin change) drops every
+entry at once, so stale detections are never served. Entries also expire
+after a TTL. Memory is bounded by an estimate of each entry's size rather
+than by entry count, since a result with many detections is much larger
+than a clean one.
+
+Only detections are cached. Confidence thresholds, suppressions (and
+their audit log), policy, plugin hooks and actions, telemetry and scan
+history run on every call, hits included.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+# Rough per-object costs used by estimate_result_size()
+_RESULT_OVERHEAD_BYTES = 2048
+_DETECTION_OVERHEAD_BYTES = 768
+_MATCH_OVERHEAD_BYTES = 160
+_PREDICTION_OVERHEAD_BYTES = 1024
+
+
+def estimate_result_size(result: Any) -> int:
+    """Estimate the memory held by a cached scan or detection stage result.
+
+    Counts a fixed overhead per result, detection, match and L2
+    prediction plus the text each match keeps alive (its bounded window
+    of the scanned text, see ``Match.retained_chars``). Lazy match fields
+    are not materialized. The estimate is deliberately cheap; it only
+    needs to be proportional, not exact.
+
+    Args:
+        result: ``DetectionStage`` or ``ScanPipelineResult`` to size
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = _RESULT_OVERHEAD_BYTES
+    combined = getattr(result, "scan_result", result)
+    l1_result = getattr(combined, "l1_result", None)
+    for detection in getattr(l1_result, "detections", None) or ():
+        size += _DETECTION_OVERHEAD_BYTES
+        for match in getattr(detection, "matches", None) or ():
+            size += _MATCH_OVERHEAD_BYTES + match.retained_chars
+    l2_result = getattr(combined, "l2_result", None)
+    size += _PREDICTION_OVERHEAD_BYTES * len(getattr(l2_result, "predictions", None) or ())
+    return size
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    size_bytes: int
+    expires_at: float | None
+
+
+class ResultCache:
+    """Byte-bounded LRU cache with TTL and token-based invalidation.
+
+    All operations take one lock and are O(1) apart from eviction.
+
+    Example usage:
+        cache = ResultCache(max_bytes=32 * 1024 * 1024, ttl=300.0)
+        key = (fingerprint.cache_key, options)
+
+        result = cache.get(key, token=(generation, model_version))
+        if result is None:
+            result = pipeline.scan(text)
+            cache.set(key, result, token=(generation, model_version))
+
+        print(f"Hit rate: {cache.stats()['hit_rate']:.2%}")
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl: float | None = 300.0):
+        """Initialize result cache.
+
+        Args:
+            max_bytes: Maximum estimated size of all cached results
+            ttl: Time-to-live in seconds (None for no expiration)
+
+        Raises:
+            ValueError: If max_bytes or ttl is not positive
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be > 0 or None, got {ttl}")
+
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._size_bytes = 0
+        self._token: Hashable = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, token: Hashable) -> Any | None:
+        """Get a cached result.
+
+        Args:
+            key: Content key plus scan options
+            token: Current validity token; a different token than the one
+                the entries were stored under clears the cache
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        with self._lock:
+            self._check_token(token)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at is not None and time.monotonic() > entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(
+        self, key: Hashable, value: Any, token: Hashable, size_bytes: int | None = None
+    ) -> None:
+        """Cache a result.
+
+        Args:
+            key: Content key plus scan options
+            value: Result to cache
+            token: Validity token the result was computed under
+            size_bytes: Size of the result (default: ``estimate_result_size``)
+        """
+        if size_bytes is None:
+            size_bytes = estimate_result_size(value)
+        if size_bytes > self._max_bytes:
+            return
+
+        expires_at = time.monotonic() + self._ttl if self._ttl else None
+        with self._lock:
+            self._check_token(token)
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self._size_bytes + size_bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+            self._entries[key] = _Entry(value, size_bytes, expires_at)
+            self._size_bytes += size_bytes
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache metrics:
+                - hits: Cache hits
+                - misses: Cache misses
+                - hit_rate: Cache hit rate (0.0 to 1.0)
+                - evictions: Entries evicted to stay within max_bytes
+                - expirations: Entries dropped after their TTL
+                - invalidations: Full clears caused by a new ruleset or model
+                - size: Current number of entries
+                - size_bytes: Estimated size of the cached results
+                - max_bytes: Size limit
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _check_token(self, token: Hashable) -> None:
+        """Clear the cache if the validity token changed (lock held)."""
+        if token != self._token:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._size_bytes = 0
+            self._token = token
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove one entry and release its size (lock held)."""
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
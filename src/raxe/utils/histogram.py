@@ -0,0 +1,372 @@
+"""Fixed-memory streaming latency histograms.
+
+Provides an HDR-style log-linear histogram used as the shared latency
+instrumentation primitive for the scan pipeline, the SDK client and the
+Prometheus exporter.
+
+Values are bucketed by power of two, with each power of two split into
+``SUB_BUCKETS`` linear sub-buckets. That bounds the relative error of any
+reported percentile to roughly 1/(2 * SUB_BUCKETS) (~3%), independently of
+how many samples were recorded, while memory stays fixed.
+
+- ``record()`` is O(1) (one ``frexp`` and an integer increment)
+- ``percentile()`` is O(buckets) (a single cumulative walk)
+- ``merge()`` adds bucket counts, so histograms from different threads or
+  processes combine exactly
+- ``to_bytes()``/``from_bytes()`` encode only the non-empty buckets, so a
+  histogram can be persisted (e.g. per hour in scan history) and merged
+  again later
+
+``StageLatencyRecorder`` keeps one histogram per stage per thread, so the
+hot path never takes a lock. Reads merge the shards on demand.
+
+Example:
+    recorder = StageLatencyRecorder()
+    recorder.record("l1", 1.8)
+    recorder.record("l2", 42.0)
+    recorder.summary()["l1"]["p95_ms"]
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import threading
+import weakref
+from collections.abc import Iterable
+
+# Linear sub-buckets per power of two (relative error ~1/32).
+SUB_BUCKETS = 16
+
+# Resolution of the smallest bucket: values are bucketed in microseconds.
+_UNITS_PER_MS = 1000.0
+
+# Powers of two covered above 1us: 2**28 us is ~268s, well past any scan.
+_MAX_EXPONENT = 28
+
+BUCKET_COUNT = 1 + _MAX_EXPONENT * SUB_BUCKETS
+
+# Serialized form: version, count, total, min, max, number of non-empty
+# buckets, then (bucket index, count) pairs.
+_ENCODING_VERSION = 1
+_HEADER = struct.Struct("<BQdddH")
+_ENTRY = struct.Struct("<HQ")
+
+
+def _bucket_index(value_ms: float) -> int:
+    """Map a latency in milliseconds to its bucket index."""
+    units = value_ms * _UNITS_PER_MS
+    if units < 1.0:
+        return 0
+    mantissa, exponent = math.frexp(units)  # units = mantissa * 2**exponent
+    if exponent > _MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub = int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+    return 1 + (exponent - 1) * SUB_BUCKETS + sub
+
+
+def _bucket_midpoint(index: int) -> float:
+    """Representative value (in milliseconds) for a bucket index."""
+    if index == 0:
+        return 0.5 / _UNITS_PER_MS
+    exponent = (index - 1) // SUB_BUCKETS + 1
+    sub = (index - 1) % SUB_BUCKETS
+    width = 2.0**exponent / (2 * SUB_BUCKETS)
+    lower = 2.0 ** (exponent - 1) + sub * width
+    return (lower + width / 2) / _UNITS_PER_MS
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with fixed memory.
+
+    Not internally locked: a single histogram should have one writer
+    (see ``StageLatencyRecorder``) or be guarded by the caller.
+
+    Attributes:
+        count: Number of recorded samples
+        total_ms: Sum of recorded samples in milliseconds
+        min_ms: Smallest recorded sample (inf if empty)
+        max_ms: Largest recorded sample (0.0 if empty)
+    """
+
+    __slots__ = ("_counts", "count", "max_ms", "min_ms", "total_ms")
+
+    def __init__(self) -> None:
+        """Create an empty histogram."""
+        self._counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record one latency sample.
+
+        Args:
+            value_ms: Latency in milliseconds (negative values count as 0)
+        """
+        if value_ms < 0.0:
+            value_ms = 0.0
+        self._counts[_bucket_index(value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        """Add another histogram's samples into this one.
+
+        Args:
+            other: Histogram to merge (left unchanged)
+
+        Returns:
+            self, for chaining
+        """
+        if other.count == 0:
+            return self
+        counts = self._counts
+        for index, bucket in enumerate(other._counts):
+            if bucket:
+                counts[index] += bucket
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    def copy(self) -> LatencyHistogram:
+        """Return an independent copy of this histogram."""
+        return LatencyHistogram().merge(self)
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        self._counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate a latency percentile.
+
+        Args:
+            percentile: Percentile as a fraction (0.0-1.0), e.g. 0.95 for P95
+
+        Returns:
+            Latency at percentile in milliseconds (0.0 if empty)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile))
+        if rank == 1:
+            return self.min_ms
+        if rank >= self.count:
+            return self.max_ms
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= rank:
+                return min(max(_bucket_midpoint(index), self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def to_bytes(self) -> bytes:
+        """Encode the histogram compactly (non-empty buckets only).
+
+        Returns:
+            Encoded histogram (see ``from_bytes``)
+        """
+        entries = [(index, bucket) for index, bucket in enumerate(self._counts) if bucket]
+        header = _HEADER.pack(
+            _ENCODING_VERSION,
+            self.count,
+            self.total_ms,
+            self.min_ms,
+            self.max_ms,
+            len(entries),
+        )
+        return header + b"".join(_ENTRY.pack(index, bucket) for index, bucket in entries)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> LatencyHistogram:
+        """Decode a histogram produced by ``to_bytes``.
+
+        Args:
+            data: Encoded histogram
+
+        Returns:
+            Decoded histogram
+
+        Raises:
+            ValueError: If the data is not a valid encoded histogram
+        """
+        try:
+            version, count, total_ms, min_ms, max_ms, entries = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"Invalid histogram encoding: {e}") from e
+        if version != _ENCODING_VERSION:
+            raise ValueError(f"Unsupported histogram encoding version: {version}")
+        if len(data) != _HEADER.size + entries * _ENTRY.size:
+            raise ValueError("Invalid histogram encoding: unexpected length")
+
+        histogram = cls()
+        for index, bucket in _ENTRY.iter_unpack(data[_HEADER.size :]):
+            if index >= BUCKET_COUNT:
+                raise ValueError(f"Invalid histogram bucket index: {index}")
+            histogram._counts[index] = bucket
+        histogram.count = count
+        histogram.total_ms = total_ms
+        histogram.min_ms = min_ms
+        histogram.max_ms = max_ms
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds (0.0 if empty)."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the distribution.
+
+        Returns:
+            Dictionary with count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms
+        """
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+        }
+
+    def __repr__(self) -> str:
+        """Compact representation."""
+        return f"LatencyHistogram(count={self.count}, p50={self.percentile(0.5):.3f}ms)"
+
+
+def merge_histograms(histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+    """Merge several histograms into a new one.
+
+    Args:
+        histograms: Histograms to merge (left unchanged)
+
+    Returns:
+        New histogram containing all samples
+    """
+    merged = LatencyHistogram()
+    for histogram in histograms:
+        merged.merge(histogram)
+    return merged
+
+
+# All live recorders, so the metrics exporter can aggregate process-wide.
+_recorders: weakref.WeakSet[StageLatencyRecorder] = weakref.WeakSet()
+_recorders_lock = threading.Lock()
+
+
+class StageLatencyRecorder:
+    """Per-stage latency histograms with lock-free recording.
+
+    Each thread records into its own shard (a dict of stage -> histogram),
+    so ``record()`` never contends. The lock is only taken when a thread
+    records for the first time and when reading. Shards of threads that
+    have exited are folded into a retired histogram set so short-lived
+    executor threads do not leak memory.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty recorder and register it for export."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[tuple[threading.Thread, dict[str, LatencyHistogram]]] = []
+        self._retired: dict[str, LatencyHistogram] = {}
+        with _recorders_lock:
+            _recorders.add(self)
+
+    def _shard(self) -> dict[str, LatencyHistogram]:
+        shard: dict[str, LatencyHistogram] | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            with self._lock:
+                self._retire_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_dead_shards(self) -> None:
+        """Fold shards of finished threads into the retired set (lock held)."""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                _merge_into(self._retired, shard)
+        self._shards = alive
+
+    def record(self, stage: str, latency_ms: float) -> None:
+        """Record a latency sample for a stage.
+
+        Args:
+            stage: Stage name (e.g. "l1", "l2", "plugins", "policy")
+            latency_ms: Latency in milliseconds
+        """
+        shard = self._shard()
+        histogram = shard.get(stage)
+        if histogram is None:
+            histogram = shard[stage] = LatencyHistogram()
+        histogram.record(latency_ms)
+
+    def merged(self) -> dict[str, LatencyHistogram]:
+        """Merge all thread shards.
+
+        Returns:
+            New histograms keyed by stage name
+        """
+        with self._lock:
+            self._retire_dead_shards()
+            result: dict[str, LatencyHistogram] = {}
+            _merge_into(result, self._retired)
+            for _, shard in self._shards:
+                _merge_into(result, shard)
+        return result
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Summarize every stage.
+
+        Returns:
+            Stage name -> summary dict (see ``LatencyHistogram.summary``)
+        """
+        return {stage: hist.summary() for stage, hist in sorted(self.merged().items())}
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._retired.clear()
+            for _, shard in self._shards:
+                for histogram in shard.values():
+                    histogram.reset()
+
+
+def _merge_into(target: dict[str, LatencyHistogram], source: dict[str, LatencyHistogram]) -> None:
+    for stage, histogram in list(source.items()):
+        existing = target.get(stage)
+        if existing is None:
+            target[stage] = histogram.copy()
+        else:
+            existing.merge(histogram)
+
+
+def merged_stage_latency() -> dict[str, LatencyHistogram]:
+    """Merge stage histograms across every live recorder in the process.
+
+    Returns:
+        New histograms keyed by stage name
+    """
+    with _recorders_lock:
+        recorders = list(_recorders)
+    result: dict[str, LatencyHistogram] = {}
+    for recorder in recorders:
+        _merge_into(result, recorder.merged())
+    return result
@@ -22,6 +22,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Generic, TypeVar
 
+from raxe.utils.histogram import LatencyHistogram
+
 T = TypeVar("T")
 
 
@@ -250,7 +252,12 @@ class CircuitBreaker(Generic[T]):
 class LatencyTracker:
     """Track latency percentiles for performance monitoring.
 
-    Tracks P50, P95, P99 latencies with rolling window.
+    Tracks P50, P95, P99 latencies over a rolling window backed by two
+    fixed-memory histograms: samples go into the current histogram, which
+    is rotated out once it holds ``window_size`` samples. Percentiles are
+    read from the current and previous histograms together, so the window
+    covers between ``window_size`` and ``2 * window_size`` recent samples.
+    Recording is O(1) and percentile reads are O(buckets).
     Thread-safe for concurrent updates.
     """
 
@@ -258,11 +265,12 @@ class LatencyTracker:
         """Initialize latency tracker.
 
         Args:
-            window_size: Number of samples to keep in rolling window
+            window_size: Number of samples per rolling window generation
         """
         self.window_size = window_size
         self._lock = threading.Lock()
-        self._latencies: list[float] = []
+        self._current = LatencyHistogram()
+        self._previous = LatencyHistogram()
         self._total_count = 0
         self._total_latency_ms = 0.0
 
@@ -273,14 +281,13 @@ class LatencyTracker:
             latency_ms: Latency in milliseconds
         """
         with self._lock:
-            self._latencies.append(latency_ms)
+            if self._current.count >= self.window_size:
+                self._previous, self._current = self._current, self._previous
+                self._current.reset()
+            self._current.record(latency_ms)
             self._total_count += 1
             self._total_latency_ms += latency_ms
 
-            # Keep only last N samples
-            if len(self._latencies) > self.window_size:
-                self._latencies.pop(0)
-
     def get_percentile(self, percentile: float) -> float:
         """Get latency percentile.
 
@@ -291,13 +298,8 @@ class LatencyTracker:
             Latency at percentile in milliseconds
         """
         with self._lock:
-            if not self._latencies:
-                return 0.0
-
-            sorted_latencies = sorted(self._latencies)
-            index = int(len(sorted_latencies) * percentile)
-            index = min(index, len(sorted_latencies) - 1)
-            return sorted_latencies[index]
+            window = self._current.copy().merge(self._previous)
+        return window.percentile(percentile)
 
     @property
     def p50(self) -> float:
@@ -322,14 +324,21 @@ class LatencyTracker:
                 return 0.0
             return self._total_latency_ms / self._total_count
 
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """Copy of the rolling-window histogram."""
+        with self._lock:
+            return self._current.copy().merge(self._previous)
+
     def get_stats(self) -> dict[str, float]:
         """Get latency statistics."""
+        window = self.histogram
         return {
-            "p50_ms": self.p50,
-            "p95_ms": self.p95,
-            "p99_ms": self.p99,
+            "p50_ms": window.percentile(0.50),
+            "p95_ms": window.percentile(0.95),
+            "p99_ms": window.percentile(0.99),
             "average_ms": self.average,
-            "sample_count": len(self._latencies),
+            "sample_count": window.count,
             "total_count": self._total_count,
         }
 
@@ -4,11 +4,14 @@ Provides detailed performance breakdowns and bottleneck identification.
 Application layer - orchestrates domain logic with performance measurement.
 """
 
+import itertools
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from raxe.domain.engine.executor import RuleExecutor
+from raxe.domain.engine.executor import RuleExecutor, RuleObserver
 from raxe.domain.ml.protocol import L2Detector
 from raxe.domain.rules.models import Rule
 
@@ -339,3 +342,253 @@ class ScanProfiler:
             cache_hits=0,
             cache_misses=0,
         )
+
+
+@dataclass
+class RuleCost:
+    """Aggregated cost of one rule across sampled scans.
+
+    Attributes:
+        rule_id: Rule identifier
+        samples: Number of sampled scans that executed the rule
+        total_ms: Cumulative execution time in milliseconds
+        max_ms: Slowest single execution in milliseconds
+        matches: Number of sampled scans where the rule matched
+        worst_input_length: Input length (chars) of the slowest execution
+        pattern_total_ms: Cumulative time per pattern index
+    """
+
+    rule_id: str
+    samples: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    matches: int = 0
+    worst_input_length: int = 0
+    pattern_total_ms: list[float] = field(default_factory=list)
+
+    @property
+    def mean_ms(self) -> float:
+        """Average execution time per sampled scan."""
+        return self.total_ms / self.samples if self.samples else 0.0
+
+    @property
+    def match_rate(self) -> float:
+        """Fraction of sampled scans where the rule matched (0.0-1.0)."""
+        return self.matches / self.samples if self.samples else 0.0
+
+    def add(
+        self,
+        duration_ms: float,
+        matched: bool,
+        input_length: int,
+        pattern_costs: list[float] | None = None,
+    ) -> None:
+        """Add one execution of the rule.
+
+        Args:
+            duration_ms: Rule execution time
+            matched: Whether the rule matched
+            input_length: Length of the scanned text
+            pattern_costs: Per-pattern execution times
+        """
+        self.samples += 1
+        self.total_ms += duration_ms
+        if matched:
+            self.matches += 1
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+            self.worst_input_length = input_length
+        if pattern_costs:
+            self.add_pattern_totals(pattern_costs)
+
+    def merge(self, other: "RuleCost") -> None:
+        """Fold another aggregate for the same rule into this one.
+
+        Args:
+            other: Aggregate to merge (left unchanged)
+        """
+        self.samples += other.samples
+        self.total_ms += other.total_ms
+        self.matches += other.matches
+        if other.max_ms > self.max_ms:
+            self.max_ms = other.max_ms
+            self.worst_input_length = other.worst_input_length
+        self.add_pattern_totals(other.pattern_total_ms)
+
+    def add_pattern_totals(self, pattern_total_ms: list[float]) -> None:
+        """Add per-pattern cumulative times."""
+        if len(self.pattern_total_ms) < len(pattern_total_ms):
+            self.pattern_total_ms.extend(
+                [0.0] * (len(pattern_total_ms) - len(self.pattern_total_ms))
+            )
+        for index, cost in enumerate(pattern_total_ms):
+            self.pattern_total_ms[index] += cost
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "rule_id": self.rule_id,
+            "samples": self.samples,
+            "total_ms": self.total_ms,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+            "match_rate": self.match_rate,
+            "worst_input_length": self.worst_input_length,
+            "pattern_total_ms": list(self.pattern_total_ms),
+        }
+
+
+# All live sampled profilers, so the metrics exporter can aggregate process-wide.
+_rule_profilers: "weakref.WeakSet[SampledRuleProfiler]" = weakref.WeakSet()
+
+
+class SampledRuleProfiler:
+    """Always-on, sampled per-rule cost profiler.
+
+    Every ``sample_rate``-th scan is executed with per-rule and per-pattern
+    timing; all other scans run the untimed executor loop and only pay for
+    a counter increment in ``begin_sample``.
+
+    Aggregates are kept twice: a running total (for ``top_rules`` and the
+    metrics endpoint) and a pending delta that callers drain to persist
+    costs (e.g. into scan history for ``raxe stats --rules``).
+
+    Example:
+        profiler = SampledRuleProfiler(sample_rate=100)
+        observer = profiler.begin_sample(len(text))
+        executor.execute_rules(text, rules, rule_observer=observer)
+        profiler.top_rules(5)
+    """
+
+    DEFAULT_SAMPLE_RATE = 100
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        """Initialize profiler.
+
+        Args:
+            sample_rate: Profile one in this many scans (0 disables sampling)
+        """
+        self.sample_rate = sample_rate
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._totals: dict[str, RuleCost] = {}
+        self._pending: dict[str, RuleCost] = {}
+        self._sampled_scans = 0
+        _rule_profilers.add(self)
+
+    def begin_sample(self, input_length: int) -> RuleObserver | None:
+        """Decide whether the current scan is sampled.
+
+        Args:
+            input_length: Length of the text about to be scanned
+
+        Returns:
+            Observer to pass to ``RuleExecutor.execute_rules`` if this scan
+            is sampled, otherwise None
+        """
+        if self.sample_rate <= 0 or next(self._counter) % self.sample_rate:
+            return None
+
+        with self._lock:
+            self._sampled_scans += 1
+
+        def observe(
+            rule: Rule, duration_ms: float, matched: bool, pattern_costs: list[float]
+        ) -> None:
+            self.record(rule.rule_id, duration_ms, matched, input_length, pattern_costs)
+
+        return observe
+
+    def record(
+        self,
+        rule_id: str,
+        duration_ms: float,
+        matched: bool,
+        input_length: int,
+        pattern_costs: list[float] | None = None,
+    ) -> None:
+        """Record one rule execution.
+
+        Args:
+            rule_id: Rule identifier
+            duration_ms: Rule execution time
+            matched: Whether the rule matched
+            input_length: Length of the scanned text
+            pattern_costs: Per-pattern execution times
+        """
+        with self._lock:
+            for costs in (self._totals, self._pending):
+                cost = costs.get(rule_id)
+                if cost is None:
+                    cost = costs[rule_id] = RuleCost(rule_id=rule_id)
+                cost.add(duration_ms, matched, input_length, pattern_costs)
+
+    @property
+    def sampled_scans(self) -> int:
+        """Number of scans profiled so far."""
+        return self._sampled_scans
+
+    def top_rules(self, limit: int = 10) -> list[RuleCost]:
+        """Costliest rules by cumulative execution time.
+
+        Args:
+            limit: Maximum number of rules to return
+
+        Returns:
+            RuleCost aggregates, most expensive first
+        """
+        with self._lock:
+            costs = list(self._totals.values())
+        return sorted(costs, key=lambda c: c.total_ms, reverse=True)[:limit]
+
+    def snapshot(self) -> dict[str, RuleCost]:
+        """Copy of the running per-rule totals."""
+        with self._lock:
+            return {rule_id: _copy_cost(cost) for rule_id, cost in self._totals.items()}
+
+    def drain_pending(self) -> list[RuleCost]:
+        """Take the costs recorded since the last drain.
+
+        Returns:
+            Per-rule deltas (empty if nothing was sampled)
+        """
+        if not self._pending:
+            return []
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return list(pending.values())
+
+    def reset(self) -> None:
+        """Discard all aggregates."""
+        with self._lock:
+            self._totals.clear()
+            self._pending.clear()
+            self._sampled_scans = 0
+
+
+def _copy_cost(cost: RuleCost) -> RuleCost:
+    return RuleCost(
+        rule_id=cost.rule_id,
+        samples=cost.samples,
+        total_ms=cost.total_ms,
+        max_ms=cost.max_ms,
+        matches=cost.matches,
+        worst_input_length=cost.worst_input_length,
+        pattern_total_ms=list(cost.pattern_total_ms),
+    )
+
+
+def merged_rule_costs() -> dict[str, RuleCost]:
+    """Merge per-rule totals across every live sampled profiler.
+
+    Returns:
+        New aggregates keyed by rule ID
+    """
+    merged: dict[str, RuleCost] = {}
+    for profiler in list(_rule_profilers):
+        for rule_id, cost in profiler.snapshot().items():
+            if rule_id in merged:
+                merged[rule_id].merge(cost)
+            else:
+                merged[rule_id] = cost
+    return merged
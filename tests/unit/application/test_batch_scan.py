@@ -0,0 +1,280 @@
+"""Tests for the streaming batch scan engine."""
+
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from raxe.application.batch_scan import (
+    BatchCheckpoint,
+    BatchResult,
+    BatchScanEngine,
+    BatchState,
+    ChunkResult,
+    CsvSink,
+    JsonSink,
+    iter_chunks,
+)
+
+
+def fake_scan(text: str, **kwargs) -> SimpleNamespace:
+    """Scan stub: "attack" prompts are critical threats, "boom" fails."""
+    if "boom" in text:
+        raise RuntimeError("scan failed")
+    threat = "attack" in text
+    detections = [
+        SimpleNamespace(
+            rule_id="pi-001", severity=SimpleNamespace(value="critical"), confidence=0.9
+        )
+    ]
+    return SimpleNamespace(
+        scan_result=SimpleNamespace(
+            has_threats=threat,
+            combined_severity=SimpleNamespace(value="critical") if threat else None,
+            l1_result=SimpleNamespace(detections=detections if threat else []),
+        ),
+        duration_ms=1.0,
+        severity="critical" if threat else None,
+        total_detections=1 if threat else 0,
+    )
+
+
+RECORD = {
+    "line": 1,
+    "prompt": "hi",
+    "has_threats": False,
+    "detection_count": 0,
+    "highest_severity": "none",
+    "duration_ms": 1.0,
+    "detections": [],
+}
+
+
+def _result(line, record, *, critical=False, error=None) -> BatchResult:
+    """Build a BatchResult for state tests."""
+    return BatchResult(line=line, record=record, critical=critical, error=error)
+
+
+@pytest.fixture
+def raxe() -> Mock:
+    """Raxe client stub."""
+    client = Mock()
+    client.scan.side_effect = fake_scan
+    return client
+
+
+@pytest.fixture
+def prompts_file(tmp_path: Path) -> Path:
+    """Input with blank lines, JSONL records and plain lines."""
+    path = tmp_path / "prompts.jsonl"
+    lines = []
+    for i in range(10):
+        lines.append(json.dumps({"id": i, "prompt": f"prompt {i}"}))
+        if i % 3 == 0:
+            lines.append("")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestIterChunks:
+    """Test lazy chunked reading."""
+
+    def test_chunks_skip_blank_lines(self, prompts_file: Path):
+        """Test prompts are grouped in order with prompt ordinals as line ids."""
+        chunks = list(iter_chunks(prompts_file, 4))
+
+        assert [len(c.prompts) for c in chunks] == [4, 4, 2]
+        assert [c.first_line for c in chunks] == [1, 5, 9]
+        assert chunks[0].prompts[0] == "prompt 0"
+        assert chunks[-1].end_offset == prompts_file.stat().st_size
+
+    def test_resume_from_offset(self, prompts_file: Path):
+        """Test reading from a chunk's end offset continues after that chunk."""
+        first = next(iter_chunks(prompts_file, 4))
+
+        resumed = list(iter_chunks(prompts_file, 4, start_offset=first.end_offset, start_line=4))
+
+        assert resumed[0].first_line == 5
+        assert resumed[0].prompts[0] == "prompt 4"
+        assert sum(len(c.prompts) for c in resumed) == 6
+
+
+class TestBatchScanEngine:
+    """Test in-process engine runs."""
+
+    def test_results_in_input_order(self, raxe: Mock, prompts_file: Path):
+        """Test every prompt is scanned once and records keep line ids."""
+        engine = BatchScanEngine(raxe=raxe, chunk_size=3, scan_kwargs={"tenant_id": "acme"})
+
+        results = [r for c in engine.run(prompts_file) for r in c.results]
+
+        assert [r.line for r in results] == list(range(1, 11))
+        assert results[0].record["prompt"] == "prompt 0"
+        raxe.scan.assert_called_with("prompt 9", tenant_id="acme")
+
+    def test_scan_errors_are_captured(self, raxe: Mock, tmp_path: Path):
+        """Test a failing prompt yields an error result without a record."""
+        path = tmp_path / "in.txt"
+        path.write_text("ok\nboom\nok again\n")
+
+        results = [r for c in BatchScanEngine(raxe=raxe).run(path) for r in c.results]
+
+        assert [r.error for r in results] == [None, "scan failed", None]
+        assert results[1].record is None
+
+    def test_fail_fast_stops_after_critical(self, raxe: Mock, tmp_path: Path):
+        """Test fail_fast cuts the run after the first critical threat."""
+        path = tmp_path / "in.txt"
+        path.write_text("a\nb\nattack now\nc\nd\ne\nf\n")
+
+        engine = BatchScanEngine(raxe=raxe, chunk_size=2, fail_fast=True)
+        results = [r for c in engine.run(path) for r in c.results]
+
+        assert [r.line for r in results] == [1, 2, 3]
+        assert results[-1].critical
+        assert raxe.scan.call_count == 4  # Rest of the chunk was scanned, not emitted
+
+    def test_content_hashes(self, raxe: Mock, tmp_path: Path):
+        """Test content hashes are only computed when requested."""
+        path = tmp_path / "in.txt"
+        path.write_text("hello\n")
+
+        raxe.detection_fingerprint.return_value = "f" * 64
+
+        plain = next(BatchScanEngine(raxe=raxe).run(path))
+        hashed = next(
+            BatchScanEngine(raxe=raxe, content_hashes=True, scan_kwargs={"tenant_id": "acme"}).run(
+                path
+            )
+        )
+
+        assert plain.results[0].content_hash is None
+        assert plain.detection_key is None
+        assert len(hashed.results[0].content_hash) == 64
+        assert hashed.detection_key == "f" * 64
+        raxe.detection_fingerprint.assert_called_once_with(
+            l2_enabled=None, tenant_id="acme", app_id=None, policy_id=None
+        )
+
+    def test_requires_client_in_process(self):
+        """Test in-process scanning needs a client."""
+        with pytest.raises(ValueError, match="raxe client"):
+            BatchScanEngine(workers=1)
+
+
+class TestBatchState:
+    """Test totals and checkpoint tracking."""
+
+    def test_checkpoint_advances_over_contiguous_prefix(self, raxe: Mock, prompts_file: Path):
+        """Test out-of-order chunks only advance the checkpoint once contiguous."""
+        chunks = list(BatchScanEngine(raxe=raxe, chunk_size=4).run(prompts_file))
+        state = BatchState(BatchCheckpoint(input_path=str(prompts_file), output_format="jsonl"))
+
+        state.record(chunks[1])
+        assert state.checkpoint.offset == 0
+        assert state.checkpoint.scanned == 0
+        assert state.totals.scanned == 4
+
+        state.record(chunks[0])
+        assert (state.checkpoint.offset, state.checkpoint.line) == (chunks[1].end_offset, 8)
+
+        state.record(chunks[2])
+        assert state.checkpoint.line == 10
+        assert state.pending == {}
+
+    def test_resume_after_out_of_order_chunks_counts_once(self, raxe: Mock, tmp_path: Path):
+        """Test totals are exact when resuming a run stopped past the prefix."""
+        path = tmp_path / "prompts.txt"
+        path.write_text("".join(f"attack {i}\n" if i % 4 == 0 else f"ok {i}\n" for i in range(12)))
+        checkpoint_path = tmp_path / "batch.ckpt"
+        chunks = list(BatchScanEngine(raxe=raxe, chunk_size=4).run(path))
+        state = BatchState(BatchCheckpoint(input_path=str(path), output_format="jsonl"))
+
+        # Chunks 0 and 2 finish, chunk 1 is still running when the run stops
+        state.record(chunks[0])
+        state.record(chunks[2])
+        assert state.totals.scanned == 8
+        state.checkpoint.save(checkpoint_path)
+
+        resume = BatchCheckpoint.load(checkpoint_path)
+        resumed = BatchState(resume)
+        for chunk in BatchScanEngine(raxe=raxe, chunk_size=4).run(path, checkpoint=resume):
+            resumed.record(chunk)
+
+        cp = resumed.checkpoint
+        assert (cp.scanned, cp.threats_found, cp.errors) == (12, 3, 0)
+        assert resumed.totals == cp
+
+    def test_counts_threats_and_errors(self):
+        """Test threat, critical and error totals."""
+        ok = {"has_threats": False}
+        threat = {"has_threats": True}
+        chunk = ChunkResult(
+            index=0,
+            end_offset=10,
+            last_line=3,
+            results=[
+                _result(1, ok),
+                _result(2, threat, critical=True),
+                _result(3, None, error="failed"),
+            ],
+        )
+        state = BatchState(BatchCheckpoint(input_path="in", output_format="csv"))
+
+        state.record(chunk)
+
+        cp = state.checkpoint
+        assert (cp.scanned, cp.threats_found, cp.errors, cp.critical_found) == (3, 1, 1, True)
+
+    def test_checkpoint_round_trip(self, tmp_path: Path):
+        """Test checkpoints are saved and loaded intact."""
+        path = tmp_path / "batch.ckpt"
+        checkpoint = BatchCheckpoint(
+            input_path="/data/in.jsonl", output_format="jsonl", offset=120, line=7
+        )
+
+        checkpoint.save(path)
+
+        assert BatchCheckpoint.load(path) == checkpoint
+
+    def test_load_rejects_other_files(self, tmp_path: Path):
+        """Test a file that is not a checkpoint is rejected."""
+        path = tmp_path / "not-a-checkpoint.json"
+        path.write_text('{"offset": 3}')
+
+        with pytest.raises(ValueError, match="Unsupported checkpoint"):
+            BatchCheckpoint.load(path)
+
+
+class TestSinks:
+    """Test streaming output sinks."""
+
+    def test_json_sink_is_one_document(self):
+        """Test the streamed JSON document parses with totals."""
+        stream = io.StringIO()
+        sink = JsonSink(stream)
+        sink.write(RECORD)
+        sink.write({**RECORD, "line": 2})
+        sink.close(BatchCheckpoint(input_path="in", output_format="json", threats_found=0))
+
+        data = json.loads(stream.getvalue())
+
+        assert data["total_scanned"] == 2
+        assert [r["line"] for r in data["results"]] == [1, 2]
+
+    def test_json_sink_empty(self):
+        """Test an empty run still produces valid JSON."""
+        stream = io.StringIO()
+        JsonSink(stream).close(BatchCheckpoint(input_path="in", output_format="json"))
+
+        assert json.loads(stream.getvalue())["results"] == []
+
+    def test_csv_sink_append_skips_header(self):
+        """Test resumed CSV output does not repeat the header."""
+        stream = io.StringIO()
+        CsvSink(stream, header=False).write(RECORD)
+
+        assert stream.getvalue().strip() == "1,hi,False,0,none,1.0"
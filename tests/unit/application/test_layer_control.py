@@ -3,7 +3,7 @@
 Tests the new layer control parameters (l1_enabled, l2_enabled, mode, etc.)
 """
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -14,6 +14,7 @@ from raxe.domain.engine.matcher import Match
 from raxe.domain.ml.protocol import L2Detector
 from raxe.domain.rules.models import Pattern, Rule, RuleExamples, RuleFamily, RuleMetrics, Severity
 from raxe.infrastructure.packs.registry import PackRegistry
+from raxe.utils.profiler import SampledRuleProfiler
 
 
 @pytest.fixture
@@ -335,3 +336,24 @@ def test_l2_metadata_false_when_percall_disabled(scan_pipeline, mock_l2_detector
     result = scan_pipeline.scan("test", l2_enabled=False)
     assert result.metadata["l2_enabled"] is False
     mock_l2_detector.analyze.assert_not_called()
+
+
+def test_sampled_scan_still_measured(mock_registry, mock_executor, mock_l2_detector):
+    """Sampled scans should still be recorded in the regex duration histogram."""
+    pipeline = ScanPipeline(
+        pack_registry=mock_registry,
+        rule_executor=mock_executor,
+        l2_detector=mock_l2_detector,
+        scan_merger=ScanMerger(),
+        rule_profiler=SampledRuleProfiler(sample_rate=1),
+    )
+    collector = MagicMock()
+
+    with (
+        patch("raxe.application.scan_pipeline.METRICS_AVAILABLE", True),
+        patch("raxe.application.scan_pipeline.collector", collector),
+    ):
+        pipeline.scan("test", l2_enabled=False)
+
+    assert "rule_observer" in mock_executor.execute_rules.call_args.kwargs
+    collector.measure_scan.assert_any_call("regex")
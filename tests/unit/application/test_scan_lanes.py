@@ -0,0 +1,274 @@
+"""Tests for L2 priority lanes.
+
+Tests for:
+- PriorityExecutor lane ordering and admission control
+- Queue slots released by cancellation and shutdown
+- AsyncScanPipeline degrading saturated scans to L1-only
+- ScanPipeline running L2 in a lane when the scan has a priority
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from raxe.application.scan_lanes import PriorityExecutor, ScanPriority
+from raxe.application.scan_merger import ScanMerger
+from raxe.application.scan_pipeline import ScanPipeline
+from raxe.application.scan_pipeline_async import AsyncScanPipeline
+from raxe.domain.engine.executor import ScanResult
+from raxe.domain.ml.protocol import L2Result
+
+
+@pytest.fixture
+def blocked_executor():
+    """Single-worker executor whose worker is held by a blocking call."""
+    executor = PriorityExecutor(
+        max_workers=1,
+        lane_depth={ScanPriority.INTERACTIVE: 3, ScanPriority.BACKGROUND: 2},
+    )
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    running = executor.try_submit(ScanPriority.INTERACTIVE, block)
+    assert started.wait(5)
+    yield executor, release, running
+    release.set()
+    executor.shutdown()
+
+
+class TestPriorityExecutor:
+    """Tests for lane ordering and admission control."""
+
+    def test_higher_lane_runs_first(self, blocked_executor):
+        """Queued interactive calls should start before earlier batch calls."""
+        executor, release, _ = blocked_executor
+        order = []
+
+        futures = [
+            executor.try_submit(ScanPriority.BATCH, order.append, "batch"),
+            executor.try_submit(ScanPriority.BACKGROUND, order.append, "background"),
+            executor.try_submit(ScanPriority.INTERACTIVE, order.append, "interactive-1"),
+            executor.try_submit(ScanPriority.INTERACTIVE, order.append, "interactive-2"),
+        ]
+        release.set()
+        for future in futures:
+            future.result(5)
+
+        assert order == ["interactive-1", "interactive-2", "background", "batch"]
+
+    def test_full_lane_rejected(self, blocked_executor):
+        """A lane at its limit should refuse calls without affecting others."""
+        executor, _, _ = blocked_executor
+
+        assert executor.try_submit(ScanPriority.BACKGROUND, print) is not None
+        assert executor.try_submit(ScanPriority.BACKGROUND, print) is not None
+        assert executor.try_submit(ScanPriority.BACKGROUND, print) is None
+        assert executor.try_submit(ScanPriority.INTERACTIVE, print) is not None
+
+        lanes = executor.stats()["lanes"]
+        assert lanes["background"] == {"queued": 2, "limit": 2, "admitted": 2, "rejected": 1}
+        assert executor.queue_depth() == 3
+
+    def test_cancel_releases_slot(self, blocked_executor):
+        """Cancelling a queued call should free its slot immediately."""
+        executor, _, _ = blocked_executor
+        future = executor.try_submit(ScanPriority.BATCH, print)
+        assert executor.try_submit(ScanPriority.BATCH, print) is None
+
+        assert future.cancel()
+
+        assert executor.queue_depth(ScanPriority.BATCH) == 0
+        assert executor.try_submit(ScanPriority.BATCH, print) is not None
+
+    def test_exception_propagates(self):
+        """Errors raised by a call should surface through its future."""
+        executor = PriorityExecutor(max_workers=1)
+        future = executor.try_submit(ScanPriority.INTERACTIVE, int, "not a number")
+
+        with pytest.raises(ValueError):
+            future.result(5)
+        executor.shutdown()
+
+    def test_shutdown_cancels_queued(self, blocked_executor):
+        """Shutdown should cancel queued calls and refuse new ones."""
+        executor, release, running = blocked_executor
+        queued = executor.try_submit(ScanPriority.BACKGROUND, print)
+
+        executor.shutdown(wait=False)
+        release.set()
+
+        assert queued.cancelled()
+        assert running.result(5) is None
+        assert executor.queue_depth() == 0
+        with pytest.raises(RuntimeError, match="shut down"):
+            executor.try_submit(ScanPriority.INTERACTIVE, print)
+
+
+def _l1_result(text, rules, compiled=None):
+    return ScanResult(
+        detections=[],
+        scanned_at="2025-01-01T00:00:00+00:00",
+        text_length=len(text),
+        rules_checked=len(rules),
+        scan_duration_ms=0.1,
+    )
+
+
+@pytest.fixture
+def pipeline():
+    """Async pipeline with one L2 worker and a one-slot batch lane."""
+    pack_registry = Mock(spec=["get_all_rules"])
+    pack_registry.get_all_rules.return_value = []
+    rule_executor = Mock()
+    rule_executor.execute_rules.side_effect = _l1_result
+    l2_detector = Mock()
+    l2_detector.analyze.return_value = L2Result(
+        predictions=[], confidence=0.9, processing_time_ms=1.0, model_version="stub"
+    )
+    pipeline = AsyncScanPipeline(
+        pack_registry=pack_registry,
+        rule_executor=rule_executor,
+        l2_detector=l2_detector,
+        scan_merger=ScanMerger(),
+        l2_workers=1,
+        lane_depth={ScanPriority.BATCH: 1},
+        l1_timeout_ms=5000,
+        l2_timeout_ms=5000,
+    )
+    yield pipeline
+    pipeline.close()
+
+
+class TestAsyncPipelineLanes:
+    """Tests for lane scheduling in the async scan pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_scan_runs_l2_on_dedicated_executor(self, pipeline):
+        """L2 should run on a raxe-l2 worker and report its lane."""
+        threads = []
+        result = pipeline.l2_detector.analyze.return_value
+        pipeline.l2_detector.analyze.side_effect = lambda *args, **kwargs: (
+            threads.append(threading.current_thread().name) or result
+        )
+
+        scan = await pipeline.scan("hello world", priority="background")
+
+        assert threads == ["raxe-l2_0"]
+        assert scan.metrics.priority == "background"
+        assert scan.metrics.l2_degraded is False
+        assert scan.l2_degraded is False
+        assert scan.metadata["l2_skipped"] is False
+
+    @pytest.mark.asyncio
+    async def test_saturated_lane_degrades_to_l1(self, pipeline):
+        """A scan whose lane is full should skip L2 and say so."""
+        release = threading.Event()
+        pipeline._l2_executor.try_submit(ScanPriority.INTERACTIVE, release.wait, 5)
+        pipeline._l2_executor.try_submit(ScanPriority.BATCH, release.wait, 5)
+
+        try:
+            scan = await pipeline.scan("hello world", priority=ScanPriority.BATCH)
+        finally:
+            release.set()
+
+        assert scan.l2_degraded is True
+        assert scan.metrics.l2_degraded is True
+        assert scan.metrics.l2_queue_depth == 1
+        assert scan.metadata["l2_skipped"] is True
+        assert pipeline.lane_stats()["lanes"]["batch"]["rejected"] == 1
+        pipeline.l2_detector.analyze.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_priority_rejected(self, pipeline):
+        """Unknown lanes should be rejected before scanning."""
+        with pytest.raises(ValueError):
+            await pipeline.scan("hello world", priority="urgent")
+
+
+@pytest.fixture
+def sync_pipeline():
+    """Sync pipeline with one L2 worker and a one-slot batch lane."""
+    pack_registry = Mock(spec=["get_all_rules"])
+    pack_registry.get_all_rules.return_value = []
+    rule_executor = Mock()
+    rule_executor.execute_rules.side_effect = _l1_result
+    l2_detector = Mock()
+    l2_detector.analyze.return_value = L2Result(
+        predictions=[], confidence=0.9, processing_time_ms=1.0, model_version="stub"
+    )
+    pipeline = ScanPipeline(
+        pack_registry=pack_registry,
+        rule_executor=rule_executor,
+        l2_detector=l2_detector,
+        scan_merger=ScanMerger(),
+        l2_workers=1,
+        lane_depth={ScanPriority.BATCH: 1},
+    )
+    yield pipeline
+    pipeline.close()
+
+
+class TestScanPipelineLanes:
+    """Tests for lane scheduling in the sync scan pipeline used by the SDK."""
+
+    def test_no_priority_runs_l2_inline(self, sync_pipeline):
+        """Without a priority L2 should run on the calling thread."""
+        threads = []
+        result = sync_pipeline.l2_detector.analyze.return_value
+        sync_pipeline.l2_detector.analyze.side_effect = lambda *args: (
+            threads.append(threading.current_thread().name) or result
+        )
+
+        scan = sync_pipeline.scan("hello world")
+
+        assert threads == [threading.current_thread().name]
+        assert "priority" not in scan.metadata
+        assert sync_pipeline._l2_lanes is None
+
+    def test_priority_runs_l2_in_lane(self, sync_pipeline):
+        """With a priority L2 should run on a raxe-l2 worker."""
+        threads = []
+        result = sync_pipeline.l2_detector.analyze.return_value
+        sync_pipeline.l2_detector.analyze.side_effect = lambda *args, **kwargs: (
+            threads.append(threading.current_thread().name) or result
+        )
+
+        scan = sync_pipeline.scan("hello world", priority="background")
+
+        assert threads == ["raxe-l2_0"]
+        assert scan.metadata["priority"] == "background"
+        assert scan.metadata["l2_degraded"] is False
+        assert scan.metadata["l2_skipped"] is False
+        assert sync_pipeline.lane_stats()["lanes"]["background"]["admitted"] == 1
+
+    def test_saturated_lane_degrades_to_l1(self, sync_pipeline):
+        """A scan whose lane is full should skip L2, say so and not be cached."""
+        release = threading.Event()
+        lanes = sync_pipeline._get_l2_lanes()
+        lanes.try_submit(ScanPriority.INTERACTIVE, release.wait, 5)
+        lanes.try_submit(ScanPriority.BATCH, release.wait, 5)
+        cache = Mock()
+        cache.get.return_value = None
+
+        try:
+            scan = sync_pipeline.scan(
+                "hello world", priority=ScanPriority.BATCH, detection_cache=cache
+            )
+        finally:
+            release.set()
+
+        assert scan.metadata["l2_degraded"] is True
+        assert scan.metadata["l2_skipped"] is True
+        assert sync_pipeline.lane_stats()["lanes"]["batch"]["rejected"] == 1
+        sync_pipeline.l2_detector.analyze.assert_not_called()
+        cache.set.assert_not_called()
+
+    def test_invalid_priority_rejected(self, sync_pipeline):
+        """Unknown lanes should be rejected before scanning."""
+        with pytest.raises(ValueError):
+            sync_pipeline.scan("hello world", priority="urgent")
@@ -97,6 +97,36 @@ class TestAsyncRaxe:
         stats = raxe.cache_stats()
         assert stats["hits"] == 0
 
+    async def test_scan_priority(self):
+        """Test scans pass their L2 lane to the pipeline (interactive by default)."""
+        raxe = AsyncRaxe(l2_enabled=False)
+
+        first = await raxe.scan("Hello lanes", use_cache=False)
+        second = await raxe.scan("Hello lanes", use_cache=False, priority="background")
+
+        assert first.metadata["priority"] == "interactive"
+        assert second.metadata["priority"] == "background"
+        await raxe.close()
+
+    @pytest.mark.parametrize("flag", ["l2_degraded", "l2_timeout"])
+    async def test_degraded_result_not_cached(self, flag):
+        """Test an L1-only result degraded under load or by a timeout is not cached."""
+        raxe = AsyncRaxe(cache_size=100, l2_enabled=False)
+        scan = raxe.pipeline.scan
+
+        def degraded(*args, **kwargs):
+            result = scan(*args, **kwargs)
+            result.metadata[flag] = True
+            return result
+
+        raxe.pipeline.scan = degraded
+
+        await raxe.scan("test prompt")
+        await raxe.scan("test prompt")
+
+        assert raxe.cache_stats()["hits"] == 0
+        await raxe.close()
+
     async def test_scan_batch(self):
         """Test batch scanning."""
         raxe = AsyncRaxe()
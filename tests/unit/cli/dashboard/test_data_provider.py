@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from raxe.cli.dashboard.data_provider import (
     AlertItem,
     DashboardData,
     DashboardDataProvider,
 )
+from raxe.infrastructure.database.scan_history import PendingScan
 
 
 class TestAlertItem:
@@ -153,3 +156,191 @@ class TestDashboardDataProvider:
         # Very unlikely to exist
         alert = provider.get_alert_details(999999999)
         assert alert is None
+
+
+class TestDashboardDataProviderRollups:
+    """Tests for dashboard data served from the history rollups."""
+
+    def test_fetch_data_from_rollups(self, tmp_path):
+        """Test counts, trends and alerts for a populated history."""
+        from datetime import timedelta
+
+        from raxe.domain.engine.executor import Detection
+        from raxe.domain.engine.matcher import Match
+        from raxe.domain.rules.models import Severity
+        from raxe.infrastructure.database.scan_history import PendingScan, ScanHistoryDB
+
+        db = ScanHistoryDB(tmp_path / "history.db")
+        now = datetime.now(timezone.utc)
+        detection = Detection(
+            rule_id="pi-001",
+            rule_version="1.0.0",
+            severity=Severity.HIGH,
+            confidence=0.8,
+            matches=[Match(0, 0, 6, "ignore", (), "", "")],
+            detected_at=now.isoformat(),
+            detection_layer="L1",
+            message="Prompt injection",
+        )
+        db.record_scans(
+            [
+                PendingScan("threat now", [detection], total_duration_ms=10.0, timestamp=now),
+                PendingScan("clean now", total_duration_ms=20.0, timestamp=now),
+                PendingScan("earlier", [detection], timestamp=now - timedelta(hours=3)),
+                PendingScan("last month", [detection], timestamp=now - timedelta(days=30)),
+            ]
+        )
+
+        data = DashboardDataProvider(db=db).get_data()
+
+        today_scans = 3 if now.hour >= 3 else 2
+        assert data.total_scans_today == today_scans
+        assert data.total_threats_today == today_scans - 1
+        assert data.threats_by_severity["HIGH"] == today_scans - 1
+        assert data.hourly_scans[23] == 2
+        assert data.hourly_threats[23] == 1
+        assert data.hourly_scans[20] == 1
+        assert sum(data.hourly_scans) == 3
+        assert data.avg_latency_ms == 15.0
+        assert [a.prompt_preview for a in data.recent_alerts] == [
+            "threat now",
+            "earlier",
+            "last month",
+        ]
+        assert data.recent_alerts[0].rule_ids == ["pi-001"]
+        assert data.last_scan_time is not None
+
+    def test_latency_percentiles_from_sketches(self, tmp_path):
+        """Test P95/P99 come from the stored histograms, not the average."""
+        from raxe.infrastructure.database.scan_history import PendingScan, ScanHistoryDB
+
+        db = ScanHistoryDB(tmp_path / "history.db")
+        now = datetime.now(timezone.utc)
+        db.record_scans(
+            [PendingScan("fast", total_duration_ms=2.0, timestamp=now) for _ in range(90)]
+            + [PendingScan("slow", total_duration_ms=80.0, timestamp=now) for _ in range(10)]
+        )
+
+        data = DashboardDataProvider(db=db).get_data()
+
+        assert data.avg_latency_ms == pytest.approx(9.8)
+        assert data.p95_latency_ms == pytest.approx(80.0, rel=0.05)
+        assert data.p99_latency_ms == pytest.approx(80.0, rel=0.05)
+
+
+class TestDashboardDataProviderIncremental:
+    """Tests for refreshes that only read scans newer than the last seen one."""
+
+    @staticmethod
+    def _detection(rule_id: str = "pi-001"):
+        from raxe.domain.engine.executor import Detection
+        from raxe.domain.engine.matcher import Match
+        from raxe.domain.rules.models import Severity
+
+        return Detection(
+            rule_id=rule_id,
+            rule_version="1.0.0",
+            severity=Severity.HIGH,
+            confidence=0.8,
+            matches=[Match(0, 0, 6, "ignore", (), "", "")],
+            detected_at=datetime.now(timezone.utc).isoformat(),
+            detection_layer="L1",
+        )
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        from raxe.infrastructure.database.scan_history import ScanHistoryDB
+
+        return ScanHistoryDB(tmp_path / "history.db")
+
+    def test_refresh_folds_new_scans(self, db):
+        """Test folded data matches a full rebuild."""
+        db.record_scan("before", [self._detection()], total_duration_ms=4.0)
+        provider = DashboardDataProvider(db=db)
+        provider.get_data()
+
+        db.record_scan("clean", [], total_duration_ms=6.0)
+        db.record_scan("after", [self._detection("jb-001")], total_duration_ms=8.0)
+        folded = provider.force_refresh()
+        rebuilt = DashboardDataProvider(db=db).get_data()
+
+        assert folded.total_scans_today == rebuilt.total_scans_today == 3
+        assert folded.total_threats_today == rebuilt.total_threats_today == 2
+        assert folded.threats_by_severity == rebuilt.threats_by_severity
+        assert folded.hourly_scans == rebuilt.hourly_scans
+        assert folded.hourly_threats == rebuilt.hourly_threats
+        assert folded.avg_latency_ms == rebuilt.avg_latency_ms
+        assert folded.last_scan_time == rebuilt.last_scan_time
+        assert [a.prompt_preview for a in folded.recent_alerts] == ["after", "before"]
+        assert folded.recent_alerts[0].rule_ids == ["jb-001"]
+
+    def test_refresh_reads_only_new_scans(self, db, monkeypatch):
+        """Test a refresh does not re-list history or query detections per scan."""
+        db.record_scan("before", [self._detection()])
+        provider = DashboardDataProvider(db=db)
+        provider.get_data()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("full history query during incremental refresh")
+
+        monkeypatch.setattr(db, "list_scans", fail)
+        monkeypatch.setattr(db, "get_detections", fail)
+
+        unchanged = provider.force_refresh()
+        assert unchanged.total_scans_today == 1
+
+        db.record_scans(
+            [
+                PendingScan(
+                    f"threat {i}", [self._detection()], timestamp=datetime.now(timezone.utc)
+                )
+                for i in range(3)
+            ]
+        )
+        data = provider.force_refresh()
+
+        assert data.total_scans_today == 4
+        assert len(data.recent_alerts) == 4
+
+    def test_alert_feed_is_bounded(self, db, monkeypatch):
+        """Test the alert feed keeps only the newest alerts."""
+        monkeypatch.setattr(DashboardDataProvider, "MAX_ALERTS_CACHED", 3)
+        provider = DashboardDataProvider(db=db)
+        provider.get_data()
+
+        for i in range(5):
+            db.record_scan(f"threat {i}", [self._detection()])
+        data = provider.force_refresh()
+
+        assert [a.prompt_preview for a in data.recent_alerts] == [
+            "threat 4",
+            "threat 3",
+            "threat 2",
+        ]
+
+    def test_large_backlog_triggers_full_rebuild(self, db, monkeypatch):
+        """Test falling back to a rebuild when too many scans arrived."""
+        monkeypatch.setattr(DashboardDataProvider, "MAX_DELTA_SCANS", 2)
+        provider = DashboardDataProvider(db=db)
+        provider.get_data()
+
+        db.record_scans([PendingScan(f"scan {i}") for i in range(5)])
+        data = provider.force_refresh()
+
+        assert data.total_scans_today == 5
+        assert provider._last_seen_scan_id == db.get_latest_scan_id()
+
+    def test_has_new_alerts(self, db):
+        """Test new threat scans are reported until the next refresh."""
+        provider = DashboardDataProvider(db=db)
+        assert provider.has_new_alerts() is False
+
+        provider.get_data()
+        db.record_scan("clean", [])
+        assert provider.has_new_alerts() is False
+
+        db.record_scan("threat", [self._detection()])
+        assert provider.has_new_alerts() is True
+
+        provider.force_refresh()
+        assert provider.has_new_alerts() is False
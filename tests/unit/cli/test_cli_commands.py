@@ -4,9 +4,13 @@ Tests for CLI commands.
 Tests the enhanced CLI functionality including rules, doctor, batch, and enhanced scan.
 """
 
+from unittest.mock import patch
+
 import pytest
 from click.testing import CliRunner
 
+from raxe.application.batch_scan import BatchResult, BatchScanEngine, ChunkResult
+from raxe.cli.exit_codes import EXIT_INVALID_INPUT
 from raxe.cli.main import cli
 
 
@@ -200,6 +204,56 @@ class TestBatchCommand:
             # Should succeed or fail gracefully (not crash on invalid tenant)
             assert result.exit_code in [0, 1]
 
+    def test_batch_accepts_streaming_options(self, runner):
+        """Test batch exposes worker, ordering and checkpoint options."""
+        result = runner.invoke(cli, ["batch", "--help"])
+        for option in ("--workers", "--chunk-size", "--unordered", "--checkpoint", "jsonl"):
+            assert option in result.output
+
+    def test_batch_checkpoint_requires_resumable_output(self, runner):
+        """Test --checkpoint is rejected without a jsonl/csv output file."""
+        with runner.isolated_filesystem():
+            with open("prompts.txt", "w") as f:
+                f.write("test prompt\n")
+
+            result = runner.invoke(cli, ["batch", "prompts.txt", "--checkpoint", "run.ckpt"])
+            assert result.exit_code == EXIT_INVALID_INPUT
+
+    def test_batch_workers_do_not_load_client_in_parent(self, runner):
+        """Test --workers > 1 leaves client construction to the workers."""
+        chunk = ChunkResult(
+            index=0,
+            end_offset=12,
+            last_line=1,
+            results=[BatchResult(line=1, record={"line": 1, "has_threats": False})],
+        )
+        with runner.isolated_filesystem():
+            with open("prompts.txt", "w") as f:
+                f.write("test prompt\n")
+
+            with (
+                patch("raxe.sdk.client.Raxe", side_effect=AssertionError("client built")),
+                patch.object(BatchScanEngine, "run", return_value=iter([chunk])) as run,
+            ):
+                result = runner.invoke(
+                    cli,
+                    [
+                        "batch",
+                        "prompts.txt",
+                        "--workers",
+                        "2",
+                        "--format",
+                        "jsonl",
+                        "--output",
+                        "out",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            run.assert_called_once()
+            with open("out") as f:
+                assert f.read().strip() == '{"line": 1, "has_threats": false}'
+
 
 class TestRulesCommands:
     """Test suite for rules commands."""
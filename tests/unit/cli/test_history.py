@@ -207,6 +207,25 @@ class TestHistoryStats:
         assert "7 days" in result.output
         mock_db.get_statistics.assert_called_once_with(days=7)
 
+    def test_stats_displays_top_rules(self, runner, mock_db):
+        """Test stats lists the most frequent rules."""
+        mock_db.get_statistics.return_value = {
+            "total_scans": 10,
+            "scans_with_threats": 3,
+            "threat_rate": 0.3,
+            "severity_counts": {"high": 3},
+            "avg_l1_duration_ms": None,
+            "avg_l2_duration_ms": None,
+            "avg_total_duration_ms": None,
+        }
+        mock_db.get_top_rules.return_value = [("pi-001", 3), ("jb-002", 1)]
+        with patch("raxe.cli.history.ScanHistoryDB", return_value=mock_db):
+            result = runner.invoke(history, ["stats"])
+
+        assert result.exit_code == 0
+        assert "pi-001: 3" in result.output
+        mock_db.get_top_rules.assert_called_once_with(days=30, limit=5)
+
 
 class TestHistoryExport:
     """Tests for raxe history export command."""
@@ -0,0 +1,115 @@
+"""Tests for lazy CLI subcommand loading and import profiling."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from raxe.cli.import_profile import ImportTiming, parse_importtime
+from raxe.cli.lazy_group import RAW_ARGS_KEY, LazyGroup
+from raxe.cli.main import LAZY_SUBCOMMANDS, cli
+
+
+@click.command()
+def eager():
+    """Eagerly registered command."""
+    click.echo("eager ran")
+
+
+class TestLazyGroup:
+    """Tests for LazyGroup."""
+
+    def _group(self, lazy):
+        @click.group(cls=LazyGroup, lazy_subcommands=lazy)
+        def root():
+            pass
+
+        root.add_command(eager)
+        return root
+
+    def test_lists_lazy_commands_without_importing(self):
+        group = self._group({"help": "raxe.cli.help:help_command"})
+        with patch("raxe.cli.lazy_group.importlib.import_module") as import_module:
+            names = group.list_commands(click.Context(group))
+
+        assert names == ["eager", "help"]
+        import_module.assert_not_called()
+
+    def test_resolves_and_caches_command(self):
+        group = self._group({"help": "raxe.cli.help:help_command"})
+        ctx = click.Context(group)
+
+        first = group.get_command(ctx, "help")
+        second = group.get_command(ctx, "help")
+
+        assert isinstance(first, click.Command)
+        assert first is second
+
+    def test_non_command_target_raises(self):
+        group = self._group({"bad": "raxe.cli.lazy_group:RAW_ARGS_KEY"})
+
+        with pytest.raises(TypeError, match="not a click command"):
+            group.get_command(click.Context(group), "bad")
+
+    def test_unknown_command_is_usage_error(self):
+        result = CliRunner().invoke(self._group({}), ["missing"])
+
+        assert result.exit_code == 2
+        assert "No such command" in result.output
+
+    def test_raw_args_are_recorded(self):
+        seen = {}
+
+        @click.group(cls=LazyGroup)
+        @click.pass_context
+        def root(ctx):
+            seen["args"] = ctx.meta[RAW_ARGS_KEY]
+
+        root.add_command(eager)
+        CliRunner().invoke(root, ["eager"])
+
+        assert seen["args"] == ["eager"]
+
+
+class TestMainCliIsLazy:
+    """The raxe CLI should not import subcommand modules up front."""
+
+    def test_every_lazy_subcommand_resolves(self):
+        ctx = click.Context(cli)
+        for name in LAZY_SUBCOMMANDS:
+            assert isinstance(cli.get_command(ctx, name), click.Command), name
+
+    def test_importing_cli_skips_subcommands_and_sdk(self):
+        code = (
+            "import sys, raxe.cli.main; "
+            "print(sorted(m for m in ('raxe.cli.stats', 'raxe.cli.tune', "
+            "'raxe.sdk.client', 'raxe.cli.dashboard_cmd') if m in sys.modules))"
+        )
+        completed = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert completed.stdout.strip() == "[]"
+
+
+class TestParseImporttime:
+    """Tests for parsing `python -X importtime` output."""
+
+    def test_parses_timings_and_keeps_other_lines(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   raxe.cli.exit_codes\n"
+            "import time:      2000 |       5000 | raxe.cli.main\n"
+            "Warning: something else\n"
+        )
+
+        timings, other = parse_importtime(stderr)
+
+        assert timings == [
+            ImportTiming("raxe.cli.exit_codes", 120, 120, 1),
+            ImportTiming("raxe.cli.main", 2000, 5000, 0),
+        ]
+        assert other == ["Warning: something else"]
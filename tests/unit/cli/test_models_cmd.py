@@ -355,3 +355,62 @@ class TestModelsStatus:
         assert result.exit_code == 0
         assert "0" in result.output  # 0/1 installed
         assert "no ml models" in result.output.lower() or "not installed" in result.output.lower()
+
+
+class TestModelsRescore:
+    """Tests for models rescore command."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Head output store with recorded scans, used by the command."""
+        import numpy as np
+
+        from raxe.domain.ml.rescore import HeadProbabilities
+        from raxe.infrastructure.ml.head_output_store import HeadOutputStore
+
+        store = HeadOutputStore(tmp_path / "head_outputs")
+        for i, threat in enumerate([0.05, 0.45, 0.97, 0.97]):
+            probabilities = HeadProbabilities(
+                binary=np.array([1.0 - threat, threat]),
+                family=np.eye(15)[10 if threat > 0.4 else 1],
+                severity=np.eye(3)[1 if threat > 0.4 else 0],
+                technique=np.eye(35)[0],
+                harm=np.zeros(10),
+            )
+            store.append("gemma-v1", f"prompt {min(i, 2)}", probabilities)
+        with patch("raxe.infrastructure.ml.head_output_store.HeadOutputStore", return_value=store):
+            yield store
+
+    def test_rescore_presets(self, runner, store):
+        """Test every preset is replayed and compared with the baseline."""
+        result = runner.invoke(models, ["rescore"])
+
+        assert result.exit_code == 0
+        assert "4 scans, gemma-v1" in result.output
+        assert "max_recall" in result.output
+        assert "+1 / -0" in result.output
+
+    def test_rescore_unique_with_scoring(self, runner, store):
+        """Test --unique deduplicates and --scoring-mode adds the action table."""
+        result = runner.invoke(
+            models,
+            ["rescore", "--preset", "low_fp", "--scoring-mode", "balanced", "--unique"],
+        )
+
+        assert result.exit_code == 0
+        assert "3 scans" in result.output
+        assert "Scoring Replay" in result.output
+        assert "high_recall" not in result.output
+
+    def test_rescore_without_records(self, runner, tmp_path):
+        """Test rescore explains how to enable recording."""
+        from raxe.infrastructure.ml.head_output_store import HeadOutputStore
+
+        with patch(
+            "raxe.infrastructure.ml.head_output_store.HeadOutputStore",
+            return_value=HeadOutputStore(tmp_path),
+        ):
+            result = runner.invoke(models, ["rescore"])
+
+        assert result.exit_code == 0
+        assert "RAXE_RECORD_HEAD_OUTPUTS" in result.output
@@ -37,6 +37,9 @@ def mock_user_stats():
     user_stats.detection_rate = 5.0
     user_stats.last_scan = datetime(2025, 6, 1, tzinfo=timezone.utc)
     user_stats.avg_scan_time_ms = 4.2
+    user_stats.p50_scan_time_ms = 3.1
+    user_stats.p95_scan_time_ms = 9.8
+    user_stats.p99_scan_time_ms = 14.5
     user_stats.l1_detections = 4
     user_stats.l2_detections = 1
     return user_stats
@@ -127,6 +130,7 @@ class TestStatsJsonFormat:
         assert data["user"]["installation_id"] == "abc123"
         assert data["user"]["total_scans"] == 100
         assert data["user"]["threats_detected"] == 5
+        assert data["user"]["p95_scan_time_ms"] == 9.8
 
 
 class TestStatsGlobal:
@@ -198,6 +202,53 @@ class TestStatsQuietMode:
             mock_logo.assert_not_called()
 
 
+class TestStatsRules:
+    """Tests for --rules (sampled rule profiling)."""
+
+    @pytest.fixture
+    def rule_costs(self):
+        from raxe.utils.profiler import RuleCost
+
+        return [
+            RuleCost(
+                "pi-042", samples=10, total_ms=12.5, max_ms=4.0, matches=2, worst_input_length=8000
+            ),
+            RuleCost(
+                "jb-001", samples=10, total_ms=1.5, max_ms=0.3, matches=0, worst_input_length=50
+            ),
+        ]
+
+    def test_stats_rules_table(self, runner, mock_analytics, rule_costs):
+        """Test --rules shows costliest rules."""
+        with patch("raxe.cli.stats.ScanHistoryDB") as mock_db_cls:
+            mock_db_cls.return_value.get_rule_costs.return_value = rule_costs
+            result = runner.invoke(stats, ["--rules", "--top", "2"], obj={})
+
+        assert result.exit_code == 0
+        assert "pi-042" in result.output
+        mock_db_cls.return_value.get_rule_costs.assert_called_once_with(limit=2)
+
+    def test_stats_rules_json(self, runner, mock_analytics, rule_costs):
+        """Test --rules JSON output."""
+        with patch("raxe.cli.stats.ScanHistoryDB") as mock_db_cls:
+            mock_db_cls.return_value.get_rule_costs.return_value = rule_costs
+            result = runner.invoke(stats, ["--rules", "--format", "json"], obj={})
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data[0]["rule_id"] == "pi-042"
+        assert data[0]["match_rate"] == pytest.approx(0.2)
+
+    def test_stats_rules_empty(self, runner, mock_analytics):
+        """Test --rules with no profiling data."""
+        with patch("raxe.cli.stats.ScanHistoryDB") as mock_db_cls:
+            mock_db_cls.return_value.get_rule_costs.return_value = []
+            result = runner.invoke(stats, ["--rules"], obj={})
+
+        assert result.exit_code == 0
+        assert "No rule profiling data" in result.output
+
+
 class TestStatsError:
     """Tests for error handling."""
 
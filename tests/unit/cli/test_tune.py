@@ -7,6 +7,8 @@ Tests cover:
 - Test file input
 """
 
+import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -80,6 +82,64 @@ class TestTuneThreshold:
 
         assert result.exit_code == 0
 
+    def test_tune_threshold_scans_once(self, runner, mock_raxe):
+        """Test each prompt is scanned once, without confidence filtering."""
+        result = runner.invoke(tune, ["threshold", "--step", "0.05"], obj={})
+
+        assert result.exit_code == 0
+        assert mock_raxe.scan.call_count == 15  # Default prompt set
+        assert {c.kwargs["confidence_threshold"] for c in mock_raxe.scan.call_args_list} == {0.0}
+
+    def test_tune_threshold_labeled_file(self, runner, mock_raxe, tmp_path):
+        """Test a labeled corpus reports metrics and writes curve points."""
+
+        def scan(prompt, **kwargs):
+            confidences = {"attack": [0.9], "subtle attack": [0.4], "benign": [0.6]}
+            detections = [SimpleNamespace(confidence=c) for c in confidences.get(prompt, [])]
+            return SimpleNamespace(
+                scan_result=SimpleNamespace(
+                    l1_result=SimpleNamespace(detections=detections), l2_result=None
+                )
+            )
+
+        mock_raxe.scan.side_effect = scan
+        test_file = tmp_path / "labeled.jsonl"
+        test_file.write_text(
+            "\n".join(
+                json.dumps({"prompt": p, "label": label})
+                for p, label in [
+                    ("attack", "threat"),
+                    ("subtle attack", 1),
+                    ("benign", "benign"),
+                    ("hello", False),
+                ]
+            )
+        )
+        curve_file = tmp_path / "curve.json"
+
+        result = runner.invoke(
+            tune,
+            ["threshold", "--test-file", str(test_file), "--curve-output", str(curve_file)],
+            obj={},
+        )
+
+        assert result.exit_code == 0
+        assert "F1" in result.output
+        assert "Recommended Threshold: 0.10" in result.output
+        curve = json.loads(curve_file.read_text())
+        assert curve["labeled"] is True
+        assert [p["recall"] for p in curve["curve"]] == [1.0, 0.5, 0.5, 0.0]
+
+    def test_tune_threshold_partially_labeled_file(self, runner, mock_raxe, tmp_path):
+        """Test a file where only some prompts are labeled is rejected."""
+        test_file = tmp_path / "mixed.jsonl"
+        test_file.write_text('{"prompt": "a", "label": 1}\nplain prompt\n')
+
+        result = runner.invoke(tune, ["threshold", "--test-file", str(test_file)], obj={})
+
+        assert result.exit_code != 0
+        assert not mock_raxe.scan.called
+
     def test_tune_threshold_raxe_init_failure(self, runner):
         """Test tune threshold when Raxe fails to initialize."""
         with patch("raxe.cli.tune.Raxe", side_effect=Exception("No config")):
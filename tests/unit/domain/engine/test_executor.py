@@ -251,6 +251,94 @@ class TestDetectionWithFlag:
             flagged.is_flagged = False  # type: ignore
 
 
+class TestLazyDetectionFields:
+    """Tests for rule-derived fields materialized on access."""
+
+    def _rule(self) -> Rule:
+        return Rule(
+            rule_id="pi-lazy",
+            version="1.2.0",
+            family=RuleFamily.PI,
+            sub_family="test",
+            name="Lazy Rule",
+            description="d" * 150,
+            severity=Severity.HIGH,
+            confidence=0.9,
+            patterns=[Pattern(pattern=r"ignore", flags=[], timeout=5.0)],
+            examples=RuleExamples(),
+            metrics=RuleMetrics(),
+            risk_explanation="risky",
+            remediation_advice="fix it",
+            docs_url="https://example.com/pi-lazy",
+        )
+
+    def test_executor_derives_fields_from_rule(self) -> None:
+        """Test message, category and explainability come from the rule."""
+        detection = RuleExecutor().execute_rule("ignore this", self._rule())
+
+        assert detection is not None
+        assert detection._message is None
+        assert detection.message == "Lazy Rule: " + "d" * 100
+        assert detection.category == "pi"
+        assert detection.risk_explanation == "risky"
+        assert detection.remediation_advice == "fix it"
+        assert detection.docs_url == "https://example.com/pi-lazy"
+
+    def test_detected_at_formatted_once(self) -> None:
+        """Test the timestamp string is produced on first access and kept."""
+        detection = RuleExecutor().execute_rule("ignore this", self._rule())
+
+        assert detection._detected_at is None
+        stamp = detection.detected_at
+        assert stamp.endswith("+00:00")
+        assert detection.detected_at is stamp
+        assert detection.to_dict()["detected_at"] == stamp
+
+    def test_explicit_values_win(self) -> None:
+        """Test explicitly passed fields override rule-derived ones."""
+        detection = Detection(
+            rule_id="pi-lazy",
+            rule_version="1.2.0",
+            severity=Severity.HIGH,
+            confidence=0.9,
+            matches=[Match(0, 0, 6, "ignore", (), "", "")],
+            detected_at="2025-01-01T00:00:00+00:00",
+            message="custom",
+            category="custom_category",
+            rule=self._rule(),
+        )
+
+        assert detection.message == "custom"
+        assert detection.category == "custom_category"
+        assert detection.detected_at == "2025-01-01T00:00:00+00:00"
+
+    def test_defaults_without_rule(self) -> None:
+        """Test fields fall back to dataclass-era defaults without a rule."""
+        detection = Detection(
+            rule_id="x",
+            rule_version="1",
+            severity=Severity.LOW,
+            confidence=0.5,
+            matches=[Match(0, 0, 1, "a", (), "", "")],
+            detected_at="now",
+        )
+
+        assert detection.category == "unknown"
+        assert detection.message == ""
+        assert detection.risk_explanation == ""
+        assert detection.docs_url == ""
+
+    def test_with_flag_keeps_lazy_fields(self) -> None:
+        """Test flagging preserves rule-derived fields."""
+        detection = RuleExecutor().execute_rule("ignore this", self._rule())
+        flagged = detection.with_flag("review")
+
+        assert flagged.message == detection.message
+        assert flagged.detected_at == detection.detected_at
+        assert flagged.is_flagged is True
+        assert not hasattr(flagged, "__dict__")
+
+
 class TestScanResult:
     """Tests for ScanResult value object."""
 
@@ -0,0 +1,58 @@
+"""ML Test Fixtures.
+
+Provides a tiny ONNX model writer so ONNX Runtime session handling can be
+tested without the real (downloaded) models or the ``onnx`` package.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def _field(number: int, payload: bytes | str | int) -> bytes:
+    """Encode one protobuf field (varint or length-delimited)."""
+
+    def varint(value: int) -> bytes:
+        out = b""
+        while True:
+            byte, value = value & 0x7F, value >> 7
+            if not value:
+                return out + bytes([byte])
+            out += bytes([byte | 0x80])
+
+    if isinstance(payload, int):
+        return varint(number << 3) + varint(payload)
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return varint((number << 3) | 2) + varint(len(payload)) + payload
+
+
+def _write_add_model(path: Path, weights: np.ndarray) -> None:
+    """Write a minimal ONNX model computing ``Y = X + W`` (W an initializer)."""
+    size = len(weights)
+    tensor_type = _field(1, _field(1, 1) + _field(2, _field(1, _field(1, size))))
+
+    def value_info(name: str) -> bytes:
+        return _field(1, name) + _field(2, tensor_type)
+
+    initializer = _field(1, size) + _field(2, 1) + _field(8, "W") + _field(9, weights.tobytes())
+    node = _field(1, "X") + _field(1, "W") + _field(2, "Y") + _field(4, "Add")
+    graph = (
+        _field(1, node)
+        + _field(2, "g")
+        + _field(5, initializer)
+        + _field(11, value_info("X"))
+        + _field(12, value_info("Y"))
+    )
+    model = _field(1, 8) + _field(8, _field(1, "") + _field(2, 17)) + _field(7, graph)
+    path.write_bytes(model)
+
+
+@pytest.fixture
+def write_onnx_add_model() -> Callable[[Path, np.ndarray], None]:
+    """Writer for float32 ``Y = X + W`` ONNX models (X and W of the same length)."""
+    return _write_add_model
@@ -0,0 +1,82 @@
+"""Tests for aborting Gemma L2 inference through a cancel token.
+
+Tests for:
+- Cancelling a token terminates the in-flight ONNX run via RunOptions
+- A token cancelled before analyze() skips inference entirely
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from raxe.domain.ml.gemma_detector import GemmaL2Detector
+from raxe.domain.ml.protocol import L2CancelledError, L2CancelToken
+
+
+class _BlockingSession:
+    """ONNX session stand-in that runs until its RunOptions are terminated."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.run_options = None
+
+    def run(self, output_names, inputs, run_options=None):
+        self.run_options = run_options
+        self.started.set()
+        deadline = time.monotonic() + 5
+        while not run_options.terminate and time.monotonic() < deadline:
+            time.sleep(0.001)
+        # onnxruntime fails the run like this once terminate is set
+        raise RuntimeError("Exiting due to terminate flag being set to true.")
+
+
+@pytest.fixture
+def detector():
+    """Detector whose embedding model blocks until terminated."""
+    detector = GemmaL2Detector.__new__(GemmaL2Detector)
+    detector._tokenizer = Mock(encode=Mock(return_value=Mock(ids=[2, 10, 11])))
+    detector._pad_token_id = 0
+    detector._cache_enabled = False
+    detector._embedding_cache = None
+    detector._embedding_session = _BlockingSession()
+    detector._model_version = "gemma-v1"
+    return detector
+
+
+class TestGemmaCancellation:
+    """Test cancelling Gemma inference."""
+
+    def test_cancel_terminates_in_flight_run(self, detector):
+        """Cancelling mid-run should set terminate and raise L2CancelledError."""
+        token = L2CancelToken()
+        errors = []
+
+        def analyze():
+            try:
+                detector.analyze("hello", Mock(detection_count=0), cancel_token=token)
+            except L2CancelledError as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=analyze)
+        worker.start()
+        assert detector._embedding_session.started.wait(5)
+
+        token.cancel()
+        worker.join(5)
+
+        assert not worker.is_alive()
+        assert detector._embedding_session.run_options.terminate
+        assert len(errors) == 1
+
+    def test_cancelled_token_skips_inference(self, detector):
+        """A token cancelled before the call should not start inference."""
+        token = L2CancelToken()
+        token.cancel()
+
+        with pytest.raises(L2CancelledError):
+            detector.analyze("hello", Mock(detection_count=0), cancel_token=token)
+
+        detector._tokenizer.encode.assert_not_called()
+        assert not detector._embedding_session.started.is_set()
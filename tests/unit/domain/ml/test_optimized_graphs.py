@@ -0,0 +1,156 @@
+"""Tests for the persistent ORT-optimized graph cache."""
+
+import numpy as np
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+
+from raxe.domain.ml.optimized_graphs import (  # noqa: E402
+    OPTIMIZED_SUFFIX,
+    OptimizedGraphCache,
+    SessionLoadRecord,
+    SessionLoadStats,
+    cpu_features_key,
+    create_sessions,
+)
+from raxe.domain.ml.shared_models import clear_shared_models, preload_shared_models  # noqa: E402
+
+PROVIDERS = ["CPUExecutionProvider"]
+
+
+def _make_options():
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return sess_options
+
+
+def _run(session) -> np.ndarray:
+    return session.run(None, {"X": np.ones(8, dtype=np.float32)})[0]
+
+
+@pytest.fixture
+def models(tmp_path, write_onnx_add_model):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    paths = {}
+    for i, name in enumerate(["embedding", "is_threat", "severity"]):
+        paths[name] = model_dir / f"{name}.onnx"
+        write_onnx_add_model(paths[name], np.full(8, i, dtype=np.float32))
+    return paths
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return OptimizedGraphCache(tmp_path / "optimized", ort.__version__)
+
+
+class TestOptimizedGraphCache:
+    def test_first_load_writes_graph_and_second_load_uses_it(self, models, cache):
+        path = models["embedding"]
+
+        session, record = cache.create_session(ort, "embedding", path, _make_options, PROVIDERS)
+        assert record.source == "optimized_now"
+        assert cache.graph_path(path).exists()
+
+        cached, cached_record = cache.create_session(
+            ort, "embedding", path, _make_options, PROVIDERS
+        )
+        assert cached_record.source == "optimized_cache"
+        assert cached_record.optimize_ms == pytest.approx(record.load_ms)
+        np.testing.assert_array_equal(_run(cached), _run(session))
+
+    def test_graph_key_changes_with_model_content(self, models, cache, write_onnx_add_model):
+        path = models["embedding"]
+        before = cache.graph_path(path)
+
+        write_onnx_add_model(path, np.full(8, 42, dtype=np.float32))
+
+        assert cache.graph_path(path) != before
+
+    def test_graph_key_includes_runtime_version_and_cpu(self, models, tmp_path):
+        path = models["embedding"]
+        current = OptimizedGraphCache(tmp_path, "1.20.0").graph_path(path)
+        upgraded = OptimizedGraphCache(tmp_path, "1.21.0").graph_path(path)
+
+        assert current != upgraded
+        assert cpu_features_key() in current.name
+        assert current.name.endswith(OPTIMIZED_SUFFIX)
+
+    def test_checksum_is_memoized(self, models, cache, monkeypatch):
+        path = models["embedding"]
+        checksum = cache.model_checksum(path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("model was re-hashed")
+
+        monkeypatch.setattr("raxe.domain.ml.optimized_graphs.hashlib.sha256", fail)
+        assert cache.model_checksum(path) == checksum
+
+    def test_corrupt_graph_is_rebuilt(self, models, cache):
+        path = models["embedding"]
+        graph_path = cache.graph_path(path)
+        graph_path.write_bytes(b"corrupt")
+
+        session, record = cache.create_session(ort, "embedding", path, _make_options, PROVIDERS)
+
+        assert record.source == "optimized_now"
+        np.testing.assert_array_equal(_run(session), np.ones(8, dtype=np.float32))
+
+    def test_for_model_dir_uses_model_directory(self, models):
+        model_dir = models["embedding"].parent
+
+        cache = OptimizedGraphCache.for_model_dir(model_dir, ort.__version__)
+
+        assert cache.cache_dir.parent == model_dir
+
+
+class TestCreateSessions:
+    def test_builds_all_sessions_and_reports_cache_use(self, models, cache):
+        sessions, stats = create_sessions(ort, models, _make_options, PROVIDERS, cache=cache)
+
+        assert set(sessions) == set(models)
+        assert stats.cache_misses == len(models)
+        for i, name in enumerate(["embedding", "is_threat", "severity"]):
+            np.testing.assert_array_equal(_run(sessions[name]), np.full(8, i + 1.0))
+
+        _, warm_stats = create_sessions(ort, models, _make_options, PROVIDERS, cache=cache)
+        assert warm_stats.cache_hits == len(models)
+        assert warm_stats.to_dict()["cache_hits"] == len(models)
+
+    def test_without_cache_loads_directly(self, models):
+        sessions, stats = create_sessions(ort, models, _make_options, PROVIDERS, max_workers=1)
+
+        assert len(sessions) == len(models)
+        assert {r.source for r in stats.records} == {"direct"}
+
+    def test_shared_models_take_precedence(self, models, cache, tmp_path):
+        preload_shared_models(models["embedding"].parent, cache_dir=tmp_path / "ort")
+        try:
+            _, stats = create_sessions(ort, models, _make_options, PROVIDERS, cache=cache)
+        finally:
+            clear_shared_models()
+
+        assert {r.source for r in stats.records} == {"shared"}
+
+    def test_errors_propagate(self, models, cache):
+        models["broken"] = models["embedding"].with_name("broken.onnx")
+        models["broken"].write_bytes(b"not a model")
+
+        with pytest.raises(Exception, match=r"(?i)protobuf|invalid|load"):
+            create_sessions(ort, models, _make_options, PROVIDERS, cache=cache)
+
+
+class TestSessionLoadStats:
+    def test_saved_ms_counts_only_cache_hits(self):
+        stats = SessionLoadStats(
+            records=[
+                SessionLoadRecord("a", "optimized_cache", load_ms=10.0, optimize_ms=250.0),
+                SessionLoadRecord("b", "optimized_now", load_ms=300.0),
+                SessionLoadRecord("c", "optimized_cache", load_ms=50.0, optimize_ms=20.0),
+            ],
+            wall_ms=310.0,
+        )
+
+        assert stats.saved_ms == 240.0
+        assert stats.to_dict()["optimization_saved_ms"] == 240.0
+        assert stats.to_dict()["per_session"]["b"]["source"] == "optimized_now"
@@ -7,6 +7,8 @@ No I/O, no mocks needed - just pure function testing.
 import pytest
 
 from raxe.domain.ml.protocol import (
+    L2CancelledError,
+    L2CancelToken,
     L2Prediction,
     L2Result,
     L2ThreatType,
@@ -211,3 +213,30 @@ class TestL2ThreatType:
 
         # Unknown values should map to OTHER_SECURITY
         assert L2ThreatType.from_family("unknown_value") == L2ThreatType.OTHER_SECURITY
+
+
+class TestL2CancelToken:
+    """Test L2CancelToken cancellation handle."""
+
+    def test_cancel_runs_callbacks_once(self):
+        """Callbacks should run once, on cancel or at registration if late."""
+        token = L2CancelToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("early"))
+
+        token.cancel()
+        token.cancel()
+        token.on_cancel(lambda: calls.append("late"))
+
+        assert token.cancelled
+        assert calls == ["early", "late"]
+
+    def test_raise_if_cancelled(self):
+        """Should raise only after cancellation."""
+        token = L2CancelToken()
+        token.raise_if_cancelled()
+
+        token.cancel()
+
+        with pytest.raises(L2CancelledError):
+            token.raise_if_cancelled()
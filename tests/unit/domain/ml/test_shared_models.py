@@ -0,0 +1,100 @@
+"""Tests for pre-fork sharing of ONNX model weights."""
+
+import numpy as np
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+
+from raxe.domain.ml.shared_models import (  # noqa: E402
+    ORT_MODEL_SUFFIX,
+    clear_shared_models,
+    configure_shared_session_options,
+    create_session,
+    get_shared_model,
+    has_shared_models,
+    ort_model_path,
+    preload_shared_models,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_shared_models()
+    yield
+    clear_shared_models()
+
+
+@pytest.fixture
+def model_dir(tmp_path, write_onnx_add_model):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    write_onnx_add_model(model_dir / "model_int8.onnx", np.arange(8, dtype=np.float32))
+    return model_dir
+
+
+def _run(session) -> np.ndarray:
+    return session.run(None, {"X": np.ones(8, dtype=np.float32)})[0]
+
+
+class TestSharedModels:
+    def test_preload_registers_ort_format_bytes(self, model_dir, tmp_path):
+        cache_dir = tmp_path / "ort_cache"
+
+        total = preload_shared_models(model_dir, cache_dir=cache_dir)
+
+        model_bytes = get_shared_model(model_dir / "model_int8.onnx")
+        assert model_bytes is not None
+        assert total == len(model_bytes)
+        assert has_shared_models()
+        assert len(list(cache_dir.glob(f"*{ORT_MODEL_SUFFIX}"))) == 1
+
+    def test_session_from_shared_bytes_matches_file_session(self, model_dir, tmp_path):
+        model_path = model_dir / "model_int8.onnx"
+        providers = ["CPUExecutionProvider"]
+        from_file = create_session(ort, model_path, ort.SessionOptions(), providers)
+
+        preload_shared_models(model_dir, cache_dir=tmp_path / "ort_cache")
+        sess_options = ort.SessionOptions()
+        configure_shared_session_options(sess_options)
+        shared = create_session(ort, model_path, sess_options, providers)
+
+        np.testing.assert_array_equal(_run(shared), _run(from_file))
+        np.testing.assert_array_equal(_run(shared), np.arange(1, 9, dtype=np.float32))
+
+    def test_conversion_is_reused(self, model_dir, tmp_path):
+        cache_dir = tmp_path / "ort_cache"
+        preload_shared_models(model_dir, cache_dir=cache_dir)
+        converted = next(cache_dir.glob(f"*{ORT_MODEL_SUFFIX}"))
+        mtime = converted.stat().st_mtime_ns
+
+        clear_shared_models()
+        preload_shared_models(model_dir, cache_dir=cache_dir)
+
+        assert converted.stat().st_mtime_ns == mtime
+
+    def test_ort_model_path_tracks_source_and_runtime(
+        self, model_dir, tmp_path, write_onnx_add_model
+    ):
+        model_path = model_dir / "model_int8.onnx"
+
+        before = ort_model_path(model_path, tmp_path, "1.20.0")
+        assert ort_model_path(model_path, tmp_path, "1.21.0") != before
+
+        write_onnx_add_model(model_path, np.arange(16, dtype=np.float32))
+        assert ort_model_path(model_path, tmp_path, "1.20.0") != before
+
+    def test_invalid_model_is_skipped(self, model_dir, tmp_path):
+        (model_dir / "broken.onnx").write_bytes(b"not an onnx model")
+
+        preload_shared_models(model_dir, cache_dir=tmp_path / "ort_cache")
+
+        assert get_shared_model(model_dir / "broken.onnx") is None
+        assert get_shared_model(model_dir / "model_int8.onnx") is not None
+
+    def test_unregistered_model_loads_from_path(self, model_dir):
+        session = create_session(
+            ort, model_dir / "model_int8.onnx", ort.SessionOptions(), ["CPUExecutionProvider"]
+        )
+
+        assert not has_shared_models()
+        np.testing.assert_array_equal(_run(session), np.arange(1, 9, dtype=np.float32))
@@ -0,0 +1,136 @@
+"""
+Unit tests for the offline threshold sweep.
+
+Tests the pure domain logic of single-pass threshold tuning:
+- Sweep counts match rescanning at every threshold
+- Confusion counts and metrics for labeled corpora
+- Curve thresholds and voting preset re-votes
+"""
+
+import numpy as np
+import pytest
+
+from raxe.domain.ml.threshold_sweep import (
+    ScoreCapture,
+    ScoreMatrix,
+    curve_thresholds,
+    revote,
+    sweep,
+)
+from raxe.domain.ml.voting.binary_first_engine import BINARY_FIRST_PRESETS
+from raxe.domain.ml.voting.engine import HeadOutputs
+
+CAPTURES = [
+    ScoreCapture(l1_confidences=(0.9, 0.3)),
+    ScoreCapture(l1_confidences=(0.5,)),
+    ScoreCapture(l1_confidences=(0.2,), l2_predictions=1),
+    ScoreCapture(),
+    ScoreCapture(l1_confidences=(0.5, 0.5, 0.7)),
+]
+LABELS = [True, True, True, False, False]
+
+
+def _heads(threat_prob: float) -> HeadOutputs:
+    """Head outputs where only the binary head carries signal."""
+    return HeadOutputs(
+        binary_threat_prob=threat_prob,
+        binary_safe_prob=1.0 - threat_prob,
+        family_prediction="prompt_injection",
+        family_confidence=0.5,
+        severity_prediction="medium",
+        severity_confidence=0.5,
+        technique_prediction=None,
+        technique_confidence=0.0,
+        harm_max_probability=0.0,
+        harm_active_labels=[],
+    )
+
+
+def _rescan(captures, threshold):
+    """Reference: filter each capture like the scan pipeline would."""
+    detections = flagged = 0
+    for capture in captures:
+        kept = sum(c >= threshold for c in capture.l1_confidences) + capture.l2_predictions
+        detections += kept
+        flagged += kept > 0
+    return detections, flagged
+
+
+class TestSweep:
+    """Test threshold sweeps over captured scores."""
+
+    def test_matches_rescan(self):
+        """Sweep counts should equal filtering every capture at each threshold."""
+        thresholds = np.round(np.arange(0.0, 1.01, 0.05), 6)
+
+        result = sweep(ScoreMatrix.from_captures(CAPTURES), thresholds)
+
+        for i, threshold in enumerate(thresholds):
+            assert (result.detections[i], result.flagged[i]) == _rescan(CAPTURES, threshold)
+        assert not result.labeled
+
+    def test_labeled_metrics(self):
+        """Confusion counts and metrics should follow the labels."""
+        matrix = ScoreMatrix.from_captures(CAPTURES, labels=LABELS)
+
+        result = sweep(matrix, [0.5, 0.8])
+
+        assert result.tp.tolist() == [3, 2]
+        assert result.fp.tolist() == [1, 0]
+        assert result.fn.tolist() == [0, 1]
+        assert result.tn.tolist() == [1, 2]
+        assert result.precision == pytest.approx([0.75, 1.0])
+        assert result.recall == pytest.approx([1.0, 2 / 3])
+        assert result.fpr == pytest.approx([0.5, 0.0])
+        assert result.f1 == pytest.approx([6 / 7, 0.8])
+
+    def test_precision_when_nothing_flagged(self):
+        """Precision should be 1.0 when no prompt is flagged."""
+        matrix = ScoreMatrix.from_captures([ScoreCapture()], labels=[True])
+
+        result = sweep(matrix, [0.5])
+
+        assert result.precision.tolist() == [1.0]
+        assert result.f1.tolist() == [0.0]
+
+    def test_label_length_mismatch(self):
+        """Labels must align with captures."""
+        with pytest.raises(ValueError, match="labels"):
+            ScoreMatrix.from_captures(CAPTURES, labels=[True])
+
+
+class TestCurve:
+    """Test ROC/PR curve points."""
+
+    def test_curve_covers_every_operating_point(self):
+        """Curve thresholds should run from all L1 prompts down to L2 only."""
+        matrix = ScoreMatrix.from_captures(CAPTURES, labels=LABELS)
+
+        thresholds = curve_thresholds(matrix)
+        points = sweep(matrix, thresholds).points()
+
+        assert thresholds.tolist() == [0.5, 0.7, 0.9, np.inf]
+        assert [p["flagged"] for p in points] == [4, 3, 2, 1]
+        assert points[-1]["threshold"] is None
+        assert points[0]["recall"] == 1.0
+
+
+class TestRevote:
+    """Test re-voting captured head outputs with presets."""
+
+    def test_revote_with_presets(self):
+        """A lower high-threat threshold should flag more borderline prompts."""
+        captures = [
+            ScoreCapture(l2_predictions=1, head_outputs=_heads(0.95)),
+            ScoreCapture(head_outputs=_heads(0.45)),
+            ScoreCapture(head_outputs=_heads(0.1)),
+            ScoreCapture(l2_predictions=2),
+        ]
+        matrix = ScoreMatrix.from_captures(captures)
+
+        balanced = revote(matrix, BINARY_FIRST_PRESETS["balanced"])
+        max_recall = revote(matrix, BINARY_FIRST_PRESETS["max_recall"])
+
+        assert balanced.tolist() == [True, False, False, True]
+        assert max_recall.tolist() == [True, True, False, True]
+        assert sweep(matrix, [0.5], max_recall).detections.tolist() == [4]
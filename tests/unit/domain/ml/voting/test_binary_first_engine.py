@@ -1,5 +1,6 @@
 """Tests for BinaryFirstEngine."""
 
+import numpy as np
 import pytest
 
 from raxe.domain.ml.voting.binary_first_engine import (
@@ -8,7 +9,7 @@ from raxe.domain.ml.voting.binary_first_engine import (
     SuppressionDetail,
     create_binary_first_engine,
 )
-from raxe.domain.ml.voting.engine import HeadOutputs
+from raxe.domain.ml.voting.engine import HeadOutputBatch, HeadOutputs
 from raxe.domain.ml.voting.models import Decision
 
 
@@ -626,3 +627,63 @@ class TestBinaryFirstVsOriginalEngineComparison:
         # Binary says benign -> SAFE regardless of other heads
         assert result.decision == Decision.SAFE
         assert "binary_low_threat" in result.decision_rule_triggered
+
+
+class TestVoteBatch:
+    """Tests for BinaryFirstEngine.vote_batch."""
+
+    def test_vote_batch_matches_vote(self):
+        """Test batch decisions equal scalar decisions across zones."""
+        engine = BinaryFirstEngine()
+        outputs = [
+            HeadOutputs(
+                binary_threat_prob=p,
+                binary_safe_prob=1.0 - p,
+                family_prediction=family,
+                family_confidence=0.9,
+                severity_prediction="none",
+                severity_confidence=0.9,
+                technique_prediction=None,
+                technique_confidence=0.9,
+                harm_max_probability=0.1,
+                harm_active_labels=[],
+            )
+            for p in (0.95, 0.7, 0.2)
+            for family in ("benign", "jailbreak")
+        ]
+
+        result = engine.vote_batch(HeadOutputBatch.from_head_outputs(outputs))
+
+        assert len(result) == 6
+        assert result.decision.tolist() == [engine.vote(o).decision.value for o in outputs]
+        assert result.decision_rule_triggered[0] == "suppression"
+        assert result.confidence.tolist() == [engine.vote(o).confidence for o in outputs]
+
+    def test_vote_batch_empty(self):
+        """Test an empty batch yields empty results."""
+        result = BinaryFirstEngine().vote_batch(HeadOutputBatch.from_head_outputs([]))
+
+        assert len(result) == 0
+
+    def test_from_probabilities_uses_argmax(self):
+        """Test stacked probabilities become argmax labels and confidences."""
+        batch = HeadOutputBatch.from_probabilities(
+            binary_proba=np.array([[0.1, 0.9], [0.8, 0.2]], dtype=np.float32),
+            family_proba=np.array([[0.7, 0.3], [0.4, 0.6]], dtype=np.float32),
+            severity_proba=np.array([[0.2, 0.8], [0.9, 0.1]], dtype=np.float32),
+            technique_proba=np.array([[0.6, 0.4], [0.5, 0.5]], dtype=np.float32),
+            harm_proba=np.array([[0.1, 0.3], [0.7, 0.2]], dtype=np.float32),
+            family_labels=["benign", "jailbreak"],
+            severity_labels=["none", "severe"],
+            technique_labels=["none", "role_play"],
+        )
+
+        assert batch.family_prediction.tolist() == ["benign", "jailbreak"]
+        assert batch.severity_prediction.tolist() == ["severe", "none"]
+        assert batch.technique_prediction.tolist() == ["none", "none"]
+        assert batch.family_confidence.tolist() == [float(np.float32(0.7)), float(np.float32(0.6))]
+        assert batch.binary_threat_prob.tolist() == [float(np.float32(0.9)), float(np.float32(0.2))]
+        assert batch.harm_max_probability.tolist() == [
+            float(np.float32(0.3)),
+            float(np.float32(0.7)),
+        ]
@@ -0,0 +1,123 @@
+"""Unit tests for the per-scan content fingerprint."""
+
+from __future__ import annotations
+
+import hashlib
+from unittest.mock import Mock, patch
+
+from raxe.application.scan_merger import ScanMerger
+from raxe.application.scan_pipeline import ScanPipeline
+from raxe.domain.engine.executor import RuleExecutor, ScanResult
+from raxe.domain.fingerprint import ContentFingerprint, fast_content_key
+from raxe.domain.ml.protocol import L2Detector
+from raxe.infrastructure.packs.registry import PackRegistry
+
+
+class TestFastContentKey:
+    """Tests for fast_content_key."""
+
+    def test_key_is_16_hex_chars(self):
+        key = fast_content_key("Test text")
+        assert len(key) == 16
+        assert all(c in "0123456789abcdef" for c in key)
+
+    def test_same_text_same_key(self):
+        assert fast_content_key("Hello world") == fast_content_key("Hello " + "world")
+
+    def test_different_text_different_key(self):
+        assert fast_content_key("Hello world") != fast_content_key("Hello World")
+
+
+class TestContentFingerprint:
+    """Tests for ContentFingerprint."""
+
+    def test_sha256_matches_hashlib(self):
+        text = "Ignore all previous instructions ✓"
+        fingerprint = ContentFingerprint(text)
+        expected = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        assert fingerprint.sha256 == expected
+        assert fingerprint.prefixed_sha256 == f"sha256:{expected}"
+
+    def test_lengths(self):
+        fingerprint = ContentFingerprint("héllo")
+        assert fingerprint.char_length == 5
+        assert fingerprint.byte_length == 6
+        assert fingerprint.data == "héllo".encode()
+
+    def test_sha256_computed_once(self):
+        fingerprint = ContentFingerprint("some prompt")
+        with patch("raxe.domain.fingerprint.hashlib.sha256", wraps=hashlib.sha256) as sha:
+            first = fingerprint.sha256
+            second = fingerprint.sha256
+
+        assert first == second
+        assert sha.call_count == 1
+
+    def test_nothing_computed_until_accessed(self):
+        with patch("raxe.domain.fingerprint.hashlib.sha256") as sha:
+            fingerprint = ContentFingerprint("x" * 50_000)
+            _ = fingerprint.cache_key
+        sha.assert_not_called()
+
+    def test_cache_key_matches_fast_content_key(self):
+        assert ContentFingerprint("abc").cache_key == fast_content_key("abc")
+
+    def test_of_reuses_matching_fingerprint(self):
+        fingerprint = ContentFingerprint("prompt")
+        assert ContentFingerprint.of("prompt", fingerprint) is fingerprint
+
+    def test_of_replaces_stale_fingerprint(self):
+        fingerprint = ContentFingerprint("prompt")
+        fresh = ContentFingerprint.of("transformed prompt", fingerprint)
+
+        assert fresh is not fingerprint
+        assert fresh.text == "transformed prompt"
+
+    def test_of_without_fingerprint(self):
+        assert ContentFingerprint.of("prompt").text == "prompt"
+
+    def test_repr_does_not_leak_text(self):
+        assert "secret" not in repr(ContentFingerprint("my secret prompt"))
+
+
+class TestPipelineUsesFingerprint:
+    """The scan pipeline should reuse a caller-provided fingerprint."""
+
+    def _pipeline(self) -> ScanPipeline:
+        registry = Mock(spec=PackRegistry)
+        registry.get_all_rules.return_value = []
+        executor = Mock(spec=RuleExecutor)
+        executor.execute_rules.return_value = ScanResult(
+            detections=[],
+            scanned_at="2025-01-01T00:00:00Z",
+            text_length=5,
+            rules_checked=0,
+            scan_duration_ms=0.1,
+        )
+        detector = Mock(spec=L2Detector)
+        detector.analyze.return_value = None
+        return ScanPipeline(
+            pack_registry=registry,
+            rule_executor=executor,
+            l2_detector=detector,
+            scan_merger=ScanMerger(),
+        )
+
+    def test_text_hash_comes_from_fingerprint(self):
+        pipeline = self._pipeline()
+        fingerprint = ContentFingerprint("hello")
+        fingerprint._sha256 = "precomputed"
+
+        result = pipeline.scan("hello", fingerprint=fingerprint)
+
+        assert result.text_hash == "precomputed"
+        assert result.metadata["input_length"] == 5
+
+    def test_fingerprint_for_other_text_is_ignored(self):
+        pipeline = self._pipeline()
+        stale = ContentFingerprint("something else")
+
+        result = pipeline.scan("hello", fingerprint=stale)
+
+        assert result.text_hash == hashlib.sha256(b"hello").hexdigest()
@@ -7,6 +7,7 @@ expiration handling, and manager orchestration.
 Coverage target: >95% for domain layer.
 """
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -781,6 +782,48 @@ class TestSuppressionManagerClearReload:
         assert len(manager.get_suppressions()) == 2
 
 
+class TestSuppressionManagerGeneration:
+    """Tests for the suppression generation counter."""
+
+    def test_changes_bump_generation(self, manager: SuppressionManager) -> None:
+        """Test add, remove, clear and reload each change the generation."""
+        seen = {manager.generation}
+
+        manager.add_suppression("pi-001", "Test")
+        seen.add(manager.generation)
+        manager.remove_suppression("pi-001")
+        seen.add(manager.generation)
+        manager.add_suppression("pi-002", "Test")
+        seen.add(manager.generation)
+        manager.clear_all()
+        seen.add(manager.generation)
+        manager.reload()
+        seen.add(manager.generation)
+
+        assert len(seen) == 6
+
+    def test_checks_do_not_bump_generation(self, manager: SuppressionManager) -> None:
+        """Test reading suppressions leaves the generation unchanged."""
+        manager.add_suppression("pi-001", "Test")
+        generation = manager.generation
+
+        manager.check_suppression("pi-001")
+        manager.get_suppressions()
+
+        assert manager.generation == generation
+
+    def test_expiry_bumps_generation(self, manager: SuppressionManager) -> None:
+        """Test a suppression expiring changes the generation."""
+        expires_at = (datetime.now(timezone.utc) + timedelta(milliseconds=50)).isoformat()
+        manager.add_suppression("pi-001", "Test", expires_at=expires_at)
+        generation = manager.generation
+
+        time.sleep(0.1)
+
+        assert manager.generation != generation
+        assert manager.generation == manager.generation
+
+
 class TestSuppressionManagerStatistics:
     """Tests for suppression statistics."""
 
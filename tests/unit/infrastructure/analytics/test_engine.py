@@ -253,6 +253,14 @@ class TestAnalyticsEngine:
         assert report["overview"]["threats_detected"] > 0
 
         assert report["performance"]["avg_total_latency_ms"] > 0
+        performance = report["performance"]
+        assert (
+            0
+            < performance["p50_total_latency_ms"]
+            <= performance["p95_total_latency_ms"]
+            <= performance["p99_total_latency_ms"]
+        )
+        assert performance["p99_total_latency_ms"] == pytest.approx(15.0, rel=0.05)
 
     def test_l1_l2_detection_tracking(self, analytics_engine, sample_events):
         """Test L1 vs L2 detection tracking."""
@@ -1,6 +1,8 @@
 """Tests for scan history database."""
 
-from datetime import datetime, timezone
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -10,9 +12,11 @@ from raxe.domain.engine.matcher import Match
 from raxe.domain.rules.models import Severity
 from raxe.infrastructure.database.scan_history import (
     DetectionRecord,
+    PendingScan,
     ScanHistoryDB,
     ScanRecord,
 )
+from raxe.utils.profiler import RuleCost
 
 
 class TestScanHistoryDB:
@@ -261,6 +265,77 @@ class TestScanHistoryDB:
         assert detections[0].rule_id in ("PI-001", "PI-002")
         assert detections[0].scan_id == scan_id
 
+    def test_get_detections_for_scans(self, db: ScanHistoryDB, sample_detections: list[Detection]):
+        """Test batched detection lookup matches per-scan lookup."""
+        first = db.record_scan("first", sample_detections)
+        clean = db.record_scan("clean", [])
+        second = db.record_scan("second", sample_detections[:1])
+
+        by_scan = db.get_detections_for_scans([first, clean, second, first])
+
+        assert set(by_scan) == {first, second}
+        assert by_scan[first] == db.get_detections(first)
+        assert [d.rule_id for d in by_scan[second]] == ["PI-001"]
+        assert db.get_detections_for_scans([]) == {}
+
+    def test_get_detections_for_scans_chunks_large_batches(
+        self, db: ScanHistoryDB, sample_detections: list[Detection]
+    ):
+        """Test batches larger than one IN list are split."""
+        db.IN_QUERY_CHUNK_SIZE = 2
+        scan_ids = [db.record_scan(f"scan {i}", sample_detections[:1]) for i in range(5)]
+
+        by_scan = db.get_detections_for_scans(scan_ids)
+
+        assert sorted(by_scan) == scan_ids
+
+    def test_list_scans_after(self, db: ScanHistoryDB, sample_detections: list[Detection]):
+        """Test listing scans newer than a known ID."""
+        assert db.get_latest_scan_id() is None
+        first = db.record_scan("first", [])
+        second = db.record_scan("second", sample_detections)
+        third = db.record_scan("third", [])
+
+        assert db.get_latest_scan_id() == third
+        assert [s.id for s in db.list_scans_after(first)] == [second, third]
+        assert [s.id for s in db.list_scans_after(0, limit=1)] == [first]
+        assert [s.id for s in db.list_scans_after(0, threats_only=True)] == [second]
+        assert db.list_scans_after(third) == []
+
+    def test_iter_scan_pages(self, db: ScanHistoryDB, sample_detections: list[Detection]):
+        """Test paged export returns every scan once, oldest first, with detections."""
+        scan_ids = [
+            db.record_scan(f"scan {i}", sample_detections if i % 2 else []) for i in range(7)
+        ]
+
+        pages = list(db.iter_scan_pages(page_size=3))
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [scan.id for page in pages for scan, _ in page] == scan_ids
+        scan, detections = pages[0][1]
+        assert detections == db.get_detections(scan.id)
+        assert len(detections) == 2
+        assert pages[0][0][1] == []
+
+    def test_iter_scan_pages_time_range(self, db: ScanHistoryDB):
+        """Test since/until select scans on the timestamp column."""
+        now = datetime.now(timezone.utc)
+        scan_ids = [db.record_scan(f"scan {i}", []) for i in range(5)]
+        with db._get_connection() as conn:
+            for days_ago, scan_id in zip([40, 20, 10, 5, 1], scan_ids, strict=True):
+                conn.execute(
+                    "UPDATE scans SET timestamp = ? WHERE id = ?",
+                    (int((now - timedelta(days=days_ago)).timestamp()), scan_id),
+                )
+
+        since, until = now - timedelta(days=30), now - timedelta(days=3)
+        pages = list(db.iter_scan_pages(since=since, until=until, page_size=1))
+
+        assert [scan.id for page in pages for scan, _ in page] == scan_ids[1:4]
+        assert db.count_scans(since=since, until=until) == 3
+        assert db.count_scans() == 5
+        assert list(db.iter_scan_pages(since=now)) == []
+
     def test_get_statistics(self, db: ScanHistoryDB, sample_detections: list[Detection]):
         """Test getting scan statistics."""
         # Record mix of clean and threat scans
@@ -287,6 +362,93 @@ class TestScanHistoryDB:
 
         assert count >= 0
 
+    def test_cleanup_old_scans_in_chunks(
+        self, db: ScanHistoryDB, sample_detections: list[Detection]
+    ):
+        """Test old scans and their detections are deleted chunk by chunk."""
+        old = datetime.now(timezone.utc) - timedelta(days=120)
+        db.record_scans(
+            [PendingScan(f"old {i}", sample_detections, timestamp=old) for i in range(25)]
+        )
+        recent_id = db.record_scan("recent", sample_detections)
+
+        count = db.cleanup_old_scans(retention_days=90, chunk_size=10)
+
+        assert count == 25
+        assert [s.id for s in db.list_scans()] == [recent_id]
+        with db._get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM detections").fetchone()[0] == 2
+
+    def test_connection_is_persistent_and_tuned(self, db: ScanHistoryDB):
+        """Test one WAL connection with synchronous=NORMAL is reused."""
+        with db._get_connection() as first:
+            assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert first.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+        db.record_scan("test", [])
+        with db._get_connection() as second:
+            assert second is first
+
+        db.close()
+        with db._get_connection() as reopened:
+            assert reopened is not first
+        assert db.get_statistics()["total_scans"] == 1
+
+    def test_deleted_database_is_recreated(self, db: ScanHistoryDB):
+        """Test the connection follows the database file when it is replaced."""
+        db.record_scan("before", [])
+        for path in db.db_path.parent.glob(db.db_path.name + "*"):
+            path.unlink()
+
+        scan_id = db.record_scan("after", [])
+
+        assert db.db_path.exists()
+        assert [s.id for s in db.list_scans()] == [scan_id]
+
+    def test_record_scans_batch(self, db: ScanHistoryDB, sample_detections: list[Detection]):
+        """Test a batch of scans is written with ordered IDs."""
+        ids = db.record_scans(
+            [
+                PendingScan("first", sample_detections, event_id="evt_1"),
+                PendingScan("second", [], store_prompt=False),
+                PendingScan("third", sample_detections[:1], prompt_hash="a" * 64),
+            ]
+        )
+
+        assert len(ids) == 3
+        assert db.get_by_event_id("evt_1").id == ids[0]
+        assert db.get_scan(ids[1]).threats_found == 0
+        assert db.get_scan(ids[1]).prompt_text is None
+        assert db.get_scan(ids[2]).prompt_hash == "a" * 64
+        assert db.get_scan(ids[2]).highest_severity == "high"
+        assert len(db.get_detections(ids[0])) == 2
+        assert len(db.get_detections(ids[2])) == 1
+        assert db.record_scans([]) == []
+
+    def test_record_scans_is_atomic(self, db: ScanHistoryDB):
+        """Test a failing batch leaves no partial rows."""
+        db.record_scan("existing", [], event_id="evt_dup")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.record_scans([PendingScan("new"), PendingScan("dup", event_id="evt_dup")])
+
+        assert db.get_statistics()["total_scans"] == 1
+
+    def test_concurrent_record_scan(self, db: ScanHistoryDB):
+        """Test threads share the connection safely."""
+
+        def write(n: int) -> None:
+            for i in range(20):
+                db.record_scan(f"thread {n} scan {i}", [])
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert db.get_statistics()["total_scans"] == 80
+
     def test_export_to_json(self, db: ScanHistoryDB, sample_detections: list[Detection]):
         """Test exporting scan to JSON."""
         scan_id = db.record_scan("test", sample_detections)
@@ -332,6 +494,326 @@ class TestScanHistoryDB:
         export = db.export_to_json(scan_id_no_prompt)
         assert prompt not in str(export)
 
+    def test_record_rule_costs_accumulates(self, db: ScanHistoryDB):
+        """Test sampled rule cost deltas are summed per rule."""
+        db.record_rule_costs(
+            [
+                RuleCost(
+                    "pi-001", samples=2, total_ms=4.0, max_ms=3.0, matches=1, worst_input_length=100
+                ),
+                RuleCost(
+                    "jb-001", samples=2, total_ms=1.0, max_ms=0.6, matches=0, worst_input_length=20
+                ),
+            ]
+        )
+        db.record_rule_costs(
+            [
+                RuleCost(
+                    "pi-001",
+                    samples=1,
+                    total_ms=5.0,
+                    max_ms=5.0,
+                    matches=1,
+                    worst_input_length=9000,
+                )
+            ]
+        )
+
+        costs = db.get_rule_costs(limit=10)
+
+        assert [c.rule_id for c in costs] == ["pi-001", "jb-001"]
+        assert costs[0].samples == 3
+        assert costs[0].total_ms == pytest.approx(9.0)
+        assert costs[0].max_ms == 5.0
+        assert costs[0].worst_input_length == 9000
+        assert costs[0].match_rate == pytest.approx(2 / 3)
+
+    def test_get_rule_costs_limit(self, db: ScanHistoryDB):
+        """Test rule cost listing honours the limit."""
+        db.record_rule_costs(
+            [RuleCost(f"rule-{i}", samples=1, total_ms=float(i)) for i in range(5)]
+        )
+
+        costs = db.get_rule_costs(limit=2)
+
+        assert [c.rule_id for c in costs] == ["rule-4", "rule-3"]
+
+
+class TestScanHistoryRollups:
+    """Test rollup tables maintained at insert time."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path) -> ScanHistoryDB:
+        """Create test database."""
+        return ScanHistoryDB(tmp_path / "rollups.db")
+
+    @staticmethod
+    def _detection(rule_id: str, severity: Severity, layer: str = "L1") -> Detection:
+        return Detection(
+            rule_id=rule_id,
+            rule_version="1.0.0",
+            severity=severity,
+            confidence=0.9,
+            matches=[
+                Match(
+                    pattern_index=0,
+                    start=0,
+                    end=4,
+                    matched_text="test",
+                    groups=(),
+                    context_before="",
+                    context_after="",
+                )
+            ],
+            detected_at=datetime.now(timezone.utc).isoformat(),
+            detection_layer=layer,
+        )
+
+    def _record_mixed_history(self, db: ScanHistoryDB) -> None:
+        now = datetime.now(timezone.utc)
+        db.record_scans(
+            [
+                PendingScan(
+                    "recent threat",
+                    [
+                        self._detection("pi-001", Severity.HIGH),
+                        self._detection("l2-threat", Severity.MEDIUM, layer="L2"),
+                    ],
+                    l1_duration_ms=2.0,
+                    l2_duration_ms=40.0,
+                    total_duration_ms=42.0,
+                    timestamp=now - timedelta(hours=2),
+                ),
+                PendingScan("recent clean", total_duration_ms=8.0, timestamp=now),
+                PendingScan(
+                    "last week",
+                    [self._detection("pi-001", Severity.CRITICAL)],
+                    total_duration_ms=10.0,
+                    timestamp=now - timedelta(days=6, hours=5),
+                ),
+                PendingScan(
+                    "last quarter",
+                    [self._detection("jb-001", Severity.LOW)],
+                    timestamp=now - timedelta(days=80),
+                ),
+            ]
+        )
+
+    def test_statistics_read_from_rollups(self, db: ScanHistoryDB):
+        """Test statistics windows are served from the rollups."""
+        self._record_mixed_history(db)
+
+        week = db.get_statistics(days=7)
+        assert week["total_scans"] == 3
+        assert week["scans_with_threats"] == 2
+        assert week["total_detections"] == 3
+        assert week["l1_detections"] == 2
+        assert week["l2_detections"] == 1
+        assert week["severity_counts"] == {"high": 1, "critical": 1}
+        assert week["avg_total_duration_ms"] == pytest.approx(20.0)
+        assert week["avg_l2_duration_ms"] == pytest.approx(40.0)
+
+        assert db.get_statistics(days=1)["total_scans"] == 2
+        assert db.get_statistics(days=90)["total_scans"] == 4
+
+        # The raw history is not consulted
+        with db._get_connection() as conn:
+            conn.execute("DELETE FROM scans")
+        assert db.get_statistics(days=90)["total_scans"] == 4
+
+    def test_statistics_since(self, db: ScanHistoryDB):
+        """Test an explicit window start."""
+        self._record_mixed_history(db)
+
+        stats = db.get_statistics(since=datetime.now(timezone.utc) - timedelta(hours=3))
+
+        assert stats["total_scans"] == 2
+        assert stats["avg_l1_duration_ms"] == pytest.approx(2.0)
+
+    def test_top_rules(self, db: ScanHistoryDB):
+        """Test rule counts come from the rule rollups."""
+        self._record_mixed_history(db)
+
+        assert db.get_top_rules(days=7) == [("pi-001", 2), ("l2-threat", 1)]
+        assert db.get_top_rules(days=90, limit=1) == [("pi-001", 2)]
+
+    def test_rollup_series(self, db: ScanHistoryDB):
+        """Test per-bucket totals."""
+        self._record_mixed_history(db)
+        now = datetime.now(timezone.utc)
+
+        hourly = db.get_rollup_series("hour", since=now - timedelta(hours=23))
+        assert [b.scans for b in hourly] == [1, 1]
+        assert [b.threat_scans for b in hourly] == [1, 0]
+        assert all(b.start.minute == 0 and b.start.second == 0 for b in hourly)
+
+        daily = db.get_rollup_series("day", since=now - timedelta(days=365))
+        assert sum(b.scans for b in daily) == 4
+
+        with pytest.raises(ValueError):
+            db.get_rollup_series("week", since=now)
+
+    def test_rollups_accumulate_across_batches(self, db: ScanHistoryDB):
+        """Test buckets are updated in place by later inserts."""
+        detections = [self._detection("pi-001", Severity.HIGH)]
+        for _ in range(3):
+            db.record_scan("again", detections, total_duration_ms=5.0)
+
+        stats = db.get_statistics(days=1)
+        assert stats["total_scans"] == 3
+        assert stats["severity_counts"] == {"high": 3}
+        with db._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT granularity, SUM(scans) FROM scan_rollups GROUP BY granularity"
+            ).fetchall()
+        assert {row[0]: row[1] for row in rows} == {"minute": 3, "hour": 3, "day": 3}
+
+    def test_old_minute_rollups_are_pruned(self, db: ScanHistoryDB):
+        """Test minute buckets beyond the retention window are dropped."""
+        db.record_scans(
+            [PendingScan("old", timestamp=datetime.now(timezone.utc) - timedelta(days=5))]
+        )
+        db._minute_rollups_pruned_at = 0
+
+        db.record_scan("now", [])
+
+        with db._get_connection() as conn:
+            minutes = conn.execute(
+                "SELECT COUNT(*) FROM scan_rollups WHERE granularity = 'minute'"
+            ).fetchone()[0]
+        assert minutes == 1
+        assert db.get_statistics(days=7)["total_scans"] == 2
+
+    def test_cleanup_prunes_expired_rollups(self, db: ScanHistoryDB):
+        """Test cleanup drops hour, day and sketch buckets past retention."""
+        now = datetime.now(timezone.utc)
+        db.record_scans(
+            [
+                PendingScan("expired", total_duration_ms=5.0, timestamp=now - timedelta(days=120)),
+                PendingScan("kept", total_duration_ms=5.0, timestamp=now - timedelta(days=10)),
+            ]
+        )
+
+        assert db.cleanup_old_scans(retention_days=90) == 1
+
+        oldest = int((now - timedelta(days=91)).timestamp())
+        with db._get_connection() as conn:
+            for table in ("scan_rollups", "count_rollups", "latency_sketches"):
+                expired = conn.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE bucket < ?",  # noqa: S608
+                    (oldest,),
+                ).fetchone()[0]
+                assert expired == 0, table
+            sketches = conn.execute("SELECT COUNT(*) FROM latency_sketches").fetchone()[0]
+        assert sketches > 0
+        assert db.get_statistics(days=365)["total_scans"] == 1
+
+    def test_cleanup_chunk_is_atomic(self, db: ScanHistoryDB, monkeypatch):
+        """Test a failed rollup prune rolls back the chunk's scan deletes."""
+        db.record_scans(
+            [PendingScan("expired", timestamp=datetime.now(timezone.utc) - timedelta(days=120))]
+        )
+
+        def fail(conn, cutoff):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(db, "_prune_rollups", fail)
+
+        with pytest.raises(sqlite3.OperationalError):
+            db.cleanup_old_scans(retention_days=90)
+
+        assert len(db.list_scans()) == 1
+
+    def test_migration_backfills_rollups(self, tmp_path: Path):
+        """Test upgrading a v6 database builds the rollups from history."""
+        db_path = tmp_path / "v6.db"
+        db = ScanHistoryDB(db_path)
+        self._record_mixed_history(db)
+        with db._get_connection() as conn:
+            conn.execute("DROP TABLE scan_rollups")
+            conn.execute("DROP TABLE count_rollups")
+            conn.execute("DROP TABLE latency_sketches")
+            conn.execute("UPDATE _metadata SET value = '6' WHERE key = 'schema_version'")
+        db.close()
+
+        upgraded = ScanHistoryDB(db_path)
+
+        week = upgraded.get_statistics(days=7)
+        assert week["total_scans"] == 3
+        assert week["severity_counts"] == {"high": 1, "critical": 1}
+        assert week["l2_detections"] == 1
+        assert upgraded.get_top_rules(days=90) == [
+            ("pi-001", 2),
+            ("jb-001", 1),
+            ("l2-threat", 1),
+        ]
+        with upgraded._get_connection() as conn:
+            version = conn.execute(
+                "SELECT value FROM _metadata WHERE key = 'schema_version'"
+            ).fetchone()[0]
+        assert version == str(ScanHistoryDB.SCHEMA_VERSION)
+
+    def test_latency_percentiles_from_sketches(self, db: ScanHistoryDB):
+        """Test percentiles reflect a bimodal distribution, not the mean."""
+        now = datetime.now(timezone.utc)
+        fast = [PendingScan("fast", total_duration_ms=2.0, timestamp=now) for _ in range(90)]
+        slow = [
+            PendingScan("slow", l2_duration_ms=78.0, total_duration_ms=80.0, timestamp=now)
+            for _ in range(10)
+        ]
+        db.record_scans(fast + slow)
+
+        latency = db.get_statistics(days=1)["latency_percentiles"]
+
+        assert latency["total"]["count"] == 100
+        assert latency["total"]["p50_ms"] == pytest.approx(2.0, rel=0.05)
+        assert latency["total"]["p95_ms"] == pytest.approx(80.0, rel=0.05)
+        assert latency["total"]["max_ms"] == pytest.approx(80.0)
+        assert latency["l2"]["count"] == 10
+        assert latency["l1"]["count"] == 0
+
+    def test_latency_sketches_merge_across_buckets(self, db: ScanHistoryDB):
+        """Test windows spanning several hours merge the hourly sketches."""
+        now = datetime.now(timezone.utc)
+        db.record_scans(
+            [
+                PendingScan("a", total_duration_ms=5.0, timestamp=now - timedelta(hours=5)),
+                PendingScan("b", total_duration_ms=50.0, timestamp=now - timedelta(hours=1)),
+            ]
+        )
+        db.record_scan("c", [], total_duration_ms=500.0)
+
+        histograms = db.get_latency_histograms(since=now - timedelta(hours=6))
+        assert histograms["total"].count == 3
+        assert histograms["total"].max_ms == pytest.approx(500.0)
+
+        recent = db.get_latency_histograms(since=now - timedelta(hours=2))
+        assert recent["total"].count == 2
+
+    def test_migration_backfills_latency_sketches(self, tmp_path: Path):
+        """Test upgrading a v7 database builds the sketches from history."""
+        db_path = tmp_path / "v7.db"
+        db = ScanHistoryDB(db_path)
+        self._record_mixed_history(db)
+        with db._get_connection() as conn:
+            conn.execute("DROP TABLE latency_sketches")
+            conn.execute("UPDATE _metadata SET value = '7' WHERE key = 'schema_version'")
+        db.close()
+
+        upgraded = ScanHistoryDB(db_path)
+
+        latency = upgraded.get_statistics(days=7)["latency_percentiles"]
+        assert latency["total"]["count"] == 3
+        assert latency["l2"]["max_ms"] == pytest.approx(40.0)
+
+    def test_list_scans_threats_only(self, db: ScanHistoryDB):
+        """Test filtering the scan list to threats."""
+        self._record_mixed_history(db)
+
+        scans = db.list_scans(threats_only=True)
+
+        assert [s.threats_found > 0 for s in scans] == [True, True, True]
+
 
 class TestScanRecord:
     """Test ScanRecord dataclass."""
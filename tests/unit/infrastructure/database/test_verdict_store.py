@@ -0,0 +1,94 @@
+"""Tests for the RAG chunk verdict store."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from raxe.infrastructure.database.verdict_store import StoredVerdict, VerdictStore
+
+CLEAN = StoredVerdict(has_threats=False, severity=None, detection_count=0)
+THREAT = StoredVerdict(has_threats=True, severity="HIGH", detection_count=2)
+
+
+class TestVerdictStore:
+    """Test verdict store."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> VerdictStore:
+        """Create test store."""
+        return VerdictStore(tmp_path / "verdicts.db")
+
+    def test_round_trip(self, store: VerdictStore):
+        """Test stored verdicts are returned for their hashes only."""
+        store.put_many({"a": CLEAN, "b": THREAT}, "key-1")
+
+        found = store.get_many(["a", "b", "missing"], "key-1")
+
+        assert found == {"a": CLEAN, "b": THREAT}
+        assert store.count() == 2
+
+    def test_other_detection_key_is_a_miss(self, store: VerdictStore):
+        """Test verdicts from another rule/model configuration are ignored."""
+        store.put_many({"a": THREAT}, "old-key")
+
+        assert store.get_many(["a"], "new-key") == {}
+
+    def test_lookup_spans_in_query_chunks(self, store: VerdictStore):
+        """Test lookups larger than one IN clause return every verdict."""
+        hashes = [f"h{i}" for i in range(VerdictStore.IN_QUERY_CHUNK_SIZE * 2 + 7)]
+        store.put_many(dict.fromkeys(hashes, CLEAN), "key")
+
+        assert len(store.get_many(hashes, "key")) == len(hashes)
+
+    def test_prune_keeps_current_key(self, store: VerdictStore):
+        """Test prune() deletes verdicts from stale detection keys."""
+        store.put_many({"a": CLEAN, "b": CLEAN}, "old-key")
+        store.put_many({"a": THREAT}, "new-key")
+
+        assert store.prune("new-key") == 2
+        assert store.count() == 1
+        assert store.count("new-key") == 1
+
+    def test_expired_verdicts_are_a_miss(self, tmp_path: Path, monkeypatch):
+        """Test verdicts older than max_age are ignored and pruned."""
+        store = VerdictStore(tmp_path / "verdicts.db", max_age=60.0)
+        store.put_many({"a": THREAT}, "key")
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + 61.0)
+        store.put_many({"b": CLEAN}, "key")
+
+        assert store.get_many(["a", "b"], "key") == {"b": CLEAN}
+        assert store.prune("key") == 1
+        assert store.count() == 1
+
+    def test_max_age_must_be_positive(self, tmp_path: Path):
+        """Test a non-positive max_age is rejected."""
+        with pytest.raises(ValueError, match="max_age"):
+            VerdictStore(tmp_path / "verdicts.db", max_age=0)
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        """Test verdicts survive reopening the database."""
+        db_path = tmp_path / "verdicts.db"
+        first = VerdictStore(db_path)
+        first.put_many({"a": THREAT}, "key")
+        first.close()
+
+        assert VerdictStore(db_path).get_many(["a"], "key") == {"a": THREAT}
+
+    def test_concurrent_writes(self, store: VerdictStore):
+        """Test threads can share one store."""
+
+        def write(worker: int) -> None:
+            for i in range(20):
+                store.put_many({f"{worker}-{i}": CLEAN}, "key")
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store.count("key") == 80
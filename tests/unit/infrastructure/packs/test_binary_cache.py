@@ -0,0 +1,198 @@
+"""Tests for the memory-mapped binary rule cache."""
+
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from raxe.domain.rules.models import (
+    Pattern,
+    Rule,
+    RuleExamples,
+    RuleFamily,
+    RuleMetrics,
+    Severity,
+)
+from raxe.infrastructure.packs import binary_cache
+from raxe.infrastructure.packs.binary_cache import (
+    BINARY_CACHE_FILENAME,
+    BinaryCacheError,
+    MappedRule,
+    MappedRuleCache,
+    read_binary_cache,
+    write_binary_cache,
+)
+from raxe.infrastructure.packs.cache import _compute_manifest_hash
+from raxe.infrastructure.packs.loader import PackLoader
+
+MANIFEST_HASH = "0123456789abcdef"
+
+
+def _make_rule(rule_id: str, family: RuleFamily = RuleFamily.PI, **overrides) -> Rule:
+    fields = {
+        "rule_id": rule_id,
+        "version": "1.0.0",
+        "family": family,
+        "sub_family": "instruction_override",
+        "name": f"Rule {rule_id}",
+        "description": f"Detects {rule_id} — ünïcödé",
+        "severity": Severity.HIGH,
+        "confidence": 0.9,
+        "patterns": [
+            Pattern(pattern=r"(?i)\bignore\b", flags=["IGNORECASE"], timeout=2.5),
+            Pattern(pattern=r"disregard"),
+        ],
+        "examples": RuleExamples(should_match=["ignore it"], should_not_match=["hello"]),
+        "metrics": RuleMetrics(precision=0.95, counts_30d={"hits": 3}),
+        "mitre_attack": ["T1562.001"],
+        "metadata": {"author": "test"},
+        "rule_hash": "abc123",
+        "risk_explanation": "Overrides instructions",
+        "remediation_advice": "Reject the prompt",
+        "docs_url": "https://docs.raxe.ai/rules/" + rule_id,
+    }
+    fields.update(overrides)
+    return Rule(**fields)
+
+
+@pytest.fixture
+def rules():
+    return [
+        _make_rule("pi-001"),
+        _make_rule("jb-001", RuleFamily.JB, severity=Severity.CRITICAL, mitre_attack=[]),
+        _make_rule("pii-001", RuleFamily.PII, patterns=[Pattern(pattern=r"\d{3}-\d{2}")]),
+    ]
+
+
+@pytest.fixture
+def cache_path(tmp_path, rules):
+    path = tmp_path / BINARY_CACHE_FILENAME
+    write_binary_cache(rules, MANIFEST_HASH, path, pack_id="test@1.0.0")
+    return path
+
+
+class TestBinaryCache:
+    """Writing and reading the binary cache."""
+
+    def test_round_trip_preserves_rules(self, cache_path, rules):
+        cached = read_binary_cache(cache_path, MANIFEST_HASH)
+
+        assert cached is not None
+        assert cached == rules
+        for view, rule in zip(cached, rules, strict=True):
+            assert isinstance(view, Rule)
+            assert view.patterns == rule.patterns
+            assert view.examples == rule.examples
+            assert view.metrics == rule.metrics
+            assert view.description == rule.description
+
+    def test_header_metadata(self, cache_path, rules):
+        cache = MappedRuleCache(cache_path)
+
+        assert cache.manifest_hash == MANIFEST_HASH
+        assert cache.pack_id == "test@1.0.0"
+        assert len(cache) == len(rules)
+        assert cache.pattern_count == sum(len(r.patterns) for r in rules)
+
+    def test_views_decode_lazily_and_are_reused(self, cache_path):
+        cache = MappedRuleCache(cache_path)
+
+        view = cache.rule(0)
+        assert "patterns" not in view.__dict__
+        assert view.rule_id == "pi-001"
+        assert view.patterns[0].flags == ["IGNORECASE"]
+        assert "patterns" in view.__dict__
+        assert cache.rule(0) is view
+
+    def test_manifest_hash_mismatch_returns_none(self, cache_path):
+        assert read_binary_cache(cache_path, "fedcba9876543210") is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert read_binary_cache(tmp_path / "missing.rxrc", MANIFEST_HASH) is None
+
+    def test_corrupt_file_is_rejected(self, tmp_path):
+        path = tmp_path / BINARY_CACHE_FILENAME
+        path.write_bytes(b"not a rule cache at all, just some bytes")
+
+        with pytest.raises(BinaryCacheError):
+            MappedRuleCache(path)
+        assert read_binary_cache(path, MANIFEST_HASH) is None
+
+    def test_truncated_file_is_rejected(self, cache_path):
+        data = cache_path.read_bytes()
+        cache_path.write_bytes(data[:-10])
+
+        with pytest.raises(BinaryCacheError):
+            MappedRuleCache(cache_path)
+
+    def test_rewritten_file_is_remapped(self, cache_path, rules):
+        first = binary_cache.open_binary_cache(cache_path)
+        assert binary_cache.open_binary_cache(cache_path) is first
+
+        write_binary_cache(rules[:1], MANIFEST_HASH, cache_path)
+
+        second = binary_cache.open_binary_cache(cache_path)
+        assert second is not first
+        assert len(second) == 1
+
+    def test_view_pickles_as_plain_rule(self, cache_path, rules):
+        view = MappedRuleCache(cache_path).rule(1)
+
+        # Round-trips locally produced data only
+        restored = pickle.loads(pickle.dumps(view))  # noqa: S301
+
+        assert type(restored) is Rule
+        assert restored == rules[1]
+
+    def test_view_is_immutable(self, cache_path):
+        view = MappedRuleCache(cache_path).rule(0)
+
+        with pytest.raises(AttributeError):
+            view.rule_id = "other"  # type: ignore[misc]
+
+
+class TestLoaderBinaryCache:
+    """PackLoader prefers the binary cache."""
+
+    @pytest.fixture
+    def pack_dir(self, tmp_path):
+        source = (
+            Path(__file__).parent.parent.parent.parent.parent
+            / "src/raxe/packs/core/v1.0.0/rules/PI/pi-001@1.0.0.yaml"
+        )
+        pack_dir = tmp_path / "pack"
+        (pack_dir / "rules" / "PI").mkdir(parents=True)
+        shutil.copy(source, pack_dir / "rules" / "PI" / "pi-001@1.0.0.yaml")
+        (pack_dir / "pack.yaml").write_text("""
+pack:
+  id: binary-test
+  version: 1.0.0
+  name: Binary Cache Test Pack
+  type: CUSTOM
+  schema_version: 1.1.0
+  rules:
+    - id: pi-001
+      version: 1.0.0
+      path: rules/PI/pi-001@1.0.0.yaml
+""")
+        return pack_dir
+
+    def test_loads_bundled_binary_cache(self, pack_dir):
+        yaml_pack = PackLoader().load_pack(pack_dir)
+        manifest_hash = _compute_manifest_hash(pack_dir / "pack.yaml")
+        write_binary_cache(yaml_pack.rules, manifest_hash, pack_dir / BINARY_CACHE_FILENAME)
+
+        pack = PackLoader().load_pack(pack_dir)
+
+        assert isinstance(pack.rules[0], MappedRule)
+        assert pack.rules == yaml_pack.rules
+
+    def test_bundled_binary_cache_is_current(self):
+        pack_dir = Path(__file__).parent.parent.parent.parent.parent / "src/raxe/packs/core/v1.0.0"
+        manifest_hash = _compute_manifest_hash(pack_dir / "pack.yaml")
+
+        cached = read_binary_cache(pack_dir / BINARY_CACHE_FILENAME, manifest_hash)
+
+        assert cached is not None
+        assert len(cached) > 0
@@ -3,6 +3,11 @@
 Tests plugin lifecycle management, hook execution, and metrics tracking.
 """
 
+import importlib.util
+import os
+import sys
+import threading
+import time
 from datetime import datetime, timezone
 from unittest.mock import Mock
 
@@ -13,7 +18,89 @@ from raxe.domain.engine.matcher import Match
 from raxe.domain.rules.models import Severity
 from raxe.plugins.loader import PluginLoader
 from raxe.plugins.manager import PluginManager, PluginMetrics
-from raxe.plugins.protocol import PluginMetadata
+from raxe.plugins.protocol import PluginConcurrency, PluginMetadata
+
+
+def _detection(rule_id: str, message: str = "Test detection") -> Detection:
+    return Detection(
+        rule_id=rule_id,
+        rule_version="0.0.1",
+        severity=Severity.HIGH,
+        confidence=0.9,
+        matches=[Match(0, 0, 4, "test", (), "", "")],
+        detected_at=datetime.now(timezone.utc).isoformat(),
+        message=message,
+    )
+
+
+class SleepyDetector:
+    """Detector that sleeps, tracking how many of its calls overlap."""
+
+    def __init__(
+        self,
+        name: str,
+        delay: float,
+        concurrency: PluginConcurrency = PluginConcurrency.SERIAL,
+    ):
+        self.metadata = PluginMetadata(
+            name=name,
+            version="0.0.1",
+            author="Test",
+            description="Test",
+            concurrency=concurrency,
+        )
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def detect(self, text, context=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [_detection(f"{self.metadata.name}_001")]
+
+
+class PidDetector:
+    """Picklable detector reporting the process it ran in."""
+
+    metadata = PluginMetadata(
+        name="pid_detector",
+        version="0.0.1",
+        author="Test",
+        description="Test",
+        concurrency=PluginConcurrency.PROCESS,
+    )
+
+    def detect(self, text, context=None):
+        return [_detection("pid_001", message=str(os.getpid()))]
+
+
+class CrashingDetector:
+    """Picklable detector whose worker process dies on "crash"."""
+
+    metadata = PluginMetadata(
+        name="crashing_detector",
+        version="0.0.1",
+        author="Test",
+        description="Test",
+        concurrency=PluginConcurrency.PROCESS,
+    )
+
+    def detect(self, text, context=None):
+        if "crash" in text:
+            os._exit(1)
+        return [_detection("crash_001")]
+
+
+def _manager(*detectors, timeout: float = 5.0) -> PluginManager:
+    manager = PluginManager(Mock(spec=PluginLoader), timeout_seconds=timeout)
+    manager.detector_plugins = list(detectors)
+    manager.plugin_metrics = {d.metadata.name: PluginMetrics() for d in detectors}
+    return manager
 
 
 class TestPluginMetrics:
@@ -276,3 +363,144 @@ class TestPluginManager:
         manager.shutdown()
 
         plugin.on_shutdown.assert_called_once()
+
+
+class TestRunDetectorsConcurrently:
+    """Test detector fan-out with a shared deadline."""
+
+    def test_latency_is_slowest_detector_not_sum(self):
+        """Test detectors run concurrently and keep priority order."""
+        detectors = [SleepyDetector(f"slow_{i}", 0.2) for i in range(3)]
+        manager = _manager(*detectors)
+
+        start = time.perf_counter()
+        detections = manager.run_detectors("test text")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45
+        assert [d.rule_id for d in detections] == ["slow_0_001", "slow_1_001", "slow_2_001"]
+        assert all(manager.plugin_metrics[d.metadata.name].total_executions == 1 for d in detectors)
+        manager.shutdown()
+
+    def test_late_detector_times_out_without_blocking(self):
+        """Test the scan returns at the deadline with the detectors that finished."""
+        fast = SleepyDetector("fast", 0.0)
+        slow = SleepyDetector("slow", 1.0)
+        manager = _manager(slow, fast, timeout=0.2)
+
+        start = time.perf_counter()
+        detections = manager.run_detectors("test text")
+
+        assert time.perf_counter() - start < 0.6
+        assert [d.rule_id for d in detections] == ["fast_001"]
+        assert manager.plugin_metrics["slow"].timeout_count == 1
+
+        # Still running from the first scan: skipped rather than queued
+        detections = manager.run_detectors("test text")
+        assert [d.rule_id for d in detections] == ["fast_001"]
+        assert manager.plugin_metrics["slow"].timeout_count == 2
+        assert slow.max_active == 1
+        manager.shutdown()
+
+    def test_errors_are_isolated(self):
+        """Test a failing detector does not affect the others."""
+        broken = Mock()
+        broken.metadata = PluginMetadata(
+            name="broken", version="0.0.1", author="Test", description="Test"
+        )
+        broken.detect = Mock(side_effect=RuntimeError("boom"))
+        manager = _manager(broken, SleepyDetector("ok", 0.0))
+
+        detections = manager.run_detectors("test text")
+
+        assert [d.rule_id for d in detections] == ["ok_001"]
+        assert manager.plugin_metrics["broken"].error_count == 1
+        manager.shutdown()
+
+    @pytest.mark.parametrize(
+        ("concurrency", "expected_overlap"),
+        [(PluginConcurrency.SERIAL, 1), (PluginConcurrency.THREAD_SAFE, 2)],
+    )
+    def test_concurrency_declaration(self, concurrency, expected_overlap):
+        """Test SERIAL detectors never overlap across concurrent scans."""
+        detector = SleepyDetector("detector", 0.1, concurrency=concurrency)
+        manager = _manager(detector)
+        barrier = threading.Barrier(2)
+
+        def scan():
+            barrier.wait()
+            manager.run_detectors("test text")
+
+        threads = [threading.Thread(target=scan) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert detector.max_active == expected_overlap
+        assert manager.plugin_metrics["detector"].total_executions == 2
+        manager.shutdown()
+
+    def test_process_isolated_detector(self):
+        """Test PROCESS detectors run in a worker process."""
+        manager = _manager(PidDetector(), SleepyDetector("inline", 0.0), timeout=30.0)
+
+        detections = manager.run_detectors("test text")
+
+        assert [d.rule_id for d in detections] == ["pid_001", "inline_001"]
+        assert detections[0].message != str(os.getpid())
+        assert manager._get_process_executor()._mp_context.get_start_method() == "spawn"
+        manager.shutdown()
+
+    def test_process_detector_loaded_from_file(self, tmp_path):
+        """Test plugins loaded by path still resolve in spawned workers."""
+        plugin_file = tmp_path / "plugin.py"
+        plugin_file.write_text(
+            "import os\n"
+            "from raxe.plugins.protocol import PluginConcurrency, PluginMetadata\n"
+            "class FileDetector:\n"
+            "    metadata = PluginMetadata(name='file_detector', version='0.0.1', author='T',\n"
+            "        description='T', concurrency=PluginConcurrency.PROCESS)\n"
+            "    def detect(self, text, context=None):\n"
+            "        return [os.getpid()]\n"
+            "plugin = FileDetector()\n"
+        )
+        spec = importlib.util.spec_from_file_location("raxe_plugin_file_detector", plugin_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        manager = _manager(module.plugin, timeout=30.0)
+
+        try:
+            detections = manager.run_detectors("test text")
+        finally:
+            manager.shutdown()
+            del sys.modules[spec.name]
+
+        assert len(detections) == 1
+        assert detections[0] != os.getpid()
+
+    def test_crashed_process_pool_is_rebuilt(self):
+        """Test a worker crash does not disable PROCESS detectors for good."""
+        manager = _manager(CrashingDetector(), timeout=30.0)
+        manager.PROCESS_POOL_RETRY_SECONDS = 0.0
+
+        assert manager.run_detectors("crash now") == []
+        detections = manager.run_detectors("test text")
+
+        assert [d.rule_id for d in detections] == ["crash_001"]
+        assert manager.plugin_metrics["crashing_detector"].error_count == 1
+        manager.shutdown()
+
+    def test_crashed_process_pool_backs_off(self):
+        """Test scans during the rebuild backoff skip PROCESS detectors."""
+        manager = _manager(CrashingDetector(), timeout=30.0)
+
+        manager.run_detectors("crash now")
+        deadline = time.monotonic() + 10
+        while manager._process_executor is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert manager.run_detectors("test text") == []
+        assert manager.plugin_metrics["crashing_detector"].error_count == 2
+        manager.shutdown()
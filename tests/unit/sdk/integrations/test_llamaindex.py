@@ -405,6 +405,36 @@ class TestRaxeLlamaIndexCallbackSynthesizeEvents:
         assert "Synthesized answer based on context." in mock_raxe.scan.call_args[0]
 
 
+class TestRaxeLlamaIndexCallbackRetrieveEvents:
+    """Tests for RETRIEVE event handling."""
+
+    def test_retrieved_nodes_are_scanned_as_one_batch(self, mock_raxe):
+        """Test retrieved nodes go through one scan_rag_context call."""
+        callback = RaxeLlamaIndexCallback(raxe_client=mock_raxe, scan_retrieved_context=True)
+        callback._scanner.scan_rag_context = Mock(return_value=[])
+        nodes = [Mock(text="chunk one"), Mock(text="chunk two"), object()]
+
+        callback.on_event_end(
+            event_type=MockCBEventType.RETRIEVE,
+            payload={"nodes": nodes},
+            event_id="evt-1",
+        )
+
+        callback._scanner.scan_rag_context.assert_called_once_with(["chunk one", "chunk two"])
+
+    def test_retrieved_nodes_not_scanned_by_default(self, mock_raxe):
+        """Test retrieval scanning is opt-in."""
+        callback = RaxeLlamaIndexCallback(raxe_client=mock_raxe)
+
+        callback.on_event_end(
+            event_type=MockCBEventType.RETRIEVE,
+            payload={"nodes": [Mock(text="chunk")]},
+            event_id="evt-1",
+        )
+
+        mock_raxe.scan.assert_not_called()
+
+
 class TestRaxeLlamaIndexCallbackTraceManagement:
     """Tests for trace start/end handling."""
 
@@ -0,0 +1,100 @@
+"""Unit tests for the agent scanner's per-conversation verdict memo."""
+
+import time
+
+import pytest
+
+from raxe.sdk.conversation_memo import ConversationMemo
+
+
+class TestConversationMemo:
+    """Tests for ConversationMemo."""
+
+    def test_get_set(self):
+        """Test basic memo operations and hit-rate stats."""
+        memo = ConversationMemo()
+
+        assert memo.get("conv", "key", token=1) is None
+        memo.set("conv", "key", "verdict", token=1)
+
+        assert memo.get("conv", "key", token=1) == "verdict"
+        stats = memo.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["conversations"] == 1
+        assert stats["messages"] == 1
+
+    def test_verdicts_are_scoped_to_conversation(self):
+        """Test a verdict memoized in one conversation is not seen by another."""
+        memo = ConversationMemo()
+        memo.set("a", "key", "verdict", token=0)
+
+        assert memo.get("b", "key", token=0) is None
+
+    def test_new_token_invalidates_everything(self):
+        """Test a new ruleset generation or model drops all verdicts."""
+        memo = ConversationMemo()
+        memo.set("a", "key", 1, token=(1, "v1"))
+        memo.set("b", "key", 2, token=(1, "v1"))
+
+        assert memo.get("a", "key", token=(2, "v1")) is None
+        assert len(memo) == 0
+        assert memo.stats()["invalidations"] == 1
+
+    def test_evicts_least_recently_used_conversation(self):
+        """Test the oldest conversation is dropped beyond max_conversations."""
+        memo = ConversationMemo(max_conversations=2)
+        memo.set("a", "k1", 1, token=0)
+        memo.set("a", "k2", 2, token=0)
+        memo.set("b", "k1", 3, token=0)
+        memo.get("a", "k1", token=0)
+
+        memo.set("c", "k1", 4, token=0)
+
+        assert memo.get("b", "k1", token=0) is None
+        assert memo.get("a", "k2", token=0) == 2
+        assert memo.stats()["evictions"] == 1
+
+    def test_evicts_least_recently_used_message(self):
+        """Test each conversation keeps at most max_messages verdicts."""
+        memo = ConversationMemo(max_messages=2)
+        memo.set("conv", "k1", 1, token=0)
+        memo.set("conv", "k2", 2, token=0)
+        memo.get("conv", "k1", token=0)
+
+        memo.set("conv", "k3", 3, token=0)
+
+        assert memo.get("conv", "k2", token=0) is None
+        assert memo.get("conv", "k1", token=0) == 1
+        assert memo.stats()["messages"] == 2
+
+    def test_ttl_expiration(self):
+        """Test verdicts expire after the TTL."""
+        memo = ConversationMemo(ttl=0.05)
+        memo.set("conv", "key", "verdict", token=0)
+
+        time.sleep(0.1)
+
+        assert memo.get("conv", "key", token=0) is None
+        assert memo.stats()["expirations"] == 1
+
+    def test_forget_drops_one_conversation(self):
+        """Test forget() only removes the given conversation."""
+        memo = ConversationMemo()
+        memo.set("a", "key", 1, token=0)
+        memo.set("b", "key", 2, token=0)
+
+        memo.forget("a")
+
+        assert memo.get("a", "key", token=0) is None
+        assert memo.get("b", "key", token=0) == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_conversations": 0}, {"max_messages": 0}, {"ttl": 0}],
+    )
+    def test_invalid_limits(self, kwargs):
+        """Test invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            ConversationMemo(**kwargs)
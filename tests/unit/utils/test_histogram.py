@@ -0,0 +1,200 @@
+"""Tests for streaming latency histograms.
+
+Tests LatencyHistogram, StageLatencyRecorder and the histogram-backed
+LatencyTracker.
+"""
+
+import random
+import threading
+
+import pytest
+
+from raxe.utils.histogram import (
+    BUCKET_COUNT,
+    LatencyHistogram,
+    StageLatencyRecorder,
+    merge_histograms,
+    merged_stage_latency,
+)
+from raxe.utils.performance import LatencyTracker
+
+
+def _exact_percentile(values, percentile):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(len(ordered) * percentile + 0.999999) - 1))
+    return ordered[index]
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        assert histogram.count == 0
+        assert histogram.percentile(0.95) == 0.0
+        assert histogram.mean == 0.0
+
+    @pytest.mark.parametrize("percentile", [0.5, 0.9, 0.95, 0.99])
+    def test_percentile_relative_error(self, percentile):
+        rng = random.Random(42)  # noqa: S311
+        values = [rng.lognormvariate(1.0, 1.5) for _ in range(20_000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        exact = _exact_percentile(values, percentile)
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.05)
+
+    def test_min_max_mean(self):
+        histogram = LatencyHistogram()
+        for value in (1.0, 2.0, 9.0):
+            histogram.record(value)
+
+        assert histogram.min_ms == 1.0
+        assert histogram.max_ms == 9.0
+        assert histogram.mean == pytest.approx(4.0)
+        assert histogram.percentile(1.0) == 9.0
+
+    def test_sub_microsecond_and_huge_values(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(-1.0)
+        histogram.record(10_000_000.0)
+
+        assert histogram.count == 3
+        assert histogram.percentile(0.0) == 0.0
+        assert histogram.percentile(1.0) == 10_000_000.0
+
+    def test_merge_equals_single_histogram(self):
+        rng = random.Random(7)  # noqa: S311
+        values = [rng.uniform(0.1, 100.0) for _ in range(5_000)]
+        single = LatencyHistogram()
+        parts = [LatencyHistogram() for _ in range(4)]
+        for i, value in enumerate(values):
+            single.record(value)
+            parts[i % 4].record(value)
+
+        merged = merge_histograms(parts)
+        assert merged.count == single.count
+        assert merged.total_ms == pytest.approx(single.total_ms)
+        for percentile in (0.5, 0.95, 0.99):
+            assert merged.percentile(percentile) == single.percentile(percentile)
+
+    def test_bytes_round_trip(self):
+        rng = random.Random(7)  # noqa: S311
+        histogram = LatencyHistogram()
+        for _ in range(1_000):
+            histogram.record(rng.expovariate(0.1))
+
+        restored = LatencyHistogram.from_bytes(histogram.to_bytes())
+
+        assert restored.summary() == histogram.summary()
+        assert restored.min_ms == histogram.min_ms
+        # Sparse: far smaller than one 8-byte count per bucket
+        assert len(histogram.to_bytes()) < BUCKET_COUNT * 8 / 2
+
+    def test_bytes_round_trip_empty(self):
+        restored = LatencyHistogram.from_bytes(LatencyHistogram().to_bytes())
+        assert restored.count == 0
+        assert restored.merge(LatencyHistogram()).percentile(0.5) == 0.0
+
+    @pytest.mark.parametrize("data", [b"", b"\x02" + bytes(40), b"garbage"])
+    def test_from_bytes_rejects_invalid_data(self, data):
+        with pytest.raises(ValueError):
+            LatencyHistogram.from_bytes(data)
+
+    def test_summary_keys(self):
+        histogram = LatencyHistogram()
+        histogram.record(3.0)
+        assert set(histogram.summary()) == {
+            "count",
+            "mean_ms",
+            "p50_ms",
+            "p95_ms",
+            "p99_ms",
+            "max_ms",
+        }
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(3.0)
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.percentile(0.5) == 0.0
+
+
+class TestStageLatencyRecorder:
+    """Tests for StageLatencyRecorder."""
+
+    def test_records_per_stage(self):
+        recorder = StageLatencyRecorder()
+        recorder.record("l1", 1.0)
+        recorder.record("l1", 2.0)
+        recorder.record("l2", 40.0)
+
+        summary = recorder.summary()
+        assert summary["l1"]["count"] == 2
+        assert summary["l2"]["count"] == 1
+        assert summary["l2"]["p50_ms"] == pytest.approx(40.0, rel=0.05)
+
+    def test_merges_across_threads(self):
+        recorder = StageLatencyRecorder()
+
+        def worker():
+            for _ in range(1_000):
+                recorder.record("l1", 1.5)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert recorder.merged()["l1"].count == 8_000
+
+    def test_dead_thread_shards_are_retired(self):
+        recorder = StageLatencyRecorder()
+        for _ in range(5):
+            thread = threading.Thread(target=recorder.record, args=("l2", 10.0))
+            thread.start()
+            thread.join()
+        recorder.record("l2", 10.0)
+
+        assert len(recorder._shards) == 1
+        assert recorder.merged()["l2"].count == 6
+
+    def test_process_wide_merge_includes_recorder(self):
+        recorder = StageLatencyRecorder()
+        recorder.record("histogram-test-stage", 5.0)
+
+        assert merged_stage_latency()["histogram-test-stage"].count >= 1
+
+
+class TestLatencyTracker:
+    """Tests for the histogram-backed LatencyTracker."""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.record(float(value))
+
+        assert tracker.p50 == pytest.approx(50.0, rel=0.05)
+        assert tracker.p95 == pytest.approx(95.0, rel=0.05)
+        assert tracker.average == pytest.approx(50.5)
+
+    def test_window_rotates(self):
+        tracker = LatencyTracker(window_size=100)
+        for _ in range(500):
+            tracker.record(100.0)
+        for _ in range(200):
+            tracker.record(1.0)
+
+        stats = tracker.get_stats()
+        assert stats["p99_ms"] == pytest.approx(1.0, rel=0.05)
+        assert stats["sample_count"] <= 200
+        assert stats["total_count"] == 700
+
+    def test_empty(self):
+        tracker = LatencyTracker()
+        assert tracker.p95 == 0.0
+        assert tracker.get_stats()["sample_count"] == 0
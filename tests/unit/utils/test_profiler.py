@@ -9,7 +9,15 @@ import pytest
 
 from raxe.domain.engine.executor import RuleExecutor
 from raxe.domain.rules.models import Pattern, Rule, RuleExamples, RuleFamily, RuleMetrics, Severity
-from raxe.utils.profiler import LayerProfile, ProfileResult, RuleProfile, ScanProfiler
+from raxe.utils.profiler import (
+    LayerProfile,
+    ProfileResult,
+    RuleCost,
+    RuleProfile,
+    SampledRuleProfiler,
+    ScanProfiler,
+    merged_rule_costs,
+)
 
 
 @pytest.fixture
@@ -385,3 +393,119 @@ def test_slowest_rules_limit():
     assert len(slowest) == 5
     assert slowest[0].rule_id == "rule-009"  # Slowest
     assert slowest[4].rule_id == "rule-005"  # 5th slowest
+
+
+def test_sampled_profiler_samples_one_in_n():
+    """Test only every Nth scan gets an observer."""
+    profiler = SampledRuleProfiler(sample_rate=4)
+
+    observers = [profiler.begin_sample(10) for _ in range(12)]
+
+    assert [o is not None for o in observers].count(True) == 3
+    assert observers[0] is None
+    assert observers[3] is not None
+    assert profiler.sampled_scans == 3
+
+
+def test_sampled_profiler_disabled():
+    """Test sample_rate=0 disables profiling."""
+    profiler = SampledRuleProfiler(sample_rate=0)
+    assert all(profiler.begin_sample(10) is None for _ in range(10))
+
+
+def test_sampled_profiler_aggregates_executor_costs(test_rules):
+    """Test sampled scans record per-rule and per-pattern cost."""
+    executor = RuleExecutor()
+    profiler = SampledRuleProfiler(sample_rate=1)
+    text = "fast path with a slow matching pattern"
+
+    for _ in range(3):
+        observer = profiler.begin_sample(len(text))
+        result = executor.execute_rules(text, test_rules, rule_observer=observer)
+
+    assert len(result.detections) == 2
+    costs = {cost.rule_id: cost for cost in profiler.top_rules(10)}
+    assert set(costs) == {"fast-rule", "slow-rule"}
+    for cost in costs.values():
+        assert cost.samples == 3
+        assert cost.matches == 3
+        assert cost.match_rate == 1.0
+        assert cost.worst_input_length == len(text)
+        assert len(cost.pattern_total_ms) == 1
+        assert cost.total_ms >= cost.pattern_total_ms[0]
+
+
+def test_observed_and_plain_execution_agree(test_rules):
+    """Test profiled execution returns the same detections."""
+    executor = RuleExecutor()
+    text = "fast slow pattern"
+    profiler = SampledRuleProfiler(sample_rate=1)
+
+    plain = executor.execute_rules(text, test_rules)
+    observed = executor.execute_rules(
+        text, test_rules, rule_observer=profiler.begin_sample(len(text))
+    )
+
+    assert [d.rule_id for d in observed.detections] == [d.rule_id for d in plain.detections]
+    assert observed.rules_checked == plain.rules_checked
+
+
+def test_sampled_profiler_top_rules_and_drain():
+    """Test top-K ordering and pending drain."""
+    profiler = SampledRuleProfiler(sample_rate=1)
+    profiler.record("cheap", 0.1, False, 10)
+    profiler.record("costly", 5.0, True, 5000)
+    profiler.record("costly", 1.0, False, 10)
+
+    top = profiler.top_rules(1)
+    assert [c.rule_id for c in top] == ["costly"]
+    assert top[0].max_ms == 5.0
+    assert top[0].worst_input_length == 5000
+
+    drained = profiler.drain_pending()
+    assert {c.rule_id for c in drained} == {"cheap", "costly"}
+    assert profiler.drain_pending() == []
+    # Running totals survive the drain
+    assert profiler.top_rules(10)[0].samples == 2
+
+
+def test_rule_cost_merge():
+    """Test merging aggregates keeps the worst case."""
+    a = RuleCost(
+        "r",
+        samples=2,
+        total_ms=2.0,
+        max_ms=1.5,
+        matches=1,
+        worst_input_length=10,
+        pattern_total_ms=[2.0],
+    )
+    b = RuleCost(
+        "r",
+        samples=1,
+        total_ms=3.0,
+        max_ms=3.0,
+        matches=0,
+        worst_input_length=99,
+        pattern_total_ms=[1.0, 2.0],
+    )
+
+    a.merge(b)
+
+    assert a.samples == 3
+    assert a.total_ms == 5.0
+    assert a.worst_input_length == 99
+    assert a.pattern_total_ms == [3.0, 2.0]
+
+
+def test_merged_rule_costs_across_profilers():
+    """Test process-wide merge used by the metrics exporter."""
+    first = SampledRuleProfiler(sample_rate=1)
+    second = SampledRuleProfiler(sample_rate=1)
+    first.record("merge-test-rule", 1.0, False, 10)
+    second.record("merge-test-rule", 2.0, True, 20)
+
+    merged = merged_rule_costs()["merge-test-rule"]
+
+    assert merged.samples >= 2
+    assert merged.total_ms >= 3.0